@@ -0,0 +1,183 @@
+"""Benchmark the Aladtec -> Entra import: serial vs. concurrent.
+
+Runs ``AladtecImporter.import_members`` for a synthetic roster against an
+in-process fake Graph service in which every HTTP call takes ``--latency``
+seconds. The roster mixes members that need a profile update, new hires
+(create + license), inactive members (disable + license removal) and
+unchanged members, all with license checks enabled.
+
+- serial: ``concurrency=1`` (one member, one Graph call at a time)
+- concurrent: the default pipeline (bounded members in flight, per-operation
+  limits, profile PATCHes coalesced into ``$batch`` calls)
+
+Prints wall time, Graph HTTP calls and peak calls in flight for each, and
+checks that both runs produce identical results.
+
+Usage:
+    uv run python scripts/bench_aladtec_import.py [--members 300] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from msgraph.generated.models.user import User
+
+from sjifire.aladtec.models import Member
+from sjifire.core.config import EntraSyncConfig
+from sjifire.core.msgraph_client import GraphBatchClient, GraphResponse
+from sjifire.entra.aladtec_import import IMPORT_CONCURRENCY, AladtecImporter
+from sjifire.entra.users import EntraUser, EntraUserManager
+
+DOMAIN = "sjifire.org"
+COMPANY = "San Juan Island Fire & Rescue"
+LICENSE_SKU = "3b555118-da6a-4418-894f-7df1e2096870"
+
+
+class FakeGraph:
+    """Graph stand-in: each HTTP call sleeps ``latency`` and is counted."""
+
+    def __init__(self, latency: float) -> None:
+        """Serve calls with ``latency`` seconds of round-trip time."""
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def call(self, result=None):
+        """One HTTP round trip."""
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return result
+
+    def user_item(self, user_id: str) -> SimpleNamespace:
+        """The ``client.users.by_user_id(id)`` request builder."""
+        licensed = SimpleNamespace(value=[SimpleNamespace(sku_id=LICENSE_SKU)])
+        return SimpleNamespace(
+            get=lambda: self.call(User(id=user_id, usage_location="US")),
+            patch=lambda body: self.call(),
+            license_details=SimpleNamespace(get=lambda: self.call(licensed)),
+            assign_license=SimpleNamespace(post=lambda body: self.call()),
+        )
+
+    async def post_user(self, user: User) -> User:
+        """``client.users.post``: echo the user back with an ID."""
+        user.id = f"new-{user.user_principal_name}"
+        return await self.call(user)
+
+    def client(self) -> SimpleNamespace:
+        """A GraphServiceClient-shaped object over this fake."""
+        return SimpleNamespace(
+            users=SimpleNamespace(by_user_id=self.user_item, post=self.post_user)
+        )
+
+
+class FakeBatchClient(GraphBatchClient):
+    """GraphBatchClient whose ``$batch`` POSTs go to the fake service."""
+
+    def __init__(self, graph: FakeGraph) -> None:
+        """Send batches to ``graph``."""
+        super().__init__(credential=SimpleNamespace())
+        self.graph = graph
+
+    async def _send(self, client, chunk):
+        self.http_requests += 1
+        await self.graph.call()
+        return {i: (GraphResponse(204), 0.0) for i, _ in chunk}
+
+
+def build_roster(count: int) -> tuple[list[Member], list[EntraUser]]:
+    """Members plus the Entra directory they are matched against.
+
+    Of every ten members: six need an update, one is new, one is inactive
+    and still enabled, and two are already up to date.
+    """
+    members, existing = [], []
+    for i in range(count):
+        kind = i % 10
+        email = f"member{i}@{DOMAIN}"
+        member = Member(
+            id=str(i),
+            first_name="Member",
+            last_name=f"N{i}",
+            email=email,
+            status="Inactive" if kind == 7 else "Active",
+            work_group="Volunteer",
+        )
+        members.append(member)
+        if kind == 6:
+            continue  # new hire
+        existing.append(
+            EntraUser(
+                id=f"user-{i}",
+                display_name=member.display_name,
+                first_name=member.first_name,
+                last_name=member.last_name,
+                email=email,
+                upn=email,
+                employee_id=None,
+                account_enabled=True,
+                employee_type="Volunteer" if kind >= 8 else "Career",
+                company_name=COMPANY,
+            )
+        )
+    return members, existing
+
+
+async def _run(members, existing, latency: float, concurrency: int):
+    graph = FakeGraph(latency)
+    manager = EntraUserManager.__new__(EntraUserManager)
+    manager.domain = DOMAIN
+    manager.client = graph.client()
+
+    async def get_users(include_disabled: bool = False):
+        return await graph.call(existing)
+
+    manager.get_users = get_users
+    config = EntraSyncConfig(company_name=COMPANY, domain=DOMAIN, service_email=f"svc@{DOMAIN}")
+    with patch("sjifire.entra.aladtec_import.load_entra_sync_config", return_value=config):
+        importer = AladtecImporter(
+            license_sku=LICENSE_SKU,
+            user_manager=manager,
+            concurrency=concurrency,
+            batch_client=FakeBatchClient(graph),
+        )
+
+    start = time.perf_counter()
+    result = await importer.import_members(members, disable_inactive=True)
+    return result, time.perf_counter() - start, graph
+
+
+def main():
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=300, help="Roster size")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per Graph call")
+    args = parser.parse_args()
+
+    members, existing = build_roster(args.members)
+    print(f"{args.members} members, {args.latency * 1000:.0f} ms per Graph call")
+
+    runs = {}
+    for label, concurrency in (("serial", 1), ("concurrent", IMPORT_CONCURRENCY)):
+        result, elapsed, graph = asyncio.run(_run(members, existing, args.latency, concurrency))
+        runs[label] = result
+        print(
+            f"{label:<10} {elapsed:7.2f} s | {graph.calls:5d} Graph calls | "
+            f"peak {graph.peak:3d} in flight | {result.summary()}"
+        )
+
+    if runs["serial"] != runs["concurrent"]:
+        raise SystemExit("results differ between serial and concurrent runs")
+    print("results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark Aladtec day/member HTML parsing: BeautifulSoup vs. html_scan.
+
+Parses the month of day HTML in ``tests/fixtures/aladtec/schedule_month.json``
+(and the member detail fixtures) repeatedly with both backends and prints
+the per-pass time and speedup. The BeautifulSoup side reproduces the
+original ``parse_day_html`` tree walk.
+
+Usage:
+    uv run python scripts/bench_aladtec_parsing.py [--rounds 20]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from sjifire.aladtec.html_scan import scan_day_html, scan_member_detail
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "aladtec"
+
+
+def _soup_day(html: str) -> int:
+    """Original BeautifulSoup walk over one day; returns filled row count."""
+    soup = BeautifulSoup(html, "html.parser")
+    platoon_elem = soup.find(class_="shift-label-display")
+    if platoon_elem:
+        platoon_elem.get_text(strip=True)
+    count = 0
+    for div in soup.find_all("div", class_="sch_entry"):
+        header = div.find(class_="calendar-event-header")
+        if header:
+            header.get_text(strip=True)
+        for row in div.find_all("tr", class_="calendar-event"):
+            if not row.get("title", "") or "ust" in row.get("class", []):
+                continue
+            if row.find(class_="open-shift"):
+                continue
+            count += 1
+    return count
+
+
+def _soup_member(html: str) -> None:
+    """Build the tree and run the three lookups the member scraper does."""
+    soup = BeautifulSoup(html, "html.parser")
+    for header_text in ("Positions:", "Schedules:"):
+        soup.find(string=lambda t, h=header_text: t and h in str(t))
+    soup.find("input", {"name": "usr_username"})
+
+
+def _time(fn, docs: list[str], rounds: int) -> float:
+    """Best-of-rounds seconds for one pass over all docs."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for html in docs:
+            fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="Passes per backend")
+    args = parser.parse_args()
+
+    days = list(json.loads((FIXTURES / "schedule_month.json").read_text()).values())
+    members = list(json.loads((FIXTURES / "member_details.json").read_text()).values())
+
+    for label, docs, soup_fn, scan_fn in (
+        ("schedule month", days, _soup_day, scan_day_html),
+        ("member details", members, _soup_member, scan_member_detail),
+    ):
+        soup_s = _time(soup_fn, docs, args.rounds)
+        scan_s = _time(scan_fn, docs, args.rounds)
+        size_kb = sum(len(d) for d in docs) / 1024
+        print(
+            f"{label:<15} {len(docs):3d} docs {size_kb:7.1f} KB | "
+            f"BeautifulSoup {soup_s * 1000:8.2f} ms | html_scan {scan_s * 1000:8.2f} ms | "
+            f"{soup_s / scan_s:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark calendar body normalization: original helpers vs. calendar.normalize.
+
+Builds a year of synthetic duty events (365 ``AllDayDutyEvent`` bodies with
+embedded CREW_DATA), the same bodies as legacy Exchange-wrapped HTML without
+the JSON comment, and a year of personal event bodies as Exchange returns
+them, then normalizes each set repeatedly with the original per-module
+helpers and with ``sjifire.calendar.normalize``.
+
+Usage:
+    uv run python scripts/bench_calendar_normalize.py [--rounds 20]
+"""
+
+import argparse
+import os
+import re
+import time
+from datetime import date, timedelta
+
+from bs4 import BeautifulSoup
+
+from sjifire.calendar.models import CREW_DATA_MARKER, AllDayDutyEvent, CrewMember
+from sjifire.calendar.normalize import CREW_DATA_RE, normalize_body
+
+EXCHANGE_WRAPPER = (
+    '<html><head>\r\n<meta http-equiv="Content-Type" content="text/html; charset=utf-8">\r\n'
+    '<style type="text/css" style="display:none">\r\nP {{margin-top:0;margin-bottom:0;}}\r\n'
+    "</style>\r\n</head>\r\n<body>\r\n{body}\r\n</body>\r\n</html>\r\n"
+)
+
+SECTIONS = {"S31": ["Captain", "Lieutenant", "Firefighter"], "S32": ["EMT", "Firefighter"]}
+
+
+def _old_duty_normalize(html: str) -> str:
+    """Original duty_sync.normalize_html_for_comparison."""
+    match = re.search(rf"<!--\s*{re.escape(CREW_DATA_MARKER)}(.*?)-->", html, re.DOTALL)
+    if match:
+        return match.group(1).strip()
+    soup = BeautifulSoup(html, "html.parser")
+    return re.sub(r"\s+", " ", soup.get_text(separator=" ")).strip()
+
+
+def _old_personal_normalize(body: str) -> str:
+    """Original personal_sync.normalize_body_for_comparison."""
+    return " ".join(re.sub(r"<[^>]+>", "", body).split())
+
+
+def _crew(day: int, platoon: str) -> dict[str, list[CrewMember]]:
+    return {
+        section: [
+            CrewMember(name=f"{platoon} Member {day}-{i}", position=position)
+            for i, position in enumerate(positions)
+        ]
+        for section, positions in SECTIONS.items()
+    }
+
+
+def _duty_bodies(year: int) -> list[str]:
+    """Body HTML for one duty event per day of the year."""
+    start = date(year, 1, 1)
+    bodies = []
+    for day in range(365):
+        until, frm = "ABC"[day % 3], "ABC"[(day + 1) % 3]
+        event = AllDayDutyEvent(
+            event_date=start + timedelta(days=day),
+            until_crew=_crew(day, until),
+            from_crew=_crew(day + 1, frm),
+            shift_change_hour=18,
+            until_platoon=until,
+            from_platoon=frm,
+        )
+        bodies.append(event.body_html)
+    return bodies
+
+
+def _personal_bodies() -> list[str]:
+    """Personal event bodies as Exchange returns plain text converted to HTML."""
+    text = (
+        "Position: {position}<br>\r\nSection: {section}<br>\r\n<br>\r\n"
+        "This event is automatically imported from Aladtec. Any changes will be "
+        "overwritten.<br>\r\n<br>\r\nModify your schedule: https://example.aladtec.com"
+    )
+    return [
+        EXCHANGE_WRAPPER.format(
+            body=f'<div class="PlainText">{text.format(position=p, section=s)}</div>'
+        )
+        for _ in range(73)
+        for s, positions in SECTIONS.items()
+        for p in positions
+    ]
+
+
+def _time(fn, docs: list[str], rounds: int) -> float:
+    """Best-of-rounds seconds for one pass over all docs."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for doc in docs:
+            fn(doc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="Passes per implementation")
+    args = parser.parse_args()
+
+    # body_html embeds the Aladtec link; any HTTPS URL will do here
+    os.environ.setdefault("ALADTEC_URL", "https://example.aladtec.com")
+    os.environ.setdefault("ALADTEC_USERNAME", "bench")
+    os.environ.setdefault("ALADTEC_PASSWORD", "bench")
+
+    duty = _duty_bodies(date.today().year)
+    legacy = [EXCHANGE_WRAPPER.format(body=CREW_DATA_RE.sub("", body)) for body in duty]
+    personal = _personal_bodies()
+
+    for label, docs, old_fn in (
+        ("duty (JSON)", duty, _old_duty_normalize),
+        ("duty (legacy)", legacy, _old_duty_normalize),
+        ("personal", personal, _old_personal_normalize),
+    ):
+        old_s = _time(old_fn, docs, args.rounds)
+        new_s = _time(normalize_body, docs, args.rounds)
+        size_kb = sum(len(d) for d in docs) / 1024
+        print(
+            f"{label:<14} {len(docs):4d} docs {size_kb:7.1f} KB | "
+            f"original {old_s * 1000:8.2f} ms | normalize {new_s * 1000:8.2f} ms | "
+            f"{old_s / new_s:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Benchmark Entra user loading for one ms-group-sync run: before vs. after.
+
+Serves a synthetic tenant from an in-memory fake Graph client and replays
+the user fetches one ``ms-group-sync`` invocation (all strategies) makes:
+
+- before: the original loader (Graph's default 100-user pages, dict-backed
+  ``EntraUser`` records) called for the active member list, again for every
+  partial-sync strategy's source emails, and again for ghost reconciliation
+- after: one paged snapshot ($top=999, slotted records) shared by all of them
+
+Prints Graph page requests and peak traced memory for each.
+
+Usage:
+    uv run python scripts/bench_entra_users.py [--users 2000]
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import time
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from msgraph.generated.models.on_premises_extension_attributes import (
+    OnPremisesExtensionAttributes,
+)
+from msgraph.generated.models.user import User
+
+from sjifire.core.group_strategies import STRATEGY_NAMES, get_strategy
+from sjifire.entra import users as users_module
+from sjifire.entra.users import EntraUser, EntraUserManager
+from sjifire.scripts.ms_group_sync import UnifiedGroupSyncManager
+
+# Page size Graph uses for /users without $top
+GRAPH_DEFAULT_TOP = 100
+
+# EntraUser as it was before slots (same fields, instance __dict__)
+LegacyEntraUser = dataclasses.make_dataclass(
+    "LegacyEntraUser",
+    [(f.name, f.type, f) for f in dataclasses.fields(EntraUser)],
+    namespace={"work_group": property(lambda self: self.employee_type)},
+)
+
+
+class FakeUsers:
+    """The ``client.users`` request builder over an in-memory tenant."""
+
+    def __init__(self, tenant: list[User], honor_top: bool = True) -> None:
+        """Serve ``tenant``; with ``honor_top=False`` pages stay at Graph's default."""
+        self.tenant = tenant
+        self.honor_top = honor_top
+        self.pages = 0
+        self._top = GRAPH_DEFAULT_TOP
+
+    def _page(self, offset: int) -> SimpleNamespace:
+        self.pages += 1
+        end = offset + self._top
+        next_link = str(end) if end < len(self.tenant) else None
+        return SimpleNamespace(value=self.tenant[offset:end], odata_next_link=next_link)
+
+    async def get(self, request_configuration=None) -> SimpleNamespace:
+        """First page, sized by the request's ``$top``."""
+        params = getattr(request_configuration, "query_parameters", None)
+        top = getattr(params, "top", None) if self.honor_top else None
+        self._top = top or GRAPH_DEFAULT_TOP
+        return self._page(0)
+
+    def with_url(self, link: str) -> SimpleNamespace:
+        """Builder for a next-page link (the link is the page offset)."""
+
+        async def get() -> SimpleNamespace:
+            return self._page(int(link))
+
+        return SimpleNamespace(get=get)
+
+
+def build_tenant(count: int) -> list[User]:
+    """Synthetic users with every selected property populated."""
+    tenant = []
+    for i in range(count):
+        email = f"member{i}@sjifire.org"
+        tenant.append(
+            User(
+                id=f"00000000-0000-0000-0000-{i:012d}",
+                display_name=f"Member {i}",
+                given_name="Member",
+                surname=str(i),
+                mail=email,
+                user_principal_name=email,
+                employee_id=str(1000 + i),
+                account_enabled=i % 10 != 0,
+                job_title="Firefighter",
+                mobile_phone="+1 360-555-0100",
+                business_phones=["+1 360-555-0101"],
+                office_location="Station 31",
+                employee_hire_date=datetime(2015, 1, 1),
+                employee_type="Volunteer",
+                other_mails=[f"member{i}@example.com"],
+                department="Operations",
+                company_name="San Juan Island Fire & Rescue",
+                on_premises_extension_attributes=OnPremisesExtensionAttributes(
+                    extension_attribute1="Firefighter",
+                    extension_attribute2="2027-01-01",
+                    extension_attribute3="Firefighter, EMT, Apparatus Operator",
+                    extension_attribute4="Station 31, Marine",
+                ),
+            )
+        )
+    return tenant
+
+
+async def _before(manager: EntraUserManager, partial_strategies: int) -> None:
+    """Original fetch pattern: one full load per consumer."""
+    active = await manager.get_users(include_disabled=False)
+    for _ in range(partial_strategies):
+        source = await manager.get_users(include_disabled=True)
+        {u.email.lower() for u in source if u.work_group is not None and u.email}
+    ghost_lookup = await manager.get_users(include_disabled=True)
+    del active, ghost_lookup
+
+
+async def _after(manager: EntraUserManager, partial_strategies: int) -> None:
+    """One snapshot shared by every consumer."""
+    sync = UnifiedGroupSyncManager(domain="sjifire.org")
+    sync._entra_users = manager
+    await sync.get_entra_users()
+    with patch("sjifire.scripts.ms_group_sync.get_service_email", return_value="svc@x"):
+        for _ in range(partial_strategies):
+            await sync.get_source_emails()
+    await sync.get_all_entra_users()
+
+
+def _measure(label: str, scenario, users: FakeUsers, partial_strategies: int) -> None:
+    manager = EntraUserManager.__new__(EntraUserManager)
+    manager.domain = "sjifire.org"
+    manager.client = SimpleNamespace(users=users)
+    users.pages = 0
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(scenario(manager, partial_strategies))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<7} {users.pages:4d} Graph pages | peak {peak / 1024 / 1024:7.2f} MiB | "
+        f"{elapsed * 1000:8.1f} ms"
+    )
+
+
+def main():
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000, help="Synthetic tenant size")
+    args = parser.parse_args()
+
+    partial_strategies = sum(get_strategy(name).partial_sync for name in STRATEGY_NAMES)
+    tenant = build_tenant(args.users)
+    print(f"{args.users} users, {partial_strategies} partial-sync strategies")
+
+    with patch.object(users_module, "EntraUser", LegacyEntraUser):
+        _measure("before", _before, FakeUsers(tenant, honor_top=False), partial_strategies)
+    _measure("after", _after, FakeUsers(tenant), partial_strategies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Compare RU charge and latency of the old vs. new ``list_for_user`` queries.
+
+Seeds a scratch container with synthetic incidents (creator + crew emails,
+``participant_emails`` index populated), then runs the nested-EXISTS query
+and the ``ARRAY_CONTAINS`` query for a sample of users and prints the
+average request charge and wall time for each.
+
+Requires ``COSMOS_ENDPOINT`` (and ``COSMOS_KEY`` or Azure CLI login).
+The scratch container is deleted afterwards unless ``--keep`` is passed.
+
+Usage:
+    uv run python scripts/bench_incident_queries.py --count 3000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+
+from azure.cosmos import PartitionKey
+
+from sjifire.core import config
+from sjifire.core.config import get_cosmos_container
+from sjifire.ops.incidents.models import IncidentDocument, PersonnelAssignment, UnitAssignment
+from sjifire.ops.incidents.store import IncidentStore
+
+LEGACY_QUERY = (
+    "SELECT * FROM c WHERE (c.created_by = @email OR EXISTS("
+    "SELECT VALUE u FROM u IN c.units WHERE EXISTS("
+    "SELECT VALUE p FROM p IN u.personnel WHERE p.email = @email)))"
+    " ORDER BY c.incident_datetime ASC"
+)
+INDEXED_QUERY = (
+    "SELECT * FROM c WHERE ARRAY_CONTAINS(c.participant_emails, @email)"
+    " ORDER BY c.incident_datetime ASC"
+)
+INDEX_POLICY = {
+    "indexingMode": "consistent",
+    "includedPaths": [{"path": "/*"}],
+    "excludedPaths": [{"path": "/narrative/?"}, {"path": '/"_etag"/?'}],
+    "compositeIndexes": [
+        [
+            {"path": "/status", "order": "ascending"},
+            {"path": "/incident_datetime", "order": "ascending"},
+        ]
+    ],
+}
+
+
+def _make_incident(i: int, roster: list[str], rng: random.Random) -> IncidentDocument:
+    """Build a synthetic incident with 1-3 units of 1-4 crew each."""
+    when = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(hours=rng.randint(0, 24 * 365 * 3))
+    units = [
+        UnitAssignment(
+            unit_id=f"E3{u}",
+            personnel=[
+                PersonnelAssignment(name=email.split("@")[0], email=email)
+                for email in rng.sample(roster, rng.randint(1, 4))
+            ],
+        )
+        for u in range(rng.randint(1, 3))
+    ]
+    return IncidentDocument(
+        incident_number=f"{when:%y}-{i:06d}",
+        incident_datetime=when,
+        created_by=rng.choice(roster),
+        units=units,
+        narrative="x" * 500,
+    )
+
+
+async def _measure(container, query: str, email: str) -> tuple[float, float, int]:
+    """Run one query to completion, returning (RU, seconds, result count)."""
+    charges: list[float] = []
+
+    def hook(headers, _result):
+        charges.append(float(headers.get("x-ms-request-charge", 0)))
+
+    start = time.perf_counter()
+    count = 0
+    async for _ in container.query_items(
+        query=query,
+        parameters=[{"name": "@email", "value": email}],
+        response_hook=hook,
+    ):
+        count += 1
+    return sum(charges), time.perf_counter() - start, count
+
+
+async def _run(count: int, users: int, samples: int, keep: bool) -> None:
+    rng = random.Random(42)  # noqa: S311 -- reproducible synthetic data
+    roster = [f"member{n:03d}@example.org" for n in range(users)]
+
+    # Initializes the shared pool; the scratch container lives in the same database
+    if await get_cosmos_container(IncidentStore._container_name) is None:
+        raise SystemExit("COSMOS_ENDPOINT is not set")
+    db = config._cosmos_db
+    name = f"bench-incidents-{int(time.time())}"
+    container = await db.create_container(
+        id=name, partition_key=PartitionKey(path="/year"), indexing_policy=INDEX_POLICY
+    )
+    print(f"Seeding {count} incidents into {name}...")
+    try:
+        sem = asyncio.Semaphore(20)
+
+        async def seed(i: int) -> None:
+            async with sem:
+                doc = _make_incident(i, roster, rng)
+                await container.create_item(body=IncidentStore._to_body(doc))
+
+        await asyncio.gather(*(seed(i) for i in range(count)))
+
+        for label, query in (("nested EXISTS", LEGACY_QUERY), ("ARRAY_CONTAINS", INDEXED_QUERY)):
+            rus, secs, rows = [], [], []
+            for email in rng.sample(roster, samples):
+                ru, sec, n = await _measure(container, query, email)
+                rus.append(ru)
+                secs.append(sec)
+                rows.append(n)
+            print(
+                f"{label:<15} avg RU {statistics.mean(rus):8.2f}  "
+                f"avg ms {statistics.mean(secs) * 1000:8.1f}  "
+                f"avg rows {statistics.mean(rows):6.1f}"
+            )
+    finally:
+        if not keep:
+            await db.delete_container(name)
+
+
+def main():
+    """Seed a scratch container and compare the two queries."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=3000, help="Incidents to seed")
+    parser.add_argument("--users", type=int, default=60, help="Size of synthetic roster")
+    parser.add_argument("--samples", type=int, default=10, help="Users to query")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch container")
+    args = parser.parse_args()
+    asyncio.run(_run(args.count, args.users, args.samples, args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -325,8 +325,26 @@ if should_run 2; then
     }
 
     # Container: incidents (partition key: /year)
+    # Composite index serves list_for_user / list_by_status: filter on
+    # status + participant_emails (ARRAY_CONTAINS), ORDER BY incident_datetime.
+    INCIDENTS_INDEX_POLICY='{
+        "indexingMode": "consistent",
+        "includedPaths": [{"path": "/*"}],
+        "excludedPaths": [{"path": "/narrative/?"}, {"path": "/edit_history/*"}, {"path": "/\"_etag\"/?"}],
+        "compositeIndexes": [
+            [{"path": "/status", "order": "ascending"}, {"path": "/incident_datetime", "order": "ascending"}]
+        ]
+    }'
     info "Creating container 'incidents'..."
-    create_container "incidents" "/year"
+    create_container "incidents" "/year" --idx "$INCIDENTS_INDEX_POLICY"
+    az cosmosdb sql container update \
+        --account-name "$COSMOS_ACCOUNT" \
+        --resource-group "$RESOURCE_GROUP" \
+        --database-name "$COSMOS_DATABASE" \
+        --name "incidents" \
+        --idx "$INCIDENTS_INDEX_POLICY" \
+        --output none
+    ok "Container 'incidents' indexing policy applied"
 
     # Container: schedules (partition key: /date)
     info "Creating container 'schedules'..."
@@ -336,6 +354,15 @@ if should_run 2; then
     info "Creating container 'dispatch-calls'..."
     create_container "dispatch-calls" "/year"
 
+    # Container: dispatch-sites (partition key: /id, one summary per normalized address)
+    info "Creating container 'dispatch-sites'..."
+    create_container "dispatch-sites" "/id"
+
+    # Container: dispatch-analysis-cache (partition key: /id, one LLM response per prompt hash,
+    # 90-day TTL)
+    info "Creating container 'dispatch-analysis-cache'..."
+    create_container "dispatch-analysis-cache" "/id" --ttl 7776000
+
     # Container: neris-reports (partition key: /year)
     info "Creating container 'neris-reports'..."
     create_container "neris-reports" "/year"
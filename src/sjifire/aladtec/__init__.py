@@ -3,6 +3,12 @@
 from sjifire.aladtec.client import AladtecClient, get_aladtec_credentials
 from sjifire.aladtec.member_scraper import AladtecMemberScraper
 from sjifire.aladtec.models import Member
+from sjifire.aladtec.schedule_cache import (
+    ScheduleCache,
+    ScheduleDiff,
+    load_schedule_diff,
+    save_schedule_diff,
+)
 from sjifire.aladtec.schedule_scraper import (
     AladtecScheduleScraper,
     load_schedules,
@@ -14,7 +20,11 @@ __all__ = [
     "AladtecMemberScraper",
     "AladtecScheduleScraper",
     "Member",
+    "ScheduleCache",
+    "ScheduleDiff",
     "get_aladtec_credentials",
+    "load_schedule_diff",
     "load_schedules",
+    "save_schedule_diff",
     "save_schedules",
 ]
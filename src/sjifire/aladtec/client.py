@@ -2,6 +2,8 @@
 
 import logging
 import os
+import threading
+from pathlib import Path
 from typing import Self
 
 import httpx
@@ -33,6 +35,23 @@ def get_aladtec_credentials() -> tuple[str, str, str]:
     return url, username, password
 
 
+def get_aladtec_cache_dir() -> Path | None:
+    """Get the directory for persisted scrape caches, if configured.
+
+    Set ``ALADTEC_CACHE_DIR`` to keep member-detail and schedule caches
+    between runs (e.g. a GitHub Actions cache path). Unset disables caching.
+
+    Returns:
+        Cache directory (created if missing), or None when caching is off
+    """
+    path = os.getenv("ALADTEC_CACHE_DIR")
+    if not path:
+        return None
+    cache_dir = Path(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 class AladtecClient:
     """Base HTTP client for Aladtec with login functionality.
 
@@ -56,6 +75,7 @@ class AladtecClient:
         self._timeout = timeout
         self.client: httpx.Client | None = None
         self._request_count = 0
+        self._count_lock = threading.Lock()
 
     def __enter__(self) -> Self:
         """Enter context manager - create HTTP client."""
@@ -81,15 +101,20 @@ class AladtecClient:
     def get(self, url: str, **kwargs) -> httpx.Response:
         """Make a GET request and track the call count."""
         client = self._require_client()
-        self._request_count += 1
+        self._count_request()
         return client.get(url, **kwargs)
 
     def post(self, url: str, **kwargs) -> httpx.Response:
         """Make a POST request and track the call count."""
         client = self._require_client()
-        self._request_count += 1
+        self._count_request()
         return client.post(url, **kwargs)
 
+    def _count_request(self) -> None:
+        """Increment the request counter (safe across worker threads)."""
+        with self._count_lock:
+            self._request_count += 1
+
     def _require_client(self) -> httpx.Client:
         """Get HTTP client or raise if not in context manager.
 
@@ -0,0 +1,320 @@
+"""Lightweight HTML scanning for Aladtec schedule and member pages.
+
+Aladtec pages are small, machine-generated fragments, and we only read a
+handful of elements from each (``tr.calendar-event`` rows, section
+headers, the ``Positions:``/``Schedules:`` cells). Building a full
+BeautifulSoup tree for every day and member page dominated scrape CPU
+time, so this module tokenizes with a few precompiled regexes and builds
+a minimal element tree with lazily-parsed attributes.
+
+Nesting follows BeautifulSoup's ``html.parser`` builder: void elements
+close immediately, ``<tag/>`` closes immediately, and an end tag pops
+back to the nearest open element with that name (stray end tags are
+ignored). Text helpers mirror ``get_text(strip=True)``. Equivalence with
+the BeautifulSoup-based parsers is pinned by golden-file tests.
+"""
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from html import unescape
+
+__all__ = ["Node", "parse_html", "scan_day_html", "scan_member_detail"]
+
+# Elements BeautifulSoup treats as empty (closed as soon as they open)
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "basefont",
+        "bgsound",
+        "br",
+        "col",
+        "command",
+        "embed",
+        "frame",
+        "hr",
+        "image",
+        "img",
+        "input",
+        "isindex",
+        "keygen",
+        "link",
+        "menuitem",
+        "meta",
+        "nextid",
+        "param",
+        "source",
+        "spacer",
+        "track",
+        "wbr",
+    }
+)
+
+# Elements whose content is raw text (no tags inside)
+_RAW_TEXT_ELEMENTS = ("script", "style")
+
+_TOKEN_RE = re.compile(
+    r"<!--.*?-->"  # comment
+    r"|<[!?][^>]*>"  # doctype / processing instruction
+    r"|<(/?)([a-zA-Z][^\s/>]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>",  # tag
+    re.DOTALL,
+)
+_ATTR_RE = re.compile(r"([^\s=/>\"']+)(?:\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+)))?")
+
+
+class Node:
+    """A minimal element: tag, raw attributes, parent and mixed children.
+
+    Children are ``Node`` objects or text strings (already unescaped).
+    Attributes are parsed from the raw tag text on first access.
+    """
+
+    __slots__ = ("_attrs", "_raw_attrs", "children", "parent", "tag")
+
+    def __init__(self, tag: str, raw_attrs: str = "", parent: Node | None = None) -> None:
+        """Initialize a node; attributes stay unparsed until first use."""
+        self.tag = tag
+        self.parent = parent
+        self.children: list[Node | str] = []
+        self._raw_attrs = raw_attrs
+        self._attrs: dict[str, str] | None = None
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        """Attribute dict (names lowercased; a repeated attribute keeps the last value)."""
+        if self._attrs is None:
+            attrs: dict[str, str] = {}
+            for m in _ATTR_RE.finditer(self._raw_attrs):
+                value = m.group(2) if m.group(2) is not None else m.group(3)
+                if value is None:
+                    value = m.group(4) or ""
+                attrs[m.group(1).lower()] = unescape(value)
+            self._attrs = attrs
+        return self._attrs
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        """Get an attribute value."""
+        return self.attrs.get(name, default)
+
+    def has_class(self, name: str) -> bool:
+        """Check whether ``name`` is one of the element's classes."""
+        if "class" not in self._raw_attrs:
+            return False
+        return name in self.attrs.get("class", "").split()
+
+    def iter(self) -> Iterator[Node]:
+        """Yield descendant elements in document order (excluding self)."""
+        stack = list(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, Node):
+                yield child
+                stack.extend(reversed(child.children))
+
+    def find(self, tag: str | None = None, class_: str | None = None) -> Node | None:
+        """First descendant matching ``tag`` and/or ``class_``."""
+        return next(self.find_all(tag, class_), None)
+
+    def find_all(self, tag: str | None = None, class_: str | None = None) -> Iterator[Node]:
+        """Descendants matching ``tag`` and/or ``class_``, in document order."""
+        for node in self.iter():
+            if (tag is None or node.tag == tag) and (class_ is None or node.has_class(class_)):
+                yield node
+
+    def strings(self) -> Iterator[str]:
+        """Yield descendant text strings in document order."""
+        stack = list(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, str):
+                yield child
+            else:
+                stack.extend(reversed(child.children))
+
+    def text(self) -> str:
+        """Equivalent of BeautifulSoup ``get_text(strip=True)``."""
+        return "".join(s for s in (s.strip() for s in self.strings()) if s)
+
+
+def parse_html(html: str) -> Node:
+    """Parse an HTML document or fragment into a minimal ``Node`` tree.
+
+    Args:
+        html: Raw HTML
+
+    Returns:
+        Root node (tag ``"[document]"``) whose children are top-level content
+    """
+    root = Node("[document]")
+    current = root
+    pos = 0
+    length = len(html)
+
+    while pos < length:
+        m = _TOKEN_RE.search(html, pos)
+        end = m.start() if m else length
+        if end > pos:
+            current.children.append(unescape(html[pos:end]))
+        if m is None:
+            break
+        pos = m.end()
+
+        tag = m.group(2)
+        if tag is None:
+            continue  # comment, doctype, processing instruction
+        tag = tag.lower()
+
+        if m.group(1):  # end tag: pop back to the nearest open element with this name
+            node = current
+            while node is not root and node.tag != tag:
+                node = node.parent
+            if node is not root:
+                current = node.parent
+            continue
+
+        raw_attrs = m.group(3)
+        node = Node(tag, raw_attrs, current)
+        current.children.append(node)
+        if tag in VOID_ELEMENTS or raw_attrs.endswith("/"):
+            continue
+        if tag in _RAW_TEXT_ELEMENTS:
+            close = html.lower().find(f"</{tag}", pos)
+            close = length if close == -1 else close
+            if close > pos:
+                node.children.append(html[pos:close])
+            pos = html.find(">", close) + 1 if close < length else length
+            continue
+        current = node
+
+    return root
+
+
+@dataclass
+class ScannedRow:
+    """A filled ``tr.calendar-event`` row from a day's schedule HTML."""
+
+    section: str
+    title: str
+
+
+@dataclass
+class ScannedDay:
+    """Platoon label and filled rows from a day's schedule HTML."""
+
+    platoon: str = ""
+    rows: list[ScannedRow] = field(default_factory=list)
+
+
+def scan_day_html(html: str) -> ScannedDay:
+    """Extract the platoon and filled schedule rows from a day's HTML.
+
+    Mirrors ``AladtecScheduleScraper``'s original BeautifulSoup walk: each
+    ``div.sch_entry`` updates the current section from its first
+    ``.calendar-event-header``; rows without a title, with the ``ust``
+    class, or containing an ``.open-shift`` element are skipped.
+
+    Args:
+        html: HTML content for one day
+
+    Returns:
+        ScannedDay with the platoon label and (section, title) rows
+    """
+    root = parse_html(html)
+    day = ScannedDay()
+
+    platoon_elem = root.find(class_="shift-label-display")
+    if platoon_elem:
+        day.platoon = platoon_elem.text()
+
+    current_section = ""
+    for div in root.find_all("div", class_="sch_entry"):
+        header = div.find(class_="calendar-event-header")
+        if header:
+            current_section = header.text()
+
+        for row in div.find_all("tr", class_="calendar-event"):
+            title = row.get("title", "")
+            if not title or row.has_class("ust") or row.find(class_="open-shift"):
+                continue
+            day.rows.append(ScannedRow(section=current_section, title=title))
+
+    return day
+
+
+def _strings_with_parent(root: Node) -> Iterator[tuple[Node, str]]:
+    """Yield (parent, text) for every text string in document order."""
+    stack: list[tuple[Node, Node | str]] = [(root, c) for c in reversed(root.children)]
+    while stack:
+        parent, child = stack.pop()
+        if isinstance(child, str):
+            yield parent, child
+        else:
+            stack.extend((child, c) for c in reversed(child.children))
+
+
+def _list_items(root: Node, header_text: str) -> list[str]:
+    """Items in the ``td`` following the cell whose text contains ``header_text``."""
+    header_parent = next(
+        (parent for parent, text in _strings_with_parent(root) if header_text in text), None
+    )
+    td = header_parent
+    while td is not None and td.tag != "td":
+        td = td.parent
+    if td is None or td.parent is None:
+        return []
+
+    siblings = td.parent.children
+    next_td = next(
+        (c for c in siblings[siblings.index(td) + 1 :] if isinstance(c, Node) and c.tag == "td"),
+        None,
+    )
+    if next_td is None:
+        return []
+
+    items = [text for li in next_td.find_all("li") if (text := li.text())]
+    if not items:
+        for cb in next_td.find_all("input"):
+            if cb.get("type") != "checkbox" or "checked" not in cb.attrs:
+                continue
+            cb_id = cb.get("id", "")
+            label = next(
+                (lbl for lbl in next_td.find_all("label") if lbl.get("for") == cb_id), None
+            )
+            if label:
+                items.append(label.text())
+    return items
+
+
+@dataclass
+class ScannedMemberDetail:
+    """Fields read from a member detail page."""
+
+    positions: list[str] = field(default_factory=list)
+    schedules: list[str] = field(default_factory=list)
+    username: str | None = None
+
+
+def scan_member_detail(html: str) -> ScannedMemberDetail:
+    """Extract positions, schedules and username from a member detail page.
+
+    Mirrors ``AladtecMemberScraper._extract_list_items`` (list items in
+    view mode, checked checkbox labels in edit mode) and
+    ``_extract_username``.
+
+    Args:
+        html: Member detail page HTML
+
+    Returns:
+        ScannedMemberDetail with the extracted fields
+    """
+    root = parse_html(html)
+    username_input = next(
+        (n for n in root.find_all("input") if n.get("name") == "usr_username"), None
+    )
+    username = (username_input.get("value", "") or "").strip() or None if username_input else None
+    return ScannedMemberDetail(
+        positions=_list_items(root, "Positions:"),
+        schedules=_list_items(root, "Schedules:"),
+        username=username,
+    )
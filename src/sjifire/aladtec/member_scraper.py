@@ -1,26 +1,56 @@
 """Aladtec web scraper for member data via CSV export."""
 
 import csv
+import hashlib
 import io
+import json
 import logging
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 
 from bs4 import BeautifulSoup
 from tenacity import retry, retry_if_result, stop_after_attempt, wait_exponential
 
-from sjifire.aladtec.client import AladtecClient
+from sjifire.aladtec.client import AladtecClient, get_aladtec_cache_dir
+from sjifire.aladtec.html_scan import scan_member_detail
 from sjifire.aladtec.models import Member
 from sjifire.core.config import get_domain
 from sjifire.core.normalize import format_phone, validate_email
+from sjifire.core.throttle import RateLimiter
 
 logger = logging.getLogger(__name__)
 
 # Delay between member detail page fetches (seconds).
 # Aladtec enforces a per-minute rate limit (~150 req/min). Without throttling,
 # fast runners can blast through 67+ requests in ~12s and trip the limit.
+# With concurrent workers this is enforced by a shared RateLimiter, so the
+# overall request rate is unchanged while page latency overlaps.
 ENRICHMENT_THROTTLE_DELAY = 0.75
 
+# Worker threads fetching and parsing member detail pages.
+ENRICHMENT_MAX_WORKERS = 4
+
+# File (under ALADTEC_CACHE_DIR) holding parsed detail pages between runs.
+DETAIL_CACHE_FILE = "member-details.json"
+
+
+@dataclass
+class MemberDetail:
+    """Fields parsed from a member detail page, cached per Aladtec user ID.
+
+    ``content_hash`` / ``etag`` / ``last_modified`` identify the page version
+    the fields were parsed from, so unchanged pages are never re-parsed.
+    """
+
+    positions: list[str] = field(default_factory=list)
+    schedules: list[str] = field(default_factory=list)
+    username: str | None = None
+    content_hash: str = ""
+    etag: str | None = None
+    last_modified: str | None = None
+
 
 def clean_title(title: str | None) -> str | None:
     """Clean up title field - handle newlines and duplicates.
@@ -46,14 +76,19 @@ def clean_title(title: str | None) -> str | None:
 class AladtecMemberScraper(AladtecClient):
     """Scraper for Aladtec member database using CSV export."""
 
-    def __init__(self, domain: str | None = None) -> None:
+    def __init__(self, domain: str | None = None, cache_dir: str | Path | None = None) -> None:
         """Initialize the scraper with credentials from environment.
 
         Args:
             domain: Email domain for identifying business emails (defaults to org config)
+            cache_dir: Directory for the member-detail cache (defaults to
+                ``ALADTEC_CACHE_DIR``; no caching when neither is set)
         """
         super().__init__(timeout=30.0)
         self.domain = domain or get_domain()
+        cache_root = Path(cache_dir) if cache_dir else get_aladtec_cache_dir()
+        self._detail_cache_path = cache_root / DETAIL_CACHE_FILE if cache_root else None
+        self._limiter = RateLimiter(ENRICHMENT_THROTTLE_DELAY)
 
     def get_members(
         self,
@@ -624,10 +659,98 @@ class AladtecMemberScraper(AladtecClient):
             return username_input.get("value", "").strip() or None
         return None
 
+    def _parse_member_detail(self, html: str) -> MemberDetail:
+        """Parse positions, schedules and username from a member detail page.
+
+        Uses the lightweight scanner in ``html_scan``, which matches
+        ``_extract_list_items`` / ``_extract_username`` without building a
+        BeautifulSoup tree.
+        """
+        scanned = scan_member_detail(html)
+        return MemberDetail(
+            positions=scanned.positions,
+            schedules=scanned.schedules,
+            username=scanned.username,
+        )
+
+    def _fetch_member_detail(
+        self, user_id: str, cached: MemberDetail | None
+    ) -> MemberDetail | None:
+        """Fetch and parse one member detail page (runs on a worker thread).
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` when a cached copy has
+        validators, and skips parsing when the body hash matches the cache.
+
+        Args:
+            user_id: Aladtec user ID
+            cached: Previously parsed detail for this user, if any
+
+        Returns:
+            MemberDetail, or None if the fetch failed (including after retries)
+        """
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        self._limiter.wait()
+        kwargs = {"headers": headers} if headers else {}
+        response = self._get_with_retry(
+            f"{self.base_url}/index.php",
+            params={
+                "action": "manage_members_view_member_information",
+                "target_user_id": user_id,
+            },
+            **kwargs,
+        )
+
+        if response.status_code == 304 and cached:
+            return cached
+        if response.status_code != 200:
+            logger.warning(
+                "Failed to fetch detail page for user %s: HTTP %s", user_id, response.status_code
+            )
+            return None
+
+        content_hash = hashlib.sha256(response.text.encode()).hexdigest()
+        if cached and cached.content_hash == content_hash:
+            return cached
+
+        detail = self._parse_member_detail(response.text)
+        detail.content_hash = content_hash
+        if self._detail_cache_path:
+            detail.etag = response.headers.get("ETag")
+            detail.last_modified = response.headers.get("Last-Modified")
+        return detail
+
+    def _load_detail_cache(self) -> dict[str, MemberDetail]:
+        """Load the per-user detail cache from disk (empty when disabled or unreadable)."""
+        if not self._detail_cache_path or not self._detail_cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self._detail_cache_path.read_text())
+            return {user_id: MemberDetail(**entry) for user_id, entry in data.items()}
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning("Ignoring unreadable member detail cache: %s", e)
+            return {}
+
+    def _save_detail_cache(self, cache: dict[str, MemberDetail]) -> None:
+        """Persist the per-user detail cache to disk (no-op when disabled)."""
+        if not self._detail_cache_path:
+            return
+        data = {user_id: asdict(detail) for user_id, detail in cache.items()}
+        self._detail_cache_path.write_text(json.dumps(data, indent=2, sort_keys=True))
+
     def enrich_member_details(self, members: list[Member]) -> list[Member]:
         """Enrich members with their full position and schedule lists.
 
-        Fetches position and schedule data from each member's detail page.
+        Fetches each member's detail page on a small thread pool, with a
+        shared rate limiter keeping the overall request rate under
+        Aladtec's limit. Parsing happens on the workers too. When a cache
+        directory is configured, pages unchanged since the previous run
+        (304 or identical body) reuse the previously parsed values.
+
         Raises RuntimeError if any detail page fetches fail, to prevent
         stale CSV-derived positions from being written to downstream systems.
 
@@ -645,50 +768,49 @@ class AladtecMemberScraper(AladtecClient):
 
         logger.info("Enriching %d members with position and schedule data", len(members))
 
-        # Get user ID mapping
+        # Get user ID mapping and match members by "Last, First" name
         user_map = self.get_user_id_map()
+        targets = [
+            (member, user_map[f"{member.last_name}, {member.first_name}"])
+            for member in members
+            if f"{member.last_name}, {member.first_name}" in user_map
+        ]
+
+        cache = self._load_detail_cache()
+        with ThreadPoolExecutor(max_workers=ENRICHMENT_MAX_WORKERS) as pool:
+            details = list(
+                pool.map(
+                    lambda target: self._fetch_member_detail(target[1], cache.get(target[1])),
+                    targets,
+                )
+            )
 
         failed_members: list[str] = []
-
-        # Match members to user IDs by name
-        fetched_count = 0
-        for member in members:
-            # Try "Last, First" format
-            name_key = f"{member.last_name}, {member.first_name}"
-            user_id = user_map.get(name_key)
-
-            if not user_id:
-                continue
-
-            # Throttle between detail page fetches to avoid rate limits
-            if fetched_count > 0 and ENRICHMENT_THROTTLE_DELAY > 0:
-                time.sleep(ENRICHMENT_THROTTLE_DELAY)
-            fetched_count += 1
-
-            # Fetch the detail page once and extract both positions and schedules
-            soup = self._get_member_detail_page(user_id)
-            if not soup:
+        reused = 0
+        for (member, user_id), detail in zip(targets, details, strict=True):
+            if detail is None:
                 failed_members.append(member.display_name)
                 continue
-
-            positions = self._extract_list_items(soup, "Positions:")
-            schedules = self._extract_list_items(soup, "Schedules:")
-            username = self._extract_username(soup)
+            if cache.get(user_id) is detail:
+                reused += 1
+            cache[user_id] = detail
 
             # Always set values (even if empty) to clear any incorrect initial value
-            member.positions = positions
-            member.schedules = schedules
-            if username:
-                member.username = username
+            member.positions = list(detail.positions)
+            member.schedules = list(detail.schedules)
+            if detail.username:
+                member.username = detail.username
 
-            if positions or schedules:
+            if detail.positions or detail.schedules:
                 logger.debug(
                     "%s: %d positions, %d schedules",
                     member.display_name,
-                    len(positions),
-                    len(schedules),
+                    len(detail.positions),
+                    len(detail.schedules),
                 )
 
+        self._save_detail_cache(cache)
+
         if failed_members:
             msg = (
                 f"Enrichment failed for {len(failed_members)} member(s): "
@@ -698,7 +820,11 @@ class AladtecMemberScraper(AladtecClient):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        logger.info("Member detail enrichment complete")
+        logger.info(
+            "Member detail enrichment complete (%d fetched, %d unchanged since last run)",
+            len(details),
+            reused,
+        )
         return members
 
     # Backwards compatibility alias
@@ -0,0 +1,204 @@
+"""Persistent, content-addressed cache of scraped Aladtec schedule days.
+
+Each day's raw AJAX HTML is stored once under its SHA-256 (``days/ab/abcd….html``)
+and ``index.json`` maps dates to hashes. The index also records when each
+month was last fetched so that months which have fully ended can be served
+from disk instead of re-scraped: past days never change.
+
+A ``ScheduleDiff`` describes which days changed between the cached and the
+freshly fetched HTML so downstream syncs can skip work when nothing moved.
+"""
+
+import hashlib
+import json
+import logging
+from calendar import monthrange
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the Aladtec cache dir holding schedule data
+SCHEDULE_CACHE_DIR = "schedule"
+
+# Days older than this are dropped from the index (and their blobs pruned)
+CACHE_RETENTION_DAYS = 400
+
+
+def _month_key(month_start: date) -> str:
+    return month_start.strftime("%Y-%m")
+
+
+def _month_end(month_start: date) -> date:
+    return month_start.replace(day=monthrange(month_start.year, month_start.month)[1])
+
+
+@dataclass
+class ScheduleDiff:
+    """Days whose schedule HTML changed since the previous scrape.
+
+    Dates are ``YYYY-MM-DD`` strings. ``names`` lists everyone scheduled on
+    an added, changed or removed day, before or after the change, so
+    per-person consumers can limit work to the people affected.
+    """
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    names: list[str] = field(default_factory=list)
+
+    @property
+    def changed_dates(self) -> list[str]:
+        """All added, changed and removed dates, sorted."""
+        return sorted({*self.added, *self.changed, *self.removed})
+
+    @property
+    def has_changes(self) -> bool:
+        """Check whether any day was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+    def __str__(self) -> str:
+        """Return a one-line summary."""
+        return (
+            f"{len(self.added)} added, {len(self.changed)} changed, "
+            f"{len(self.removed)} removed, {self.unchanged} unchanged"
+        )
+
+
+def save_schedule_diff(diff: ScheduleDiff, path: str | Path) -> None:
+    """Write a schedule diff report as JSON.
+
+    Args:
+        diff: Diff to save
+        path: Path to write JSON file
+    """
+    Path(path).write_text(json.dumps(asdict(diff), indent=2))
+    logger.info("Saved schedule diff (%s) to %s", diff, path)
+
+
+def load_schedule_diff(path: str | Path) -> ScheduleDiff:
+    """Load a schedule diff report written by ``save_schedule_diff``.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        ScheduleDiff
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If file is invalid JSON
+    """
+    return ScheduleDiff(**json.loads(Path(path).read_text()))
+
+
+class ScheduleCache:
+    """On-disk store of per-day schedule HTML, keyed by date and content hash."""
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Open (or create) the cache under ``cache_dir``.
+
+        Args:
+            cache_dir: Aladtec cache directory; data lives in its ``schedule/`` subdirectory
+        """
+        self.root = Path(cache_dir) / SCHEDULE_CACHE_DIR
+        self._index_path = self.root / "index.json"
+        self._days: dict[str, str] = {}  # YYYY-MM-DD -> sha256
+        self._months: dict[str, str] = {}  # YYYY-MM -> date last fetched (ISO)
+        self._load()
+
+    def _load(self) -> None:
+        if not self._index_path.exists():
+            return
+        try:
+            data = json.loads(self._index_path.read_text())
+            self._days = dict(data.get("days", {}))
+            self._months = dict(data.get("months", {}))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable schedule cache index: %s", e)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "days" / digest[:2] / f"{digest}.html"
+
+    def hash_for(self, date_str: str) -> str | None:
+        """Get the content hash recorded for a day, if cached."""
+        return self._days.get(date_str)
+
+    def get(self, date_str: str) -> str | None:
+        """Get a day's cached HTML (None if not cached or the blob is missing)."""
+        digest = self._days.get(date_str)
+        if digest is None:
+            return None
+        try:
+            return self._blob_path(digest).read_text()
+        except OSError:
+            return None
+
+    def put(self, date_str: str, html: str) -> bool:
+        """Store a day's HTML.
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            html: Raw day HTML from the AJAX endpoint
+
+        Returns:
+            True if the content differs from what was cached for that day
+        """
+        digest = hashlib.sha256(html.encode()).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            blob.write_text(html)
+        previous = self._days.get(date_str)
+        self._days[date_str] = digest
+        return previous != digest
+
+    def delete(self, date_str: str) -> None:
+        """Forget a day (its blob is pruned on ``save`` if unreferenced)."""
+        self._days.pop(date_str, None)
+
+    def month_days(self, month_start: date) -> dict[str, str]:
+        """Cached HTML for every cached day in a month, keyed by date string."""
+        prefix = _month_key(month_start)
+        days: dict[str, str] = {}
+        for date_str in sorted(d for d in self._days if d.startswith(prefix)):
+            html = self.get(date_str)
+            if html is not None:
+                days[date_str] = html
+        return days
+
+    def mark_month_fetched(self, month_start: date, fetched_on: date) -> None:
+        """Record that a month was scraped in full on ``fetched_on``."""
+        self._months[_month_key(month_start)] = fetched_on.isoformat()
+
+    def is_month_final(self, month_start: date) -> bool:
+        """Check whether a month was fetched in full after it ended.
+
+        Such a month can no longer change and is served from the cache.
+        """
+        fetched_on = self._months.get(_month_key(month_start))
+        if not fetched_on or date.fromisoformat(fetched_on) <= _month_end(month_start):
+            return False
+        return len(self.month_days(month_start)) > 0
+
+    def save(self, today: date | None = None) -> None:
+        """Write the index, dropping expired days and unreferenced blobs.
+
+        Args:
+            today: Reference date for retention (defaults to today)
+        """
+        cutoff = ((today or date.today()) - timedelta(days=CACHE_RETENTION_DAYS)).isoformat()
+        self._days = {d: h for d, h in self._days.items() if d >= cutoff}
+        self._months = {m: f for m, f in self._months.items() if m >= cutoff[:7]}
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._index_path.write_text(
+            json.dumps({"days": self._days, "months": self._months}, indent=2, sort_keys=True)
+        )
+
+        referenced = set(self._days.values())
+        for blob in (self.root / "days").glob("*/*.html"):
+            if blob.stem not in referenced:
+                blob.unlink(missing_ok=True)
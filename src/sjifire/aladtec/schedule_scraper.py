@@ -7,14 +7,21 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
-from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from sjifire.aladtec.client import AladtecClient
+from sjifire.aladtec.client import AladtecClient, get_aladtec_cache_dir
+from sjifire.aladtec.html_scan import scan_day_html
+from sjifire.aladtec.schedule_cache import ScheduleCache, ScheduleDiff
 from sjifire.core.schedule import is_filled_entry
 
 logger = logging.getLogger(__name__)
 
+# Pieces of a calendar-event row title:
+# "Name<br/><p>Section / Position<br/>Date Start - Date End</p>"
+_TITLE_NAME_RE = re.compile(r"^([^<]+)")
+_TITLE_POSITION_RE = re.compile(r"/ ([^<]+)<br/>")
+_TITLE_TIMES_RE = re.compile(r"(\d{2}:\d{2})\s*-\s*[^>]*?(\d{2}:\d{2})")
+
 
 def _parse_time(time_str: str) -> datetime:
     """Parse a time string (HH:MM) into a datetime.time object.
@@ -103,11 +110,29 @@ class DaySchedule:
 
 
 class AladtecScheduleScraper(AladtecClient):
-    """Scraper for Aladtec schedule data using AJAX endpoints."""
+    """Scraper for Aladtec schedule data using AJAX endpoints.
+
+    When a cache directory is configured, day HTML is kept in a
+    ``ScheduleCache``: months that have ended are served from disk, the
+    current month is only fetched from today onward, and ``last_diff``
+    reports which days changed since the previous committed scrape.
+    Scrapes only update the cache in memory; callers ``commit_cache()``
+    once the schedule has actually been applied, so a dry run or a failed
+    sync leaves the previous snapshot (and its pending changes) on disk.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the scraper with credentials from environment."""
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        """Initialize the scraper with credentials from environment.
+
+        Args:
+            cache_dir: Directory for the schedule cache (defaults to
+                ``ALADTEC_CACHE_DIR``; caching is off when neither is set)
+        """
         super().__init__(timeout=60.0)
+        cache_root = Path(cache_dir) if cache_dir else get_aladtec_cache_dir()
+        self._cache = ScheduleCache(cache_root) if cache_root else None
+        self.last_diff: ScheduleDiff | None = None
+        self._scraped_on: date | None = None
 
     @retry(
         stop=stop_after_attempt(3),
@@ -173,7 +198,9 @@ class AladtecScheduleScraper(AladtecClient):
 
         return {}
 
-    def fetch_month_schedule(self, month_start: date) -> dict[str, str]:
+    def fetch_month_schedule(
+        self, month_start: date, start_from: date | None = None
+    ) -> dict[str, str]:
         """Fetch a full month's schedule via chained AJAX requests.
 
         The AJAX endpoint returns a variable-sized window of data (typically 10-30 days).
@@ -182,6 +209,7 @@ class AladtecScheduleScraper(AladtecClient):
 
         Args:
             month_start: First day of the month to fetch (day is ignored, uses 1st)
+            start_from: Day within the month to start the chain at (default: the 1st)
 
         Returns:
             Dict mapping date strings (YYYY-MM-DD) to HTML content for each day
@@ -198,7 +226,7 @@ class AladtecScheduleScraper(AladtecClient):
         month_end = first_of_month.replace(day=last_day)
 
         all_data: dict[str, str] = {}
-        current_start = first_of_month
+        current_start = max(first_of_month, start_from) if start_from else first_of_month
         max_fetches = 10  # Safety limit to prevent infinite loops
         fetch_count = 0
 
@@ -239,6 +267,10 @@ class AladtecScheduleScraper(AladtecClient):
     def parse_day_html(self, date_str: str, html: str) -> DaySchedule:
         """Parse a single day's HTML to extract schedule entries.
 
+        Uses the lightweight scanner in ``html_scan`` rather than a full
+        BeautifulSoup tree; filled rows are ``tr.calendar-event`` elements
+        whose ``title`` attribute carries name, position and times.
+
         Args:
             date_str: Date in YYYY-MM-DD format
             html: HTML content for the day
@@ -247,69 +279,112 @@ class AladtecScheduleScraper(AladtecClient):
             DaySchedule with all entries for that day
         """
         day_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        soup = BeautifulSoup(html, "html.parser")
+        scanned = scan_day_html(html)
+        platoon = scanned.platoon
         entries: list[ScheduleEntry] = []
 
-        # Get platoon from the shift-label
-        platoon = ""
-        platoon_elem = soup.find(class_="shift-label-display")
-        if platoon_elem:
-            platoon = platoon_elem.get_text(strip=True)
-
-        # Find all schedule sections
-        current_section = ""
-
-        for div in soup.find_all("div", class_="sch_entry"):
-            # Get section header
-            header = div.find(class_="calendar-event-header")
-            if header:
-                current_section = header.get_text(strip=True)
-
-            # Find all scheduled entries (rows with title containing schedule info)
-            for row in div.find_all("tr", class_="calendar-event"):
-                title = row.get("title", "")
-                if not title:
-                    continue
-
-                # Skip unfilled/open slots - they have "ust" class or "open-shift" in child elements
-                row_classes = row.get("class", [])
-                if "ust" in row_classes:
-                    continue
-                # Also check for open-shift class in name/time cells
-                if row.find(class_="open-shift"):
-                    continue
-
-                # Parse the title format:
-                # "Name<br/><p>Section / Position<br/>Date Start - Date End</p>"
-
-                name_match = re.match(r"^([^<]+)", title)
-                if not name_match:
-                    continue
-                name = name_match.group(1).strip()
-
-                # Get position from the title
-                pos_match = re.search(r"/ ([^<]+)<br/>", title)
-                position = pos_match.group(1).strip() if pos_match else ""
-
-                # Get times - handles both "19:00 - 20:00" and "20:00 - Tue, Feb 3 10:00"
-                time_match = re.search(r"(\d{2}:\d{2})\s*-\s*[^>]*?(\d{2}:\d{2})", title)
-                start_time = time_match.group(1) if time_match else "18:00"
-                end_time = time_match.group(2) if time_match else "18:00"
-
-                entries.append(
-                    ScheduleEntry(
-                        date=day_date,
-                        section=current_section,
-                        position=position,
-                        name=name,
-                        start_time=start_time,
-                        end_time=end_time,
-                        platoon=platoon,
-                    )
+        for row in scanned.rows:
+            # Parse the title format:
+            # "Name<br/><p>Section / Position<br/>Date Start - Date End</p>"
+            title = row.title
+
+            name_match = _TITLE_NAME_RE.match(title)
+            if not name_match:
+                continue
+            name = name_match.group(1).strip()
+
+            # Get position from the title
+            pos_match = _TITLE_POSITION_RE.search(title)
+            position = pos_match.group(1).strip() if pos_match else ""
+
+            # Get times - handles both "19:00 - 20:00" and "20:00 - Tue, Feb 3 10:00"
+            time_match = _TITLE_TIMES_RE.search(title)
+            start_time = time_match.group(1) if time_match else "18:00"
+            end_time = time_match.group(2) if time_match else "18:00"
+
+            entries.append(
+                ScheduleEntry(
+                    date=day_date,
+                    section=row.section,
+                    position=position,
+                    name=name,
+                    start_time=start_time,
+                    end_time=end_time,
+                    platoon=platoon,
                 )
+            )
 
         return DaySchedule(date=day_date, platoon=platoon, entries=entries)
 
+    def _names_on_day(self, date_str: str, html: str | None) -> set[str]:
+        """Names of everyone with a filled entry in a day's HTML."""
+        if not html:
+            return set()
+        day = self.parse_day_html(date_str, html)
+        return {e.name for e in day.entries if is_filled_entry(e.name)}
+
+    def _fetch_month_cached(
+        self, cache: ScheduleCache, month_start: date, today: date, diff: ScheduleDiff
+    ) -> dict[str, str]:
+        """Fetch a month, reusing cached past days, and record changes in ``diff``.
+
+        For the current month, days before today come from the cache when all
+        of them are present and the AJAX chain starts at today; otherwise the
+        whole month is fetched. Fetched days are compared with the cache by
+        content hash. An empty fetch leaves the cache untouched.
+
+        Args:
+            cache: Schedule cache to read from and update
+            month_start: First day of the month
+            today: Reference date splitting past from current/future days
+            diff: Diff report to extend
+
+        Returns:
+            Dict mapping date strings (YYYY-MM-DD) to HTML content
+        """
+        window_start = month_start
+        cached_past: dict[str, str] = {}
+        if (month_start.year, month_start.month) == (today.year, today.month) and today.day > 1:
+            today_str = today.isoformat()
+            cached_past = {
+                d: html for d, html in cache.month_days(month_start).items() if d < today_str
+            }
+            if len(cached_past) == today.day - 1:
+                window_start = today
+            else:
+                cached_past = {}
+
+        fetched = self.fetch_month_schedule(
+            month_start, start_from=window_start if window_start != month_start else None
+        )
+        if not fetched:
+            logger.warning("No data fetched for %s; keeping cached days", month_start)
+            return {**cache.month_days(month_start), **cached_past}
+
+        window_str = window_start.isoformat()
+        names: set[str] = set(diff.names)
+        for date_str in sorted(fetched):
+            if date_str < window_str:
+                continue
+            previous = cache.get(date_str)
+            if not cache.put(date_str, fetched[date_str]):
+                diff.unchanged += 1
+                continue
+            (diff.changed if previous is not None else diff.added).append(date_str)
+            names |= self._names_on_day(date_str, previous)
+            names |= self._names_on_day(date_str, fetched[date_str])
+
+        for date_str in cache.month_days(month_start):
+            if date_str >= window_str and date_str not in fetched:
+                names |= self._names_on_day(date_str, cache.get(date_str))
+                diff.removed.append(date_str)
+                cache.delete(date_str)
+
+        diff.names = sorted(names)
+        if window_start == month_start:
+            cache.mark_month_fetched(month_start, today)
+        return {**cached_past, **fetched}
+
     def get_schedule_range(
         self,
         start_date: date,
@@ -317,6 +392,11 @@ class AladtecScheduleScraper(AladtecClient):
     ) -> list[DaySchedule]:
         """Fetch schedule for a date range.
 
+        With a cache configured, ended months are read from disk, the
+        current month is fetched from today onward, and ``last_diff`` is
+        set to the days that changed since the previous committed scrape.
+        The updated cache is not written until ``commit_cache()``.
+
         Args:
             start_date: First date to include
             end_date: Last date to include
@@ -329,14 +409,23 @@ class AladtecScheduleScraper(AladtecClient):
 
         schedules: list[DaySchedule] = []
         all_day_data: dict[str, str] = {}
+        today = date.today()
+        diff = ScheduleDiff()
 
         # Fetch by month
         current = start_date.replace(day=1)
         end_month = end_date.replace(day=1)
 
         while current <= end_month:
-            logger.info("Fetching %s...", current.strftime("%B %Y"))
-            month_data = self.fetch_month_schedule(current)
+            if self._cache is None:
+                logger.info("Fetching %s...", current.strftime("%B %Y"))
+                month_data = self.fetch_month_schedule(current)
+            elif self._cache.is_month_final(current):
+                logger.info("Using cached %s", current.strftime("%B %Y"))
+                month_data = self._cache.month_days(current)
+            else:
+                logger.info("Fetching %s...", current.strftime("%B %Y"))
+                month_data = self._fetch_month_cached(self._cache, current, today, diff)
 
             if month_data:
                 all_day_data.update(month_data)
@@ -347,6 +436,11 @@ class AladtecScheduleScraper(AladtecClient):
             else:
                 current = current.replace(month=current.month + 1)
 
+        if self._cache is not None:
+            self.last_diff = diff
+            self._scraped_on = today
+            logger.info("Schedule changes since last scrape: %s", diff)
+
         # Parse all days within our date range
         for date_str, html in sorted(all_day_data.items()):
             try:
@@ -362,6 +456,15 @@ class AladtecScheduleScraper(AladtecClient):
         logger.info("Fetched %d days with schedule data", len(schedules))
         return schedules
 
+    def commit_cache(self) -> None:
+        """Write the schedule cache so the next scrape diffs against this one.
+
+        Call only after the scraped schedule was applied (not on a dry run
+        or a failed sync). No-op when caching is off.
+        """
+        if self._cache is not None:
+            self._cache.save(self._scraped_on)
+
     def get_schedule_months_ahead(self, months: int = 6) -> list[DaySchedule]:
         """Fetch schedule from today through N months ahead.
 
@@ -1,9 +1,11 @@
 """Calendar sync logic for M365 shared calendar."""
 
 import asyncio
+import json
 import logging
-import re
 from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import NamedTuple
 
 import msal
 from azure.core.credentials import AccessToken, TokenCredential
@@ -17,13 +19,20 @@ from msgraph.generated.models.body_type import BodyType
 from msgraph.generated.models.date_time_time_zone import DateTimeTimeZone
 from msgraph.generated.models.event import Event
 from msgraph.generated.models.item_body import ItemBody
+from msgraph.generated.models.single_value_legacy_extended_property import (
+    SingleValueLegacyExtendedProperty,
+)
 from msgraph.generated.users.item.calendar_view.calendar_view_request_builder import (
     CalendarViewRequestBuilder,
 )
+from msgraph.generated.users.item.calendar_view.delta.delta_request_builder import (
+    DeltaRequestBuilder,
+)
 from msgraph.generated.users.users_request_builder import UsersRequestBuilder
 
 from sjifire.aladtec.schedule_scraper import DaySchedule, ScheduleEntry
 from sjifire.calendar.models import AllDayDutyEvent, CrewMember, SyncResult
+from sjifire.calendar.normalize import body_hash
 from sjifire.core.config import (
     get_graph_credentials,
     get_service_account_credentials,
@@ -31,11 +40,38 @@ from sjifire.core.config import (
     get_timezone,
     get_timezone_name,
 )
-from sjifire.core.msgraph_client import create_graph_client
+from sjifire.core.msgraph_client import GraphBatchClient, GraphRequest, create_graph_client
 from sjifire.core.schedule import detect_shift_change_hour, should_exclude_section
 
 logger = logging.getLogger(__name__)
 
+# Extended property holding the hash of the normalized body we last wrote,
+# so unchanged events are detected without downloading bodies
+DUTY_BODY_HASH_PROPERTY_ID = (
+    "String {878252b7-1489-412e-a18a-5f7ce5f3639f} Name SjifireDutyBodyHash"
+)
+
+# calendarView page size; further pages are followed via @odata.nextLink
+EVENTS_PAGE_SIZE = 500
+
+# File (under ALADTEC_CACHE_DIR) holding calendarView delta links and the
+# event index they maintain
+DELTA_STATE_FILE = "duty_calendar_delta.json"
+
+# Delta windows kept per state file (e.g. the 1-month and 4-month runs)
+MAX_DELTA_WINDOWS = 4
+
+
+class ExistingDutyEvent(NamedTuple):
+    """An On Duty event already on the calendar.
+
+    ``body_hash`` is ``normalize.body_hash`` of its body, or None when unknown
+    (events written before hashes were stored).
+    """
+
+    event_id: str
+    body_hash: str | None
+
 
 class ROPCCredential(TokenCredential):
     """ROPC credential for confidential clients using msal.
@@ -130,50 +166,19 @@ def _detect_shift_change_hour_from_schedules(schedules: list[DaySchedule]) -> in
 
 # Timezone loaded from organization.json via get_timezone() / get_timezone_name().
 
-# Concurrency limit for parallel API calls (avoid rate limiting)
-MAX_CONCURRENT_REQUESTS = 10
-
-
-def _extract_crew_data_json(html: str) -> str | None:
-    """Extract the CREW_DATA JSON string from an HTML body, or None if absent."""
-    from sjifire.calendar.models import CREW_DATA_MARKER
-
-    match = re.search(rf"<!--\s*{re.escape(CREW_DATA_MARKER)}(.*?)-->", html, re.DOTALL)
-    if not match:
-        return None
-    return match.group(1).strip()
-
-
-def normalize_html_for_comparison(html: str) -> str:
-    """Normalize event HTML for comparison.
-
-    If the HTML contains a CREW_DATA JSON comment, returns just the JSON
-    string — this is the canonical data and ignores cosmetic HTML changes.
-    Falls back to plain-text extraction for legacy events without JSON.
-    """
-    json_str = _extract_crew_data_json(html)
-    if json_str is not None:
-        return json_str
-
-    # Legacy fallback: extract plain text and normalize whitespace
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.get_text(separator=" ")
-
-    normalized = re.sub(r"\s+", " ", text)
-    return normalized.strip()
-
 
 class DutyCalendarSync:
     """Sync on-duty schedule to M365 shared calendar or group calendar."""
 
-    def __init__(self, mailbox: str | None = None) -> None:
+    def __init__(self, mailbox: str | None = None, state_path: str | Path | None = None) -> None:
         """Initialize with Graph API credentials.
 
         Args:
             mailbox: Email address of the shared mailbox or M365 group calendar
                      (default: service account email from organization config)
+            state_path: JSON file for calendarView delta state; when set, user
+                     mailboxes are read with delta queries so later runs only
+                     receive changed events
 
         Note:
             For M365 group calendars, delegated auth (username/password) is required
@@ -194,6 +199,9 @@ class DutyCalendarSync:
         self._group_id: str | None = None
         self._is_group: bool | None = None  # None = not yet determined
         self._delegated_client: GraphServiceClient | None = None
+        self._delegated_credential: ROPCCredential | None = None
+        self._batch_client: GraphBatchClient | None = None
+        self.state_path = Path(state_path) if state_path else None
 
     async def _detect_if_group(self) -> bool:
         """Detect if the mailbox is an M365 group and cache the group ID.
@@ -257,6 +265,7 @@ class DutyCalendarSync:
                 password=password,
             )
             self._delegated_client = create_graph_client(delegated_credential)
+            self._delegated_credential = delegated_credential
             logger.debug("Delegated auth client initialized with ROPC")
         except Exception as e:
             logger.error("Failed to set up delegated auth: %s", e)
@@ -275,6 +284,23 @@ class DutyCalendarSync:
             return self._delegated_client
         return self.client
 
+    def _get_batch_client(self) -> GraphBatchClient:
+        """Get the ``$batch`` client, authenticated like ``_get_client_for_calendar``."""
+        if self._batch_client is None:
+            credential = self._app_credential
+            if self._is_group and self._delegated_credential:
+                credential = self._delegated_credential
+            self._batch_client = GraphBatchClient(credential)
+        return self._batch_client
+
+    def _events_url(self, event_id: str | None = None) -> str:
+        """Relative Graph URL of the calendar's events (or one event)."""
+        if self._is_group and self._group_id:
+            url = f"/groups/{self._group_id}/calendar/events"
+        else:
+            url = f"/users/{self.mailbox}/events"
+        return f"{url}/{event_id}" if event_id else url
+
     async def _load_user_contacts(self) -> dict[str, dict]:
         """Load all user contact info from Entra ID.
 
@@ -493,32 +519,53 @@ class DutyCalendarSync:
         self,
         start_date: date,
         end_date: date,
-    ) -> dict[date, tuple[str, str]]:
-        """Fetch existing On Duty events from the calendar.
+    ) -> dict[date, ExistingDutyEvent]:
+        """Fetch existing On Duty events from the calendar (without bodies).
+
+        User mailboxes with a ``state_path`` are read with a calendarView
+        delta query; otherwise the calendarView is listed with the stored
+        body hash expanded.
 
         Returns:
-            Dict mapping event date to (event_id, body_content) tuple
+            Dict mapping event date to ExistingDutyEvent
         """
-        # Extend end date to capture full range
+        is_group = await self._detect_if_group()
+        if self.state_path and not is_group:
+            events = await self._get_events_via_delta(start_date, end_date)
+            if events is not None:
+                return events
+        return await self._get_events_via_calendar_view(start_date, end_date)
+
+    @staticmethod
+    def _window(start_date: date, end_date: date) -> tuple[str, str]:
+        """Window bounds: local midnight of ``start_date`` to the midnight after ``end_date``."""
         start_dt = datetime.combine(start_date, datetime.min.time(), tzinfo=get_timezone())
         end_dt = datetime.combine(
             end_date + timedelta(days=1), datetime.min.time(), tzinfo=get_timezone()
         )
+        return start_dt.isoformat(), end_dt.isoformat()
 
-        # Check if this is a group calendar
-        is_group = await self._detect_if_group()
+    async def _get_events_via_calendar_view(
+        self, start_date: date, end_date: date
+    ) -> dict[date, ExistingDutyEvent]:
+        """List On Duty events in the range with their stored body hash."""
+        start_str, end_str = self._window(start_date, end_date)
+        select = ["id", "subject", "start", "end", "isAllDay"]
+        expand = [f"singleValueExtendedProperties($filter=id eq '{DUTY_BODY_HASH_PROPERTY_ID}')"]
 
         try:
             client = self._get_client_for_calendar()
-            if is_group and self._group_id:
+            if self._is_group and self._group_id:
                 # Use group calendar endpoint
+                builder = client.groups.by_group_id(self._group_id).calendar_view
                 query_params = (
                     GroupCalendarViewRequestBuilder.CalendarViewRequestBuilderGetQueryParameters(
-                        start_date_time=start_dt.isoformat(),
-                        end_date_time=end_dt.isoformat(),
+                        start_date_time=start_str,
+                        end_date_time=end_str,
                         filter="startswith(subject, 'On Duty')",
-                        top=500,
-                        select=["id", "subject", "start", "end", "isAllDay", "body"],
+                        top=EVENTS_PAGE_SIZE,
+                        select=select,
+                        expand=expand,
                     )
                 )
                 # fmt: off
@@ -527,18 +574,17 @@ class DutyCalendarSync:
                 )
                 # fmt: on
                 config = request_config_class(query_parameters=query_params)
-                result = await client.groups.by_group_id(self._group_id).calendar_view.get(
-                    request_configuration=config
-                )
             else:
                 # Use user calendar endpoint
+                builder = client.users.by_user_id(self.mailbox).calendar_view
                 query_params = (
                     CalendarViewRequestBuilder.CalendarViewRequestBuilderGetQueryParameters(
-                        start_date_time=start_dt.isoformat(),
-                        end_date_time=end_dt.isoformat(),
+                        start_date_time=start_str,
+                        end_date_time=end_str,
                         filter="startswith(subject, 'On Duty')",
-                        top=500,
-                        select=["id", "subject", "start", "end", "isAllDay", "body"],
+                        top=EVENTS_PAGE_SIZE,
+                        select=select,
+                        expand=expand,
                     )
                 )
                 config = (
@@ -546,27 +592,129 @@ class DutyCalendarSync:
                         query_parameters=query_params,
                     )
                 )
-                result = await client.users.by_user_id(self.mailbox).calendar_view.get(
-                    request_configuration=config
-                )
+            result = await builder.get(request_configuration=config)
+
+            events_by_date: dict[date, ExistingDutyEvent] = {}
+            while result:
+                for item in result.value or []:
+                    event_date = self._parse_graph_date(item.start)
+                    if event_date and item.id:
+                        stored_hash = next(
+                            (
+                                p.value
+                                for p in item.single_value_extended_properties or []
+                                if p.value
+                            ),
+                            None,
+                        )
+                        events_by_date[event_date] = ExistingDutyEvent(item.id, stored_hash)
+                next_link = result.odata_next_link
+                result = await builder.with_url(next_link).get() if next_link else None
         except Exception as e:
             logger.error("Failed to fetch existing events: %s", e)
             return {}
 
-        events_by_date: dict[date, tuple[str, str]] = {}
+        logger.debug("Found %d existing On Duty events", len(events_by_date))
+        return events_by_date
 
-        if result and result.value:
-            for item in result.value:
-                # Parse start date
-                event_date = self._parse_graph_date(item.start)
-                if event_date and item.id:
-                    # Extract body content (default to empty string if not present)
-                    body_content = ""
-                    if item.body and item.body.content:
-                        body_content = item.body.content
-                    events_by_date[event_date] = (item.id, body_content)
+    def _load_delta_state(self) -> dict[str, dict]:
+        """Delta windows keyed by ``mailbox|start|end`` (empty if unreadable)."""
+        if self.state_path is None or not self.state_path.exists():
+            return {}
+        try:
+            return dict(json.loads(self.state_path.read_text()).get("windows", {}))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable calendar delta state: %s", e)
+            return {}
 
-        logger.debug("Found %d existing On Duty events", len(events_by_date))
+    def _save_delta_state(self, windows: dict[str, dict]) -> None:
+        """Write delta windows, keeping the most recently used ones."""
+        if self.state_path is None:
+            return
+        recent = sorted(windows.items(), key=lambda kv: kv[1].get("used", ""), reverse=True)
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(
+            json.dumps({"windows": dict(recent[:MAX_DELTA_WINDOWS])}, indent=2, sort_keys=True)
+        )
+
+    def _apply_delta_items(self, index: dict[str, dict], items: list[Event]) -> None:
+        """Fold delta items into the ``event_id -> {date, hash}`` index.
+
+        Delta queries can't filter, so non-On Duty events are dropped here.
+        Removed events arrive as ``@removed`` stubs with only an id.
+        """
+        for item in items:
+            if not item.id:
+                continue
+            removed = (item.additional_data or {}).get("@removed")
+            event_date = self._parse_graph_date(item.start)
+            if removed or not (item.subject or "").startswith("On Duty") or not event_date:
+                index.pop(item.id, None)
+                continue
+            content = item.body.content if item.body and item.body.content else ""
+            index[item.id] = {"date": event_date.isoformat(), "hash": body_hash(content)}
+
+    async def _get_events_via_delta(
+        self, start_date: date, end_date: date
+    ) -> dict[date, ExistingDutyEvent] | None:
+        """Read the range with a calendarView delta query.
+
+        The first run for a window downloads every event once; later runs
+        replay the stored delta link and receive only changes. Hashes are
+        computed from the bodies in delta pages, so comparisons never need
+        a separate body download.
+
+        Returns:
+            Events by date, or None if the delta query failed (the caller
+            falls back to a calendarView listing)
+        """
+        windows = self._load_delta_state()
+        key = f"{self.mailbox.lower()}|{start_date}|{end_date}"
+        window = windows.get(key) or {"delta_link": None, "events": {}}
+        index: dict[str, dict] = dict(window["events"])
+        builder = self.client.users.by_user_id(self.mailbox).calendar_view.delta
+
+        try:
+            if window["delta_link"]:
+                result = await builder.with_url(window["delta_link"]).get()
+            else:
+                start_str, end_str = self._window(start_date, end_date)
+                config = DeltaRequestBuilder.DeltaRequestBuilderGetRequestConfiguration(
+                    query_parameters=DeltaRequestBuilder.DeltaRequestBuilderGetQueryParameters(
+                        start_date_time=start_str,
+                        end_date_time=end_str,
+                    )
+                )
+                result = await builder.get(request_configuration=config)
+
+            delta_link = None
+            while result:
+                self._apply_delta_items(index, result.value or [])
+                if result.odata_next_link:
+                    result = await builder.with_url(result.odata_next_link).get()
+                else:
+                    delta_link = result.odata_delta_link
+                    result = None
+        except Exception as e:
+            # An expired or invalid delta link needs a fresh initial sync
+            logger.warning("Calendar delta query failed; listing events instead: %s", e)
+            windows.pop(key, None)
+            self._save_delta_state(windows)
+            return None
+
+        windows[key] = {
+            "delta_link": delta_link,
+            "events": index,
+            "used": datetime.now().isoformat(),
+        }
+        self._save_delta_state(windows)
+
+        events_by_date: dict[date, ExistingDutyEvent] = {}
+        for event_id, info in index.items():
+            event_date = date.fromisoformat(info["date"])
+            if start_date <= event_date <= end_date:
+                events_by_date[event_date] = ExistingDutyEvent(event_id, info["hash"])
+        logger.debug("Found %d existing On Duty events (delta)", len(events_by_date))
         return events_by_date
 
     def _parse_graph_date(self, dt: DateTimeTimeZone | None) -> date | None:
@@ -602,6 +750,11 @@ class DutyCalendarSync:
             ),
             is_all_day=True,
             is_reminder_on=False,
+            single_value_extended_properties=[
+                SingleValueLegacyExtendedProperty(
+                    id=DUTY_BODY_HASH_PROPERTY_ID, value=body_hash(event.body_html)
+                )
+            ],
         )
 
     async def create_event(self, event: AllDayDutyEvent) -> str | None:
@@ -668,42 +821,11 @@ class DutyCalendarSync:
             logger.error("Failed to delete event %s: %s", event_id, e)
             return False
 
-    async def _create_event_with_semaphore(
-        self,
-        event: AllDayDutyEvent,
-        semaphore: asyncio.Semaphore,
-    ) -> tuple[date, str | None]:
-        """Create event with concurrency limit."""
-        async with semaphore:
-            event_id = await self.create_event(event)
-            return event.event_date, event_id
-
-    async def _update_event_with_semaphore(
-        self,
-        event: AllDayDutyEvent,
-        semaphore: asyncio.Semaphore,
-    ) -> tuple[date, bool]:
-        """Update event with concurrency limit."""
-        async with semaphore:
-            success = await self.update_event(event)
-            return event.event_date, success
-
-    async def _delete_event_with_semaphore(
-        self,
-        event_date: date,
-        event_id: str,
-        semaphore: asyncio.Semaphore,
-    ) -> tuple[date, bool]:
-        """Delete event with concurrency limit."""
-        async with semaphore:
-            success = await self.delete_event(event_id)
-            return event_date, success
-
     async def create_events_batch(
         self,
         events: list[AllDayDutyEvent],
     ) -> tuple[int, list[str]]:
-        """Create multiple events concurrently.
+        """Create multiple events via Graph JSON batching.
 
         Returns:
             Tuple of (success_count, list of error messages)
@@ -711,18 +833,20 @@ class DutyCalendarSync:
         if not events:
             return 0, []
 
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-        tasks = [self._create_event_with_semaphore(e, semaphore) for e in events]
-
-        results = await asyncio.gather(*tasks)
+        requests = [
+            GraphRequest("POST", self._events_url(), self._build_duty_event(e)) for e in events
+        ]
+        responses = await self._get_batch_client().execute(requests)
 
         success_count = 0
         errors = []
-        for event_date, event_id in results:
-            if event_id:
+        for event, response in zip(events, responses, strict=True):
+            if response.ok and response.body.get("id"):
+                event.event_id = response.body["id"]
                 success_count += 1
             else:
-                errors.append(f"Failed to create {event_date}")
+                logger.error("Failed to create event %s: %s", event.event_date, response.error)
+                errors.append(f"Failed to create {event.event_date}")
 
         return success_count, errors
 
@@ -730,7 +854,7 @@ class DutyCalendarSync:
         self,
         events: list[AllDayDutyEvent],
     ) -> tuple[int, list[str]]:
-        """Update multiple events concurrently.
+        """Update multiple events via Graph JSON batching.
 
         Returns:
             Tuple of (success_count, list of error messages)
@@ -738,18 +862,28 @@ class DutyCalendarSync:
         if not events:
             return 0, []
 
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-        tasks = [self._update_event_with_semaphore(e, semaphore) for e in events]
-
-        results = await asyncio.gather(*tasks)
-
         success_count = 0
         errors = []
-        for event_date, success in results:
-            if success:
+        batchable = []
+        for event in events:
+            if event.event_id:
+                batchable.append(event)
+            else:
+                logger.error("Cannot update event without event_id")
+                errors.append(f"Failed to update {event.event_date}")
+
+        requests = [
+            GraphRequest("PATCH", self._events_url(e.event_id), self._build_duty_event(e))
+            for e in batchable
+        ]
+        responses = await self._get_batch_client().execute(requests)
+
+        for event, response in zip(batchable, responses, strict=True):
+            if response.ok:
                 success_count += 1
             else:
-                errors.append(f"Failed to update {event_date}")
+                logger.error("Failed to update event %s: %s", event.event_id, response.error)
+                errors.append(f"Failed to update {event.event_date}")
 
         return success_count, errors
 
@@ -757,7 +891,7 @@ class DutyCalendarSync:
         self,
         events_to_delete: dict[date, str],
     ) -> tuple[int, list[str]]:
-        """Delete multiple events concurrently.
+        """Delete multiple events via Graph JSON batching.
 
         Args:
             events_to_delete: Dict mapping event_date to event_id
@@ -768,20 +902,18 @@ class DutyCalendarSync:
         if not events_to_delete:
             return 0, []
 
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-        tasks = [
-            self._delete_event_with_semaphore(event_date, event_id, semaphore)
-            for event_date, event_id in events_to_delete.items()
-        ]
-
-        results = await asyncio.gather(*tasks)
+        items = list(events_to_delete.items())
+        requests = [GraphRequest("DELETE", self._events_url(event_id)) for _, event_id in items]
+        responses = await self._get_batch_client().execute(requests)
 
         success_count = 0
         errors = []
-        for event_date, success in results:
-            if success:
+        for (event_date, event_id), response in zip(items, responses, strict=True):
+            # 404: already gone, which is what we wanted
+            if response.ok or response.status == 404:
                 success_count += 1
             else:
+                logger.error("Failed to delete event %s: %s", event_id, response.error)
                 errors.append(f"Failed to delete {event_date}")
 
         return success_count, errors
@@ -797,7 +929,7 @@ class DutyCalendarSync:
         """Sync all-day events to calendar, updating/creating/deleting as needed."""
         result = SyncResult()
 
-        # Get existing events (date -> (event_id, body) mapping)
+        # Get existing events (date -> (event_id, body hash) mapping)
         existing_by_date = await self.get_existing_events(start_date, end_date)
 
         # Separate events into create vs update lists
@@ -810,19 +942,16 @@ class DutyCalendarSync:
             existing = existing_by_date.get(event_date)
 
             if existing:
-                existing_id, existing_body = existing
-                new_event.event_id = existing_id
+                new_event.event_id = existing.event_id
 
                 if force:
                     # Force update regardless of content
                     events_to_update.append(new_event)
                     continue
 
-                # Compare normalized HTML to detect actual changes
-                new_body_normalized = normalize_html_for_comparison(new_event.body_html)
-                existing_body_normalized = normalize_html_for_comparison(existing_body)
-
-                if new_body_normalized == existing_body_normalized:
+                # Compare normalized-body hashes; events without a known hash
+                # are rewritten once so the hash gets stored
+                if existing.body_hash == body_hash(new_event.body_html):
                     # No changes needed
                     unchanged_count += 1
                 else:
@@ -923,9 +1052,8 @@ class DutyCalendarSync:
 
             logger.info("Found %d On Duty events to delete", len(existing_by_date))
 
-            # Extract just the event IDs from tuples (id, body)
             events_to_delete = {
-                event_date: event_id for event_date, (event_id, _) in existing_by_date.items()
+                event_date: existing.event_id for event_date, existing in existing_by_date.items()
             }
 
             if dry_run:
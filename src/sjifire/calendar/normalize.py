@@ -0,0 +1,67 @@
+"""Normalization of calendar event bodies for change detection.
+
+Both calendar syncs compare the body they would write with the one already
+on the calendar. Exchange rewrites bodies (plain text becomes HTML, markup
+is reformatted), so bodies are compared after normalizing:
+
+- Duty events embed their crew as ``CREW_DATA`` JSON (see
+  ``AllDayDutyEvent._crew_data_json``); when present, that JSON string is
+  the whole comparison key and cosmetic HTML changes are ignored. It is
+  written by ``json.dumps`` in a fixed key order, so it is compared as-is
+  rather than re-parsed.
+- Otherwise the visible text is used: comments, ``<script>`` and
+  ``<style>`` blocks are dropped, tags become spaces, entities are
+  unescaped and whitespace is collapsed.
+
+``body_hash`` turns the normalized form into a short, storable key so
+events can be compared without downloading bodies.
+"""
+
+import hashlib
+import re
+from html import unescape
+
+from sjifire.calendar.models import CREW_DATA_MARKER
+
+__all__ = ["CREW_DATA_RE", "body_hash", "extract_crew_data", "normalize_body"]
+
+# The CREW_DATA JSON inside its HTML comment
+CREW_DATA_RE = re.compile(rf"<!--\s*{re.escape(CREW_DATA_MARKER)}(.*?)-->", re.DOTALL)
+
+# Everything that is not visible text: comments, script/style blocks, tags
+_NON_TEXT_RE = re.compile(
+    r"<(?:!--.*?-->|(script|style)\b[^>]*>.*?</\1\s*>|[^>]*>)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def extract_crew_data(html: str) -> str | None:
+    """Extract the raw CREW_DATA JSON string from a body, or None if absent."""
+    if CREW_DATA_MARKER not in html:
+        return None
+    match = CREW_DATA_RE.search(html)
+    return match.group(1).strip() if match else None
+
+
+def normalize_body(body: str) -> str:
+    """Normalize an event body (HTML or plain text) for comparison.
+
+    Args:
+        body: Event body as written or as returned by Graph
+
+    Returns:
+        The CREW_DATA JSON when embedded, else the collapsed visible text
+    """
+    crew_data = extract_crew_data(body)
+    if crew_data is not None:
+        return crew_data
+
+    text = _NON_TEXT_RE.sub(" ", body) if "<" in body else body
+    if "&" in text:
+        text = unescape(text)
+    return " ".join(text.split())
+
+
+def body_hash(body: str) -> str:
+    """SHA-256 hex digest of ``normalize_body(body)``."""
+    return hashlib.sha256(normalize_body(body).encode()).hexdigest()
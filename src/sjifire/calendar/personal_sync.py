@@ -2,26 +2,39 @@
 
 import asyncio
 import logging
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from msgraph.generated.models.body_type import BodyType
 from msgraph.generated.models.date_time_time_zone import DateTimeTimeZone
 from msgraph.generated.models.event import Event
 from msgraph.generated.models.item_body import ItemBody
+from msgraph.generated.models.single_value_legacy_extended_property import (
+    SingleValueLegacyExtendedProperty,
+)
+from msgraph.generated.users.item.calendars.item.calendar_view.calendar_view_request_builder import (  # noqa: E501
+    CalendarViewRequestBuilder,
+)
 from msgraph.generated.users.item.calendars.item.events.events_request_builder import (
     EventsRequestBuilder,
 )
 
 from sjifire.aladtec.schedule_scraper import ScheduleEntry
 from sjifire.calendar.models import get_aladtec_url
+from sjifire.calendar.normalize import body_hash, normalize_body
 from sjifire.core.config import (
     get_org_config,
     get_timezone,
     get_timezone_name,
 )
-from sjifire.core.msgraph_client import get_graph_client
+from sjifire.core.msgraph_client import (
+    GraphBatchClient,
+    GraphRequest,
+    get_graph_client,
+    get_graph_credential,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +45,30 @@ logger = logging.getLogger(__name__)
 # to avoid MailboxConcurrency throttling (ApplicationThrottled 429s).
 MAX_CONCURRENT_REQUESTS = 3
 
+# calendarView page size; further pages are followed via @odata.nextLink
+EVENTS_PAGE_SIZE = 100
+
+# Extended property recording the hash of the body we last wrote to an
+# event, so unchanged events are detected without downloading bodies.
+BODY_HASH_PROPERTY_ID = "String {878252b7-1489-412e-a18a-5f7ce5f3639f} Name SjifireBodyHash"
+
+# Set by any helper that observes a 429 during the current sync_user call
+# and reset at its top. A ContextVar so concurrent sync_user tasks each see
+# their own flag.
+_throttled: ContextVar[bool] = ContextVar("personal_sync_throttled", default=False)
+
 
 @dataclass
 class ExistingEvent:
-    """Info about an existing calendar event."""
+    """Info about an existing calendar event.
+
+    ``body`` is None when it was not downloaded; ``body_hash`` is the hash
+    stored on the event when we last wrote it (None for older events).
+    """
 
     event_id: str
-    body: str
+    body: str | None = None
+    body_hash: str | None = None
 
 
 def _is_throttled(exc: BaseException) -> bool:
@@ -63,8 +93,11 @@ class PersonalSyncResult:
     events_deleted: int = 0
     errors: list[str] = field(default_factory=list)
     throttled: bool = False  # Set when a 429 was seen during this sync
+    skipped: bool = False  # Schedule slice unchanged since last sync; no Graph calls
 
     def __str__(self) -> str:  # noqa: D105
+        if self.skipped:
+            return f"{self.user}: unchanged (skipped)"
         parts = []
         if self.events_created:
             parts.append(f"{self.events_created} created")
@@ -82,6 +115,13 @@ def make_event_subject(entry: ScheduleEntry) -> str:
     return f"{entry.section} - {entry.position}"
 
 
+def event_key(entry: ScheduleEntry) -> str:
+    """Key matching an entry to its calendar event (``date|subject|start|end``)."""
+    start_time = entry.start_datetime.strftime("%H:%M")
+    end_time = entry.end_datetime.strftime("%H:%M")
+    return f"{entry.date}|{make_event_subject(entry)}|{start_time}|{end_time}"
+
+
 def make_event_body(entry: ScheduleEntry) -> str:
     """Create event body from schedule entry."""
     aladtec_url = get_aladtec_url()
@@ -93,19 +133,9 @@ This event is automatically imported from Aladtec. Any changes will be overwritt
 Modify your schedule: {aladtec_url}"""
 
 
-def normalize_body_for_comparison(body: str) -> str:
-    """Normalize body text for comparison.
-
-    Microsoft Exchange converts plain text to HTML, so we need to
-    extract text content and normalize whitespace for comparison.
-    """
-    import re
-
-    # Remove HTML tags
-    text = re.sub(r"<[^>]+>", "", body)
-    # Normalize whitespace (collapse multiple spaces/newlines)
-    text = " ".join(text.split())
-    return text
+def schedule_fingerprint(entries: list[ScheduleEntry]) -> dict[str, str]:
+    """Map each entry's event key to the hash of the body written for it."""
+    return {event_key(entry): body_hash(make_event_body(entry)) for entry in entries}
 
 
 def _parse_graph_datetime(dt_str: str, tz_name: str | None) -> datetime:
@@ -155,9 +185,22 @@ class PersonalCalendarSync:
         self.client = get_graph_client()
         self._calendar_cache: dict[str, str] = {}  # user_email -> calendar_id
         self._uses_primary_calendar: set[str] = set()  # users using primary calendar
-        # Set to True by any helper that observes a 429 during the current
-        # sync_user call. Reset at the top of sync_user.
-        self._throttled_this_run: bool = False
+        self._batch_client: GraphBatchClient | None = None
+
+    @property
+    def _throttled_this_run(self) -> bool:
+        return _throttled.get()
+
+    @_throttled_this_run.setter
+    def _throttled_this_run(self, value: bool) -> None:
+        _throttled.set(value)
+
+    @property
+    def batch_client(self) -> GraphBatchClient:
+        """Graph ``$batch`` client for event writes (created on first use)."""
+        if self._batch_client is None:
+            self._batch_client = GraphBatchClient(get_graph_credential())
+        return self._batch_client
 
     async def ensure_aladtec_category(self, user_email: str) -> bool:
         """Ensure the Aladtec category exists in user's master category list.
@@ -231,79 +274,100 @@ class PersonalCalendarSync:
         calendar_id: str,
         start_date: date,
         end_date: date,
+        include_body: bool = False,
     ) -> dict[str, ExistingEvent]:
         """Get existing Aladtec events in date range.
 
+        Lists the calendar's ``calendarView`` for the window (following
+        pagination), with each event's stored body hash. Bodies are only
+        downloaded when ``include_body`` is set; ``sync_user`` fetches the
+        few it needs with ``fetch_event_bodies``.
+
         When using primary calendar, only returns events with the Aladtec category.
         When using dedicated Aladtec calendar, returns all events.
 
         Returns:
-            Dict mapping event_key to ExistingEvent (id and body)
+            Dict mapping event_key to ExistingEvent
         """
-        # Note: We filter by date after fetching, not by calendarView endpoint
-        # because we need to match events by key for sync logic
-
         # If using primary calendar, filter by Aladtec category
         uses_primary = user_email.lower() in self._uses_primary_calendar
         filter_query = None
         if uses_primary:
             filter_query = f"categories/any(c:c eq '{get_org_config().calendar_category}')"
 
+        start_dt = datetime.combine(start_date, datetime.min.time(), tzinfo=get_timezone())
+        end_dt = datetime.combine(
+            end_date + timedelta(days=1), datetime.min.time(), tzinfo=get_timezone()
+        )
+        select = ["id", "subject", "start", "end", "categories"]
+        if include_body:
+            select.append("body")
+
         try:
-            # Get events from this calendar
-            query_params = EventsRequestBuilder.EventsRequestBuilderGetQueryParameters(
-                top=500,
-                select=["id", "subject", "start", "end", "body", "categories"],
+            query_params = CalendarViewRequestBuilder.CalendarViewRequestBuilderGetQueryParameters(
+                start_date_time=start_dt.isoformat(),
+                end_date_time=end_dt.isoformat(),
+                top=EVENTS_PAGE_SIZE,
+                select=select,
                 filter=filter_query,
+                expand=[f"singleValueExtendedProperties($filter=id eq '{BODY_HASH_PROPERTY_ID}')"],
             )
-            config = EventsRequestBuilder.EventsRequestBuilderGetRequestConfiguration(
+            config = CalendarViewRequestBuilder.CalendarViewRequestBuilderGetRequestConfiguration(
                 query_parameters=query_params,
             )
 
-            result = await (
+            calendar_view = (
                 self.client.users.by_user_id(user_email)
                 .calendars.by_calendar_id(calendar_id)
-                .events.get(request_configuration=config)
+                .calendar_view
             )
+            result = await calendar_view.get(request_configuration=config)
+            events = list(result.value or []) if result else []
+            while result and result.odata_next_link:
+                result = await calendar_view.with_url(result.odata_next_link).get()
+                if result and result.value:
+                    events.extend(result.value)
 
             events_by_key: dict[str, ExistingEvent] = {}
 
-            if result and result.value:
-                for event in result.value:
-                    if not event.start or not event.start.date_time or not event.id:
-                        continue
+            for event in events:
+                if not event.start or not event.start.date_time or not event.id:
+                    continue
+
+                # Parse event datetime and convert to local timezone
+                try:
+                    event_dt = _parse_graph_datetime(event.start.date_time, event.start.time_zone)
+                    event_date = event_dt.date()
+                except ValueError:
+                    continue
 
-                    # Parse event datetime and convert to local timezone
+                # calendarView also returns events that only overlap the window
+                if not start_date <= event_date <= end_date:
+                    continue
+
+                # Parse end time
+                end_time_str = "00:00"
+                if event.end and event.end.date_time:
                     try:
-                        event_dt = _parse_graph_datetime(
-                            event.start.date_time, event.start.time_zone
-                        )
-                        event_date = event_dt.date()
+                        end_dt = _parse_graph_datetime(event.end.date_time, event.end.time_zone)
+                        end_time_str = end_dt.strftime("%H:%M")
                     except ValueError:
-                        continue
-
-                    # Only include events in our date range
-                    if start_date <= event_date <= end_date:
-                        # Parse end time
-                        end_time_str = "00:00"
-                        if event.end and event.end.date_time:
-                            try:
-                                end_dt = _parse_graph_datetime(
-                                    event.end.date_time, event.end.time_zone
-                                )
-                                end_time_str = end_dt.strftime("%H:%M")
-                            except ValueError:
-                                pass
-
-                        # Create key from subject, start time, and end time
-                        # Format: "date|subject|start_time|end_time"
-                        start_time = event_dt.strftime("%H:%M")
-                        key = f"{event_date}|{event.subject}|{start_time}|{end_time_str}"
-                        # Extract body content
-                        body = ""
-                        if event.body and event.body.content:
-                            body = event.body.content
-                        events_by_key[key] = ExistingEvent(event_id=event.id, body=body)
+                        pass
+
+                # Create key from subject, start time, and end time
+                # Format: "date|subject|start_time|end_time"
+                start_time = event_dt.strftime("%H:%M")
+                key = f"{event_date}|{event.subject}|{start_time}|{end_time_str}"
+                body = None
+                if include_body:
+                    body = event.body.content if event.body and event.body.content else ""
+                stored_hash = next(
+                    (p.value for p in event.single_value_extended_properties or [] if p.value),
+                    None,
+                )
+                events_by_key[key] = ExistingEvent(
+                    event_id=event.id, body=body, body_hash=stored_hash
+                )
 
             return events_by_key
 
@@ -315,17 +379,46 @@ class PersonalCalendarSync:
                 logger.error("Failed to get existing events for %s: %s", user_email, e)
             return {}
 
+    async def fetch_event_bodies(
+        self,
+        user_email: str,
+        calendar_id: str,
+        event_ids: list[str],
+    ) -> dict[str, str]:
+        """Download the bodies of specific events (batched GETs).
+
+        Returns:
+            Dict mapping event ID to body content; events that could not be
+            read are omitted
+        """
+        if not event_ids:
+            return {}
+        requests = [
+            GraphRequest("GET", f"{self._events_url(user_email, calendar_id, eid)}?$select=body")
+            for eid in event_ids
+        ]
+        responses = await self.batch_client.execute(requests)
+
+        bodies: dict[str, str] = {}
+        for event_id, response in zip(event_ids, responses, strict=True):
+            if response.ok:
+                bodies[event_id] = (response.body.get("body") or {}).get("content") or ""
+            elif response.throttled:
+                self._throttled_this_run = True
+        return bodies
+
     def _build_personal_event(self, user_email: str, entry: ScheduleEntry) -> Event:
         """Build a Graph Event object from a schedule entry."""
         categories = None
         if user_email.lower() in self._uses_primary_calendar:
             categories = [get_org_config().calendar_category]
 
+        body = make_event_body(entry)
         return Event(
             subject=make_event_subject(entry),
             body=ItemBody(
                 content_type=BodyType.Text,
-                content=make_event_body(entry),
+                content=body,
             ),
             start=DateTimeTimeZone(
                 date_time=entry.start_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
@@ -337,8 +430,17 @@ class PersonalCalendarSync:
             ),
             is_reminder_on=False,
             categories=categories,
+            single_value_extended_properties=[
+                SingleValueLegacyExtendedProperty(id=BODY_HASH_PROPERTY_ID, value=body_hash(body))
+            ],
         )
 
+    @staticmethod
+    def _events_url(user_email: str, calendar_id: str, event_id: str | None = None) -> str:
+        """Relative Graph URL of a calendar's events (or one event)."""
+        url = f"/users/{user_email}/calendars/{calendar_id}/events"
+        return f"{url}/{event_id}" if event_id else url
+
     async def create_event(
         self,
         user_email: str,
@@ -519,9 +621,13 @@ class PersonalCalendarSync:
         end_date: date,
         dry_run: bool = False,
         force: bool = False,
+        previous: dict[str, str] | None = None,
     ) -> PersonalSyncResult:
         """Sync schedule entries to a user's personal calendar.
 
+        Events are still created or deleted by comparing keys with the
+        calendar, so ``previous`` never hides a missing or stray event.
+
         Args:
             user_email: User's email address
             entries: Schedule entries for this user
@@ -529,6 +635,9 @@ class PersonalCalendarSync:
             end_date: End of sync range
             dry_run: If True, preview without making changes
             force: If True, update all events even if body hasn't changed
+            previous: Fingerprint from the last sync (see ``schedule_fingerprint``);
+                when given, only events whose entry changed since then are
+                updated and no bodies are compared
 
         Returns:
             PersonalSyncResult with counts and errors
@@ -558,10 +667,7 @@ class PersonalCalendarSync:
         entries_by_key: dict[str, ScheduleEntry] = {}
 
         for entry in entries:
-            subject = make_event_subject(entry)
-            start_time = entry.start_datetime.strftime("%H:%M")
-            end_time = entry.end_datetime.strftime("%H:%M")
-            key = f"{entry.date}|{subject}|{start_time}|{end_time}"
+            key = event_key(entry)
             new_event_keys.add(key)
             entries_by_key[key] = entry
 
@@ -573,21 +679,44 @@ class PersonalCalendarSync:
 
         # Check which existing events need body updates
         to_update: list[tuple[str, str]] = []  # (key, event_id)
-        for key in maybe_update:
-            if force:
-                # Force update all matching events
-                to_update.append((key, existing[key].event_id))
-            else:
-                # Only update if body has changed
-                entry = entries_by_key[key]
-                new_body = make_event_body(entry)
-                existing_body = existing[key].body
+        to_tag: list[str] = []  # unchanged events missing the stored body hash
+        if force:
+            # Force update all matching events
+            to_update = [(key, existing[key].event_id) for key in maybe_update]
+        elif previous is not None:
+            # Change-only: bodies are rewritten only where the entry changed
+            # since the last sync, so unchanged events need no comparison
+            for key in maybe_update:
+                if previous.get(key) != body_hash(make_event_body(entries_by_key[key])):
+                    to_update.append((key, existing[key].event_id))
+        else:
+            needs_body = []
+            for key in maybe_update:
+                event = existing[key]
+                if event.body_hash is None:
+                    needs_body.append(key)
+                elif event.body_hash != body_hash(make_event_body(entries_by_key[key])):
+                    logger.debug("Body hash mismatch for %s", key)
+                    to_update.append((key, event.event_id))
+
+            # Older events have no stored hash: compare their bodies instead
+            bodies = await self.fetch_event_bodies(
+                user_email,
+                calendar_id,
+                [existing[k].event_id for k in needs_body if existing[k].body is None],
+            )
+            for key in needs_body:
+                event = existing[key]
+                existing_body = event.body if event.body is not None else bodies.get(event.event_id)
                 # Normalize both for comparison (Exchange converts plain text to HTML)
-                if normalize_body_for_comparison(new_body) != normalize_body_for_comparison(
+                new_body = make_event_body(entries_by_key[key])
+                if existing_body is None or normalize_body(new_body) != normalize_body(
                     existing_body
                 ):
                     logger.debug("Body mismatch for %s", key)
-                    to_update.append((key, existing[key].event_id))
+                    to_update.append((key, event.event_id))
+                else:
+                    to_tag.append(key)
 
         if dry_run:
             result.events_created = len(to_create)
@@ -602,46 +731,61 @@ class PersonalCalendarSync:
             for key in to_delete:
                 logger.info("Would delete: %s", key)
         else:
-            # Create new events
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-
-            async def create_with_semaphore(entry: ScheduleEntry) -> bool:
-                async with semaphore:
-                    return await self.create_event(user_email, calendar_id, entry)
-
-            if to_create:
-                create_tasks = [create_with_semaphore(entries_by_key[key]) for key in to_create]
-                create_results = await asyncio.gather(*create_tasks)
-                result.events_created = sum(1 for r in create_results if r)
-                result.errors.extend(["Failed to create event" for r in create_results if not r])
-
-            # Update existing events with changed bodies
-            async def update_with_semaphore(key: str, event_id: str) -> bool:
-                async with semaphore:
-                    return await self.update_event(
-                        user_email, calendar_id, event_id, entries_by_key[key]
+            # Send creates, updates and deletes together as Graph $batch calls
+            operations: list[tuple[str, GraphRequest]] = []
+            for key in to_create:
+                event = self._build_personal_event(user_email, entries_by_key[key])
+                operations.append(
+                    (
+                        "create",
+                        GraphRequest("POST", self._events_url(user_email, calendar_id), event),
                     )
+                )
+            for key, event_id in to_update:
+                event = self._build_personal_event(user_email, entries_by_key[key])
+                url = self._events_url(user_email, calendar_id, event_id)
+                operations.append(("update", GraphRequest("PATCH", url, event)))
+            for key in to_delete:
+                url = self._events_url(user_email, calendar_id, existing[key].event_id)
+                operations.append(("delete", GraphRequest("DELETE", url)))
+            for key in to_tag:
+                url = self._events_url(user_email, calendar_id, existing[key].event_id)
+                new_hash = body_hash(make_event_body(entries_by_key[key]))
+                tag = {
+                    "singleValueExtendedProperties": [
+                        {"id": BODY_HASH_PROPERTY_ID, "value": new_hash}
+                    ]
+                }
+                operations.append(("tag", GraphRequest("PATCH", url, tag)))
+
+            responses = []
+            if operations:
+                responses = await self.batch_client.execute([r for _, r in operations])
+            succeeded = {"create": 0, "update": 0, "delete": 0, "tag": 0}
+            for (operation, _), response in zip(operations, responses, strict=True):
+                if response.ok:
+                    succeeded[operation] += 1
+                    continue
+                if operation == "tag":
+                    # Best effort: the body is compared again next run
+                    logger.debug("Could not store body hash for %s", user_email)
+                    continue
+                if response.throttled:
+                    self._throttled_this_run = True
+                    logger.warning("Throttled on %s for %s", operation, user_email)
+                else:
+                    logger.error(
+                        "Failed to %s event for %s: %s", operation, user_email, response.error
+                    )
+                result.errors.append(f"Failed to {operation} event")
 
-            if to_update:
-                update_tasks = [update_with_semaphore(key, eid) for key, eid in to_update]
-                update_results = await asyncio.gather(*update_tasks)
-                result.events_updated = sum(1 for r in update_results if r)
-                result.errors.extend(["Failed to update event" for r in update_results if not r])
-
-            # Delete old events
-            async def delete_with_semaphore(event_id: str) -> bool:
-                async with semaphore:
-                    return await self.delete_event(user_email, calendar_id, event_id)
-
-            if to_delete:
-                delete_tasks = [delete_with_semaphore(existing[key].event_id) for key in to_delete]
-                delete_results = await asyncio.gather(*delete_tasks)
-                result.events_deleted = sum(1 for r in delete_results if r)
-                result.errors.extend(["Failed to delete event" for r in delete_results if not r])
+            result.events_created = succeeded["create"]
+            result.events_updated = succeeded["update"]
+            result.events_deleted = succeeded["delete"]
 
         # Propagate throttle signal to the caller. Set here (in addition to
-        # the early-return path above) so per-event 429s from parallel
-        # create/update/delete bursts still flag the user for retry.
+        # the early-return path above) so batch items still throttled after
+        # their retries flag the user for retry.
         if self._throttled_this_run:
             result.throttled = True
         return result
@@ -0,0 +1,112 @@
+"""Persisted fingerprints of what was last synced to each personal calendar.
+
+For every user the state maps each synced event key (``date|subject|start|end``)
+to the hash of the body written for it, plus the months that were synced
+in full. A run whose schedule slice for a user matches the stored one can
+skip that user without any Graph calls; otherwise only keys that were
+added, removed or whose body changed need writing.
+"""
+
+import json
+import logging
+from datetime import date, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# File (under ALADTEC_CACHE_DIR) holding the per-user fingerprints
+SYNC_STATE_FILE = "personal_sync_state.json"
+
+# Entries and months older than this are dropped on save
+STATE_RETENTION_DAYS = 62
+
+
+def _months(start_date: date, end_date: date) -> list[str]:
+    """``YYYY-MM`` keys for every month touched by the range."""
+    months = []
+    current = start_date.replace(day=1)
+    while current <= end_date:
+        months.append(current.strftime("%Y-%m"))
+        current = (current + timedelta(days=32)).replace(day=1)
+    return months
+
+
+def _in_range(key: str, start_date: date, end_date: date) -> bool:
+    return start_date.isoformat() <= key[:10] <= end_date.isoformat()
+
+
+class PersonalSyncState:
+    """On-disk fingerprints of the entries last synced for each user."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or start) the state file.
+
+        Args:
+            path: JSON file holding the state
+        """
+        self.path = Path(path)
+        self._users: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                self._users = dict(json.loads(self.path.read_text()).get("users", {}))
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable personal sync state: %s", e)
+
+    def get(self, user_email: str, start_date: date, end_date: date) -> dict[str, str] | None:
+        """Get the stored fingerprint of a user's events in a date range.
+
+        Args:
+            user_email: User's email address
+            start_date: Start of sync range
+            end_date: End of sync range
+
+        Returns:
+            Event key -> body hash, or None if any month of the range was
+            never synced for this user (a full comparison is needed)
+        """
+        user = self._users.get(user_email.lower())
+        if user is None or not set(_months(start_date, end_date)) <= set(user["months"]):
+            return None
+        return {k: v for k, v in user["entries"].items() if _in_range(k, start_date, end_date)}
+
+    def record(
+        self, user_email: str, start_date: date, end_date: date, fingerprint: dict[str, str]
+    ) -> None:
+        """Replace a user's stored entries in a range after a successful sync.
+
+        Args:
+            user_email: User's email address
+            start_date: Start of sync range (the whole month must have been synced)
+            end_date: End of sync range
+            fingerprint: Event key -> body hash now on the calendar
+        """
+        user = self._users.setdefault(user_email.lower(), {"months": [], "entries": {}})
+        entries = {
+            k: v for k, v in user["entries"].items() if not _in_range(k, start_date, end_date)
+        }
+        entries.update(fingerprint)
+        user["entries"] = entries
+        user["months"] = sorted({*user["months"], *_months(start_date, end_date)})
+
+    def users_with_entries(self, start_date: date, end_date: date) -> set[str]:
+        """Users with stored events in a date range."""
+        return {
+            email
+            for email, user in self._users.items()
+            if any(_in_range(k, start_date, end_date) for k in user["entries"])
+        }
+
+    def save(self, today: date | None = None) -> None:
+        """Write the state, dropping expired entries and months.
+
+        Args:
+            today: Reference date for retention (defaults to today)
+        """
+        cutoff = ((today or date.today()) - timedelta(days=STATE_RETENTION_DAYS)).isoformat()
+        for user in self._users.values():
+            user["entries"] = {k: v for k, v in user["entries"].items() if k[:10] >= cutoff}
+            user["months"] = [m for m in user["months"] if m >= cutoff[:7]]
+        self._users = {e: u for e, u in self._users.items() if u["months"]}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"users": self._users}, indent=2, sort_keys=True))
@@ -2,25 +2,53 @@
 
 All GraphServiceClient instances should be created through this module
 to ensure consistent retry middleware (429/503/504 with exponential backoff).
+
+``GraphBatchClient`` sends many independent write operations through the
+JSON ``$batch`` endpoint (up to 20 per HTTP call), retrying only the items
+that were throttled, honoring each item's ``Retry-After``.
+``GraphBatchQueue`` lets many concurrent tasks each submit a single
+operation and coalesces them into those ``$batch`` calls.
 """
 
-from azure.core.credentials import TokenCredential
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from azure.core.credentials import AccessToken, TokenCredential
 from azure.identity import ClientSecretCredential
+from kiota_abstractions.serialization import Parsable
 from kiota_authentication_azure.azure_identity_authentication_provider import (
     AzureIdentityAuthenticationProvider,
 )
 from kiota_http.middleware.options.retry_handler_option import RetryHandlerOption
+from kiota_serialization_json.json_serialization_writer import JsonSerializationWriter
 from msgraph import GraphServiceClient
 from msgraph.graph_request_adapter import GraphRequestAdapter
 from msgraph_core import GraphClientFactory
 
 from sjifire.core.config import get_graph_credentials
 
+logger = logging.getLogger(__name__)
+
 # Retry config for Graph API rate limiting (429) and transient errors (503/504).
 # Kiota's RetryHandler uses exponential backoff with jitter and respects Retry-After headers.
 GRAPH_MAX_RETRIES = 8
 GRAPH_RETRY_DELAY = 5.0  # initial delay in seconds
 
+GRAPH_API_URL = "https://graph.microsoft.com/v1.0"
+GRAPH_SCOPE = "https://graph.microsoft.com/.default"
+
+# JSON batching: Graph accepts at most 20 requests per $batch call
+GRAPH_BATCH_SIZE = 20
+GRAPH_BATCH_MAX_RETRIES = 5
+GRAPH_BATCH_MAX_RETRY_AFTER = 60.0  # cap on a single Retry-After wait (seconds)
+RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+
 
 def _create_retry_options() -> dict:
     """Build middleware options dict with retry configuration."""
@@ -53,6 +81,16 @@ def create_graph_client(credential: TokenCredential) -> GraphServiceClient:
     return GraphServiceClient(request_adapter=adapter)
 
 
+def get_graph_credential() -> ClientSecretCredential:
+    """Create the app-only (client credentials) credential from environment variables."""
+    tenant_id, client_id, client_secret = get_graph_credentials()
+    return ClientSecretCredential(
+        tenant_id=tenant_id,
+        client_id=client_id,
+        client_secret=client_secret,
+    )
+
+
 def get_graph_client() -> GraphServiceClient:
     """Create and return an authenticated MS Graph client.
 
@@ -63,12 +101,252 @@ def get_graph_client() -> GraphServiceClient:
     Returns:
         Authenticated GraphServiceClient instance
     """
-    tenant_id, client_id, client_secret = get_graph_credentials()
+    return create_graph_client(get_graph_credential())
 
-    credential = ClientSecretCredential(
-        tenant_id=tenant_id,
-        client_id=client_id,
-        client_secret=client_secret,
-    )
 
-    return create_graph_client(credential)
+def serialize_graph_model(model: Parsable) -> dict:
+    """Serialize a Graph SDK model (e.g. ``Event``) to a JSON-ready dict."""
+    writer = JsonSerializationWriter()
+    writer.write_object_value(None, model)
+    return json.loads(writer.get_serialized_content())
+
+
+@dataclass
+class GraphRequest:
+    """One operation in a JSON batch.
+
+    ``url`` is relative to the API version (e.g. ``/users/a@b.org/events``).
+    ``body`` may be a dict or a Graph SDK model.
+    """
+
+    method: str
+    url: str
+    body: Any = None
+
+
+@dataclass
+class GraphResponse:
+    """Result of one batched operation."""
+
+    status: int
+    body: dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Check whether the operation succeeded (2xx)."""
+        return 200 <= self.status < 300
+
+    @property
+    def throttled(self) -> bool:
+        """Check whether the operation was throttled (429)."""
+        return self.status == 429
+
+    @property
+    def error(self) -> str:
+        """Graph error message (empty on success)."""
+        if self.ok:
+            return ""
+        err = self.body.get("error") if isinstance(self.body, dict) else None
+        message = err.get("message") if isinstance(err, dict) else None
+        return message or f"HTTP {self.status}"
+
+
+def _retry_after(headers: dict | httpx.Headers | None) -> float:
+    """Seconds to wait from a Retry-After header (default ``GRAPH_RETRY_DELAY``)."""
+    value = None
+    if headers:
+        value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    try:
+        seconds = float(value) if value is not None else GRAPH_RETRY_DELAY
+    except ValueError:
+        seconds = GRAPH_RETRY_DELAY
+    return min(max(seconds, 0.0), GRAPH_BATCH_MAX_RETRY_AFTER)
+
+
+class GraphBatchClient:
+    """Send Graph write operations through the JSON ``$batch`` endpoint.
+
+    Operations are packed ``GRAPH_BATCH_SIZE`` per HTTP call. Items that
+    come back 429/503/504 (or whose whole batch was rejected) are re-sent
+    in later batches after the largest ``Retry-After`` among them, up to
+    ``max_retries`` times. Results are returned in request order.
+
+    ``on_throttle``, when set, is called with the ``Retry-After`` seconds of
+    every throttled item so callers can adapt their own concurrency.
+    """
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        base_url: str = GRAPH_API_URL,
+        max_retries: int = GRAPH_BATCH_MAX_RETRIES,
+    ) -> None:
+        """Initialize the batch client.
+
+        Args:
+            credential: Credential used to get Graph bearer tokens
+            base_url: Graph API root including version
+            max_retries: Retry rounds for throttled or unavailable items
+        """
+        self._credential = credential
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self._token: AccessToken | None = None
+        self.http_requests = 0  # $batch calls made
+        self.throttle_events = 0  # throttled items (including retried ones)
+        self.on_throttle: Callable[[float], None] | None = None
+
+    async def _get_token(self) -> str:
+        """Get a bearer token, refreshing five minutes before expiry."""
+        if self._token is None or self._token.expires_on - 300 < time.time():
+            self._token = await asyncio.to_thread(self._credential.get_token, GRAPH_SCOPE)
+        return self._token.token
+
+    @staticmethod
+    def _payload(request_id: int, request: GraphRequest) -> dict:
+        item: dict[str, Any] = {
+            "id": str(request_id),
+            "method": request.method.upper(),
+            "url": request.url,
+        }
+        if request.body is not None:
+            body = request.body
+            item["body"] = body if isinstance(body, dict) else serialize_graph_model(body)
+            item["headers"] = {"Content-Type": "application/json"}
+        return item
+
+    async def _send(
+        self, client: httpx.AsyncClient, chunk: list[tuple[int, GraphRequest]]
+    ) -> dict[int, tuple[GraphResponse, float]]:
+        """POST one batch; map request index to (response, Retry-After seconds)."""
+        payload = {"requests": [self._payload(i, r) for i, r in chunk]}
+        headers = {"Authorization": f"Bearer {await self._get_token()}"}
+        self.http_requests += 1
+        try:
+            resp = await client.post(f"{self.base_url}/$batch", json=payload, headers=headers)
+        except httpx.HTTPError as e:
+            logger.warning("Graph $batch request failed: %s", e)
+            failed = GraphResponse(503, {"error": {"message": str(e)}})
+            return {i: (failed, GRAPH_RETRY_DELAY) for i, _ in chunk}
+
+        if resp.status_code != 200:
+            try:
+                body = resp.json()
+            except ValueError:
+                body = {}
+            whole = GraphResponse(resp.status_code, body if isinstance(body, dict) else {})
+            return {i: (whole, _retry_after(resp.headers)) for i, _ in chunk}
+
+        results: dict[int, tuple[GraphResponse, float]] = {}
+        for item in resp.json().get("responses", []):
+            body = item.get("body")
+            response = GraphResponse(int(item.get("status", 0)), body or {})
+            results[int(item["id"])] = (response, _retry_after(item.get("headers")))
+        missing = GraphResponse(500, {"error": {"message": "Missing from $batch response"}})
+        for i, _ in chunk:
+            results.setdefault(i, (missing, 0.0))
+        return results
+
+    async def execute(self, requests: list[GraphRequest]) -> list[GraphResponse]:
+        """Run operations in ``$batch`` calls and return per-item results.
+
+        Args:
+            requests: Independent operations (order is not significant to Graph)
+
+        Returns:
+            One GraphResponse per request, in the same order
+        """
+        responses: list[GraphResponse | None] = [None] * len(requests)
+        pending = list(enumerate(requests))
+
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            for attempt in range(self.max_retries + 1):
+                retry: list[tuple[int, GraphRequest]] = []
+                wait = 0.0
+                for start in range(0, len(pending), GRAPH_BATCH_SIZE):
+                    chunk = pending[start : start + GRAPH_BATCH_SIZE]
+                    for i, (response, retry_after) in (await self._send(client, chunk)).items():
+                        responses[i] = response
+                        if response.throttled:
+                            self.throttle_events += 1
+                            if self.on_throttle is not None:
+                                self.on_throttle(retry_after)
+                        if response.status in RETRYABLE_STATUS_CODES:
+                            retry.append((i, requests[i]))
+                            wait = max(wait, retry_after)
+
+                if not retry or attempt == self.max_retries:
+                    break
+                logger.info(
+                    "Retrying %d throttled Graph operations in %.0fs (attempt %d/%d)",
+                    len(retry),
+                    wait,
+                    attempt + 1,
+                    self.max_retries,
+                )
+                await asyncio.sleep(wait)
+                pending = sorted(retry)
+
+        return [r if r is not None else GraphResponse(0) for r in responses]
+
+
+class GraphBatchQueue:
+    """Coalesce concurrent single operations into ``$batch`` calls.
+
+    Callers ``await submit(request)`` from many tasks at once; requests are
+    collected until ``GRAPH_BATCH_SIZE`` are waiting (or ``linger`` seconds
+    pass) and then sent together through ``GraphBatchClient.execute``. Each
+    caller gets back its own ``GraphResponse``.
+    """
+
+    def __init__(self, client: GraphBatchClient, linger: float = 0.05) -> None:
+        """Initialize the queue.
+
+        Args:
+            client: Batch client that sends the coalesced requests
+            linger: Seconds to wait for more requests before sending a partial batch
+        """
+        self.client = client
+        self.linger = linger
+        self._waiting: list[tuple[GraphRequest, asyncio.Future[GraphResponse]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, request: GraphRequest) -> GraphResponse:
+        """Queue one operation and wait for its result.
+
+        Args:
+            request: Operation to send
+
+        Returns:
+            The operation's GraphResponse (a failed send comes back as status 0)
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[GraphResponse] = loop.create_future()
+        self._waiting.append((request, future))
+        if len(self._waiting) >= GRAPH_BATCH_SIZE:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send everything waiting as one ``execute`` call."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._waiting = self._waiting, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[GraphRequest, asyncio.Future[GraphResponse]]]) -> None:
+        try:
+            responses = await self.client.execute([request for request, _ in batch])
+        except Exception as e:
+            logger.warning("Graph $batch send failed: %s", e)
+            responses = [GraphResponse(0, {"error": {"message": str(e)}})] * len(batch)
+        for (_, future), response in zip(batch, responses, strict=True):
+            if not future.done():
+                future.set_result(response)
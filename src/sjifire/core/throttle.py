@@ -0,0 +1,145 @@
+"""Adaptive concurrency control for throttled APIs.
+
+``AdaptiveLimiter`` caps how many units of work (e.g. per-user calendar
+syncs) run at once using AIMD (additive increase, multiplicative decrease):
+every unit that finishes cleanly raises the limit by ``increase`` and every
+throttle signal (a 429, optionally with ``Retry-After``) cuts it by
+``decrease_factor``. Decreases are rate-limited to one per ``cooldown`` so
+a burst of 429s from one round of requests counts as a single signal, and
+a ``Retry-After`` pauses new starts until it has elapsed.
+
+``RateLimiter`` instead spaces request starts a fixed interval apart across
+threads, for APIs with a flat request-rate limit.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit driven by throttling signals."""
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 6,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            minimum: Lowest the limit may drop to
+            maximum: Highest the limit may grow to
+            increase: Added to the limit per clean completion
+            decrease_factor: Multiplier applied to the limit on a throttle signal
+            cooldown: Minimum seconds between two decreases
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._clock = clock
+        self._last_decrease: float | None = None
+        self._resume_at = 0.0
+        self._released = asyncio.Event()
+        self.in_flight = 0
+        self.peak = 0
+        self.throttle_events = 0
+        self.decreases = 0
+
+    @property
+    def current(self) -> int:
+        """Whole number of units allowed to run at once."""
+        return max(self.minimum, int(self.limit))
+
+    async def acquire(self) -> None:
+        """Wait for a free slot (and for any Retry-After pause to pass)."""
+        while True:
+            resume_at = self._resume_at
+            delay = resume_at - self._clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                if self._resume_at > resume_at:
+                    continue  # pause was extended while we slept
+            if self.in_flight < self.current:
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                return
+            self._released.clear()
+            await self._released.wait()
+
+    def release(self, throttled: bool = False) -> None:
+        """Free a slot; a clean completion grows the limit.
+
+        Args:
+            throttled: True if the unit saw throttling (its signal is
+                reported separately through ``record_throttle``)
+        """
+        self.in_flight -= 1
+        if not throttled:
+            self.limit = min(float(self.maximum), self.limit + self.increase)
+        self._released.set()
+
+    def record_throttle(self, retry_after: float = 0.0) -> None:
+        """Record a throttle signal: shrink the limit and honor Retry-After.
+
+        Args:
+            retry_after: Seconds the server asked us to wait (0 if unknown)
+        """
+        self.throttle_events += 1
+        now = self._clock()
+        if retry_after > 0:
+            self._resume_at = max(self._resume_at, now + retry_after)
+        if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        new_limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        if new_limit < self.limit:
+            self.decreases += 1
+            logger.info(
+                "Throttled: concurrency limit %d -> %d (retry after %.0fs)",
+                self.current,
+                max(self.minimum, int(new_limit)),
+                retry_after,
+            )
+        self.limit = new_limit
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces request starts ``interval`` seconds apart.
+
+    Shared by worker threads so concurrent requests still respect a
+    service's rate limit (e.g. Aladtec's per-minute cap) as a whole.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            interval: Minimum seconds between consecutive request starts
+        """
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller's request slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            time.sleep(delay)
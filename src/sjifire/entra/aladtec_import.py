@@ -1,15 +1,33 @@
-"""Import Aladtec members into Entra ID."""
+"""Import Aladtec members into Entra ID.
+
+Members are processed concurrently (``IMPORT_CONCURRENCY`` at a time, enough
+to fill one Graph ``$batch``), and profile updates issued at the same time
+are coalesced into ``$batch`` PATCHes. Single-request operations have their
+own cap on calls in flight (``OPERATION_LIMITS``). Each member's outcome is collected
+on its own and merged in input order, so ``ImportResult`` lists do not
+depend on which Graph call finished first.
+"""
 
 import asyncio
+import contextlib
 import logging
 from dataclasses import dataclass, field
 
 from sjifire.aladtec.models import Member
 from sjifire.core.config import load_entra_sync_config
+from sjifire.core.msgraph_client import GRAPH_BATCH_SIZE, GraphBatchClient
 from sjifire.entra.users import EntraUser, EntraUserManager
 
 logger = logging.getLogger(__name__)
 
+# Members processed at once (1 = one after another, no batching). One per
+# $batch slot, so concurrent profile updates can fill a whole batch.
+IMPORT_CONCURRENCY = GRAPH_BATCH_SIZE
+
+# Graph calls in flight per single-request operation type. Updates are not
+# listed: they ride $batch PATCHes and are bounded by IMPORT_CONCURRENCY.
+OPERATION_LIMITS = {"create": 4, "license": 8, "disable": 4}
+
 
 @dataclass
 class ImportResult:
@@ -32,6 +50,18 @@ class ImportResult:
             + len(self.errors)
         )
 
+    def extend(self, other: ImportResult) -> None:
+        """Append another result's entries after this one's.
+
+        Args:
+            other: Result to merge in (e.g. a single member's outcome)
+        """
+        self.created.extend(other.created)
+        self.updated.extend(other.updated)
+        self.disabled.extend(other.disabled)
+        self.skipped.extend(other.skipped)
+        self.errors.extend(other.errors)
+
     def summary(self) -> str:
         """Return a summary string."""
         return (
@@ -51,6 +81,9 @@ class AladtecImporter:
         domain: str | None = None,
         company_name: str | None = None,
         license_sku: str | None = None,
+        user_manager: EntraUserManager | None = None,
+        concurrency: int = IMPORT_CONCURRENCY,
+        batch_client: GraphBatchClient | None = None,
     ) -> None:
         """Initialize the importer.
 
@@ -58,13 +91,24 @@ class AladtecImporter:
             domain: Email domain for generating UPNs (loaded from config if not provided)
             company_name: Company name for Entra ID users (loaded from config if not provided)
             license_sku: License SKU ID to assign to newly created users (optional)
+            user_manager: User manager to use (e.g. one sharing a cached user snapshot)
+            concurrency: Members processed at once (1 processes them serially)
+            batch_client: Client for batched user PATCHes (defaults to app-only credentials)
         """
         config = load_entra_sync_config()
         self.domain = domain or config.domain
         self.company_name = company_name or config.company_name
         self.skip_emails = {e.lower() for e in config.skip_emails}
         self.license_sku = license_sku
-        self.user_manager = EntraUserManager(domain=self.domain)
+        self.user_manager = user_manager or EntraUserManager(domain=self.domain)
+        self.concurrency = max(1, concurrency)
+        self.batch_client = batch_client
+        # Per-operation semaphores, set only while import_members runs
+        self._limits: dict[str, asyncio.Semaphore] = {}
+
+    def _limit(self, operation: str) -> contextlib.AbstractAsyncContextManager:
+        """Slot for one Graph call of the given type (a no-op outside a concurrent run)."""
+        return self._limits.get(operation) or contextlib.nullcontext()
 
     async def import_members(
         self,
@@ -99,27 +143,49 @@ class AladtecImporter:
             if u.first_name and u.last_name
         }
 
-        result = ImportResult()
+        member_slots = asyncio.Semaphore(self.concurrency)
+
+        async def run(member: Member) -> ImportResult:
+            member_result = ImportResult()
+            async with member_slots:
+                try:
+                    await self._process_member(
+                        member=member,
+                        user_by_email=user_by_email,
+                        user_by_upn=user_by_upn,
+                        user_by_name=user_by_name,
+                        result=member_result,
+                        dry_run=dry_run,
+                        disable_inactive=disable_inactive,
+                    )
+                except Exception as e:
+                    logger.error("Error processing %s: %s", member.display_name, e)
+                    member_result.errors.append(
+                        {
+                            "member": member.display_name,
+                            "error": str(e),
+                        }
+                    )
+            return member_result
 
-        for member in members:
-            try:
-                await self._process_member(
-                    member=member,
-                    user_by_email=user_by_email,
-                    user_by_upn=user_by_upn,
-                    user_by_name=user_by_name,
-                    result=result,
-                    dry_run=dry_run,
-                    disable_inactive=disable_inactive,
-                )
-            except Exception as e:
-                logger.error("Error processing %s: %s", member.display_name, e)
-                result.errors.append(
-                    {
-                        "member": member.display_name,
-                        "error": str(e),
-                    }
-                )
+        concurrent = self.concurrency > 1
+        batching = (
+            self.user_manager.batch_updates(self.batch_client)
+            if concurrent and not dry_run
+            else contextlib.nullcontext()
+        )
+        if concurrent:
+            self._limits = {op: asyncio.Semaphore(n) for op, n in OPERATION_LIMITS.items()}
+        try:
+            async with batching:
+                member_results = await asyncio.gather(*(run(m) for m in members))
+        finally:
+            self._limits = {}
+
+        # Merge in input order so results don't depend on Graph timing
+        result = ImportResult()
+        for member_result in member_results:
+            result.extend(member_result)
 
         logger.info("Import complete: %s", result.summary())
         return result
@@ -237,9 +303,11 @@ class AladtecImporter:
                     )
                     logger.info("Would disable and remove licenses: %s", member.display_name)
                 else:
-                    disable_ok, license_ok = await self.user_manager.disable_and_remove_licenses(
-                        existing.id
-                    )
+                    async with self._limit("disable"):
+                        (
+                            disable_ok,
+                            license_ok,
+                        ) = await self.user_manager.disable_and_remove_licenses(existing.id)
                     if disable_ok:
                         result.disabled.append(
                             {
@@ -390,26 +458,27 @@ class AladtecImporter:
             positions_str = ",".join(member.positions) if member.positions else None
             schedules_str = ",".join(member.schedules) if member.schedules else None
 
-            created_user = await self.user_manager.create_user(
-                display_name=display_name,
-                first_name=member.first_name,
-                last_name=member.last_name,
-                upn=upn,
-                email=member.email,
-                employee_id=member.employee_id,
-                job_title=member.job_title,
-                mobile_phone=member.phone,
-                business_phones=business_phones,
-                office_location=member.office_location,
-                employee_hire_date=member.date_hired,
-                employee_type=member.work_group,
-                personal_email=member.personal_email,
-                company_name=self.company_name,
-                extension_attribute1=member.rank,
-                extension_attribute2=member.evip,
-                extension_attribute3=positions_str,
-                extension_attribute4=schedules_str,
-            )
+            async with self._limit("create"):
+                created_user = await self.user_manager.create_user(
+                    display_name=display_name,
+                    first_name=member.first_name,
+                    last_name=member.last_name,
+                    upn=upn,
+                    email=member.email,
+                    employee_id=member.employee_id,
+                    job_title=member.job_title,
+                    mobile_phone=member.phone,
+                    business_phones=business_phones,
+                    office_location=member.office_location,
+                    employee_hire_date=member.date_hired,
+                    employee_type=member.work_group,
+                    personal_email=member.personal_email,
+                    company_name=self.company_name,
+                    extension_attribute1=member.rank,
+                    extension_attribute2=member.evip,
+                    extension_attribute3=positions_str,
+                    extension_attribute4=schedules_str,
+                )
             if created_user:
                 # Assign license if configured — retry with backoff since Entra
                 # may not have fully replicated the new user object yet
@@ -470,7 +539,8 @@ class AladtecImporter:
                 )
                 await asyncio.sleep(delay)
 
-            ok = await self.user_manager.assign_license(user_id, sku_id)
+            async with self._limit("license"):
+                ok = await self.user_manager.assign_license(user_id, sku_id)
             if ok:
                 return True
 
@@ -488,7 +558,8 @@ class AladtecImporter:
         if not self.license_sku:
             return None
 
-        licenses = await self.user_manager.get_user_licenses(existing.id)
+        async with self._limit("license"):
+            licenses = await self.user_manager.get_user_licenses(existing.id)
         if licenses:
             # User has at least one license (may be the configured SKU or a
             # higher-tier plan like Business Standard) — don't touch it
@@ -500,7 +571,8 @@ class AladtecImporter:
             return False
 
         # Ensure usageLocation is set (required for license assignment)
-        await self.user_manager.set_usage_location(existing.id)
+        async with self._limit("license"):
+            await self.user_manager.set_usage_location(existing.id)
 
         # Retry with backoff — usageLocation may not have replicated yet
         ok = await self._assign_license_with_retry(
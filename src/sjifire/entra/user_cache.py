@@ -0,0 +1,102 @@
+"""On-disk copy of the Entra user directory, kept current with Graph delta queries.
+
+The first run downloads every user once through ``users/delta`` and stores
+the directory together with the returned delta link; later runs replay the
+link and receive only users that were created, changed or deleted since.
+
+Delta pages carry only the properties that changed, and a property cleared
+to null cannot be told apart from one that was not sent, so the directory
+is rebuilt from scratch every ``FULL_REFRESH_DAYS`` (or on demand).
+"""
+
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# File (under ENTRA_CACHE_DIR) holding the directory and its delta link
+USER_CACHE_FILE = "entra_users_delta.json"
+
+# Age after which the directory is rebuilt with a full delta sync
+FULL_REFRESH_DAYS = 7
+
+
+class UserDirectoryCache:
+    """Users by ID (as ``EntraUser`` field dicts) plus the Graph delta link."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or start) the cache file.
+
+        Args:
+            path: JSON file holding the cache
+        """
+        self.path = Path(path)
+        self.delta_link: str | None = None
+        self.select: list[str] = []
+        self.full_sync: str | None = None
+        self.users: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                self.delta_link = data.get("delta_link")
+                self.select = list(data.get("select", []))
+                self.full_sync = data.get("full_sync")
+                self.users = dict(data.get("users", {}))
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable Entra user cache: %s", e)
+
+    def needs_full_sync(
+        self, select: list[str] | tuple[str, ...], now: datetime | None = None
+    ) -> bool:
+        """Check whether the cache must be rebuilt instead of replaying its delta link.
+
+        Args:
+            select: Properties the caller needs (a different set forces a rebuild)
+            now: Reference time (defaults to now)
+        """
+        if not self.delta_link or not self.full_sync or self.select != list(select):
+            return True
+        age = (now or datetime.now(UTC)) - datetime.fromisoformat(self.full_sync)
+        return age > timedelta(days=FULL_REFRESH_DAYS)
+
+    def reset(self, select: list[str] | tuple[str, ...], now: datetime | None = None) -> None:
+        """Drop everything ahead of a full delta sync.
+
+        Args:
+            select: Properties the new sync fetches
+            now: Time of the full sync (defaults to now)
+        """
+        self.delta_link = None
+        self.select = list(select)
+        self.full_sync = (now or datetime.now(UTC)).isoformat()
+        self.users = {}
+
+    def apply(self, user_id: str, fields: dict | None) -> None:
+        """Apply one delta item.
+
+        Args:
+            user_id: Entra object ID
+            fields: Properties returned for the user (merged over the cached
+                ones), or None if the user was deleted
+        """
+        if fields is None:
+            self.users.pop(user_id, None)
+        else:
+            self.users[user_id] = {**self.users.get(user_id, {}), **fields}
+
+    def save(self) -> None:
+        """Write the cache."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(
+                {
+                    "delta_link": self.delta_link,
+                    "select": self.select,
+                    "full_sync": self.full_sync,
+                    "users": self.users,
+                },
+                sort_keys=True,
+            )
+        )
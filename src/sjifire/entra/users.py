@@ -1,9 +1,13 @@
 """Entra ID user management operations."""
 
 import logging
+import os
 import secrets
 import string
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from pathlib import Path
 from uuid import UUID
 
 from kiota_abstractions.base_request_configuration import RequestConfiguration
@@ -13,21 +17,75 @@ from msgraph.generated.models.on_premises_extension_attributes import (
 )
 from msgraph.generated.models.password_profile import PasswordProfile
 from msgraph.generated.models.user import User
+from msgraph.generated.users.delta.delta_request_builder import DeltaRequestBuilder
 from msgraph.generated.users.item.assign_license.assign_license_post_request_body import (
     AssignLicensePostRequestBody,
 )
 from msgraph.generated.users.users_request_builder import UsersRequestBuilder
 
 from sjifire.core.config import get_domain
-from sjifire.core.msgraph_client import get_graph_client
+from sjifire.core.msgraph_client import (
+    GraphBatchClient,
+    GraphBatchQueue,
+    GraphRequest,
+    get_graph_client,
+    get_graph_credential,
+)
 from sjifire.core.normalize import normalize_name_part
+from sjifire.entra.user_cache import USER_CACHE_FILE, UserDirectoryCache
 
 logger = logging.getLogger(__name__)
 
+# Graph properties backing every EntraUser field (the default $select)
+USER_SELECT_FIELDS = (
+    "id",
+    "displayName",
+    "givenName",
+    "surname",
+    "mail",
+    "userPrincipalName",
+    "employeeId",
+    "accountEnabled",
+    "jobTitle",
+    "mobilePhone",
+    "businessPhones",
+    "officeLocation",
+    "employeeHireDate",
+    "employeeType",
+    "otherMails",
+    "department",
+    "companyName",
+    "onPremisesExtensionAttributes",
+)
+
+# Users per Graph page ($top); 999 is the maximum for /users (default is 100)
+USERS_PAGE_SIZE = 999
+
+
+def get_entra_cache_dir() -> Path | None:
+    """Get the directory for the persisted user directory cache, if configured.
+
+    Set ``ENTRA_CACHE_DIR`` to keep the user directory (and its Graph delta
+    link) between runs (e.g. a GitHub Actions cache path). Unset disables
+    caching.
+
+    Returns:
+        Cache directory (created if missing), or None when caching is off
+    """
+    path = os.getenv("ENTRA_CACHE_DIR")
+    if not path:
+        return None
+    cache_dir = Path(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
 
-@dataclass
+@dataclass(slots=True)
 class EntraUser:
-    """Represents an Entra ID user."""
+    """Represents an Entra ID user.
+
+    Slotted: a run can hold every tenant user at once, several times over.
+    """
 
     id: str
     display_name: str | None
@@ -153,76 +211,117 @@ class EntraUser:
 class EntraUserManager:
     """Manage users in Entra ID."""
 
-    def __init__(self, domain: str | None = None) -> None:
+    # Delta-synced directory cache (None: list users from Graph every time)
+    cache_path: Path | None = None
+    refresh_full: bool = False
+    _snapshot: list[EntraUser] | None = None
+    # Set inside batch_updates(): update_user PATCHes go through Graph $batch
+    _update_queue: GraphBatchQueue | None = None
+
+    def __init__(
+        self,
+        domain: str | None = None,
+        cache_dir: str | Path | None = None,
+        refresh_full: bool = False,
+    ) -> None:
         """Initialize the user manager.
 
         Args:
             domain: Email domain for generating UPNs (defaults to org config)
+            cache_dir: Directory for the user directory cache (see
+                ``get_entra_cache_dir``); None reads every user from Graph
+            refresh_full: If True, rebuild the cache with a full sync this run
         """
         self.domain = domain or get_domain()
         self.client: GraphServiceClient = get_graph_client()
+        if cache_dir is not None:
+            self.cache_path = Path(cache_dir) / USER_CACHE_FILE
+        self.refresh_full = refresh_full
 
-    async def get_users(
+    async def iter_user_pages(
         self,
+        select: list[str] | tuple[str, ...] | None = None,
         include_disabled: bool = False,
         employees_only: bool = False,
-    ) -> list[EntraUser]:
-        """Fetch users from Entra ID.
+    ) -> AsyncIterator[list[EntraUser]]:
+        """Stream users from Entra ID one Graph page at a time.
+
+        Only the current page is held in memory, so callers that just scan
+        (count, index by email) never materialize the whole tenant.
 
         Args:
+            select: Graph properties to fetch (defaults to ``USER_SELECT_FIELDS``);
+                ``id``, ``accountEnabled`` and ``employeeId`` are always added
+                for filtering. Fields not selected are None on the results.
             include_disabled: If True, include disabled accounts
-            employees_only: If True, only return users with employee IDs
+            employees_only: If True, only yield users with employee IDs
 
-        Returns:
-            List of EntraUser objects
+        Yields:
+            EntraUser objects for each page (filtered; possibly empty)
         """
-        logger.info("Fetching Entra ID users")
-
+        fields = list(
+            dict.fromkeys(["id", "accountEnabled", "employeeId", *(select or USER_SELECT_FIELDS)])
+        )
         query_params = UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
-            select=[
-                "id",
-                "displayName",
-                "givenName",
-                "surname",
-                "mail",
-                "userPrincipalName",
-                "employeeId",
-                "accountEnabled",
-                "jobTitle",
-                "mobilePhone",
-                "businessPhones",
-                "officeLocation",
-                "employeeHireDate",
-                "employeeType",
-                "otherMails",
-                "department",
-                "companyName",
-                "onPremisesExtensionAttributes",
-            ],
+            select=fields,
+            top=USERS_PAGE_SIZE,
         )
         config = RequestConfiguration(query_parameters=query_params)
         result = await self.client.users.get(request_configuration=config)
 
-        users = []
-        if result and result.value:
-            for user in result.value:
-                if not include_disabled and not user.account_enabled:
-                    continue
-                if employees_only and not user.employee_id:
-                    continue
-                users.append(self._to_entra_user(user))
-
-        # Handle pagination
-        while result and result.odata_next_link:
+        while result:
+            yield [
+                self._to_entra_user(user)
+                for user in result.value or []
+                if (include_disabled or user.account_enabled)
+                and (not employees_only or user.employee_id)
+            ]
+            if not result.odata_next_link:
+                break
             result = await self.client.users.with_url(result.odata_next_link).get()
-            if result and result.value:
-                for user in result.value:
-                    if not include_disabled and not user.account_enabled:
-                        continue
-                    if employees_only and not user.employee_id:
-                        continue
-                    users.append(self._to_entra_user(user))
 
+    async def iter_users(
+        self,
+        select: list[str] | tuple[str, ...] | None = None,
+        include_disabled: bool = False,
+        employees_only: bool = False,
+    ) -> AsyncIterator[EntraUser]:
+        """Stream users from Entra ID (see ``iter_user_pages``)."""
+        async for page in self.iter_user_pages(select, include_disabled, employees_only):
+            for user in page:
+                yield user
+
+    async def get_users(
+        self,
+        include_disabled: bool = False,
+        employees_only: bool = False,
+        select: list[str] | tuple[str, ...] | None = None,
+    ) -> list[EntraUser]:
+        """Fetch users from Entra ID.
+
+        Args:
+            include_disabled: If True, include disabled accounts
+            employees_only: If True, only return users with employee IDs
+            select: Graph properties to fetch (defaults to ``USER_SELECT_FIELDS``)
+
+        Returns:
+            List of EntraUser objects
+        """
+        if self.cache_path is not None and select is None:
+            return [
+                user
+                for user in await self.get_user_snapshot()
+                if (include_disabled or user.account_enabled)
+                and (not employees_only or user.employee_id)
+            ]
+
+        logger.info("Fetching Entra ID users")
+        users = [
+            user
+            async for user in self.iter_users(
+                select, include_disabled=include_disabled, employees_only=employees_only
+            )
+        ]
         logger.info("Found %d users", len(users))
         return users
 
@@ -240,6 +339,117 @@ class EntraUserManager:
         """
         return await self.get_users(include_disabled=include_disabled, employees_only=True)
 
+    async def get_user_snapshot(self) -> list[EntraUser]:
+        """Get every user, including disabled ones (memoized per manager).
+
+        With a cache configured the directory is brought up to date through
+        Graph ``users/delta`` (only changes are downloaded after the first
+        run); otherwise every user is listed.
+
+        Returns:
+            List of EntraUser objects with all ``USER_SELECT_FIELDS``
+        """
+        if self._snapshot is None:
+            if self.cache_path is not None:
+                self._snapshot = await self._sync_user_cache(self.cache_path)
+            else:
+                self._snapshot = [u async for u in self.iter_users(include_disabled=True)]
+        return self._snapshot
+
+    async def _sync_user_cache(self, path: Path) -> list[EntraUser]:
+        """Update the on-disk user directory from Graph delta and return it."""
+        cache = UserDirectoryCache(path)
+        full = self.refresh_full or cache.needs_full_sync(USER_SELECT_FIELDS)
+        if full:
+            cache.reset(USER_SELECT_FIELDS)
+        builder = self.client.users.delta
+
+        pages = changes = 0
+        try:
+            if full:
+                query_params = DeltaRequestBuilder.DeltaRequestBuilderGetQueryParameters(
+                    select=list(USER_SELECT_FIELDS),
+                )
+                config = RequestConfiguration(query_parameters=query_params)
+                result = await builder.get(request_configuration=config)
+            else:
+                result = await builder.with_url(cache.delta_link).get()
+
+            delta_link = None
+            while result:
+                pages += 1
+                for user in result.value or []:
+                    if not user.id:
+                        continue
+                    removed = "@removed" in (user.additional_data or {})
+                    cache.apply(user.id, None if removed else self._delta_fields(user))
+                    changes += 1
+                if result.odata_next_link:
+                    result = await builder.with_url(result.odata_next_link).get()
+                else:
+                    delta_link = result.odata_delta_link
+                    result = None
+        except Exception as e:
+            # An expired delta link (or any failure) needs a fresh full sync next run
+            logger.warning("Entra users delta query failed; listing users instead: %s", e)
+            cache.reset(USER_SELECT_FIELDS)
+            cache.save()
+            return [u async for u in self.iter_users(include_disabled=True)]
+
+        cache.delta_link = delta_link
+        cache.save()
+        logger.info(
+            "Entra user cache: %s sync, %d page(s), %d change(s), %d users",
+            "full" if full else "delta",
+            pages,
+            changes,
+            len(cache.users),
+        )
+        return [self._cached_user(values) for values in cache.users.values()]
+
+    @staticmethod
+    def _delta_fields(user: User) -> dict:
+        """EntraUser fields for the properties a delta item actually carries."""
+        values = {
+            "id": user.id,
+            "display_name": user.display_name,
+            "first_name": user.given_name,
+            "last_name": user.surname,
+            "email": user.mail,
+            "upn": user.user_principal_name,
+            "employee_id": user.employee_id,
+            "account_enabled": user.account_enabled,
+            "job_title": user.job_title,
+            "mobile_phone": user.mobile_phone,
+            "business_phones": user.business_phones,
+            "office_location": user.office_location,
+            "employee_hire_date": (
+                user.employee_hire_date.isoformat() if user.employee_hire_date else None
+            ),
+            "employee_type": user.employee_type,
+            "department": user.department,
+            "company_name": user.company_name,
+        }
+        values = {k: v for k, v in values.items() if v is not None}
+        if user.other_mails is not None:
+            values["personal_email"] = user.other_mails[0] if user.other_mails else None
+        # The complex type comes back whole, so its nulls are real
+        if ext := user.on_premises_extension_attributes:
+            values["extension_attribute1"] = ext.extension_attribute1
+            values["extension_attribute2"] = ext.extension_attribute2
+            values["extension_attribute3"] = ext.extension_attribute3
+            values["extension_attribute4"] = ext.extension_attribute4
+        return values
+
+    @staticmethod
+    def _cached_user(values: dict) -> EntraUser:
+        """Build an EntraUser from cached fields (missing ones are None)."""
+        user = dict.fromkeys(f.name for f in fields(EntraUser))
+        user.update(values)
+        user["id"] = user["id"] or ""
+        user["account_enabled"] = bool(user["account_enabled"])
+        return EntraUser(**user)
+
     def _to_entra_user(self, user: User) -> EntraUser:
         """Convert MS Graph User to EntraUser.
 
@@ -561,7 +771,7 @@ class EntraUserManager:
             user.additional_data = fields_to_clear
 
         try:
-            await self.client.users.by_user_id(user_id).patch(user)
+            await self._patch_user(user_id, user)
             logger.info("Updated user: %s", user_id)
             return True
         except Exception as e:
@@ -628,7 +838,7 @@ class EntraUserManager:
                 if retry_fields_to_clear:
                     user_retry.additional_data = retry_fields_to_clear
                 try:
-                    await self.client.users.by_user_id(user_id).patch(user_retry)
+                    await self._patch_user(user_id, user_retry)
                     logger.info(
                         "Updated user (partial): %s (skipped: %s)", user_id, ", ".join(skipped)
                     )
@@ -645,6 +855,35 @@ class EntraUserManager:
             logger.error("Failed to update user %s: %s", user_id, e)
             return False
 
+    @asynccontextmanager
+    async def batch_updates(self, client: GraphBatchClient | None = None) -> AsyncIterator[None]:
+        """Coalesce concurrent ``update_user`` calls into Graph ``$batch`` requests.
+
+        Inside the block, PATCHes issued from concurrent tasks are sent up to
+        20 per HTTP call instead of one call each.
+
+        Args:
+            client: Batch client to send through (defaults to app-only credentials)
+        """
+        self._update_queue = GraphBatchQueue(client or GraphBatchClient(get_graph_credential()))
+        try:
+            yield
+        finally:
+            self._update_queue = None
+
+    async def _patch_user(self, user_id: str, user: User) -> None:
+        """PATCH a user directly or through the active batch queue.
+
+        Raises:
+            RuntimeError: If a batched PATCH fails (message carries the HTTP status)
+        """
+        if self._update_queue is None:
+            await self.client.users.by_user_id(user_id).patch(user)
+            return
+        response = await self._update_queue.submit(GraphRequest("PATCH", f"/users/{user_id}", user))
+        if not response.ok:
+            raise RuntimeError(f"{response.status}: {response.error}")
+
     async def disable_user(self, user_id: str) -> bool:
         """Disable a user account in Entra ID.
 
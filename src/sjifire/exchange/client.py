@@ -1,7 +1,9 @@
 """Exchange Online PowerShell client.
 
 Executes Exchange Online PowerShell cmdlets via subprocess to manage
-mail-enabled security groups and distribution lists.
+mail-enabled security groups and distribution lists. Long runs can keep a
+connected worker alive (``persistent=True``, see ``exchange.session``)
+instead of paying the import + connect cost on every call.
 
 This uses the official Exchange Online PowerShell module which is fully
 supported by Microsoft.
@@ -26,10 +28,16 @@ import json
 import logging
 import re
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from sjifire.core.config import get_domain, get_exchange_credentials
+from sjifire.exchange.session import (
+    COMMAND_TIMEOUT_SECONDS,
+    PowerShellCommandError,
+    PowerShellSessionError,
+    PowerShellSessionPool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +50,20 @@ TRANSIENT_ERROR_PATTERNS = [
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAYS_SECONDS = [10, 20, 30]  # Delays between retries
 
+# Groups per batched PowerShell script (bulk reads and applied changes)
+GROUP_BATCH_SIZE = 10
+
+# Extra seconds a batched script gets per cmdlet it runs, on top of the
+# single-command time limit
+SECONDS_PER_BATCH_OPERATION = 5.0
+
+BATCH_SCRIPT_FAILED = "Failed to execute batched change script"
+
+
+def _batch_time_limit(operations: int) -> float:
+    """Time limit for a batched script that runs *operations* cmdlets."""
+    return COMMAND_TIMEOUT_SECONDS + operations * SECONDS_PER_BATCH_OPERATION
+
 
 def _escape_ps_string(value: str) -> str:
     """Escape a value for use inside PowerShell single-quoted strings.
@@ -59,6 +81,20 @@ def is_transient_error(error_msg: str) -> bool:
     return any(re.search(pattern, error_msg, re.IGNORECASE) for pattern in TRANSIENT_ERROR_PATTERNS)
 
 
+def _as_list(value: object) -> list:
+    """Normalize a ConvertTo-Json value (PowerShell emits single items as scalars)."""
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _ps_array(values: list[str]) -> str:
+    """Render strings as a PowerShell array literal of single-quoted strings."""
+    return "@(" + ", ".join(f"'{_escape_ps_string(v)}'" for v in values) + ")"
+
+
 def extract_member_from_error(error_msg: str) -> str | None:
     """Extract member email from an error message like 'Add user@domain.com: error...'."""
     match = re.match(r"Add ([^:]+):", error_msg)
@@ -78,6 +114,34 @@ class ExchangeGroup:
     members: list[str] | None = None
 
 
+@dataclass
+class ExchangeGroupChange:
+    """Changes to apply to one group in a batched ``apply_group_changes`` call."""
+
+    identity: str  # Group email address
+    add: list[str] = field(default_factory=list)
+    remove: list[str] = field(default_factory=list)
+    description: str | None = None
+    managed_by: str | None = None
+    alias_addresses: list[str] = field(default_factory=list)  # e.g. ["ff@example.org"]
+
+    @property
+    def operations(self) -> int:
+        """Number of cmdlets the change script runs for this group."""
+        settings = (self.description, self.managed_by, self.alias_addresses)
+        return len(self.add) + len(self.remove) + sum(1 for s in settings if s)
+
+
+@dataclass
+class ExchangeGroupChangeResult:
+    """Per-group outcome of ``apply_group_changes``."""
+
+    identity: str
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
 class ExchangeOnlineClient:
     """Client for Exchange Online PowerShell operations.
 
@@ -91,6 +155,8 @@ class ExchangeOnlineClient:
         certificate_path: Path | str | None = None,
         certificate_password: str | None = None,
         organization: str | None = None,
+        persistent: bool = False,
+        pool_size: int = 1,
     ) -> None:
         """Initialize the Exchange Online client.
 
@@ -99,6 +165,9 @@ class ExchangeOnlineClient:
             certificate_path: Path to .pfx certificate file (cross-platform)
             certificate_password: Password for the .pfx file
             organization: The organization domain (overrides env config)
+            persistent: Keep connected PowerShell worker(s) for the client's
+                lifetime instead of connecting per call; call ``close()`` when done
+            pool_size: Number of persistent workers (concurrent commands)
         """
         creds = get_exchange_credentials()
         self.tenant_id = creds.tenant_id
@@ -108,6 +177,16 @@ class ExchangeOnlineClient:
         self.certificate_thumbprint = certificate_thumbprint or creds.certificate_thumbprint
         self.certificate_path = certificate_path or creds.certificate_path
         self.certificate_password = certificate_password or creds.certificate_password
+        self.persistent = persistent
+        self.pool_size = pool_size
+        self._pool: PowerShellSessionPool | None = None
+
+    def _setup_commands(self) -> list[str]:
+        """Commands that import the module and connect (run once per process)."""
+        return [
+            "Import-Module ExchangeOnlineManagement -ErrorAction Stop",
+            self._build_connect_command(),
+        ]
 
     def _build_connect_command(self) -> str:
         """Build the Connect-ExchangeOnline command."""
@@ -141,22 +220,54 @@ class ExchangeOnlineClient:
         else:
             raise ValueError("Either certificate_thumbprint or certificate_path must be provided")
 
-    def _run_powershell(self, commands: list[str], parse_json: bool = True) -> dict | str | None:
+    @staticmethod
+    def _parse_output(stdout: str, parse_json: bool) -> dict | str:
+        """Parse PowerShell output as JSON (tolerating leading banner text) or raw text."""
+        output = stdout.strip()
+        if not output:
+            return {} if parse_json else ""
+
+        if parse_json:
+            try:
+                return json.loads(output)
+            except json.JSONDecodeError:
+                # Banner text may precede JSON - try to find JSON in output
+                json_start = output.find("{")
+                if json_start == -1:
+                    json_start = output.find("[")
+                if json_start != -1:
+                    try:
+                        return json.loads(output[json_start:])
+                    except json.JSONDecodeError:
+                        pass
+                # Only warn if output looks like it might contain JSON data
+                # (not just banner text or empty results)
+                if "{" in output or "[" in output:
+                    logger.warning("Failed to parse JSON output: %s", output[:200])
+                return {"raw": output}
+
+        return output
+
+    def _run_powershell(
+        self,
+        commands: list[str],
+        parse_json: bool = True,
+        time_limit: float = COMMAND_TIMEOUT_SECONDS,
+    ) -> dict | str | None:
         """Run PowerShell commands and return the result.
 
         Args:
             commands: List of PowerShell commands to execute
             parse_json: If True, parse output as JSON
+            time_limit: Seconds to wait for the commands
 
         Returns:
             Parsed JSON dict, raw string output, or None on failure
         """
         # Build the full script with connection
         full_script = [
-            # Import module
-            "Import-Module ExchangeOnlineManagement -ErrorAction Stop",
-            # Connect
-            self._build_connect_command(),
+            # Import module and connect
+            *self._setup_commands(),
             # Run commands
             *commands,
             # Disconnect (suppress output)
@@ -170,37 +281,14 @@ class ExchangeOnlineClient:
                 ["pwsh", "-NoProfile", "-NonInteractive", "-Command", script],  # noqa: S607
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=time_limit,
             )
 
             if result.returncode != 0:
                 logger.error("PowerShell error: %s", result.stderr)
                 return None
 
-            output = result.stdout.strip()
-            if not output:
-                return {} if parse_json else ""
-
-            if parse_json:
-                try:
-                    return json.loads(output)
-                except json.JSONDecodeError:
-                    # Banner text may precede JSON - try to find JSON in output
-                    json_start = output.find("{")
-                    if json_start == -1:
-                        json_start = output.find("[")
-                    if json_start != -1:
-                        try:
-                            return json.loads(output[json_start:])
-                        except json.JSONDecodeError:
-                            pass
-                    # Only warn if output looks like it might contain JSON data
-                    # (not just banner text or empty results)
-                    if "{" in output or "[" in output:
-                        logger.warning("Failed to parse JSON output: %s", output[:200])
-                    return {"raw": output}
-
-            return output
+            return self._parse_output(result.stdout, parse_json)
 
         except subprocess.TimeoutExpired:
             logger.error("PowerShell command timed out")
@@ -212,6 +300,46 @@ class ExchangeOnlineClient:
             logger.error("Failed to run PowerShell: %s", e)
             return None
 
+    async def _execute(
+        self,
+        commands: list[str],
+        parse_json: bool = True,
+        time_limit: float = COMMAND_TIMEOUT_SECONDS,
+    ) -> dict | str | None:
+        """Run PowerShell commands without blocking the event loop.
+
+        With ``persistent=True`` the commands go to a long-lived worker
+        session (connected once, restarted after failures); otherwise each
+        call runs ``_run_powershell`` in a thread.
+
+        Args:
+            commands: List of PowerShell commands to execute
+            parse_json: If True, parse output as JSON
+            time_limit: Seconds to wait for the commands
+
+        Returns:
+            Parsed JSON dict, raw string output, or None on failure
+        """
+        if not self.persistent:
+            return await asyncio.to_thread(self._run_powershell, commands, parse_json, time_limit)
+
+        if self._pool is None:
+            self._pool = PowerShellSessionPool(self._setup_commands(), size=self.pool_size)
+        try:
+            output = await self._pool.run("; ".join(commands), time_limit)
+        except PowerShellCommandError as e:
+            logger.error("PowerShell error: %s", e)
+            return None
+        except PowerShellSessionError as e:
+            logger.error("PowerShell session failed (restarting on next call): %s", e)
+            return None
+        return self._parse_output(output, parse_json)
+
+    @property
+    def connect_count(self) -> int:
+        """Number of persistent-session connects so far (0 when not persistent)."""
+        return self._pool.starts if self._pool else 0
+
     async def get_distribution_group(self, identity: str) -> ExchangeGroup | None:
         """Get a distribution group or mail-enabled security group by identity.
 
@@ -228,7 +356,7 @@ class ExchangeOnlineClient:
             f"if ($group) {{ $group | Select-Object {select_fields} | ConvertTo-Json }}",
         ]
 
-        result = self._run_powershell(commands)
+        result = await self._execute(commands)
         if result and isinstance(result, dict) and "Identity" in result:
             return ExchangeGroup(
                 identity=result.get("Identity", identity),
@@ -265,7 +393,7 @@ class ExchangeOnlineClient:
             ),
         ]
 
-        result = self._run_powershell(commands)
+        result = await self._execute(commands)
         if not result or not isinstance(result, dict):
             return None, []
 
@@ -350,7 +478,7 @@ class ExchangeOnlineClient:
             f"$group | Select-Object {select_fields} | ConvertTo-Json",
         ]
 
-        result = self._run_powershell(commands)
+        result = await self._execute(commands)
         if result and isinstance(result, dict) and "Identity" in result:
             logger.info("Created mail-enabled security group: %s", display_name)
             return ExchangeGroup(
@@ -384,7 +512,7 @@ class ExchangeOnlineClient:
             "Write-Output 'SUCCESS'",
         ]
 
-        result = self._run_powershell(commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
         if result and "SUCCESS" in str(result):
             logger.info("Updated description for %s", identity)
             return True
@@ -415,7 +543,7 @@ class ExchangeOnlineClient:
             "Write-Output 'SUCCESS'",
         ]
 
-        result = self._run_powershell(commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
         if result and "SUCCESS" in str(result):
             logger.info("Updated ManagedBy for %s to %s", identity, managed_by)
             return True
@@ -459,7 +587,7 @@ class ExchangeOnlineClient:
         )
         commands = [set_cmd, "Write-Output 'SUCCESS'"]
 
-        result = self._run_powershell(commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
         if result and "SUCCESS" in str(result):
             logger.info("Added aliases to %s: %s", identity, ", ".join(aliases))
             return True
@@ -506,7 +634,7 @@ class ExchangeOnlineClient:
 
         commands.append("Write-Output 'SUCCESS'")
 
-        result = self._run_powershell(commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
         if result and "SUCCESS" in str(result):
             if description:
                 logger.info("Updated description for %s", identity)
@@ -532,7 +660,7 @@ class ExchangeOnlineClient:
             "Write-Output 'SUCCESS'",
         ]
 
-        result = self._run_powershell(commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
         if result and "SUCCESS" in str(result):
             logger.info("Deleted distribution group: %s", identity)
             return True
@@ -562,7 +690,7 @@ class ExchangeOnlineClient:
             "| Select-Object PrimarySmtpAddress | ConvertTo-Json",
         ]
 
-        result = self._run_powershell(commands)
+        result = await self._execute(commands)
         if not result:
             return []
 
@@ -604,7 +732,7 @@ class ExchangeOnlineClient:
             "Write-Output 'SUCCESS'",
         ]
 
-        result = self._run_powershell(commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
         result_str = str(result) if result else ""
 
         if "SUCCESS" in result_str:
@@ -642,7 +770,7 @@ class ExchangeOnlineClient:
             "{ Write-Output 'ALREADY_REMOVED' } else { throw } }",
         ]
 
-        result = self._run_powershell(commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
         result_str = str(result) if result else ""
         if "SUCCESS" in result_str:
             logger.info("Removed %s from %s", member, identity)
@@ -729,7 +857,7 @@ class ExchangeOnlineClient:
             "@{ Added = $added; Removed = $removed; Errors = $errors } | ConvertTo-Json"
         )
 
-        result = self._run_powershell(commands)
+        result = await self._execute(commands)
 
         added: list[str] = []
         removed: list[str] = []
@@ -884,7 +1012,7 @@ class ExchangeOnlineClient:
             ]
         )
 
-        result = self._run_powershell(script_parts)
+        result = await self._execute(script_parts)
 
         # Parse result
         if not result or not isinstance(result, dict):
@@ -951,7 +1079,7 @@ class ExchangeOnlineClient:
                         " 'SUCCESS'"
                         " } catch { $_.Exception.Message }"
                     ]
-                    retry_result = self._run_powershell(add_script)
+                    retry_result = await self._execute(add_script)
                     # Check for SUCCESS in string or raw dict output
                     if "SUCCESS" in str(retry_result):
                         logger.info("Retry succeeded: Added %s to %s", member, identity)
@@ -972,6 +1100,279 @@ class ExchangeOnlineClient:
         result["errors"] = permanent_errors
         return result
 
+    async def get_groups_with_members(
+        self, identities: list[str]
+    ) -> dict[str, tuple[ExchangeGroup | None, list[str]]]:
+        """Get several groups and their members with one script per batch.
+
+        Bulk equivalent of ``get_group_with_members``: every group in a
+        batch of ``GROUP_BATCH_SIZE`` is read in a single PowerShell call.
+
+        Args:
+            identities: Group email addresses
+
+        Returns:
+            Dict mapping each identity to (ExchangeGroup or None, member emails).
+            Groups that could not be read map to (None, []).
+        """
+        batches = [
+            identities[i : i + GROUP_BATCH_SIZE]
+            for i in range(0, len(identities), GROUP_BATCH_SIZE)
+        ]
+        outputs = await asyncio.gather(*(self._read_group_batch(b) for b in batches))
+
+        groups: dict[str, tuple[ExchangeGroup | None, list[str]]] = {
+            identity: (None, []) for identity in identities
+        }
+        for output in outputs:
+            groups.update(output)
+        return groups
+
+    async def _read_group_batch(
+        self, identities: list[str]
+    ) -> dict[str, tuple[ExchangeGroup | None, list[str]]]:
+        """Read one batch of groups and members (see ``get_groups_with_members``)."""
+        commands = [
+            "$out = @()",
+            (
+                f"foreach ($id in {_ps_array(identities)}) {{ "
+                "$group = Get-DistributionGroup -Identity $id -ErrorAction SilentlyContinue; "
+                "$members = @(); "
+                "if ($group) { $members = @(Get-DistributionGroupMember -Identity $group.Identity "
+                '| ForEach-Object { "$($_.PrimarySmtpAddress)".ToLower() } '
+                "| Where-Object { $_ -ne '' }) }; "
+                "$out += @{ Identity = $id; Group = ($group | Select-Object Identity, "
+                "DisplayName, PrimarySmtpAddress, RecipientTypeDetails); Members = $members } }"
+            ),
+            "ConvertTo-Json -InputObject @($out) -Depth 4",
+        ]
+
+        # Two cmdlets (group, members) per group
+        result = await self._execute(commands, time_limit=_batch_time_limit(2 * len(identities)))
+        groups: dict[str, tuple[ExchangeGroup | None, list[str]]] = {}
+        if not isinstance(result, list | dict) or "raw" in result:
+            logger.error("Failed to read groups: %s", ", ".join(identities))
+            return groups
+
+        for entry in _as_list(result):
+            if not isinstance(entry, dict) or not entry.get("Identity"):
+                continue
+            identity = entry["Identity"]
+            group_data = entry.get("Group")
+            group = None
+            if isinstance(group_data, dict) and "Identity" in group_data:
+                group = ExchangeGroup(
+                    identity=group_data.get("Identity", identity),
+                    display_name=group_data.get("DisplayName", ""),
+                    primary_smtp_address=group_data.get("PrimarySmtpAddress", ""),
+                    group_type=group_data.get("RecipientTypeDetails", ""),
+                )
+            members = [str(m).lower() for m in _as_list(entry.get("Members")) if m]
+            groups[identity] = (group, members)
+        return groups
+
+    @staticmethod
+    def _group_change_script(change: ExchangeGroupChange) -> str:
+        """PowerShell block applying one group's changes and appending to ``$results``."""
+        esc_id = _escape_ps_string(change.identity)
+        parts = [f"$r = @{{ Identity = '{esc_id}'; Added = @(); Removed = @(); Errors = @() }}"]
+        if change.description:
+            parts.append(
+                f"try {{ Set-DistributionGroup -Identity '{esc_id}' "
+                f"-Description '{_escape_ps_string(change.description)}' -ErrorAction Stop }} "
+                "catch { $r.Errors += 'Description: ' + $_.Exception.Message }"
+            )
+        if change.managed_by:
+            parts.append(
+                f"try {{ Set-DistributionGroup -Identity '{esc_id}' "
+                f"-ManagedBy '{_escape_ps_string(change.managed_by)}' "
+                "-BypassSecurityGroupManagerCheck -ErrorAction Stop } "
+                "catch { $r.Errors += 'ManagedBy: ' + $_.Exception.Message }"
+            )
+        if change.add:
+            parts.append(
+                f"foreach ($member in {_ps_array(change.add)}) {{ "
+                f"try {{ Add-DistributionGroupMember -Identity '{esc_id}' -Member $member "
+                "-BypassSecurityGroupManagerCheck -ErrorAction Stop; $r.Added += $member } "
+                "catch { if ($_.Exception.Message -like '*already a member*') "
+                "{ $r.Added += $member } "
+                'else { $r.Errors += "Add $member`: " + $_.Exception.Message } } }'
+            )
+        if change.remove:
+            parts.append(
+                f"foreach ($member in {_ps_array(change.remove)}) {{ "
+                f"try {{ Remove-DistributionGroupMember -Identity '{esc_id}' -Member $member "
+                "-BypassSecurityGroupManagerCheck -Confirm:$false -ErrorAction Stop; "
+                "$r.Removed += $member } "
+                'catch { if ($_.Exception.Message -match "isn\'t a member of the group") '
+                "{ $r.Removed += $member } "
+                'else { $r.Errors += "Remove $member`: " + $_.Exception.Message } } }'
+            )
+        if change.alias_addresses:
+            addresses = '","'.join(f"smtp:{a}" for a in change.alias_addresses)
+            parts.append(
+                f"try {{ Set-DistributionGroup -Identity '{esc_id}' "
+                f'-EmailAddresses @{{Add="{addresses}"}} -ErrorAction Stop }} '
+                "catch { $r.Errors += 'Aliases: ' + $_.Exception.Message }"
+            )
+        parts.append("$results += $r")
+        return "; ".join(parts)
+
+    async def _apply_change_batch(
+        self, changes: list[ExchangeGroupChange]
+    ) -> dict[str, ExchangeGroupChangeResult]:
+        """Apply one batch of group changes in a single script."""
+        commands = [
+            "$results = @()",
+            *(self._group_change_script(c) for c in changes),
+            "ConvertTo-Json -InputObject @($results) -Depth 4",
+        ]
+        time_limit = _batch_time_limit(sum(c.operations for c in changes))
+        result = await self._execute(commands, time_limit=time_limit)
+        if not isinstance(result, list | dict) or "raw" in result:
+            return await self._reconcile_failed_batch(changes)
+
+        outcomes = {
+            c.identity: ExchangeGroupChangeResult(identity=c.identity, errors=[BATCH_SCRIPT_FAILED])
+            for c in changes
+        }
+        for entry in _as_list(result):
+            if not isinstance(entry, dict) or entry.get("Identity") not in outcomes:
+                continue
+            outcomes[entry["Identity"]] = ExchangeGroupChangeResult(
+                identity=entry["Identity"],
+                added=[str(m) for m in _as_list(entry.get("Added")) if m],
+                removed=[str(m) for m in _as_list(entry.get("Removed")) if m],
+                errors=[str(e) for e in _as_list(entry.get("Errors")) if e],
+            )
+        return outcomes
+
+    async def _reconcile_failed_batch(
+        self, changes: list[ExchangeGroupChange]
+    ) -> dict[str, ExchangeGroupChangeResult]:
+        """Report what a failed change script applied before it stopped.
+
+        A script that timed out or threw may have applied some of its
+        changes, so the groups are re-read and membership changes that
+        already took effect are reported as applied. Anything else is
+        reported as an error.
+        """
+        current = await self.get_groups_with_members([c.identity for c in changes])
+        outcomes: dict[str, ExchangeGroupChangeResult] = {}
+        for change in changes:
+            outcome = ExchangeGroupChangeResult(identity=change.identity)
+            outcomes[change.identity] = outcome
+            group, members = current[change.identity]
+            if group is None:
+                outcome.errors.append(BATCH_SCRIPT_FAILED)
+                continue
+
+            present = set(members)
+            for member in change.add:
+                if member.lower() in present:
+                    outcome.added.append(member)
+                else:
+                    outcome.errors.append(f"Add {member}: {BATCH_SCRIPT_FAILED}")
+            for member in change.remove:
+                if member.lower() in present:
+                    outcome.errors.append(f"Remove {member}: {BATCH_SCRIPT_FAILED}")
+                else:
+                    outcome.removed.append(member)
+            for label, requested in (
+                ("Description", change.description),
+                ("ManagedBy", change.managed_by),
+                ("Aliases", change.alias_addresses),
+            ):
+                if requested:
+                    outcome.errors.append(f"{label}: {BATCH_SCRIPT_FAILED}")
+        return outcomes
+
+    async def _apply_batches(
+        self, changes: list[ExchangeGroupChange]
+    ) -> dict[str, ExchangeGroupChangeResult]:
+        """Apply changes ``GROUP_BATCH_SIZE`` groups per script (no retries).
+
+        Each script's time limit grows with the cmdlets it runs; if one
+        still fails, its groups are re-read to report what was applied.
+        """
+        batches = [
+            changes[i : i + GROUP_BATCH_SIZE] for i in range(0, len(changes), GROUP_BATCH_SIZE)
+        ]
+        outcomes: dict[str, ExchangeGroupChangeResult] = {}
+        for batch_result in await asyncio.gather(*(self._apply_change_batch(b) for b in batches)):
+            outcomes.update(batch_result)
+        return outcomes
+
+    async def apply_group_changes(
+        self, changes: list[ExchangeGroupChange]
+    ) -> dict[str, ExchangeGroupChangeResult]:
+        """Apply member, description, owner and alias changes across many groups.
+
+        Changes are sent ``GROUP_BATCH_SIZE`` groups per script and each
+        script returns one JSON envelope with per-group results. Transient
+        Azure AD sync failures on adds are retried (batched across groups)
+        with the same delays as ``sync_group``.
+
+        Args:
+            changes: Per-group changes (members already diffed by the caller)
+
+        Returns:
+            Dict mapping group identity to its ExchangeGroupChangeResult
+        """
+        if not changes:
+            return {}
+
+        outcomes = await self._apply_batches(changes)
+
+        # Split transient add failures out for retry
+        pending: dict[str, list[str]] = {}
+        for outcome in outcomes.values():
+            permanent = []
+            for error in outcome.errors:
+                member = extract_member_from_error(error) if is_transient_error(error) else None
+                if member:
+                    pending.setdefault(outcome.identity, []).append(member)
+                else:
+                    permanent.append(error)
+            outcome.errors = permanent
+
+        for attempt, delay in enumerate(RETRY_DELAYS_SECONDS[:MAX_RETRY_ATTEMPTS]):
+            if not pending:
+                break
+            logger.info(
+                "Retry attempt %d/%d after %ds delay for %d members in %d groups",
+                attempt + 1,
+                MAX_RETRY_ATTEMPTS,
+                delay,
+                sum(len(m) for m in pending.values()),
+                len(pending),
+            )
+            await asyncio.sleep(delay)
+            retry_changes = [ExchangeGroupChange(identity=i, add=m) for i, m in pending.items()]
+            pending = {}
+            for identity, retried in (await self._apply_batches(retry_changes)).items():
+                outcomes[identity].added.extend(retried.added)
+                for error in retried.errors:
+                    member = extract_member_from_error(error)
+                    if member and is_transient_error(error):
+                        pending.setdefault(identity, []).append(member)
+                    else:
+                        outcomes[identity].errors.append(error)
+
+        for identity, members in pending.items():
+            outcomes[identity].errors.extend(
+                f"Add {member}: Failed after {MAX_RETRY_ATTEMPTS} retries" for member in members
+            )
+
+        for outcome in outcomes.values():
+            for member in outcome.added:
+                logger.info("Added %s to %s", member, outcome.identity)
+            for member in outcome.removed:
+                logger.info("Removed %s from %s", member, outcome.identity)
+            for error in outcome.errors:
+                logger.error("Error syncing %s: %s", outcome.identity, error)
+        return outcomes
+
     async def set_unified_group_welcome_message(self, identity: str, enabled: bool) -> bool:
         """Enable or disable welcome messages for a unified (M365) group.
 
@@ -987,7 +1388,7 @@ class ExchangeOnlineClient:
         cmd += f"-UnifiedGroupWelcomeMessageEnabled:{enabled_str}"
         commands = [cmd]
 
-        result = await asyncio.to_thread(self._run_powershell, commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
 
         if result is None:
             logger.error("Failed to set welcome message for %s", identity)
@@ -1020,7 +1421,7 @@ class ExchangeOnlineClient:
         cmd += f"-AlwaysSubscribeMembersToCalendarEvents:{always_str}"
         commands = [cmd]
 
-        result = await asyncio.to_thread(self._run_powershell, commands, parse_json=False)
+        result = await self._execute(commands, parse_json=False)
 
         if result is None:
             logger.error("Failed to set calendar settings for %s", identity)
@@ -1030,5 +1431,7 @@ class ExchangeOnlineClient:
         return True
 
     async def close(self) -> None:
-        """Close the client (no-op for subprocess approach)."""
-        pass
+        """Close persistent PowerShell sessions (no-op for one-shot subprocesses)."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
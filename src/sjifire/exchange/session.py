@@ -0,0 +1,250 @@
+"""Long-lived PowerShell worker sessions for Exchange Online.
+
+Spawning ``pwsh``, importing ExchangeOnlineManagement and connecting costs
+10-30 seconds, which dominated runs that issue one script per group. A
+``PowerShellSession`` pays that once: it starts a worker that runs the
+setup commands (import + connect), then reads one JSON request per line
+from stdin and answers each with a single framed JSON line on stdout.
+
+Frames are prefixed with ``FRAME_MARKER`` so banner text or stray host
+output on stdout is skipped. A worker that exits, times out or writes
+garbage is killed and transparently restarted on the next call.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+FRAME_MARKER = "##SJIFIRE-PS-FRAME##"
+
+# Seconds allowed for the worker to import the module and connect
+START_TIMEOUT_SECONDS = 180.0
+
+# Seconds allowed per command (matches the one-shot subprocess timeout)
+COMMAND_TIMEOUT_SECONDS = 120.0
+
+# asyncio stream buffer; large groups produce long single-line JSON frames
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+_WORKER_LOOP = f"""
+$ErrorActionPreference = 'Continue'
+function Send-Frame($frame) {{
+    [Console]::Out.WriteLine('{FRAME_MARKER}' + ($frame | ConvertTo-Json -Compress -Depth 2))
+    [Console]::Out.Flush()
+}}
+Send-Frame @{{ id = 0; ok = $true; output = 'READY' }}
+while ($null -ne ($line = [Console]::In.ReadLine())) {{
+    $request = $line | ConvertFrom-Json
+    try {{
+        $output = & ([scriptblock]::Create($request.script)) | Out-String -Width 4096
+        Send-Frame @{{ id = $request.id; ok = $true; output = $output }}
+    }} catch {{
+        Send-Frame @{{ id = $request.id; ok = $false; output = ''; error = $_.Exception.Message }}
+    }}
+}}
+Disconnect-ExchangeOnline -Confirm:$false *>$null
+"""
+
+
+class PowerShellError(Exception):
+    """Base error for persistent PowerShell sessions."""
+
+
+class PowerShellSessionError(PowerShellError):
+    """The worker process failed (exited, timed out, or broke the protocol)."""
+
+
+class PowerShellCommandError(PowerShellError):
+    """A command ran but threw a terminating error."""
+
+
+def build_worker_script(setup: list[str]) -> str:
+    """Build the worker script: setup commands followed by the request loop.
+
+    Args:
+        setup: Commands run once at startup (e.g. Import-Module, Connect-ExchangeOnline)
+
+    Returns:
+        PowerShell script for ``pwsh -Command``
+    """
+    return "\n".join(["$ErrorActionPreference = 'Stop'", *setup, _WORKER_LOOP])
+
+
+class PowerShellSession:
+    """A single long-lived ``pwsh`` worker driven over stdin/stdout.
+
+    Commands are serialized per session. The worker is started lazily and
+    restarted after any failure.
+    """
+
+    def __init__(self, setup: list[str], executable: str = "pwsh") -> None:
+        """Initialize the session (the process starts on first use).
+
+        Args:
+            setup: Commands run once when the worker starts
+            executable: PowerShell executable name or path
+        """
+        self._setup = setup
+        self.executable = executable
+        self._proc: asyncio.subprocess.Process | None = None
+        self._stdin: asyncio.StreamWriter | None = None
+        self._stdout: asyncio.StreamReader | None = None
+        self._stderr_task: asyncio.Task | None = None
+        self._stderr_tail: deque[str] = deque(maxlen=20)
+        self._lock = asyncio.Lock()
+        self._next_id = 1
+        self.starts = 0
+
+    @property
+    def running(self) -> bool:
+        """Check whether the worker process is alive."""
+        return self._proc is not None and self._proc.returncode is None
+
+    async def _drain_stderr(self, stream: asyncio.StreamReader) -> None:
+        """Log worker stderr and keep the tail for error messages."""
+        while line := await stream.readline():
+            text = line.decode(errors="replace").rstrip()
+            self._stderr_tail.append(text)
+            logger.debug("pwsh stderr: %s", text)
+
+    async def _read_frame(self) -> dict:
+        """Read stdout until the next framed line and decode it."""
+        if self._proc is None or self._stdout is None:
+            raise PowerShellSessionError("PowerShell session is not running")
+        while True:
+            line = await self._stdout.readline()
+            if not line:
+                code = await self._proc.wait()
+                tail = " | ".join(self._stderr_tail)
+                raise PowerShellSessionError(f"PowerShell exited with code {code}: {tail}")
+            text = line.decode(errors="replace").rstrip()
+            if not text.startswith(FRAME_MARKER):
+                logger.debug("pwsh: %s", text)
+                continue
+            try:
+                return json.loads(text[len(FRAME_MARKER) :])
+            except json.JSONDecodeError as e:
+                raise PowerShellSessionError(f"Malformed frame from PowerShell: {e}") from e
+
+    async def _start(self) -> None:
+        """Start the worker and wait for it to finish setup."""
+        self._stderr_tail.clear()
+        self._proc = await asyncio.create_subprocess_exec(
+            self.executable,
+            "-NoProfile",
+            "-NonInteractive",
+            "-Command",
+            build_worker_script(self._setup),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_STREAM_LIMIT,
+        )
+        self.starts += 1
+        self._stdin, self._stdout = self._proc.stdin, self._proc.stdout
+        if self._proc.stderr is not None:
+            self._stderr_task = asyncio.create_task(self._drain_stderr(self._proc.stderr))
+        await asyncio.wait_for(self._read_frame(), START_TIMEOUT_SECONDS)
+        logger.info("PowerShell session ready (start #%d)", self.starts)
+
+    async def run(self, script: str, time_limit: float = COMMAND_TIMEOUT_SECONDS) -> str:
+        """Run a script in the worker and return its output.
+
+        Args:
+            script: PowerShell script (runs in its own scope)
+            time_limit: Seconds to wait for the result
+
+        Returns:
+            The script's output, formatted by ``Out-String``
+
+        Raises:
+            PowerShellSessionError: The worker failed; it will be restarted next call
+            PowerShellCommandError: The script threw a terminating error
+        """
+        async with self._lock:
+            try:
+                if not self.running:
+                    await self._start()
+                if self._stdin is None:
+                    raise PowerShellSessionError("PowerShell session has no stdin")
+                request_id = self._next_id
+                self._next_id += 1
+                request = json.dumps({"id": request_id, "script": script})
+                self._stdin.write(request.encode() + b"\n")
+                await self._stdin.drain()
+                frame = await asyncio.wait_for(self._read_frame(), time_limit)
+                while frame.get("id") != request_id:
+                    frame = await asyncio.wait_for(self._read_frame(), time_limit)
+            except TimeoutError as e:
+                await self._kill()
+                raise PowerShellSessionError("PowerShell command timed out") from e
+            except PowerShellSessionError:
+                await self._kill()
+                raise
+            except OSError as e:
+                await self._kill()
+                raise PowerShellSessionError(f"Failed to run PowerShell: {e}") from e
+
+        if not frame.get("ok"):
+            raise PowerShellCommandError(frame.get("error") or "PowerShell command failed")
+        return frame.get("output") or ""
+
+    async def _kill(self) -> None:
+        """Kill the worker so the next call starts a fresh one."""
+        if self._proc is not None and self._proc.returncode is None:
+            self._proc.kill()
+            await self._proc.wait()
+        if self._stderr_task:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+        self._proc = self._stdin = self._stdout = None
+
+    async def close(self) -> None:
+        """Ask the worker to disconnect and exit (killing it if it hangs)."""
+        async with self._lock:
+            if self._proc is not None and self._stdin is not None and self.running:
+                self._stdin.close()
+                try:
+                    await asyncio.wait_for(self._proc.wait(), 30)
+                except TimeoutError:
+                    logger.warning("PowerShell session did not exit; killing it")
+            await self._kill()
+
+
+class PowerShellSessionPool:
+    """A small pool of ``PowerShellSession`` workers sharing the same setup."""
+
+    def __init__(self, setup: list[str], size: int = 1, executable: str = "pwsh") -> None:
+        """Initialize the pool (workers start lazily on first use).
+
+        Args:
+            setup: Commands run once when each worker starts
+            size: Number of workers (concurrent commands)
+            executable: PowerShell executable name or path
+        """
+        self.sessions = [PowerShellSession(setup, executable) for _ in range(max(1, size))]
+        self._idle: asyncio.Queue[PowerShellSession] | None = None
+
+    @property
+    def starts(self) -> int:
+        """Total worker starts (each is one import + connect)."""
+        return sum(s.starts for s in self.sessions)
+
+    async def run(self, script: str, time_limit: float = COMMAND_TIMEOUT_SECONDS) -> str:
+        """Run a script on the next idle worker (see ``PowerShellSession.run``)."""
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for session in self.sessions:
+                self._idle.put_nowait(session)
+        session = await self._idle.get()
+        try:
+            return await session.run(script, time_limit)
+        finally:
+            self._idle.put_nowait(session)
+
+    async def close(self) -> None:
+        """Close every worker."""
+        await asyncio.gather(*(s.close() for s in self.sessions))
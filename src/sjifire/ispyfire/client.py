@@ -23,6 +23,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from sjifire.core.throttle import RateLimiter
 from sjifire.ispyfire.models import DispatchCall, ISpyFirePerson
 
 
@@ -80,7 +81,7 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 5
 MIN_WAIT_SECONDS = 1
 MAX_WAIT_SECONDS = 30
-BULK_OPERATION_DELAY = 0.2  # 200ms delay between bulk operations
+BULK_OPERATION_DELAY = 0.2  # 200ms between request starts on the main API
 
 
 def _is_rate_limited(response: httpx.Response) -> bool:
@@ -99,8 +100,15 @@ class ISpyFireClient:
 
     CENTRAL_API_BASE = "https://api.ispyfire.com"
 
-    def __init__(self) -> None:
-        """Initialize the client with credentials from environment."""
+    def __init__(self, limiter: RateLimiter | None = None) -> None:
+        """Initialize the client with credentials from environment.
+
+        Args:
+            limiter: Request spacing for the main API (defaults to one request
+                start per ``BULK_OPERATION_DELAY``); shared by every thread
+                using this client
+        """
+        self._limiter = limiter or RateLimiter(BULK_OPERATION_DELAY)
         self._fixture_dir = _get_fixture_dir()
         if self._fixture_dir:
             self.base_url = "https://fixture.ispyfire.com"
@@ -152,11 +160,12 @@ class ISpyFireClient:
         url: str,
         **kwargs,
     ) -> httpx.Response:
-        """Make an HTTP request with proactive delay and retry logic.
+        """Make an HTTP request with proactive spacing and retry logic.
 
         All API calls should go through this method to ensure consistent
         rate limiting behavior:
-        1. Proactive delay before each request to avoid hitting limits
+        1. Request starts spaced ``BULK_OPERATION_DELAY`` apart (across
+           threads) to avoid hitting limits
         2. Exponential backoff retry on 429 responses
 
         Args:
@@ -170,8 +179,8 @@ class ISpyFireClient:
         if not self.client:
             raise RuntimeError("Client must be used as context manager")
 
-        # Proactive delay to avoid rate limiting
-        time.sleep(BULK_OPERATION_DELAY)
+        # Proactive spacing to avoid rate limiting
+        self._limiter.wait()
 
         response = self.client.request(method, url, **kwargs)
 
@@ -7,12 +7,17 @@ Each subclass must set ``_container_name`` and keeps its own
 ``_memory: ClassVar[dict[str, dict]]`` for in-memory fallback state.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Any, ClassVar, Self, TypeVar
 
 from sjifire.core.config import get_cosmos_container
 
 T = TypeVar("T")
 
+# Server-managed properties dropped before re-inserting a raw document
+_SYSTEM_PROPERTIES = ("_rid", "_self", "_etag", "_attachments", "_ts")
+
 
 class CosmosStore:
     """Base class for Cosmos DB-backed stores with in-memory fallback.
@@ -38,6 +43,7 @@ class CosmosStore:
     """
 
     _container_name: ClassVar[str]
+    _memory: ClassVar[dict[str, dict]]
 
     def __init__(self) -> None:
         """Initialize store. Call ``__aenter__`` to connect."""
@@ -123,3 +129,81 @@ class CosmosStore:
             if len(items) >= max_items:
                 break
         return items
+
+    # ------------------------------------------------------------------
+    # Raw documents (backup export / restore)
+    # ------------------------------------------------------------------
+
+    async def iter_raw_pages(
+        self,
+        *,
+        page_size: int = 1000,
+        continuation: str | None = None,
+        since_ts: int | None = None,
+    ) -> AsyncIterator[tuple[list[dict], str | None]]:
+        """Stream every document in the container, one page at a time.
+
+        Pages follow Cosmos continuation tokens, so the whole container
+        is never held in memory and a caller can stop after any page and
+        pick up later from the token it saved.
+
+        Args:
+            page_size: Documents per page
+            continuation: Token saved from an earlier page (None to start)
+            since_ts: Only documents whose ``_ts`` (last write, epoch
+                seconds) is at or after this value
+
+        Yields:
+            Tuples of (raw documents, continuation token for the next
+            page or None after the last page)
+        """
+        if self._in_memory:
+            docs = [
+                doc
+                for doc in self._memory.values()
+                if since_ts is None or doc.get("_ts", 0) >= since_ts
+            ]
+            offset = int(continuation or 0)
+            while offset < len(docs):
+                end = offset + page_size
+                yield docs[offset:end], str(end) if end < len(docs) else None
+                offset = end
+            return
+
+        if since_ts is None:
+            query, parameters = "SELECT * FROM c", None
+        else:
+            query = "SELECT * FROM c WHERE c._ts >= @since"
+            parameters = [{"name": "@since", "value": since_ts}]
+        pager = self._container.query_items(
+            query=query,
+            parameters=parameters,
+            max_item_count=page_size,
+        ).by_page(continuation)
+        async for page in pager:
+            yield [item async for item in page], pager.continuation_token
+
+    async def upsert_raw(self, docs: list[dict], *, concurrency: int = 16) -> int:
+        """Write raw documents back, e.g. when restoring a backup.
+
+        Args:
+            docs: Documents as exported by ``iter_raw_pages``
+            concurrency: Maximum upserts in flight
+
+        Returns:
+            Number of documents written
+        """
+        bodies = [{k: v for k, v in doc.items() if k not in _SYSTEM_PROPERTIES} for doc in docs]
+        if self._in_memory:
+            for body in bodies:
+                self._memory[body["id"]] = body
+            return len(bodies)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upsert(body: dict) -> None:
+            async with semaphore:
+                await self._container.upsert_item(body=body)
+
+        await asyncio.gather(*(upsert(body) for body in bodies))
+        return len(bodies)
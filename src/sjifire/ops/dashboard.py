@@ -971,40 +971,35 @@ async def _fetch_open_calls_enriched() -> list[dict]:
     """Enrich cached open-call docs with geo, severity, and site history.
 
     Reads from the shared open-calls cache — no separate iSpyFire fetch.
-    Only opens a DispatchStore for Cosmos DB site-history queries.
+    Site history is one point-read of the site index per call, with all
+    calls looked up concurrently.
     """
     docs = await _fetch_open_docs_cached()
 
-    enriched = []
     async with DispatchStore() as store:
-        for doc in docs:
-            call_data = _enrich_doc_for_kiosk(doc, doc.to_dict())
-
-            # Site history (max 5)
-            if doc.address:
-                try:
-                    history = await store.list_by_address(
-                        doc.address, exclude_id=doc.id, max_items=5
-                    )
-                    call_data["site_history"] = [
-                        {
-                            "dispatch_id": h.long_term_call_id,
-                            "nature": h.nature,
-                            "date": h.time_reported.isoformat() if h.time_reported else "",
-                        }
-                        for h in history
-                    ]
-                except Exception:
-                    logger.warning("Site history lookup failed for %s", doc.address)
-                    call_data["site_history"] = []
-            else:
-                call_data["site_history"] = []
+        histories = await asyncio.gather(*(_site_history(store, doc) for doc in docs))
 
-            enriched.append(call_data)
+    enriched = []
+    for doc, history in zip(docs, histories, strict=True):
+        call_data = _enrich_doc_for_kiosk(doc, doc.to_dict())
+        call_data["site_history"] = history
+        enriched.append(call_data)
 
     return enriched
 
 
+async def _site_history(store: DispatchStore, doc) -> list[dict]:
+    """Return up to 5 earlier calls at an open call's address for the kiosk."""
+    if not doc.address:
+        return []
+    try:
+        history = await store.site_history(doc.address, exclude_id=doc.id, max_items=5)
+    except Exception:
+        logger.warning("Site history lookup failed for %s", doc.address)
+        return []
+    return [{"dispatch_id": h.dispatch_id, "nature": h.nature, "date": h.date} for h in history]
+
+
 async def get_dashboard_data(*, call_limit: int = 200) -> dict:
     """Fetch all data and return template context for client-side refresh.
 
@@ -7,12 +7,29 @@ Provider selection (checked in order):
 1. Azure OpenAI — set ``AZURE_OPENAI_ENDPOINT`` (+ ``AZURE_OPENAI_API_KEY``)
 2. Anthropic — set ``ANTHROPIC_API_KEY`` (requires ``pip install anthropic``)
 3. No provider configured → returns empty ``DispatchAnalysis``
+
+Responses are cached by a hash of the model id and full prompt (see
+``analysis_cache``), so re-analyzing an unchanged call costs no LLM call.
+
+Each request is a static prefix (the system instructions and dispatch
+cheat sheet, identical for every call) followed by the per-call prompt
+from ``_build_prompt``. Keeping the prefix byte-identical lets both
+providers serve it from their prompt cache: Anthropic via an explicit
+``cache_control`` breakpoint, Azure OpenAI automatically for repeated
+prefixes of 1024+ tokens. Cache read/write token counts are logged per
+call and summed into ``cache_stats``.
 """
 
 import logging
 import os
 from pathlib import Path
 
+from sjifire.ops.dispatch.analysis_cache import (
+    AnalysisCacheStore,
+    CachedAnalysis,
+    analysis_cache_key,
+    cache_stats,
+)
 from sjifire.ops.dispatch.models import DispatchAnalysis, DispatchCallDocument
 
 logger = logging.getLogger(__name__)
@@ -30,7 +47,11 @@ if _CHEATSHEET_PATH.is_file():
 
 
 def _build_prompt(doc: DispatchCallDocument, crew_context: str = "") -> str:
-    """Build the user prompt from dispatch document fields."""
+    """Build the user prompt from dispatch document fields.
+
+    Holds only per-call data; anything static belongs in ``_SYSTEM_PROMPT``
+    so it stays in the cached prefix.
+    """
     reported = doc.time_reported.strftime("%Y-%m-%d %H:%M:%S") if doc.time_reported else "N/A"
     lines = [
         f"Call: {doc.nature} at {doc.address}",
@@ -77,11 +98,17 @@ def _get_azure_client():
     return _azure_client
 
 
+def _azure_deployment() -> str:
+    """Azure OpenAI deployment used for analysis."""
+    return os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
+
+
 async def _call_azure_openai(system: str, user_prompt: str) -> str:
     """Call Azure OpenAI with JSON mode."""
     client = _get_azure_client()
-    deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
+    deployment = _azure_deployment()
 
+    # System message first: Azure caches the longest repeated prefix
     response = await client.chat.completions.create(
         model=deployment,
         messages=[
@@ -91,21 +118,30 @@ async def _call_azure_openai(system: str, user_prompt: str) -> str:
         response_format={"type": "json_object"},
         temperature=0,
     )
+    _record_azure_usage(response.usage)
     return response.choices[0].message.content or ""
 
 
+def _anthropic_params(system: str, user_prompt: str) -> dict:
+    """Messages API parameters for one analysis (shared with batch mode)."""
+    from sjifire.core.anthropic import MODEL, cached_system
+
+    return {
+        "model": MODEL,
+        "max_tokens": 10_280,
+        "system": cached_system(system),
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
+
+
 async def _call_anthropic(system: str, user_prompt: str) -> str:
     """Call Anthropic Claude with JSON output."""
-    from sjifire.core.anthropic import MODEL, cached_system, get_client
+    from sjifire.core.anthropic import get_client
 
     client = get_client()
 
-    response = await client.messages.create(
-        model=MODEL,
-        max_tokens=10_280,
-        system=cached_system(system),
-        messages=[{"role": "user", "content": user_prompt}],
-    )
+    response = await client.messages.create(**_anthropic_params(system, user_prompt))
+    _record_anthropic_usage(response.usage)
     return response.content[0].text.strip()
 
 
@@ -124,6 +160,66 @@ async def _call_llm(system: str, user_prompt: str) -> str:
     return ""
 
 
+def _record_prompt_usage(read: int, write: int, uncached: int) -> None:
+    """Log one call's prompt cache usage and add it to ``cache_stats``."""
+    cache_stats.prompt_cache_read_tokens += read
+    cache_stats.prompt_cache_write_tokens += write
+    cache_stats.prompt_uncached_tokens += uncached
+    logger.info(
+        "Analysis prompt tokens: %d cache read, %d cache write, %d uncached",
+        read,
+        write,
+        uncached,
+    )
+
+
+def _record_anthropic_usage(usage: object) -> None:
+    """Record Anthropic usage (``input_tokens`` excludes cached tokens)."""
+    _record_prompt_usage(
+        getattr(usage, "cache_read_input_tokens", 0) or 0,
+        getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        getattr(usage, "input_tokens", 0) or 0,
+    )
+
+
+def _record_azure_usage(usage: object) -> None:
+    """Record Azure OpenAI usage (cache writes are not reported)."""
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", 0) or 0
+    _record_prompt_usage(cached, 0, prompt_tokens - cached)
+
+
+def _model_id() -> str:
+    """Provider-qualified id of the model ``_call_llm`` routes to (empty if none)."""
+    if os.getenv("AZURE_OPENAI_ENDPOINT"):
+        return f"azure:{_azure_deployment()}"
+    if os.getenv("ANTHROPIC_API_KEY"):
+        from sjifire.core.anthropic import MODEL
+
+        return f"anthropic:{MODEL}"
+    return ""
+
+
+async def _get_cached(key: str) -> CachedAnalysis | None:
+    """Look up a cached response (a cache failure counts as a miss)."""
+    try:
+        async with AnalysisCacheStore() as cache:
+            return await cache.get(key)
+    except Exception:
+        logger.warning("Analysis cache lookup failed", exc_info=True)
+        return None
+
+
+async def _put_cached(entry: CachedAnalysis) -> None:
+    """Store a response (failures are logged, never raised)."""
+    try:
+        async with AnalysisCacheStore() as cache:
+            await cache.put(entry)
+    except Exception:
+        logger.warning("Analysis cache write failed", exc_info=True)
+
+
 def _clean_json(text: str) -> str:
     """Strip markdown code fences if the model wraps its JSON output."""
     text = text.strip()
@@ -166,11 +262,21 @@ async def analyze_dispatch(
         len(doc.cad_comments),
     )
     prompt = _build_prompt(doc, crew_context)
-    text = await _call_llm(_SYSTEM_PROMPT, prompt)
-    if not text:
-        return DispatchAnalysis()
-
-    clean = _clean_json(text)
+    model = _model_id()
+    key = analysis_cache_key(model, _SYSTEM_PROMPT, prompt) if model else ""
+    cached = await _get_cached(key) if key else None
+
+    if cached:
+        cache_stats.hits += 1
+        logger.info("Reusing cached analysis for %s", doc.long_term_call_id)
+        clean = cached.response
+    else:
+        if key:
+            cache_stats.misses += 1
+        text = await _call_llm(_SYSTEM_PROMPT, prompt)
+        if not text:
+            return DispatchAnalysis()
+        clean = _clean_json(text)
 
     try:
         result = DispatchAnalysis.model_validate_json(clean)
@@ -183,6 +289,9 @@ async def analyze_dispatch(
         )
         return DispatchAnalysis()
 
+    if key and not cached:
+        await _put_cached(CachedAnalysis(id=key, model=model, response=clean))
+
     if result.incident_commander:
         logger.info(
             "Dispatch analysis for %s: IC=%s, outcome=%s",
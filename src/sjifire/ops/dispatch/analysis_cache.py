@@ -0,0 +1,148 @@
+"""Content-addressed cache of LLM dispatch analyses.
+
+Each entry is keyed by a hash of everything the model sees: the model id,
+the system instructions and the per-call prompt from ``_build_prompt``
+(call data plus on-duty crew context). Re-enriching a call whose inputs
+have not changed reuses the stored response instead of calling the LLM
+again; any change to the call, the crew roster, the instructions or the
+model produces a new key.
+
+Stores the model's JSON response (not the parsed ``DispatchAnalysis``),
+so a cached hit goes through exactly the same parsing as a fresh one.
+Entries expire after 90 days through the container's default TTL.
+
+When ``COSMOS_ENDPOINT`` is not set, falls back to an in-memory store.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, datetime
+from typing import ClassVar
+
+from pydantic import BaseModel, Field
+
+from sjifire.ops.cosmos import CosmosStore
+
+logger = logging.getLogger(__name__)
+
+
+def analysis_cache_key(model: str, system: str, prompt: str) -> str:
+    """Hash the full LLM input for one analysis.
+
+    Args:
+        model: Provider-qualified model id, e.g. "anthropic:claude-sonnet-4-6"
+        system: System instructions
+        prompt: Per-call user prompt
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps([model, system, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class AnalysisCacheStats:
+    """Cache lookups and LLM prompt-cache token usage since the last ``reset``.
+
+    ``hits``/``misses`` count this response cache. The ``prompt_*`` fields
+    sum the provider's prompt (prefix) cache usage over the LLM calls that
+    were made: tokens read from cache, written to cache, and billed at the
+    full input rate.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    prompt_cache_read_tokens: int = 0
+    prompt_cache_write_tokens: int = 0
+    prompt_uncached_tokens: int = 0
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        for f in fields(self):
+            setattr(self, f.name, 0)
+
+    def as_dict(self) -> dict[str, int]:
+        """Counters keyed for task reporting."""
+        counts = asdict(self)
+        return {
+            "analysis_cache_hits": counts.pop("hits"),
+            "analysis_cache_misses": counts.pop("misses"),
+            **counts,
+        }
+
+
+# Process-wide counters (tasks reset and report them)
+cache_stats = AnalysisCacheStats()
+
+
+class CachedAnalysis(BaseModel):
+    """One cached LLM response."""
+
+    id: str
+    """Key from ``analysis_cache_key`` (also the partition key)."""
+
+    model: str
+    """Model id the response came from."""
+
+    response: str
+    """Model output, already stripped of code fences."""
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    def to_cosmos(self) -> dict:
+        """Serialize for Cosmos DB storage."""
+        return self.model_dump(mode="json")
+
+    @classmethod
+    def from_cosmos(cls, data: dict) -> CachedAnalysis:
+        """Deserialize from Cosmos DB document."""
+        return cls.model_validate(data)
+
+
+class AnalysisCacheStore(CosmosStore):
+    """Async access to cached dispatch analyses.
+
+    Usage::
+
+        async with AnalysisCacheStore() as cache:
+            cached = await cache.get(key)
+    """
+
+    _container_name: ClassVar[str] = "dispatch-analysis-cache"
+
+    # Shared in-memory store across instances (persists for server lifetime)
+    _memory: ClassVar[dict[str, dict]] = {}
+
+    async def get(self, key: str) -> CachedAnalysis | None:
+        """Point-read a cached response.
+
+        Args:
+            key: Key from ``analysis_cache_key``
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        if self._in_memory:
+            data = self._memory.get(key)
+            return CachedAnalysis.from_cosmos(data) if data else None
+
+        try:
+            result = await self._container.read_item(item=key, partition_key=key)
+            return CachedAnalysis.from_cosmos(result)
+        except Exception:
+            logger.debug("No cached analysis for %s", key)
+            return None
+
+    async def put(self, entry: CachedAnalysis) -> None:
+        """Store a response.
+
+        Args:
+            entry: Response to cache
+        """
+        if self._in_memory:
+            self._memory[entry.id] = entry.to_cosmos()
+            return
+        await self._container.upsert_item(body=entry.to_cosmos())
@@ -0,0 +1,124 @@
+"""Anthropic Message Batches mode for bulk dispatch analysis.
+
+Backfills of hundreds of calls are cheaper and gentler on rate limits
+through the batch API than through one interactive request per call.
+``prefill_analysis_cache`` builds exactly the prompts ``enrich_dispatch``
+would send (call data plus on-duty crew), submits the uncached ones as a
+single Message Batch, polls until it ends, and stores each successful
+response in the analysis cache under the same key ``analyze_dispatch``
+computes.
+
+The normal per-call enrichment then runs unchanged: every batched call
+is a cache hit, and IC resolution and unit timing are applied by the
+same deterministic code as interactive enrichment. Requests that error
+or expire in the batch are simply not cached, so those calls fall back
+to an interactive request.
+
+Requires ``ANTHROPIC_API_KEY`` (Azure OpenAI, when configured, takes
+precedence for analysis and has no batch mode here).
+"""
+
+import asyncio
+import logging
+
+from sjifire.ops.dispatch.analysis import (
+    _SYSTEM_PROMPT,
+    _anthropic_params,
+    _build_prompt,
+    _clean_json,
+    _get_cached,
+    _model_id,
+    _put_cached,
+    _record_anthropic_usage,
+)
+from sjifire.ops.dispatch.analysis_cache import CachedAnalysis, analysis_cache_key
+from sjifire.ops.dispatch.enrich import (
+    _build_crew_roster,
+    _format_crew_context,
+    _get_on_duty_entries,
+)
+from sjifire.ops.dispatch.models import DispatchAnalysis, DispatchCallDocument
+
+logger = logging.getLogger(__name__)
+
+# Seconds between batch status checks
+BATCH_POLL_INTERVAL = 30.0
+
+
+async def prefill_analysis_cache(docs: list[DispatchCallDocument]) -> int:
+    """Analyze documents through one Message Batch and cache the responses.
+
+    Documents with nothing to analyze, or whose prompt is already cached,
+    are skipped. Identical prompts are submitted once.
+
+    Args:
+        docs: Documents about to be (re-)enriched
+
+    Returns:
+        Number of responses added to the analysis cache
+    """
+    model = _model_id()
+    if not model.startswith("anthropic:"):
+        logger.warning("Batch analysis needs the Anthropic provider — analyzing interactively")
+        return 0
+
+    prompts: dict[str, str] = {}
+    for doc in docs:
+        if not doc.responder_details and not doc.cad_comments:
+            continue
+        crew = _build_crew_roster(await _get_on_duty_entries(doc))
+        prompt = _build_prompt(doc, _format_crew_context(crew))
+        key = analysis_cache_key(model, _SYSTEM_PROMPT, prompt)
+        if key not in prompts and not await _get_cached(key):
+            prompts[key] = prompt
+
+    if not prompts:
+        logger.info("Batch analysis: all %d calls already cached", len(docs))
+        return 0
+
+    from sjifire.core.anthropic import get_client
+
+    client = get_client()
+    # The cache key (64 hex chars) doubles as the batch custom_id
+    batch = await client.messages.batches.create(
+        requests=[
+            {"custom_id": key, "params": _anthropic_params(_SYSTEM_PROMPT, prompt)}
+            for key, prompt in prompts.items()
+        ]
+    )
+    logger.info("Submitted analysis batch %s with %d requests", batch.id, len(prompts))
+
+    while batch.processing_status != "ended":
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
+        batch = await client.messages.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        logger.info(
+            "Analysis batch %s: %s (%d processing, %d succeeded, %d errored)",
+            batch.id,
+            batch.processing_status,
+            counts.processing,
+            counts.succeeded,
+            counts.errored,
+        )
+
+    cached = 0
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.custom_id not in prompts:
+            continue
+        if entry.result.type != "succeeded":
+            logger.warning("Batch request %s %s", entry.custom_id, entry.result.type)
+            continue
+
+        _record_anthropic_usage(entry.result.message.usage)
+        clean = _clean_json(entry.result.message.content[0].text)
+        try:
+            DispatchAnalysis.model_validate_json(clean)
+        except Exception:
+            logger.warning("Unparseable batch response for %s: %s", entry.custom_id, clean[:200])
+            continue
+
+        await _put_cached(CachedAnalysis(id=entry.custom_id, model=model, response=clean))
+        cached += 1
+
+    logger.info("Analysis batch %s: cached %d of %d responses", batch.id, cached, len(prompts))
+    return cached
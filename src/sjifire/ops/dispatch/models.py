@@ -1,9 +1,10 @@
 """Pydantic models for dispatch call documents stored in Cosmos DB."""
 
+import re
 from dataclasses import asdict
 from datetime import UTC, datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from sjifire.ispyfire.models import DispatchCall
 
@@ -130,6 +131,13 @@ class DispatchCallDocument(BaseModel):
     analysis: DispatchAnalysis = Field(default_factory=DispatchAnalysis)
     created_timestamp: int | None = None
     stored_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    address_key: str = ""  # normalize_address(address), the site history key
+
+    @model_validator(mode="after")
+    def _set_address_key(self) -> DispatchCallDocument:
+        """Derive the site history key from the address."""
+        self.address_key = normalize_address(self.address)
+        return self
 
     @classmethod
     def from_dispatch_call(cls, call: DispatchCall) -> DispatchCallDocument:
@@ -184,12 +192,13 @@ class DispatchCallDocument(BaseModel):
     def to_dict(self) -> dict:
         """Convert to tool-output dict, stripping Cosmos-only fields.
 
-        Strips Cosmos-only fields (``year``, ``stored_at``) so the
-        output matches the shape tool consumers expect.
+        Strips Cosmos-only fields (``year``, ``stored_at``,
+        ``address_key``) so the output matches the shape tool consumers
+        expect.
         """
         d = self.model_dump(mode="json")
         # Remove Cosmos storage fields not in the original DispatchCall
-        for key in ("year", "stored_at"):
+        for key in ("year", "stored_at", "address_key"):
             d.pop(key, None)
         return d
 
@@ -230,3 +239,63 @@ def year_from_dispatch_id(dispatch_id: str) -> str | None:
         if len(prefix) == 2 and prefix.isdigit():
             return f"20{prefix}"
     return None
+
+
+# Street suffixes and directionals folded to their USPS abbreviations
+_ADDRESS_ABBREVIATIONS = {
+    "AVENUE": "AVE",
+    "BOULEVARD": "BLVD",
+    "CIRCLE": "CIR",
+    "COURT": "CT",
+    "DRIVE": "DR",
+    "HIGHWAY": "HWY",
+    "LANE": "LN",
+    "PARKWAY": "PKWY",
+    "PLACE": "PL",
+    "POINT": "PT",
+    "ROAD": "RD",
+    "STREET": "ST",
+    "TERRACE": "TER",
+    "TRAIL": "TRL",
+    "NORTH": "N",
+    "SOUTH": "S",
+    "EAST": "E",
+    "WEST": "W",
+    "NORTHEAST": "NE",
+    "NORTHWEST": "NW",
+    "SOUTHEAST": "SE",
+    "SOUTHWEST": "SW",
+}
+
+# Secondary unit designators; the designator and the token after it are dropped
+_UNIT_DESIGNATORS = frozenset(
+    {"#", "APT", "APARTMENT", "BLDG", "BUILDING", "RM", "ROOM", "SPC", "STE", "SUITE", "UNIT"}
+)
+
+_ADDRESS_TOKEN_RE = re.compile(r"#|[A-Z0-9]+")
+
+
+def normalize_address(address: str) -> str:
+    """Fold an address to a key shared by its common spellings.
+
+    Upper-cases, drops punctuation, abbreviates street suffixes and
+    directionals, and removes unit numbers, so "200 Spring Street, Apt. 4"
+    and "200 spring st" both become "200 SPRING ST".
+
+    Args:
+        address: Street address as dispatched
+
+    Returns:
+        Normalized key, or "" for a blank address
+    """
+    tokens = _ADDRESS_TOKEN_RE.findall(address.upper())
+    folded: list[str] = []
+    skip_next = False
+    for token in tokens:
+        if skip_next:
+            skip_next = False
+        elif token in _UNIT_DESIGNATORS:
+            skip_next = True
+        else:
+            folded.append(_ADDRESS_ABBREVIATIONS.get(token, token))
+    return " ".join(folded)
@@ -0,0 +1,205 @@
+"""Per-address site history index for dispatch calls.
+
+Every address seen in stored dispatch calls has one summary document in
+the ``dispatch-sites`` container, keyed (and partitioned) by its
+normalized address (see ``normalize_address``). ``DispatchStore.upsert``
+keeps the summary current, so the site history for an open call is a
+single point-read instead of a cross-partition query, and spellings like
+"200 Spring Street" and "200 Spring St Apt 4" land on the same site.
+
+Summaries are updated with optimistic concurrency (create, or replace
+only if the ``_etag`` is unchanged since the read), so the server's
+background sync and an ``ops-tasks`` run touching the same address can't
+drop each other's calls.
+
+When ``COSMOS_ENDPOINT`` is not set, falls back to an in-memory store.
+"""
+
+import logging
+from datetime import UTC, datetime
+from typing import ClassVar
+
+from pydantic import BaseModel, Field
+
+from sjifire.ops.cosmos import CosmosStore
+from sjifire.ops.dispatch.models import DispatchCallDocument
+
+logger = logging.getLogger(__name__)
+
+# Most recent calls kept per site
+SITE_HISTORY_MAX = 25
+
+# Read-modify-write attempts per call before giving up on concurrent writers
+SITE_RECORD_ATTEMPTS = 5
+
+# Cosmos status codes for a lost write race: 409 create conflict, 412 etag mismatch
+_RACE_STATUS_CODES = (409, 412)
+
+
+class SiteVisit(BaseModel):
+    """One dispatch call at a site."""
+
+    id: str
+    """iSpyFire UUID of the call."""
+
+    dispatch_id: str
+    """Dispatch ID, e.g. "26-001678"."""
+
+    nature: str = ""
+    """Call nature, e.g. "Medical Aid"."""
+
+    date: str = ""
+    """ISO timestamp the call was reported, or empty if unknown."""
+
+    @classmethod
+    def from_doc(cls, doc: DispatchCallDocument) -> SiteVisit:
+        """Summarize a dispatch call document."""
+        return cls(
+            id=doc.id,
+            dispatch_id=doc.long_term_call_id,
+            nature=doc.nature,
+            date=doc.time_reported.isoformat() if doc.time_reported else "",
+        )
+
+
+class SiteHistory(BaseModel):
+    """Recent dispatch calls at one normalized address."""
+
+    id: str
+    """Normalized address key (also the partition key)."""
+
+    address: str = ""
+    """Address as most recently dispatched."""
+
+    calls: list[SiteVisit] = []
+    """Most recent calls first, at most ``SITE_HISTORY_MAX``."""
+
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    def add(self, doc: DispatchCallDocument) -> None:
+        """Add or refresh a call, keeping the newest ``SITE_HISTORY_MAX``."""
+        calls = [c for c in self.calls if c.id != doc.id]
+        calls.append(SiteVisit.from_doc(doc))
+        calls.sort(key=lambda c: c.date, reverse=True)
+        self.calls = calls[:SITE_HISTORY_MAX]
+        if not self.address or self.calls[0].id == doc.id:
+            self.address = doc.address
+        self.updated_at = datetime.now(UTC)
+
+    def to_cosmos(self) -> dict:
+        """Serialize for Cosmos DB storage."""
+        return self.model_dump(mode="json")
+
+    @classmethod
+    def from_cosmos(cls, data: dict) -> SiteHistory:
+        """Deserialize from Cosmos DB document."""
+        return cls.model_validate(data)
+
+
+class SiteHistoryStore(CosmosStore):
+    """Async access to per-address site history summaries.
+
+    Usage::
+
+        async with SiteHistoryStore() as sites:
+            await sites.record(doc)
+            history = await sites.get(doc.address_key)
+    """
+
+    _container_name: ClassVar[str] = "dispatch-sites"
+
+    # Shared in-memory store across instances (persists for server lifetime)
+    _memory: ClassVar[dict[str, dict]] = {}
+
+    async def get(self, address_key: str) -> SiteHistory | None:
+        """Point-read the summary for a normalized address.
+
+        Args:
+            address_key: Key from ``normalize_address``
+
+        Returns:
+            SiteHistory if any call has been recorded there, None otherwise
+        """
+        if not address_key:
+            return None
+
+        data = await self._read(address_key)
+        return SiteHistory.from_cosmos(data) if data else None
+
+    async def _read(self, address_key: str) -> dict | None:
+        """Read the raw summary document (with ``_etag`` in Cosmos), or None."""
+        if self._in_memory:
+            return self._memory.get(address_key)
+
+        try:
+            return await self._container.read_item(item=address_key, partition_key=address_key)
+        except Exception:
+            logger.debug("No site history for %s", address_key)
+            return None
+
+    async def save(self, history: SiteHistory) -> None:
+        """Write a site summary.
+
+        Args:
+            history: Summary to upsert
+        """
+        if self._in_memory:
+            self._memory[history.id] = history.to_cosmos()
+            return
+        await self._container.upsert_item(body=history.to_cosmos())
+
+    async def record(self, doc: DispatchCallDocument) -> None:
+        """Add a dispatch call to the summary for its address.
+
+        Args:
+            doc: Stored dispatch call (skipped when it has no address)
+        """
+        if not doc.address_key:
+            return
+        if self._in_memory:
+            history = await self.get(doc.address_key) or SiteHistory(id=doc.address_key)
+            history.add(doc)
+            await self.save(history)
+            return
+
+        from azure.core import MatchConditions
+
+        for _ in range(SITE_RECORD_ATTEMPTS):
+            data = await self._read(doc.address_key)
+            history = SiteHistory.from_cosmos(data) if data else SiteHistory(id=doc.address_key)
+            history.add(doc)
+            try:
+                if data is None:
+                    await self._container.create_item(body=history.to_cosmos())
+                else:
+                    await self._container.replace_item(
+                        item=history.id,
+                        body=history.to_cosmos(),
+                        etag=data["_etag"],
+                        match_condition=MatchConditions.IfNotModified,
+                    )
+                return
+            except Exception as exc:
+                if getattr(exc, "status_code", None) not in _RACE_STATUS_CODES:
+                    raise
+                logger.debug("Site %s changed concurrently; retrying", history.id)
+        raise RuntimeError(
+            f"Site history for {doc.address_key} kept changing; {doc.id} not recorded"
+        )
+
+    async def rebuild(self, docs: list[DispatchCallDocument]) -> int:
+        """Rewrite the summaries for every address in *docs* from scratch.
+
+        Args:
+            docs: All stored dispatch calls
+
+        Returns:
+            Number of sites written
+        """
+        sites: dict[str, SiteHistory] = {}
+        for doc in docs:
+            if doc.address_key:
+                sites.setdefault(doc.address_key, SiteHistory(id=doc.address_key)).add(doc)
+        for history in sites.values():
+            await self.save(history)
+        return len(sites)
@@ -20,7 +20,8 @@ from typing import ClassVar
 
 from sjifire.ispyfire.models import DispatchCall
 from sjifire.ops.cosmos import CosmosStore
-from sjifire.ops.dispatch.models import DispatchCallDocument
+from sjifire.ops.dispatch.models import DispatchCallDocument, normalize_address
+from sjifire.ops.dispatch.sites import SiteHistoryStore, SiteVisit
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +109,8 @@ class DispatchStore(CosmosStore):
     async def upsert(self, doc: DispatchCallDocument) -> DispatchCallDocument:
         """Write or update a dispatch call document.
 
+        Also adds the call to the site history summary for its address.
+
         Args:
             doc: Document to upsert
 
@@ -117,11 +120,18 @@ class DispatchStore(CosmosStore):
         if self._in_memory:
             self._memory[doc.id] = doc.to_cosmos()
             logger.debug("Upserted dispatch call %s (in-memory)", doc.id)
-            return doc
+            result = doc
+        else:
+            stored = await self._container.upsert_item(body=doc.to_cosmos())
+            logger.debug("Upserted dispatch call %s", doc.id)
+            result = DispatchCallDocument.from_cosmos(stored)
 
-        result = await self._container.upsert_item(body=doc.to_cosmos())
-        logger.debug("Upserted dispatch call %s", doc.id)
-        return DispatchCallDocument.from_cosmos(result)
+        try:
+            async with SiteHistoryStore() as sites:
+                await sites.record(doc)
+        except Exception:
+            logger.warning("Site history update failed for %s", doc.id, exc_info=True)
+        return result
 
     # ------------------------------------------------------------------
     # Queries
@@ -223,6 +233,44 @@ class DispatchStore(CosmosStore):
             max_items=max_items,
         )
 
+    async def site_history(
+        self,
+        address: str,
+        *,
+        exclude_id: str = "",
+        max_items: int = 10,
+    ) -> list[SiteVisit]:
+        """List recent calls at an address from the site history index.
+
+        One point-read of the address's summary; unlike ``list_by_address``
+        it matches any spelling that normalizes to the same key.
+
+        Args:
+            address: Street address
+            exclude_id: Call UUID to exclude (the current call)
+            max_items: Maximum results
+
+        Returns:
+            Matching calls, most recent first
+        """
+        async with SiteHistoryStore() as sites:
+            history = await sites.get(normalize_address(address))
+        if history is None:
+            return []
+        return [c for c in history.calls if c.id != exclude_id][:max_items]
+
+    async def rebuild_site_history(self) -> int:
+        """Rebuild the site history index from every stored call.
+
+        Backfills calls stored before the index existed.
+
+        Returns:
+            Number of sites written
+        """
+        docs = await self.list_all(max_items=100_000)
+        async with SiteHistoryStore() as sites:
+            return await sites.rebuild(docs)
+
     async def list_recent(self, *, limit: int = 15) -> list[DispatchCallDocument]:
         """List the most recent dispatch calls.
 
@@ -435,16 +483,21 @@ class DispatchStore(CosmosStore):
         return len(new_calls)
 
     async def enrich_stored(
-        self, *, force: bool = False, limit: int = 100
+        self, *, force: bool = False, limit: int = 100, batch: bool = False
     ) -> list[DispatchCallDocument]:
         """Re-enrich stored documents.
 
         Processes documents missing analysis, or all documents when
         ``force=True``.
 
+        With ``batch=True`` the LLM analyses are first run through one
+        Anthropic Message Batch (see ``dispatch.batch``); enrichment then
+        proceeds as usual, reusing the batched responses from the cache.
+
         Args:
             force: Re-analyze all documents, even those with existing analysis
             limit: Maximum number of documents to process
+            batch: Submit the LLM analyses as a Message Batch first
 
         Returns:
             All targeted documents (enriched or not). Check
@@ -456,6 +509,14 @@ class DispatchStore(CosmosStore):
         if not force:
             docs = [d for d in docs if not d.analysis.incident_commander and not d.analysis.summary]
 
+        if batch and docs:
+            from sjifire.ops.dispatch.batch import prefill_analysis_cache
+
+            try:
+                await prefill_analysis_cache(docs)
+            except Exception:
+                logger.exception("Batch analysis failed — analyzing interactively")
+
         for doc in docs:
             await self._enrich(doc)
             if doc.analysis.incident_commander or doc.analysis.summary:
@@ -9,16 +9,43 @@ Each calendar source is a dict with:
 - ``label``: Display label (e.g. "Training")
 - ``calendar_name`` (optional): Name of a specific calendar folder.
   When omitted, queries the user's default calendar.
+
+Events are cached per calendar per calendar month, so any date range is
+assembled from month slices and overlapping ranges share cache entries.
+The current and next month are refreshed in the background shortly
+before their slices expire, so the Events tab rarely waits on Graph
+(short-lived callers such as background tasks turn this off). Fetches
+on one event loop share a Graph client, and named calendar IDs are
+looked up once per process.
 """
 
 import asyncio
 import logging
-from datetime import date, datetime, time
+import time as clock
+from datetime import date, datetime, time, timedelta
 
 from sjifire.core.config import get_timezone_name, load_org_config
 
 logger = logging.getLogger(__name__)
 
+_graph_client = None
+_graph_client_loop: asyncio.AbstractEventLoop | None = None
+
+# (mailbox, calendar name) -> calendar folder ID, both lowercased
+_calendar_ids: dict[tuple[str, str], str] = {}
+
+
+def _get_graph_client():
+    """Get or create the Graph client shared by calendar fetches on the running loop."""
+    global _graph_client, _graph_client_loop
+    loop = asyncio.get_running_loop()
+    if _graph_client is None or _graph_client_loop is not loop:
+        from sjifire.core.msgraph_client import get_graph_client
+
+        _graph_client = get_graph_client()
+        _graph_client_loop = loop
+    return _graph_client
+
 
 def _get_calendar_sources() -> list[dict[str, str]]:
     """Load calendar sources from organization config."""
@@ -39,15 +66,27 @@ def _strip_html(html: str) -> str:
 
 
 async def _resolve_calendar_id(client, mailbox: str, calendar_name: str) -> str | None:
-    """Look up a named calendar folder on a mailbox, return its ID."""
-    try:
-        calendars = await client.users.by_user_id(mailbox).calendars.get()
-        if calendars and calendars.value:
-            for cal in calendars.value:
-                if cal.name and cal.name.lower() == calendar_name.lower():
-                    return cal.id
-    except Exception:
-        logger.warning("Failed to list calendars for %s", mailbox, exc_info=True)
+    """Look up a named calendar folder on a mailbox, return its ID.
+
+    Found IDs are memoized for the life of the process; misses are not,
+    so they are retried on the next fetch.
+
+    Returns:
+        The calendar ID, or None if the mailbox has no such calendar
+
+    Raises:
+        Exception: If the calendars could not be listed
+    """
+    memo_key = (mailbox.lower(), calendar_name.lower())
+    if memo_key in _calendar_ids:
+        return _calendar_ids[memo_key]
+
+    calendars = await client.users.by_user_id(mailbox).calendars.get()
+    if calendars and calendars.value:
+        for cal in calendars.value:
+            if cal.name and cal.name.lower() == calendar_name.lower():
+                _calendar_ids[memo_key] = cal.id
+                return cal.id
     return None
 
 
@@ -57,23 +96,24 @@ async def _fetch_one_calendar(
     start: date,
     end: date,
     calendar_name: str = "",
-) -> list[dict]:
+) -> list[dict] | None:
     """Fetch events from a single shared mailbox calendar.
 
     When *calendar_name* is given, queries that specific calendar folder
     instead of the user's default calendar.
+
+    Returns:
+        Events in the range, or None if Graph could not be reached
     """
     try:
-        from sjifire.core.msgraph_client import get_graph_client
-
-        client = get_graph_client()
+        client = _get_graph_client()
     except Exception:
         logger.warning(
             "Graph client unavailable — cannot fetch calendar %s",
             mailbox,
             exc_info=True,
         )
-        return []
+        return None
 
     tz = get_timezone_name()
     start_dt = datetime.combine(start, time.min).isoformat()
@@ -82,7 +122,12 @@ async def _fetch_one_calendar(
     # Resolve named calendar if requested
     calendar_id: str | None = None
     if calendar_name:
-        calendar_id = await _resolve_calendar_id(client, mailbox, calendar_name)
+        try:
+            calendar_id = await _resolve_calendar_id(client, mailbox, calendar_name)
+        except Exception:
+            # A failed lookup is not an empty calendar — keep it out of the cache
+            logger.warning("Failed to list calendars for %s", mailbox, exc_info=True)
+            return None
         if calendar_id is None:
             logger.warning(
                 "Calendar '%s' not found on %s — skipping",
@@ -127,7 +172,7 @@ async def _fetch_one_calendar(
             )
     except Exception:
         logger.warning("Failed to fetch calendar events from %s", mailbox, exc_info=True)
-        return []
+        return None
 
     # Station address for conference rooms (falls back to org config)
     org = load_org_config()
@@ -177,10 +222,90 @@ async def _fetch_one_calendar(
 
 _CACHE_TTL = 10800  # 3 hours
 
+# Refresh current/next month slices in the background once this old
+_REFRESH_AFTER = 7200  # 2 hours
+
+# Graph allows 4 concurrent requests per mailbox
+_MAILBOX_CONCURRENCY = 4
+
+# Cache keys with a background refresh in flight
+_refreshing: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _month_start(day: date) -> date:
+    """First day of the month containing ``day``."""
+    return day.replace(day=1)
+
 
-def _cache_key(label: str, start: date, end: date) -> str:
-    """Simple per-calendar cache key: ``cal:<label>:<start>:<end>``."""
-    return f"cal:{label}:{start}:{end}"
+def _next_month(month: date) -> date:
+    """First day of the month after ``month``."""
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _month_buckets(start: date, end: date) -> list[date]:
+    """First day of every calendar month overlapping ``start``..``end``."""
+    months = []
+    month = _month_start(start)
+    while month <= end:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+
+def _cache_key(label: str, month: date) -> str:
+    """Per-calendar, per-month cache key: ``cal:<label>:<YYYY-MM>``."""
+    return f"cal:{label}:{month:%Y-%m}"
+
+
+def _in_range(event: dict, start: date, end: date) -> bool:
+    """Whether an event overlaps ``start``..``end`` (inclusive days)."""
+    ev_start = event.get("start", "")[:19]
+    ev_end = (event.get("end") or ev_start)[:19]
+    range_start = datetime.combine(start, time.min).isoformat()
+    range_end = datetime.combine(end, time.max).isoformat()[:19]
+    return ev_start <= range_end and (ev_end > range_start or ev_start >= range_start)
+
+
+async def _fetch_month(
+    mailbox: str,
+    label: str,
+    month: date,
+    calendar_name: str = "",
+) -> list[dict] | None:
+    """Fetch one calendar month from Graph and cache it (failures are not cached)."""
+    from sjifire.ops.cache import cosmos_cache
+
+    events = await _fetch_one_calendar(
+        mailbox, label, month, _next_month(month) - timedelta(days=1), calendar_name
+    )
+    if events is not None:
+        await cosmos_cache.set(
+            _cache_key(label, month),
+            {"fetched_at": clock.time(), "events": events},
+            ttl=_CACHE_TTL,
+        )
+    return events
+
+
+def _schedule_refresh(mailbox: str, label: str, month: date, calendar_name: str) -> None:
+    """Re-fetch a month slice in the background (at most one per slice)."""
+    key = _cache_key(label, month)
+    if key in _refreshing:
+        return
+    _refreshing.add(key)
+    logger.info("EVENT_CAL: background refresh of %s", key)
+
+    async def _refresh() -> None:
+        try:
+            await _fetch_month(mailbox, label, month, calendar_name)
+        except Exception:
+            logger.warning("EVENT_CAL: background refresh of %s failed", key, exc_info=True)
+
+    task = asyncio.create_task(_refresh())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    task.add_done_callback(lambda _t: _refreshing.discard(key))
 
 
 async def _fetch_cached(
@@ -189,38 +314,98 @@ async def _fetch_cached(
     start: date,
     end: date,
     calendar_name: str = "",
+    *,
+    refresh_ahead: bool = True,
 ) -> list[dict]:
-    """Fetch a single calendar with per-calendar caching (3 h TTL)."""
+    """Fetch a single calendar, assembled from per-month cached slices (3 h TTL).
+
+    Missing months are fetched from Graph concurrently. Cached slices
+    for the current and next month that are close to expiry are served
+    as-is and, with *refresh_ahead*, refreshed in the background.
+    """
     from sjifire.ops.cache import cosmos_cache
 
-    key = _cache_key(label, start, end)
-    cached = await cosmos_cache.get(key)
-    if cached is not None:
+    months = _month_buckets(start, end)
+    slices = await asyncio.gather(*(cosmos_cache.get(_cache_key(label, m)) for m in months))
+
+    this_month = _month_start(date.today())
+    refresh_months = {this_month, _next_month(this_month)}
+    now = clock.time()
+
+    by_month: dict[date, list[dict]] = {}
+    missing: list[date] = []
+    for month, cached in zip(months, slices, strict=True):
+        if cached is None:
+            missing.append(month)
+            continue
+        by_month[month] = cached["events"]
+        if (
+            refresh_ahead
+            and month in refresh_months
+            and now - cached["fetched_at"] >= _REFRESH_AFTER
+        ):
+            _schedule_refresh(mailbox, label, month, calendar_name)
+
+    if missing:
+        limit = asyncio.Semaphore(_MAILBOX_CONCURRENCY)
+
+        async def fetch(month: date) -> list[dict] | None:
+            async with limit:
+                return await _fetch_month(mailbox, label, month, calendar_name)
+
+        # First month alone so a named calendar's ID is memoized before fan-out
+        fetched = [await fetch(missing[0])]
+        fetched += await asyncio.gather(*(fetch(m) for m in missing[1:]))
+        for month, events in zip(missing, fetched, strict=True):
+            by_month[month] = events or []
+        logger.info(
+            "EVENT_CAL: fetched %d of %d months for %s (%s → %s)",
+            len(missing),
+            len(months),
+            label,
+            start,
+            end,
+        )
+    else:
         logger.debug("EVENT_CAL: cache hit for %s (%s → %s)", label, start, end)
-        return cached
 
-    events = await _fetch_one_calendar(mailbox, label, start, end, calendar_name)
-    await cosmos_cache.set(key, events, ttl=_CACHE_TTL)
-    logger.info(
-        "EVENT_CAL: cached %d events for %s (%s → %s, ttl=%ds)",
-        len(events),
-        label,
-        start,
-        end,
-        _CACHE_TTL,
-    )
+    # Events spanning a month boundary appear in both slices
+    seen: set[str] = set()
+    events: list[dict] = []
+    for month in months:
+        for event in by_month[month]:
+            event_id = event.get("event_id", "")
+            if (event_id and event_id in seen) or not _in_range(event, start, end):
+                continue
+            seen.add(event_id)
+            events.append(event)
     return events
 
 
-async def fetch_events(start: date, end: date) -> list[dict]:
+async def fetch_events(start: date, end: date, *, refresh_ahead: bool = True) -> list[dict]:
     """Fetch events from all configured calendars.
 
-    Each calendar is cached independently in Cosmos DB for 3 hours
-    so the Events tab loads quickly and reduces Graph API calls.
+    Calendars are fetched concurrently; each is cached independently in
+    Cosmos DB per month for 3 hours so the Events tab loads quickly and
+    reduces Graph API calls.
+
+    Args:
+        start: First day of the range
+        end: Last day of the range
+        refresh_ahead: Refresh nearly-expired current/next month slices in
+            the background. Pass False outside the long-running server,
+            where the event loop may end before the refresh does.
     """
     sources = _get_calendar_sources()
     tasks = [
-        _fetch_cached(s["mailbox"], s["label"], start, end, s.get("calendar_name", ""))
+        _fetch_cached(
+            s["mailbox"],
+            s["label"],
+            start,
+            end,
+            s.get("calendar_name", ""),
+            refresh_ahead=refresh_ahead,
+        )
         for s in sources
     ]
     results = await asyncio.gather(*tasks, return_exceptions=True)
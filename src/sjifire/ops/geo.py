@@ -4,18 +4,42 @@ Wraps Azure Maps Search REST API for reverse geocoding and cross-street
 lookup.  Returns the same shape as the legacy OSM Nominatim + Overpass
 approach so callers don't need to change.
 
+Fire calls recur at the same addresses, so results are cached by
+coordinates rounded to ``GEOCODE_PRECISION`` decimal places (about 11 m):
+an in-process LRU in front of ``cosmos_cache`` with a long TTL. The two
+lookups for a miss run concurrently over one pooled HTTP client, and
+concurrent callers for the same point share a single lookup.
+
 Requires ``AZURE_MAPS_KEY`` environment variable.
 """
 
+import asyncio
 import logging
 import os
 
 import httpx
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://atlas.microsoft.com"
 
+# Decimal places coordinates are rounded to for lookups and cache keys
+GEOCODE_PRECISION = 4
+
+# Geocode results change only when streets or addresses do
+GEOCODE_CACHE_TTL = 30 * 24 * 3600  # 30 days
+
+# In-process LRU in front of cosmos_cache
+_l1: TTLCache = TTLCache(maxsize=1024, ttl=GEOCODE_CACHE_TTL)
+
+# Lookups in flight, so concurrent callers for one point share a request pair
+_inflight: dict[str, asyncio.Future] = {}
+
+# Pooled client, bound to the event loop that created it
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
 # Map Azure Maps entityType to a human-readable property type
 _ENTITY_TYPE_MAP = {
     "Address": "building",
@@ -39,14 +63,42 @@ def get_azure_maps_key() -> str | None:
     return os.getenv("AZURE_MAPS_KEY") or None
 
 
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Azure Maps client for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            base_url=_BASE_URL,
+            timeout=10,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=4),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Azure Maps client (e.g. on shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = _client_loop = None
+
+
+def _cache_key(lat: float, lon: float) -> str:
+    """Cache key for the quantized coordinates: ``geo:<lat>,<lon>``."""
+    return f"geo:{lat:.{GEOCODE_PRECISION}f},{lon:.{GEOCODE_PRECISION}f}"
+
+
 async def reverse_geocode(lat: float, lon: float) -> dict:
-    """Reverse geocode coordinates using Azure Maps.
+    """Reverse geocode coordinates using Azure Maps (cached).
 
-    Makes two calls:
+    Makes two concurrent calls on a miss:
     1. Reverse address lookup (road, city, county, state, display address)
     2. Reverse cross-street lookup (nearest cross streets)
 
-    Cross-street failure degrades gracefully (returns empty list).
+    Cross-street failure degrades gracefully (returns empty list) and the
+    degraded result is not cached.
 
     Args:
         lat: Latitude
@@ -74,63 +126,120 @@ async def reverse_geocode(lat: float, lon: float) -> dict:
         msg = "AZURE_MAPS_KEY environment variable not set"
         raise ValueError(msg)
 
-    query = f"{lat},{lon}"
-    common_params = {
-        "api-version": "1.0",
-        "subscription-key": api_key,
-        "query": query,
-    }
-
-    async with httpx.AsyncClient(timeout=10) as client:
-        # 1. Reverse geocode — address from coordinates
-        resp = await client.get(
-            f"{_BASE_URL}/search/address/reverse/json",
-            params=common_params,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        addresses = data.get("addresses", [])
-        if not addresses:
-            return {
-                "road": "",
-                "cross_streets": [],
-                "city": "",
-                "county": "",
-                "state": "",
-                "display_address": "",
-                "property_type": "",
-            }
-
-        addr = addresses[0].get("address", {})
-        entity_type = addresses[0].get("entityType", "")
-
-        road = addr.get("streetName", "")
-        city = addr.get("municipality", "")
-        county = addr.get("countrySecondarySubdivision", "")
-        state = addr.get("countrySubdivision", "")
-        display_address = addr.get("freeformAddress", "")
-        fallback = entity_type.lower() if entity_type else ""
-        property_type = _ENTITY_TYPE_MAP.get(entity_type, fallback)
-
-        # 2. Reverse cross-street lookup
-        cross_streets: list[dict] = []
+    lat, lon = round(lat, GEOCODE_PRECISION), round(lon, GEOCODE_PRECISION)
+    key = _cache_key(lat, lon)
+    while (pending := _inflight.get(key)) is not None and key not in _l1:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # The leading caller was cancelled, not this one: look again
+    if key in _l1:
+        return _l1[key]
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await _lookup_cached(key, lat, lon, api_key)
+    except asyncio.CancelledError:
+        # Don't hand our cancellation to waiters; they retry on their own
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # retrieved: no "never retrieved" warning without waiters
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _lookup_cached(key: str, lat: float, lon: float, api_key: str) -> dict:
+    """Serve a lookup from cosmos_cache, or query Azure Maps and store it."""
+    from sjifire.ops.cache import cosmos_cache
+
+    try:
+        cached = await cosmos_cache.get(key)
+    except Exception:
+        logger.warning("Geocode cache read failed for %s", key, exc_info=True)
+        cached = None
+    if cached is not None:
+        _l1[key] = cached
+        return cached
+
+    result, complete = await _lookup(lat, lon, api_key)
+    if complete:
+        _l1[key] = result
         try:
-            resp2 = await client.get(
-                f"{_BASE_URL}/search/address/reverse/crossStreet/json",
-                params=common_params,
-            )
-            resp2.raise_for_status()
-            cross_data = resp2.json()
-            for cs_addr in cross_data.get("addresses", []):
-                cs_info = cs_addr.get("address", {})
-                street = cs_info.get("streetName", "")
-                if street and street.lower() != road.lower():
-                    cross_streets.append({"name": street, "type": "road"})
+            await cosmos_cache.set(key, result, ttl=GEOCODE_CACHE_TTL)
         except Exception:
-            logger.warning("Azure Maps cross-street lookup failed for %.6f,%.6f", lat, lon)
+            logger.warning("Geocode cache write failed for %s", key, exc_info=True)
+    return result
+
 
-    return {
+async def _lookup(lat: float, lon: float, api_key: str) -> tuple[dict, bool]:
+    """Query Azure Maps; returns (result, False if cross streets failed)."""
+    params = {
+        "api-version": "1.0",
+        "subscription-key": api_key,
+        "query": f"{lat},{lon}",
+    }
+    client = _get_client()
+
+    # 1. Reverse geocode and 2. cross streets, concurrently
+    address_resp, cross_resp = await asyncio.gather(
+        client.get("/search/address/reverse/json", params=params),
+        client.get("/search/address/reverse/crossStreet/json", params=params),
+        return_exceptions=True,
+    )
+    if isinstance(address_resp, BaseException):
+        raise address_resp
+    address_resp.raise_for_status()
+    data = address_resp.json()
+
+    addresses = data.get("addresses", [])
+    if not addresses:
+        empty = {
+            "road": "",
+            "cross_streets": [],
+            "city": "",
+            "county": "",
+            "state": "",
+            "display_address": "",
+            "property_type": "",
+        }
+        return empty, True
+
+    addr = addresses[0].get("address", {})
+    entity_type = addresses[0].get("entityType", "")
+
+    road = addr.get("streetName", "")
+    city = addr.get("municipality", "")
+    county = addr.get("countrySecondarySubdivision", "")
+    state = addr.get("countrySubdivision", "")
+    display_address = addr.get("freeformAddress", "")
+    fallback = entity_type.lower() if entity_type else ""
+    property_type = _ENTITY_TYPE_MAP.get(entity_type, fallback)
+
+    cross_streets: list[dict] = []
+    complete = True
+    try:
+        if isinstance(cross_resp, BaseException):
+            raise cross_resp
+        cross_resp.raise_for_status()
+        for cs_addr in cross_resp.json().get("addresses", []):
+            cs_info = cs_addr.get("address", {})
+            street = cs_info.get("streetName", "")
+            if street and street.lower() != road.lower():
+                cross_streets.append({"name": street, "type": "road"})
+    except Exception:
+        logger.warning("Azure Maps cross-street lookup failed for %.6f,%.6f", lat, lon)
+        complete = False
+
+    result = {
         "road": road,
         "cross_streets": cross_streets,
         "city": city,
@@ -139,3 +248,4 @@ async def reverse_geocode(lat: float, lon: float) -> dict:
         "display_address": display_address,
         "property_type": property_type,
     }
+    return result, complete
@@ -299,6 +299,10 @@ class IncidentDocument(BaseModel):
         """Get set of personnel emails (lowered) for access checks."""
         return {p.email.lower() for p in self.all_personnel() if p.email}
 
+    def participant_emails(self) -> set[str]:
+        """Get emails (lowered) of everyone who can see this incident: creator plus crew."""
+        return self.personnel_emails() | {self.created_by.lower()}
+
     def personnel_count(self) -> int:
         """Total personnel across all units."""
         return sum(len(u.personnel) for u in self.units)
@@ -10,11 +10,19 @@ for local development and testing with ``mcp dev``.
 import logging
 from typing import ClassVar
 
+from cachetools import LRUCache
+
+from sjifire.core.config import local_now
 from sjifire.ops.cosmos import CosmosStore
 from sjifire.ops.incidents.models import IncidentDocument
 
 logger = logging.getLogger(__name__)
 
+# Denormalized top-level array of creator + crew emails.  Maintained by
+# the store on every write so ``list_for_user`` can filter with
+# ``ARRAY_CONTAINS`` instead of a nested EXISTS over units[].personnel[].
+PARTICIPANTS_FIELD = "participant_emails"
+
 
 class IncidentStore(CosmosStore):
     """Async CRUD operations for incident documents in Cosmos DB.
@@ -34,6 +42,10 @@ class IncidentStore(CosmosStore):
     # Shared in-memory store across instances (persists for server lifetime)
     _memory: ClassVar[dict[str, dict]] = {}
 
+    # Per-replica id -> year (partition key) map so get_by_id can point-read.
+    # The year never changes for a given incident, so entries don't expire.
+    _partitions: ClassVar[LRUCache] = LRUCache(maxsize=4096)
+
     async def create(self, doc: IncidentDocument) -> IncidentDocument:
         """Create a new incident document.
 
@@ -44,13 +56,13 @@ class IncidentStore(CosmosStore):
             The created document (with any server-side fields populated)
         """
         if self._in_memory:
-            self._memory[doc.id] = doc.to_cosmos()
+            self._memory[doc.id] = self._to_body(doc)
             logger.info("Created incident %s (in-memory, year=%s)", doc.id, doc.year)
             return doc
 
-        result = await self._container.create_item(body=doc.to_cosmos())
+        result = await self._container.create_item(body=self._to_body(doc))
         logger.info("Created incident %s (year=%s)", doc.id, doc.year)
-        return IncidentDocument.from_cosmos(result)
+        return self._remember(IncidentDocument.from_cosmos(result))
 
     async def get(self, incident_id: str, year: str) -> IncidentDocument | None:
         """Get an incident by ID and year (partition key).
@@ -73,16 +85,18 @@ class IncidentStore(CosmosStore):
                 item=incident_id,
                 partition_key=year,
             )
-            return IncidentDocument.from_cosmos(result)
+            return self._remember(IncidentDocument.from_cosmos(result))
         except Exception:
             logger.debug("Incident not found: %s (year=%s)", incident_id, year)
             return None
 
     async def get_by_id(self, incident_id: str) -> IncidentDocument | None:
-        """Find an incident by document ID (cross-partition).
+        """Find an incident by document ID without knowing its year.
 
-        Slower than ``get()`` but doesn't require the year partition key.
-        Suitable for small datasets like a single fire department's incidents.
+        Resolves the year partition key from a per-replica id -> year
+        cache (filled by every read and write), then tries a point read in
+        the current year, where nearly all active incidents live.  Only
+        falls back to a cross-partition query when both miss.
 
         Args:
             incident_id: Document ID (UUID)
@@ -94,11 +108,18 @@ class IncidentStore(CosmosStore):
             data = self._memory.get(incident_id)
             return IncidentDocument.from_cosmos(data) if data else None
 
-        return await self._query_one(
+        years = [self._partitions.get(incident_id), str(local_now().year)]
+        for year in dict.fromkeys(y for y in years if y):
+            doc = await self.get(incident_id, year)
+            if doc is not None:
+                return doc
+
+        doc = await self._query_one(
             "SELECT * FROM c WHERE c.id = @id",
             [{"name": "@id", "value": incident_id}],
             IncidentDocument,
         )
+        return self._remember(doc) if doc else None
 
     async def get_by_number(self, incident_number: str) -> IncidentDocument | None:
         """Find an incident by incident number (cross-partition).
@@ -115,11 +136,12 @@ class IncidentStore(CosmosStore):
                     return IncidentDocument.from_cosmos(data)
             return None
 
-        return await self._query_one(
+        doc = await self._query_one(
             "SELECT * FROM c WHERE c.incident_number = @num",
             [{"name": "@num", "value": incident_number}],
             IncidentDocument,
         )
+        return self._remember(doc) if doc else None
 
     async def get_by_neris_id(self, neris_incident_id: str) -> IncidentDocument | None:
         """Find an incident by its NERIS incident ID (cross-partition).
@@ -136,11 +158,12 @@ class IncidentStore(CosmosStore):
                     return IncidentDocument.from_cosmos(data)
             return None
 
-        return await self._query_one(
+        doc = await self._query_one(
             "SELECT * FROM c WHERE c.neris_incident_id = @nid",
             [{"name": "@nid", "value": neris_incident_id}],
             IncidentDocument,
         )
+        return self._remember(doc) if doc else None
 
     async def update(self, doc: IncidentDocument) -> IncidentDocument:
         """Update an existing incident document.
@@ -152,16 +175,16 @@ class IncidentStore(CosmosStore):
             The updated document
         """
         if self._in_memory:
-            self._memory[doc.id] = doc.to_cosmos()
+            self._memory[doc.id] = self._to_body(doc)
             logger.info("Updated incident %s (in-memory)", doc.id)
             return doc
 
         result = await self._container.replace_item(
             item=doc.id,
-            body=doc.to_cosmos(),
+            body=self._to_body(doc),
         )
         logger.info("Updated incident %s", doc.id)
-        return IncidentDocument.from_cosmos(result)
+        return self._remember(IncidentDocument.from_cosmos(result))
 
     async def delete(self, incident_id: str, year: str) -> None:
         """Delete an incident document.
@@ -179,6 +202,7 @@ class IncidentStore(CosmosStore):
             item=incident_id,
             partition_key=year,
         )
+        self._partitions.pop(incident_id, None)
         logger.info("Deleted incident %s", incident_id)
 
     async def list_by_status(
@@ -216,12 +240,13 @@ class IncidentStore(CosmosStore):
         where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
         query = f"SELECT * FROM c{where_clause} ORDER BY c.incident_datetime ASC"
 
-        return await self._query_many(
+        results = await self._query_many(
             query,
             parameters or None,
             IncidentDocument,
             max_items=max_items,
         )
+        return [self._remember(doc) for doc in results]
 
     async def list_for_user(
         self,
@@ -233,7 +258,10 @@ class IncidentStore(CosmosStore):
     ) -> list[IncidentDocument]:
         """List incidents accessible to a specific user.
 
-        Returns incidents where the user is the creator or a crew member.
+        Returns incidents where the user is the creator or a crew member,
+        using the denormalized ``participant_emails`` array.  Documents
+        written before that field existed fall back to the nested creator/
+        crew check until ``backfill_participants()`` has rewritten them.
 
         Args:
             user_email: User's email address (lowered)
@@ -253,9 +281,10 @@ class IncidentStore(CosmosStore):
             )
 
         conditions = [
-            "(c.created_by = @email OR EXISTS("
+            f"(ARRAY_CONTAINS(c.{PARTICIPANTS_FIELD}, @email) OR "
+            f"(NOT IS_DEFINED(c.{PARTICIPANTS_FIELD}) AND (c.created_by = @email OR EXISTS("
             "SELECT VALUE u FROM u IN c.units WHERE EXISTS("
-            "SELECT VALUE p FROM p IN u.personnel WHERE p.email = @email)))"
+            "SELECT VALUE p FROM p IN u.personnel WHERE p.email = @email)))))"
         ]
         parameters: list[dict] = [{"name": "@email", "value": user_email.lower()}]
 
@@ -269,12 +298,13 @@ class IncidentStore(CosmosStore):
         where_clause = f" WHERE {' AND '.join(conditions)}"
         query = f"SELECT * FROM c{where_clause} ORDER BY c.incident_datetime ASC"
 
-        return await self._query_many(
+        results = await self._query_many(
             query,
             parameters,
             IncidentDocument,
             max_items=max_items,
         )
+        return [self._remember(doc) for doc in results]
 
     async def list_all(self, *, max_items: int = 500) -> list[IncidentDocument]:
         """List all incidents across all partitions.
@@ -301,6 +331,45 @@ class IncidentStore(CosmosStore):
             max_items=max_items,
         )
 
+    async def backfill_participants(self) -> int:
+        """Add ``participant_emails`` to documents written before it existed.
+
+        One-time migration -- ``create()`` and ``update()`` keep the field
+        current from then on.
+
+        Returns:
+            Number of documents rewritten
+        """
+        if self._in_memory:
+            stale = [d for d in self._memory.values() if PARTICIPANTS_FIELD not in d]
+            for data in stale:
+                doc = IncidentDocument.from_cosmos(data)
+                self._memory[doc.id] = self._to_body(doc)
+            return len(stale)
+
+        stale = await self._query_many(
+            f"SELECT * FROM c WHERE NOT IS_DEFINED(c.{PARTICIPANTS_FIELD})",
+            None,
+            IncidentDocument,
+            max_items=100_000,
+        )
+        for doc in stale:
+            await self._container.replace_item(item=doc.id, body=self._to_body(doc))
+        logger.info("Backfilled participant_emails on %d incidents", len(stale))
+        return len(stale)
+
+    def _remember(self, doc: IncidentDocument) -> IncidentDocument:
+        """Record the document's year so later ``get_by_id`` calls can point-read."""
+        self._partitions[doc.id] = doc.year
+        return doc
+
+    @staticmethod
+    def _to_body(doc: IncidentDocument) -> dict:
+        """Serialize a document with the ``participant_emails`` index field."""
+        body = doc.to_cosmos()
+        body[PARTICIPANTS_FIELD] = sorted(doc.participant_emails())
+        return body
+
     def _filter_memory(
         self,
         *,
@@ -316,15 +385,14 @@ class IncidentStore(CosmosStore):
                 continue
             if exclude_status and data.get("status") == exclude_status:
                 continue
+            doc = IncidentDocument.from_cosmos(data)
             if user_email:
-                is_creator = data.get("created_by") == user_email
-                is_personnel = any(
-                    p.get("email") == user_email
-                    for u in data.get("units", [])
-                    for p in u.get("personnel", [])
-                )
-                if not is_creator and not is_personnel:
+                participants = data.get(PARTICIPANTS_FIELD)
+                if participants is None:
+                    # Not backfilled yet (or seeded raw): derive from creator + crew
+                    participants = doc.participant_emails()
+                if user_email not in participants:
                     continue
-            results.append(IncidentDocument.from_cosmos(data))
+            results.append(doc)
         results.sort(key=lambda doc: doc.incident_datetime)
         return results[:max_items]
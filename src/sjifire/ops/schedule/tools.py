@@ -21,7 +21,7 @@ from datetime import date, datetime, timedelta
 
 from bs4 import BeautifulSoup, Tag
 
-from sjifire.calendar.models import CREW_DATA_MARKER
+from sjifire.calendar.normalize import extract_crew_data
 from sjifire.core.config import local_now
 from sjifire.core.schedule import (
     detect_shift_change_hour,
@@ -44,10 +44,6 @@ CACHE_MAX_AGE_HOURS_PAST = 168.0  # 7 days
 # Matches "From 1800 (A Platoon)" or "Until 1800 (B Platoon)"
 _SECTION_RE = re.compile(r"(Until|From)\s+(\d{4})\s*(?:\(([^)]+)\))?")
 
-# Regex to extract the CREW_DATA JSON from an HTML comment.
-# Uses the shared marker constant so writer and reader stay in sync.
-_CREW_DATA_RE = re.compile(rf"<!--\s*{re.escape(CREW_DATA_MARKER)}(.*?)-->", re.DOTALL)
-
 
 # ---------------------------------------------------------------------------
 # Outlook calendar → DayScheduleCache pipeline
@@ -60,13 +56,13 @@ def _parse_crew_data_json(html: str) -> tuple[list[ScheduleEntryCache], str] | N
     Returns (entries, platoon) if the CREW_DATA comment is present and valid,
     or None to signal the caller should fall back to HTML table parsing.
     """
-    match = _CREW_DATA_RE.search(html)
-    if not match:
+    crew_data = extract_crew_data(html)
+    if crew_data is None:
         return None
 
     try:
-        data = json.loads(match.group(1))
-    except (json.JSONDecodeError, IndexError):
+        data = json.loads(crew_data)
+    except json.JSONDecodeError:
         logger.warning("CREW_DATA comment found but JSON is invalid, falling back to HTML parsing")
         return None
 
@@ -503,6 +503,7 @@ if os.getenv("TESTING") == "1":
         and ``is_editor`` (bool to toggle editor mode for the dev user).
         """
         from sjifire.ops.dispatch.store import DispatchStore
+        from sjifire.ops.incidents.models import IncidentDocument
         from sjifire.ops.incidents.store import IncidentStore
         from sjifire.ops.schedule.store import ScheduleStore
 
@@ -518,7 +519,9 @@ if os.getenv("TESTING") == "1":
             seeded["schedule"] = seeded.get("schedule", 0) + 1
 
         for inc_data in body.get("incidents", []):
-            IncidentStore._memory[inc_data["id"]] = inc_data
+            # Through _to_body so seeded docs carry the participant index field
+            doc = IncidentDocument.from_cosmos(inc_data)
+            IncidentStore._memory[doc.id] = IncidentStore._to_body(doc)
             seeded["incidents"] = seeded.get("incidents", 0) + 1
 
         # Toggle editor mode for the dev user
@@ -585,8 +588,15 @@ async def _stop_dispatch_sync() -> None:
         logger.info("Stopped background dispatch sync")
 
 
+async def _close_geo_client() -> None:
+    from sjifire.ops.geo import close_client
+
+    await close_client()
+
+
 app.add_event_handler("startup", _start_dispatch_sync)
 app.add_event_handler("shutdown", _stop_dispatch_sync)
+app.add_event_handler("shutdown", _close_geo_client)
 
 
 # ---------------------------------------------------------------------------
@@ -8,6 +8,8 @@ Tasks:
     dispatch-sync     — Sync new calls from iSpyFire + enrich missing
     dispatch-enrich   — Enrich stored calls missing analysis
     dispatch-reenrich — Force re-enrich ALL stored calls (after code changes)
+    dispatch-reenrich-batch — Same, with LLM analyses run as a Message Batch
+    dispatch-sites    — Rebuild the per-address site history index
 
 Requires: ISPYFIRE_*, COSMOS_*, ANTHROPIC_API_KEY env vars.
 """
@@ -15,7 +17,7 @@ Requires: ISPYFIRE_*, COSMOS_*, ANTHROPIC_API_KEY env vars.
 import logging
 from datetime import timedelta
 
-from sjifire.ops.tasks.registry import register
+from sjifire.ops.tasks.registry import record_stats, register
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,20 @@ async def _prewarm_schedule(docs) -> None:
         await _ensure_cache(sstore, sorted(dates_needed))
 
 
+def _report_cache_stats() -> None:
+    """Log analysis and prompt cache stats and attach them to the task result."""
+    from sjifire.ops.dispatch.analysis_cache import cache_stats
+
+    logger.info("Analysis cache: %d hits, %d misses", cache_stats.hits, cache_stats.misses)
+    logger.info(
+        "Analysis prompt cache: %d tokens read, %d written, %d uncached",
+        cache_stats.prompt_cache_read_tokens,
+        cache_stats.prompt_cache_write_tokens,
+        cache_stats.prompt_uncached_tokens,
+    )
+    record_stats(**cache_stats.as_dict())
+
+
 @register("dispatch-sync")
 async def dispatch_sync() -> int:
     """Sync recent dispatch calls and enrich any missing analysis.
@@ -86,6 +102,7 @@ async def dispatch_enrich() -> int:
     Returns:
         Number of calls enriched
     """
+    from sjifire.ops.dispatch.analysis_cache import cache_stats
     from sjifire.ops.dispatch.store import DispatchStore
 
     async with DispatchStore() as store:
@@ -101,9 +118,11 @@ async def dispatch_enrich() -> int:
 
         if unenriched:
             await _prewarm_schedule(unenriched)
+            cache_stats.reset()
             results = await store.enrich_stored(force=False, limit=9999)
             count = sum(1 for d in results if d.analysis.incident_commander or d.analysis.summary)
             logger.info("Enriched %d calls", count)
+            _report_cache_stats()
             return count
 
     return 0
@@ -118,13 +137,40 @@ async def dispatch_reenrich() -> int:
     Use after changing enrichment logic (e.g., new status mappings,
     updated prompts).
 
-    Excluded from automatic runs (``auto=False``) because it calls the
-    LLM for every stored call, which can take many minutes.
+    Excluded from automatic runs (``auto=False``) because it can call the
+    LLM for every stored call, which can take many minutes. Calls whose
+    prompt (call data, crew roster, instructions, model) is unchanged are
+    answered from the analysis cache; hit/miss counts and prompt cache
+    token totals are reported in the task result.
     Run explicitly: ``uv run ops-tasks dispatch-reenrich``
 
     Returns:
         Number of calls re-enriched
     """
+    return await _force_reenrich(batch=False)
+
+
+@register("dispatch-reenrich-batch", auto=False)
+async def dispatch_reenrich_batch() -> int:
+    """Force re-enrichment of ALL stored calls via the Message Batches API.
+
+    Like ``dispatch-reenrich``, but the uncached LLM analyses are submitted
+    as one Anthropic Message Batch (half the cost, no per-request rate
+    limiting) and polled to completion before the usual per-call
+    enrichment applies them. Batches usually finish within minutes but
+    may take up to 24 hours. Requests that fail in the batch are retried
+    interactively.
+    Run explicitly: ``uv run ops-tasks dispatch-reenrich-batch``
+
+    Returns:
+        Number of calls re-enriched
+    """
+    return await _force_reenrich(batch=True)
+
+
+async def _force_reenrich(*, batch: bool) -> int:
+    """Prewarm the schedule and force re-enrich every stored call."""
+    from sjifire.ops.dispatch.analysis_cache import cache_stats
     from sjifire.ops.dispatch.store import DispatchStore
 
     async with DispatchStore() as store:
@@ -134,8 +180,30 @@ async def dispatch_reenrich() -> int:
         if docs:
             await _prewarm_schedule(docs)
 
-        results = await store.enrich_stored(force=True, limit=9999)
+        cache_stats.reset()
+        results = await store.enrich_stored(force=True, limit=9999, batch=batch)
         count = sum(1 for d in results if d.analysis.incident_commander or d.analysis.summary)
         logger.info("Force re-enriched %d of %d stored calls", count, len(results))
+        _report_cache_stats()
+
+    return count
+
+
+@register("dispatch-sites", auto=False)
+async def dispatch_sites() -> int:
+    """Rebuild the per-address site history index from all stored calls.
 
+    ``DispatchStore.upsert`` keeps the index current; run this once to
+    backfill calls stored before the index existed, or after changing
+    address normalization.
+    Run explicitly: ``uv run ops-tasks dispatch-sites``
+
+    Returns:
+        Number of sites written
+    """
+    from sjifire.ops.dispatch.store import DispatchStore
+
+    async with DispatchStore() as store:
+        count = await store.rebuild_site_history()
+    logger.info("Rebuilt site history for %d addresses", count)
     return count
@@ -31,7 +31,8 @@ async def event_archive() -> int:
     start = today - timedelta(days=180)
     end = today - timedelta(days=150)
 
-    events = await fetch_events(start, end)
+    # No refresh-ahead: this run's event loop ends before a background refresh would
+    events = await fetch_events(start, end, refresh_ahead=False)
     if not events:
         logger.info("No calendar events in archive window (%s to %s)", start, end)
         return 0
@@ -4,16 +4,29 @@ Compares operational users in Entra ID with iSpyFire people and
 applies changes: add new users, update changed fields, reactivate
 matched-but-inactive users, and deactivate removed users.
 
+Changes for different people are independent, so they are applied on a
+small thread pool sharing one client; the client's rate limiter keeps
+request starts ``BULK_OPERATION_DELAY`` apart overall while request
+latency overlaps. Changes for the same person (update, then reactivate)
+stay in order. Per-operation latency is logged at the end.
+
 Requires: MS_GRAPH_*, ISPYFIRE_* env vars.
 """
 
 import asyncio
 import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from sjifire.ops.tasks.registry import register
 
 logger = logging.getLogger(__name__)
 
+# Worker threads applying changes (request rate is capped by the client)
+APPLY_MAX_WORKERS = 4
+
 
 @register("ispyfire-sync")
 async def ispyfire_sync() -> int:
@@ -22,6 +35,7 @@ async def ispyfire_sync() -> int:
     Returns:
         Total number of changes applied (adds + updates + reactivations + deactivations)
     """
+    from sjifire.core.normalize import normalize_email
     from sjifire.entra.users import EntraUserManager
     from sjifire.ispyfire.client import ISpyFireClient
     from sjifire.ispyfire.sync import (
@@ -40,44 +54,57 @@ async def ispyfire_sync() -> int:
 
     # Compare
     comparison = compare_entra_to_ispyfire(entra_users, ispyfire_people)
-    changes = 0
-
-    if not comparison.to_add and not comparison.to_update and not comparison.to_remove:
-        # Check for reactivations among matched/updated
-        to_reactivate = [
-            person
-            for _user, person in comparison.matched + comparison.to_update
-            if not person.is_active
-        ]
-        if not to_reactivate:
-            logger.info("iSpyFire sync: no changes needed")
-            return 0
-
-    # Apply changes
-    def _apply():
-        nonlocal changes
+
+    # Matched-but-inactive users to reactivate
+    to_reactivate = [
+        person
+        for _user, person in comparison.matched + comparison.to_update
+        if not person.is_active
+    ]
+
+    if not (comparison.to_add or comparison.to_update or comparison.to_remove or to_reactivate):
+        logger.info("iSpyFire sync: no changes needed")
+        return 0
+
+    # Everyone (including inactive and deleted) by email, from the list just
+    # fetched — guards against creating a duplicate of an existing person
+    people_by_email = {
+        normalize_email(person.email): person for person in ispyfire_people if person.email
+    }
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+
+    def _apply() -> int:
         with ISpyFireClient() as client:
-            # Add new people
-            for user in comparison.to_add:
-                existing = client.get_person_by_email(user.email) if user.email else None
+
+            def timed(operation: str, fn: Callable, *args, **kwargs):
+                start = time.monotonic()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    latencies[operation].append(time.monotonic() - start)
+
+            def reactivate(person) -> int:
+                if timed("reactivate", client.reactivate_person, person.id, email=person.email):
+                    logger.info("Reactivated: %s", person.display_name)
+                    return 1
+                logger.error("Failed to reactivate: %s", person.display_name)
+                return 0
+
+            def add(user) -> int:
+                existing = people_by_email.get(normalize_email(user.email)) if user.email else None
                 if existing:
-                    if not existing.is_active and client.reactivate_person(
-                        existing.id, email=existing.email
-                    ):
-                        logger.info("Reactivated: %s", existing.display_name)
-                        changes += 1
-                    continue
+                    return 0 if existing.is_active else reactivate(existing)
 
                 person = entra_user_to_ispyfire_person(user)
-                result = client.create_and_invite(person)
+                result = timed("create", client.create_and_invite, person)
                 if result:
                     logger.info("Created: %s (ID: %s)", person.display_name, result.id)
-                    changes += 1
-                else:
-                    logger.error("Failed to create: %s", person.display_name)
+                    return 1
+                logger.error("Failed to create: %s", person.display_name)
+                return 0
 
-            # Update existing people
-            for user, person in comparison.to_update:
+            def update(user, person) -> int:
                 if user.first_name:
                     person.first_name = user.first_name
                 if user.last_name:
@@ -88,35 +115,49 @@ async def ispyfire_sync() -> int:
                     person.title = user.extension_attribute1
                 person.responder_types = get_responder_types(user)
 
-                if client.update_person(person):
+                changes = 0
+                if timed("update", client.update_person, person):
                     logger.info("Updated: %s", person.display_name)
                     changes += 1
                 else:
                     logger.error("Failed to update: %s", person.display_name)
+                # Reactivate after the update, which writes the person's old flags
+                if not person.is_active:
+                    changes += reactivate(person)
+                return changes
 
-            # Reactivate matched-but-inactive users
-            to_reactivate = [
-                person
-                for _user, person in comparison.matched + comparison.to_update
+            def deactivate(person) -> int:
+                if timed("deactivate", client.deactivate_person, person.id, email=person.email):
+                    logger.info("Deactivated: %s", person.display_name)
+                    return 1
+                logger.error("Failed to deactivate: %s", person.display_name)
+                return 0
+
+            # One unit of work per person
+            units: list[Callable[[], int]] = [lambda u=user: add(u) for user in comparison.to_add]
+            units += [
+                lambda u=user, p=person: update(u, p) for user, person in comparison.to_update
+            ]
+            units += [
+                lambda p=person: reactivate(p)
+                for _user, person in comparison.matched
                 if not person.is_active
             ]
-            for person in to_reactivate:
-                if client.reactivate_person(person.id, email=person.email):
-                    logger.info("Reactivated: %s", person.display_name)
-                    changes += 1
-                else:
-                    logger.error("Failed to reactivate: %s", person.display_name)
+            units += [lambda p=person: deactivate(p) for person in comparison.to_remove]
 
-            # Deactivate removed people
-            for person in comparison.to_remove:
-                if client.deactivate_person(person.id, email=person.email):
-                    logger.info("Deactivated: %s", person.display_name)
-                    changes += 1
-                else:
-                    logger.error("Failed to deactivate: %s", person.display_name)
+            with ThreadPoolExecutor(max_workers=APPLY_MAX_WORKERS) as pool:
+                return sum(pool.map(lambda unit: unit(), units))
 
-    await asyncio.to_thread(_apply)
+    changes = await asyncio.to_thread(_apply)
 
+    for operation, seconds in sorted(latencies.items()):
+        logger.info(
+            "iSpyFire %s: %d calls, avg %.0f ms, max %.0f ms",
+            operation,
+            len(seconds),
+            sum(seconds) / len(seconds) * 1000,
+            max(seconds) * 1000,
+        )
     logger.info(
         "iSpyFire sync complete: %d adds, %d updates, %d removals, %d total changes",
         len(comparison.to_add),
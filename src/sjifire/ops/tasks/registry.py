@@ -3,11 +3,15 @@
 Each task is an async function decorated with ``@register(name)``.
 The runner discovers tasks via ``list_tasks()`` and executes them
 with ``run_task()`` or ``run_all()``.
+
+A task can attach extra counters to its result (e.g. cache hits) by
+calling ``record_stats()`` while it runs.
 """
 
+import contextvars
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,24 @@ class TaskResult:
     count: int = 0
     elapsed: float = 0.0
     error: str = ""
+    stats: dict[str, int] = field(default_factory=dict)
+
+
+# Stats of the task currently running in this context
+_current_stats: contextvars.ContextVar[dict[str, int] | None] = contextvars.ContextVar(
+    "task_stats", default=None
+)
+
+
+def record_stats(**counts: int) -> None:
+    """Attach counters to the running task's ``TaskResult.stats``.
+
+    Later calls overwrite earlier values for the same name. Outside
+    ``run_task`` this is a no-op.
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.update(counts)
 
 
 def register(name: str, *, auto: bool = True):
@@ -67,16 +89,20 @@ async def run_task(name: str) -> TaskResult:
         return TaskResult(name=name, ok=False, error=f"Unknown task: {name}")
 
     fn = entry[0]
+    stats: dict[str, int] = {}
+    token = _current_stats.set(stats)
     t0 = time.monotonic()
     try:
         count = await fn()
         elapsed = time.monotonic() - t0
         logger.info("Task %s completed: %d items in %.1fs", name, count, elapsed)
-        return TaskResult(name=name, ok=True, count=count, elapsed=elapsed)
+        return TaskResult(name=name, ok=True, count=count, elapsed=elapsed, stats=stats)
     except Exception as exc:
         elapsed = time.monotonic() - t0
         logger.exception("Task %s failed after %.1fs", name, elapsed)
-        return TaskResult(name=name, ok=False, elapsed=elapsed, error=str(exc))
+        return TaskResult(name=name, ok=False, elapsed=elapsed, error=str(exc), stats=stats)
+    finally:
+        _current_stats.reset(token)
 
 
 async def run_all() -> list[TaskResult]:
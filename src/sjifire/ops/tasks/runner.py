@@ -83,6 +83,8 @@ def _print_result(result) -> None:
         print(f"  OK  {result.name}: {result.count} items in {result.elapsed:.1f}s")
     else:
         print(f"  FAIL {result.name}: {result.error} ({result.elapsed:.1f}s)")
+    if result.stats:
+        print("       " + ", ".join(f"{k}={v}" for k, v in sorted(result.stats.items())))
 
 
 def main() -> None:
@@ -1,20 +1,60 @@
 #!/usr/bin/env python3
-"""Export Cosmos DB collections to JSON files for backup.
+"""Export Cosmos DB containers to gzip'd NDJSON for backup, and restore them.
+
+Every container owned by a ``CosmosStore`` is streamed page by page
+(Cosmos continuation tokens), so nothing is truncated and memory stays
+flat however large the archive grows. Each run writes one directory::
+
+    backups/cosmos_20260301_120000/
+        manifest.json               # per-container progress and counts
+        incidents.ndjson.gz         # one raw Cosmos document per line
+        dispatch-calls.ndjson.gz
+        ...
+
+Each page is appended as its own gzip member and recorded in the manifest
+(continuation token and file size), so an interrupted export resumes where
+it stopped instead of starting over.
+
+Incremental mode keeps a chain of backups under the output directory
+(listed in ``chain.json``): a full snapshot every ``FULL_SNAPSHOT_DAYS``,
+and in between deltas holding only documents whose ``_ts`` is at or after
+the time the chain's previous export of that container started (less
+``TS_CLOCK_SKEW`` seconds). Pages do not come back in ``_ts`` order, so a
+write landing on an already-exported page mid-run is picked up by the next
+delta rather than lost behind a newer ``_ts`` seen later. ``--compact``
+replays a full snapshot and its deltas into a standalone point-in-time
+snapshot, newest version of each document winning. Deletions are not
+visible through ``_ts``, so a compacted snapshot still holds documents
+deleted since the last full snapshot.
 
 Usage:
-    uv run backup-cosmos                    # Both collections
-    uv run backup-cosmos --incidents-only   # Incidents only
-    uv run backup-cosmos --dispatch-only    # Dispatch calls only
-    uv run backup-cosmos --output /path/    # Custom output directory
+    uv run backup-cosmos                         # All containers
+    uv run backup-cosmos --container incidents   # Selected containers (repeatable)
+    uv run backup-cosmos --incidents-only        # Incidents only
+    uv run backup-cosmos --dispatch-only         # Dispatch calls only
+    uv run backup-cosmos --output /path/         # Custom output directory
+    uv run backup-cosmos --resume backups/cosmos_20260301_120000
+    uv run backup-cosmos --restore backups/cosmos_20260301_120000
+    uv run backup-cosmos --incremental           # Delta (or due full) into the chain
+    uv run backup-cosmos --incremental --full    # Force a new full snapshot
+    uv run backup-cosmos --compact backups       # Snapshot as of the latest backup
+    uv run backup-cosmos --compact backups --until cosmos_20260305_020000
 """
 
 import argparse
 import asyncio
+import gzip
+import importlib
 import json
 import logging
-from datetime import UTC, datetime
+import sys
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+from sjifire.ops.cosmos import CosmosStore
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -24,71 +64,429 @@ logger = logging.getLogger(__name__)
 # Silence noisy libraries
 logging.getLogger("azure").setLevel(logging.WARNING)
 
+# CosmosStore subclass that owns each container ("module:Class", imported lazily)
+CONTAINER_STORES = {
+    "budgets": "sjifire.ops.chat.store:BudgetStore",
+    "conversations": "sjifire.ops.chat.store:ConversationStore",
+    "dispatch-analysis-cache": "sjifire.ops.dispatch.analysis_cache:AnalysisCacheStore",
+    "dispatch-calls": "sjifire.ops.dispatch.store:DispatchStore",
+    "dispatch-sites": "sjifire.ops.dispatch.sites:SiteHistoryStore",
+    "events": "sjifire.ops.events.store:EventStore",
+    "incidents": "sjifire.ops.incidents.store:IncidentStore",
+    "schedules": "sjifire.ops.schedule.store:ScheduleStore",
+}
+
+# Partition key property of each container (documents are unique per id + partition)
+PARTITION_KEYS = {
+    "budgets": "month",
+    "conversations": "incident_id",
+    "dispatch-analysis-cache": "id",
+    "dispatch-calls": "year",
+    "dispatch-sites": "id",
+    "events": "year",
+    "incidents": "year",
+    "schedules": "date",
+}
+
+MANIFEST_FILE = "manifest.json"
+CHAIN_FILE = "chain.json"
+PAGE_SIZE = 1000
+
+# Age of the chain's last full snapshot after which --incremental takes a new one
+FULL_SNAPSHOT_DAYS = 7
+
+# Seconds subtracted from an export's start time to allow for clock drift
+# between this machine and Cosmos (which stamps ``_ts``)
+TS_CLOCK_SKEW = 60
+
+
+def _store_class(container: str) -> type[CosmosStore]:
+    """Import the store class for a container."""
+    module_name, _, class_name = CONTAINER_STORES[container].partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _load_manifest(backup_dir: Path) -> dict:
+    """Read a backup's manifest."""
+    return json.loads((backup_dir / MANIFEST_FILE).read_text())
+
+
+def _save_manifest(backup_dir: Path, manifest: dict) -> None:
+    """Atomically rewrite a backup's manifest."""
+    tmp = backup_dir / f"{MANIFEST_FILE}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2))
+    tmp.replace(backup_dir / MANIFEST_FILE)
+
+
+def _new_manifest(
+    containers: list[str],
+    page_size: int,
+    *,
+    kind: str = "full",
+    since: dict[str, int] | None = None,
+) -> dict:
+    """Manifest for a fresh backup of *containers*.
+
+    Args:
+        containers: Containers to export
+        page_size: Documents per page
+        kind: "full" or "delta"
+        since: For a delta, the ``_ts`` each container's export starts at
+    """
+    since = since or {}
+    return {
+        "created": datetime.now(UTC).isoformat(),
+        "kind": kind,
+        "page_size": page_size,
+        "containers": {
+            name: {
+                "file": f"{name}.ndjson.gz",
+                "count": 0,
+                "bytes": 0,
+                "continuation": None,
+                "complete": False,
+                "since": since.get(name),
+                "high_water": None,
+            }
+            for name in containers
+        },
+    }
+
+
+async def _export_container(backup_dir: Path, manifest: dict, container: str) -> int:
+    """Stream one container into its NDJSON file, resuming if partly done.
+
+    Returns:
+        Number of documents in the container's file
+    """
+    entry = manifest["containers"][container]
+    if entry["complete"]:
+        return entry["count"]
+
+    if entry.get("high_water") is None:
+        # Everything written from here on is left for the next delta
+        entry["high_water"] = int(time.time()) - TS_CLOCK_SKEW
+        _save_manifest(backup_dir, manifest)
+
+    path = backup_dir / entry["file"]
+    # Drop anything written after the last page the manifest recorded
+    with path.open("a+b") as f:
+        f.truncate(entry["bytes"])
+
+    async with _store_class(container)() as store:
+        async for docs, continuation in store.iter_raw_pages(
+            page_size=manifest["page_size"],
+            continuation=entry["continuation"],
+            since_ts=entry.get("since"),
+        ):
+            # One gzip member per page; concatenated members read as one stream
+            with gzip.open(path, "ab", compresslevel=6) as gz:
+                gz.writelines(json.dumps(doc).encode() + b"\n" for doc in docs)
+            entry["count"] += len(docs)
+            entry["bytes"] = path.stat().st_size
+            entry["continuation"] = continuation
+            entry["complete"] = continuation is None
+            _save_manifest(backup_dir, manifest)
+
+    if not entry["complete"]:
+        entry["complete"] = True
+        _save_manifest(backup_dir, manifest)
+    return entry["count"]
+
+
+async def export_backup(
+    backup_dir: Path,
+    containers: list[str] | None = None,
+    *,
+    page_size: int = PAGE_SIZE,
+) -> dict[str, int]:
+    """Export containers into *backup_dir*, or finish an interrupted export there.
+
+    Args:
+        backup_dir: Backup directory (created if new; resumed if it has a manifest)
+        containers: Containers for a new backup (default: all)
+        page_size: Documents per page for a new backup
+
+    Returns:
+        Document count per container
+    """
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    if (backup_dir / MANIFEST_FILE).exists():
+        manifest = _load_manifest(backup_dir)
+    else:
+        manifest = _new_manifest(containers or sorted(CONTAINER_STORES), page_size)
+        _save_manifest(backup_dir, manifest)
+
+    counts = {}
+    for container in manifest["containers"]:
+        counts[container] = await _export_container(backup_dir, manifest, container)
+        print(f"Exported {counts[container]} documents from {container}")
+    return counts
+
+
+def _read_ndjson(path: Path) -> Iterator[dict]:
+    """Yield documents from a gzip'd NDJSON file without loading it whole."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
 
-async def _backup_incidents(output_dir: Path, timestamp: str) -> int:
-    """Export all incidents to a JSON file.
+
+async def restore_backup(
+    backup_dir: Path,
+    containers: list[str] | None = None,
+    *,
+    page_size: int = PAGE_SIZE,
+) -> dict[str, int]:
+    """Upsert the documents in a backup back into their containers.
+
+    Args:
+        backup_dir: Directory written by ``export_backup``
+        containers: Containers to restore (default: all in the backup)
+        page_size: Documents read and written per batch
 
     Returns:
-        Number of documents exported
+        Document count restored per container
     """
-    from sjifire.ops.incidents.store import IncidentStore
+    manifest = _load_manifest(backup_dir)
+    counts = {}
+    for container, entry in manifest["containers"].items():
+        if containers and container not in containers:
+            continue
+        if not entry["complete"]:
+            logger.warning("Skipping %s: export incomplete (run --resume first)", container)
+            continue
+
+        count = 0
+        async with _store_class(container)() as store:
+            batch: list[dict] = []
+            for doc in _read_ndjson(backup_dir / entry["file"]):
+                batch.append(doc)
+                if len(batch) >= page_size:
+                    count += await store.upsert_raw(batch)
+                    batch = []
+            if batch:
+                count += await store.upsert_raw(batch)
+
+        counts[container] = count
+        print(f"Restored {count} documents to {container}")
+    return counts
+
+
+def _load_chain(root: Path) -> list[dict]:
+    """Read the incremental chain under *root* (oldest first)."""
+    path = root / CHAIN_FILE
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def _save_chain(root: Path, chain: list[dict]) -> None:
+    """Atomically rewrite the incremental chain."""
+    tmp = root / f"{CHAIN_FILE}.tmp"
+    tmp.write_text(json.dumps(chain, indent=2))
+    tmp.replace(root / CHAIN_FILE)
+
+
+def _high_water(root: Path, links: list[dict]) -> dict[str, int]:
+    """Latest export start (``_ts`` a following delta begins at) per container."""
+    marks: dict[str, int] = {}
+    for link in links:
+        for name, entry in _load_manifest(root / link["dir"])["containers"].items():
+            if entry.get("high_water") is not None:
+                marks[name] = max(marks.get(name, 0), entry["high_water"])
+    return marks
 
-    async with IncidentStore() as store:
-        docs = await store.list_all()
 
-    data = [doc.model_dump(mode="json") for doc in docs]
-    path = output_dir / f"cosmos_incidents_{timestamp}.json"
-    path.write_text(json.dumps(data, indent=2))
+def _is_complete(backup_dir: Path) -> bool:
+    """Check whether every container in a backup finished exporting."""
+    return all(e["complete"] for e in _load_manifest(backup_dir)["containers"].values())
 
-    print(f"Exported {len(data)} incidents to {path}")
-    return len(data)
 
+async def incremental_backup(
+    root: Path,
+    containers: list[str] | None = None,
+    *,
+    full: bool = False,
+    page_size: int = PAGE_SIZE,
+    now: datetime | None = None,
+) -> tuple[Path, dict[str, int]]:
+    """Add a backup to the chain under *root*: a delta, or a full snapshot when due.
 
-async def _backup_dispatch(output_dir: Path, timestamp: str) -> int:
-    """Export all dispatch calls to a JSON file.
+    An unfinished last backup in the chain is resumed instead.
+
+    Args:
+        root: Chain directory
+        containers: Containers for a new full snapshot (default: all;
+            deltas cover the containers of the chain's full snapshot)
+        full: Take a full snapshot even if one is not due
+        page_size: Documents per page
+        now: Backup time (defaults to now)
 
     Returns:
-        Number of documents exported
+        The backup directory and its document count per container
     """
-    from sjifire.ops.dispatch.store import DispatchStore
+    root.mkdir(parents=True, exist_ok=True)
+    chain = _load_chain(root)
+    if chain and not _is_complete(root / chain[-1]["dir"]):
+        backup_dir = root / chain[-1]["dir"]
+        return backup_dir, await export_backup(backup_dir)
+
+    now = now or datetime.now(UTC)
+    full_idx = next((i for i in reversed(range(len(chain))) if chain[i]["kind"] == "full"), None)
+    if full_idx is not None and not full:
+        age = now - datetime.fromisoformat(chain[full_idx]["created"])
+        full = age > timedelta(days=FULL_SNAPSHOT_DAYS)
+
+    name = f"cosmos_{now:%Y%m%d_%H%M%S}"
+    backup_dir = root / name
+    backup_dir.mkdir()
+    if full or full_idx is None:
+        kind = "full"
+        manifest = _new_manifest(containers or sorted(CONTAINER_STORES), page_size)
+    else:
+        kind = "delta"
+        base = _load_manifest(root / chain[full_idx]["dir"])
+        manifest = _new_manifest(
+            list(base["containers"]),
+            page_size,
+            kind=kind,
+            since=_high_water(root, chain[full_idx:]),
+        )
+    _save_manifest(backup_dir, manifest)
+    chain.append({"dir": name, "kind": kind, "created": now.isoformat()})
+    _save_chain(root, chain)
+
+    print(f"Starting {kind} backup {name}")
+    return backup_dir, await export_backup(backup_dir)
+
 
-    async with DispatchStore() as store:
-        docs = await store.list_all()
+def compact_chain(
+    root: Path,
+    until: str | None = None,
+    output: Path | None = None,
+) -> tuple[Path, dict[str, int]]:
+    """Rebuild a standalone snapshot from a full backup and its deltas.
 
-    data = [doc.model_dump(mode="json") for doc in docs]
-    path = output_dir / f"cosmos_dispatch_{timestamp}.json"
-    path.write_text(json.dumps(data, indent=2))
+    Reads the links newest first and keeps the first copy of each
+    document, so memory holds only the document keys seen so far.
+
+    Args:
+        root: Chain directory
+        until: Chain backup the snapshot is as of (default: the latest)
+        output: Snapshot directory (default: ``<root>/<until>_snapshot``)
+
+    Returns:
+        The snapshot directory and its document count per container
+    """
+    chain = _load_chain(root)
+    names = [link["dir"] for link in chain]
+    if not chain:
+        raise ValueError(f"No backup chain at {root}")
+    if until and until not in names:
+        raise ValueError(f"No backup {until} in the chain at {root}")
+    end = names.index(until) if until else len(chain) - 1
+    start = next((i for i in range(end, -1, -1) if chain[i]["kind"] == "full"), None)
+    if start is None:
+        raise ValueError(f"No full snapshot at or before {names[end]}")
+    links = [root / name for name in names[start : end + 1]]
+    for link in links:
+        if not _is_complete(link):
+            raise ValueError(f"Backup {link.name} is incomplete (run --incremental to resume)")
 
-    print(f"Exported {len(data)} dispatch calls to {path}")
-    return len(data)
+    output = output or root / f"{names[end]}_snapshot"
+    output.mkdir(parents=True, exist_ok=True)
+    base = _load_manifest(links[0])
+    manifest = _new_manifest(list(base["containers"]), base["page_size"])
+    manifest["compacted_from"] = [link.name for link in links]
+    marks = _high_water(root, chain[start : end + 1])
 
+    counts = {}
+    for name, entry in manifest["containers"].items():
+        partition = PARTITION_KEYS.get(name, "id")
+        seen: set[tuple[str, object]] = set()
+        path = output / entry["file"]
+        with gzip.open(path, "wb", compresslevel=6) as gz:
+            for link in reversed(links):
+                link_entry = _load_manifest(link)["containers"].get(name)
+                if link_entry is None:
+                    continue
+                for doc in _read_ndjson(link / link_entry["file"]):
+                    key = (doc["id"], doc.get(partition))
+                    if key not in seen:
+                        seen.add(key)
+                        gz.write(json.dumps(doc).encode() + b"\n")
+        entry.update(
+            count=len(seen),
+            bytes=path.stat().st_size,
+            complete=True,
+            high_water=marks.get(name),
+        )
+        counts[name] = len(seen)
+        print(f"Compacted {len(seen)} documents for {name}")
 
-async def _run(args: argparse.Namespace) -> None:
-    """Run the backup."""
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _save_manifest(output, manifest)
+    return output, counts
 
-    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-    total = 0
 
-    if not args.dispatch_only:
-        total += await _backup_incidents(output_dir, timestamp)
-    if not args.incidents_only:
-        total += await _backup_dispatch(output_dir, timestamp)
+async def _run(args: argparse.Namespace) -> int:
+    """Run the backup or restore."""
+    containers = args.container
+    if args.incidents_only:
+        containers = ["incidents"]
+    elif args.dispatch_only:
+        containers = ["dispatch-calls"]
 
-    print(f"\nBackup complete: {total} documents exported to {output_dir}")
+    if args.compact:
+        try:
+            snapshot, counts = compact_chain(Path(args.compact), args.until)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"\nSnapshot complete: {sum(counts.values())} documents in {snapshot}")
+        return 0
+
+    if args.incremental:
+        backup_dir, counts = await incremental_backup(
+            Path(args.output), containers, full=args.full, page_size=args.page_size
+        )
+        print(f"\nBackup complete: {sum(counts.values())} documents exported to {backup_dir}")
+        return 0
+
+    if args.restore:
+        backup_dir = Path(args.restore)
+        counts = await restore_backup(backup_dir, containers, page_size=args.page_size)
+        print(f"\nRestore complete: {sum(counts.values())} documents from {backup_dir}")
+        return 0
+
+    if args.resume:
+        backup_dir = Path(args.resume)
+        if not (backup_dir / MANIFEST_FILE).exists():
+            print(f"No backup manifest in {backup_dir}", file=sys.stderr)
+            return 1
+    else:
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        backup_dir = Path(args.output) / f"cosmos_{timestamp}"
+
+    counts = await export_backup(backup_dir, containers, page_size=args.page_size)
+    print(f"\nBackup complete: {sum(counts.values())} documents exported to {backup_dir}")
+    return 0
 
 
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
-        description="Export Cosmos DB collections to JSON files for backup.",
+        description="Export Cosmos DB containers to gzip'd NDJSON, or restore a backup.",
     )
     parser.add_argument(
         "--output",
         default="backups",
         help="Output directory (default: backups/)",
     )
+    parser.add_argument(
+        "--container",
+        action="append",
+        choices=sorted(CONTAINER_STORES),
+        help="Container to export or restore (repeatable; default: all)",
+    )
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
         "--incidents-only",
@@ -100,9 +498,50 @@ def main() -> None:
         action="store_true",
         help="Export dispatch calls only",
     )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=PAGE_SIZE,
+        help=f"Documents per page (default: {PAGE_SIZE})",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--resume",
+        metavar="BACKUP_DIR",
+        help="Finish an interrupted export",
+    )
+    mode.add_argument(
+        "--restore",
+        metavar="BACKUP_DIR",
+        help="Upsert a backup's documents back into Cosmos DB",
+    )
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Add a delta (or a due full snapshot) to the backup chain in --output",
+    )
+    mode.add_argument(
+        "--compact",
+        metavar="CHAIN_DIR",
+        help="Rebuild a point-in-time snapshot from a backup chain",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="With --incremental: take a full snapshot even if one is not due",
+    )
+    parser.add_argument(
+        "--until",
+        metavar="BACKUP_NAME",
+        help="With --compact: chain backup to snapshot as of (default: latest)",
+    )
 
     args = parser.parse_args()
-    asyncio.run(_run(args))
+    if args.full and not args.incremental:
+        parser.error("--full requires --incremental")
+    if args.until and not args.compact:
+        parser.error("--until requires --compact")
+    sys.exit(asyncio.run(_run(args)))
 
 
 if __name__ == "__main__":
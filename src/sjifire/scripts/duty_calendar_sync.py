@@ -6,6 +6,12 @@ Usage:
     uv run duty-calendar-sync --months 4           # Sync next 4 months
     uv run duty-calendar-sync --delete "Jan 2026"  # Delete all events for a month
     uv run duty-calendar-sync --inspect "Feb 2026" # View existing events
+
+With ALADTEC_CACHE_DIR set, scraped days are cached between runs;
+--changed-only skips the calendar sync when no day changed and
+--save-diff writes the changed-day report for personal-calendar-sync.
+The calendar's delta-query state is kept there too, so a user mailbox
+only sends events that changed since the previous run.
 """
 
 import argparse
@@ -17,8 +23,11 @@ from datetime import date
 
 from dateutil import parser as dateparser
 
+from sjifire.aladtec.client import get_aladtec_cache_dir
+from sjifire.aladtec.schedule_cache import save_schedule_diff
 from sjifire.aladtec.schedule_scraper import AladtecScheduleScraper, save_schedules
 from sjifire.calendar import DutyCalendarSync
+from sjifire.calendar.duty_sync import DELTA_STATE_FILE
 
 logging.basicConfig(
     level=logging.INFO,
@@ -126,6 +135,17 @@ def main() -> int:
         metavar="PATH",
         help="Save fetched schedule to JSON file (for personal-calendar-sync --load-schedule)",
     )
+    parser.add_argument(
+        "--save-diff",
+        type=str,
+        metavar="PATH",
+        help="Save the changed-day report to JSON (for personal-calendar-sync --load-diff)",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Skip the calendar sync when no schedule day changed since the last scrape",
+    )
 
     args = parser.parse_args()
 
@@ -194,7 +214,7 @@ def main() -> int:
 
             print(f"\nFound events on {len(events)} days:\n")
             for event_date in sorted(events.keys()):
-                event_id, _ = events[event_date]  # Unpack tuple (id, body)
+                event_id = events[event_date].event_id
                 # Show date and that an event exists (ID is just for reference)
                 print(f"  {event_date}: On Duty (id: {event_id[:8]}...)")
 
@@ -238,6 +258,7 @@ def main() -> int:
             return 1
 
         schedules = scraper.get_schedule_range(start_date, end_date)
+        diff = scraper.last_diff
 
     if not schedules:
         logger.warning("No schedule data retrieved")
@@ -250,10 +271,30 @@ def main() -> int:
     if args.save_schedule:
         save_schedules(schedules, args.save_schedule)
 
+    if args.save_diff:
+        if diff is None:
+            logger.warning("Schedule cache is off (set ALADTEC_CACHE_DIR); no diff to save")
+        else:
+            save_schedule_diff(diff, args.save_diff)
+
+    if args.changed_only and not args.force:
+        if diff is None:
+            logger.warning("Schedule cache is off; syncing all days")
+        elif not diff.has_changes:
+            logger.info("No schedule changes since last scrape; skipping calendar sync")
+            if not args.dry_run:
+                scraper.commit_cache()
+            return 0
+
     # Step 2: Sync to calendar
     logger.info("Syncing to calendar: %s", args.mailbox)
 
-    calendar_sync = DutyCalendarSync(mailbox=args.mailbox)
+    # Reuse the Aladtec cache dir for the calendar's delta state
+    cache_dir = get_aladtec_cache_dir()
+    calendar_sync = DutyCalendarSync(
+        mailbox=args.mailbox,
+        state_path=cache_dir / DELTA_STATE_FILE if cache_dir else None,
+    )
     result = calendar_sync.sync(schedules, dry_run=args.dry_run, force=args.force)
 
     # Report results
@@ -264,6 +305,10 @@ def main() -> int:
             logger.error("  Error: %s", error)
         return 1
 
+    # Only a real, successful sync consumes the schedule changes
+    if not args.dry_run:
+        scraper.commit_cache()
+
     return 0
 
 
@@ -5,13 +5,10 @@ import asyncio
 import logging
 import sys
 
-from kiota_abstractions.base_request_configuration import RequestConfiguration
-from msgraph.generated.users.users_request_builder import UsersRequestBuilder
-
 from sjifire.aladtec.member_scraper import AladtecMemberScraper
 from sjifire.aladtec.models import Member
 from sjifire.core.config import get_domain
-from sjifire.core.msgraph_client import get_graph_client
+from sjifire.entra.users import EntraUserManager, get_entra_cache_dir
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -54,51 +51,30 @@ def check_missing_data(members: list[Member]) -> dict[str, list[Member]]:
     return issues
 
 
-async def get_entra_users() -> list[dict]:
+async def get_entra_users(refresh_full: bool = False) -> list[dict]:
     """Fetch all users from Entra ID.
 
+    Uses the delta-synced user cache when ``ENTRA_CACHE_DIR`` is set.
+
+    Args:
+        refresh_full: If True, rebuild the Entra user cache instead of using delta
+
     Returns:
         List of user dicts with relevant fields
     """
-    client = get_graph_client()
-
-    users = []
-    # Get users with relevant properties
-    query_params = UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
-        select=[
-            "id",
-            "displayName",
-            "givenName",
-            "surname",
-            "mail",
-            "userPrincipalName",
-            "employeeId",
-        ]
-    )
-    config = RequestConfiguration(query_parameters=query_params)
-    result = await client.users.get(request_configuration=config)
-
-    def _user_to_dict(user):
-        return {
+    manager = EntraUserManager(cache_dir=get_entra_cache_dir(), refresh_full=refresh_full)
+    return [
+        {
             "id": user.id,
             "display_name": user.display_name,
-            "first_name": user.given_name,
-            "last_name": user.surname,
-            "email": user.mail,
-            "upn": user.user_principal_name,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": user.email,
+            "upn": user.upn,
             "employee_id": user.employee_id,
         }
-
-    if result and result.value:
-        users.extend(_user_to_dict(user) for user in result.value)
-
-    # Handle pagination
-    while result and result.odata_next_link:
-        result = await client.users.with_url(result.odata_next_link).get()
-        if result and result.value:
-            users.extend(_user_to_dict(user) for user in result.value)
-
-    return users
+        for user in await manager.get_users(include_disabled=True)
+    ]
 
 
 def is_shared_mailbox(user: dict) -> bool:
@@ -223,11 +199,12 @@ def print_section(title: str, items: list, format_func) -> None:
         print("  (none)")
 
 
-async def run_audit(skip_entra: bool = False) -> int:
+async def run_audit(skip_entra: bool = False, refresh_full: bool = False) -> int:
     """Run the audit.
 
     Args:
         skip_entra: Skip Entra ID comparison
+        refresh_full: If True, rebuild the Entra user cache instead of using delta
 
     Returns:
         Exit code
@@ -290,7 +267,7 @@ async def run_audit(skip_entra: bool = False) -> int:
 
         logger.info("Fetching users from Entra ID...")
         try:
-            entra_users = await get_entra_users()
+            entra_users = await get_entra_users(refresh_full=refresh_full)
             logger.info("Found %d users in Entra ID", len(entra_users))
 
             # Filter to just org domain accounts for reporting
@@ -369,10 +346,15 @@ def main():
         action="store_true",
         help="Skip Entra ID comparison (only run Aladtec data quality checks)",
     )
+    parser.add_argument(
+        "--refresh-full",
+        action="store_true",
+        help="Rebuild the Entra user cache ($ENTRA_CACHE_DIR) with a full sync",
+    )
 
     args = parser.parse_args()
 
-    exit_code = asyncio.run(run_audit(skip_entra=args.skip_entra))
+    exit_code = asyncio.run(run_audit(skip_entra=args.skip_entra, refresh_full=args.refresh_full))
     sys.exit(exit_code)
 
 
@@ -13,7 +13,7 @@ from email_validator import EmailNotValidError, validate_email
 from sjifire.aladtec.member_scraper import AladtecMemberScraper
 from sjifire.core.backup import backup_entra_users
 from sjifire.entra.aladtec_import import AladtecImporter
-from sjifire.entra.users import EntraUserManager
+from sjifire.entra.users import EntraUserManager, get_entra_cache_dir
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -24,11 +24,12 @@ logging.getLogger("azure.identity").setLevel(logging.WARNING)
 logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(logging.WARNING)
 
 
-async def cleanup_disabled_licenses(dry_run: bool = False) -> int:
+async def cleanup_disabled_licenses(dry_run: bool = False, refresh_full: bool = False) -> int:
     """Remove licenses from all disabled Entra users.
 
     Args:
         dry_run: If True, don't make changes, just report what would happen
+        refresh_full: If True, rebuild the Entra user cache instead of using delta
 
     Returns:
         Exit code
@@ -40,7 +41,7 @@ async def cleanup_disabled_licenses(dry_run: bool = False) -> int:
     if dry_run:
         logger.info("DRY RUN - no changes will be made")
 
-    user_manager = EntraUserManager()
+    user_manager = EntraUserManager(cache_dir=get_entra_cache_dir(), refresh_full=refresh_full)
 
     # Get all users including disabled
     logger.info("")
@@ -102,6 +103,7 @@ async def run_import(
     output_json: bool = False,
     individual: str | None = None,
     license_sku: str | None = None,
+    refresh_full: bool = False,
 ) -> int:
     """Run the Aladtec to Entra import.
 
@@ -113,6 +115,7 @@ async def run_import(
         output_json: If True, output results as JSON
         individual: If set, only sync this individual by email
         license_sku: If set, assign this license SKU to newly created users
+        refresh_full: If True, rebuild the Entra user cache instead of using delta
 
     Returns:
         Exit code
@@ -164,6 +167,10 @@ async def run_import(
         logger.error("Failed to fetch Aladtec members: %s", e)
         return 1
 
+    # One user snapshot (delta-synced when ENTRA_CACHE_DIR is set) serves
+    # both the backup and the importer's lookups
+    user_manager = EntraUserManager(cache_dir=get_entra_cache_dir(), refresh_full=refresh_full)
+
     # Backup Entra data before making changes (automatic, not optional)
     # Skip backup only for dry runs since no changes will be made
     if not dry_run:
@@ -171,7 +178,6 @@ async def run_import(
         logger.info("Creating backup of Entra ID users...")
 
         try:
-            user_manager = EntraUserManager()
             entra_users = await user_manager.get_users(include_disabled=True)
             entra_backup = backup_entra_users(entra_users)
             logger.info("Entra backup: %s", entra_backup)
@@ -185,7 +191,7 @@ async def run_import(
     logger.info("Importing to Entra ID...")
 
     try:
-        importer = AladtecImporter(license_sku=license_sku)
+        importer = AladtecImporter(license_sku=license_sku, user_manager=user_manager)
         result = await importer.import_members(
             members,
             dry_run=dry_run,
@@ -267,12 +273,19 @@ def main():
         default=os.environ.get("ENTRA_LICENSE_SKU"),
         help="License SKU ID to assign to newly created users (default: $ENTRA_LICENSE_SKU)",
     )
+    parser.add_argument(
+        "--refresh-full",
+        action="store_true",
+        help="Rebuild the Entra user cache ($ENTRA_CACHE_DIR) with a full sync",
+    )
 
     args = parser.parse_args()
 
     # Handle cleanup mode separately
     if args.cleanup_disabled_licenses:
-        exit_code = asyncio.run(cleanup_disabled_licenses(dry_run=args.dry_run))
+        exit_code = asyncio.run(
+            cleanup_disabled_licenses(dry_run=args.dry_run, refresh_full=args.refresh_full)
+        )
         sys.exit(exit_code)
 
     # Validate email if provided
@@ -292,6 +305,7 @@ def main():
             output_json=args.output_json,
             individual=individual,
             license_sku=args.license_sku,
+            refresh_full=args.refresh_full,
         )
     )
     sys.exit(exit_code)
@@ -16,10 +16,12 @@ Prerequisites for Exchange groups:
 
 import argparse
 import asyncio
+import json
 import logging
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from pathlib import Path
 
 from tenacity import (
     retry,
@@ -37,8 +39,8 @@ from sjifire.core.group_strategies import (
     get_strategy,
 )
 from sjifire.entra.groups import EntraGroupManager
-from sjifire.entra.users import EntraUser, EntraUserManager
-from sjifire.exchange.client import ExchangeOnlineClient
+from sjifire.entra.users import EntraUser, EntraUserManager, get_entra_cache_dir
+from sjifire.exchange.client import ExchangeGroupChange, ExchangeOnlineClient
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -78,11 +80,46 @@ class GroupSyncResult:
         return self.created or bool(self.members_added) or bool(self.members_removed)
 
 
+@dataclass
+class ExchangeGroupPlan:
+    """Planned changes for an existing Exchange group.
+
+    Produced by the planning phase (bulk membership read + diff) and
+    consumed by the apply phase. Plans serialize to JSON, so a dry run's
+    plan can be reviewed and then applied as-is with ``--apply-plan``.
+    """
+
+    group_key: str
+    display_name: str
+    email: str
+    alias: str  # Mail nickname
+    description: str
+    managed_by: str
+    target_members: list[str] = field(default_factory=list)
+    to_add: list[str] = field(default_factory=list)
+    to_remove: list[str] = field(default_factory=list)
+    aliases: list[str] = field(default_factory=list)  # Alias names without domain
+    member_names: dict[str, str] = field(default_factory=dict)  # email -> display name
+
+    def to_change(self) -> ExchangeGroupChange:
+        """Convert to the client's batched change request."""
+        domain = self.email.split("@", 1)[1]
+        return ExchangeGroupChange(
+            identity=self.email,
+            add=self.to_add,
+            remove=self.to_remove,
+            description=self.description,
+            managed_by=self.managed_by,
+            alias_addresses=[f"{alias}@{domain}" for alias in self.aliases],
+        )
+
+
 @dataclass
 class FullSyncResult:
     """Result of a full sync operation."""
 
     groups: list[GroupSyncResult] = field(default_factory=list)
+    exchange_plans: list[ExchangeGroupPlan] = field(default_factory=list)
 
     @property
     def total_created(self) -> int:
@@ -120,14 +157,21 @@ class UnifiedGroupSyncManager:
     Uses Entra ID users as the source of truth for membership data.
     """
 
-    def __init__(self, domain: str | None = None) -> None:
-        """Initialize the sync manager."""
+    def __init__(self, domain: str | None = None, refresh_full: bool = False) -> None:
+        """Initialize the sync manager.
+
+        Args:
+            domain: Organization email domain (defaults to org config)
+            refresh_full: If True, rebuild the Entra user cache instead of using delta
+        """
         self.domain = domain or get_domain()
+        self.refresh_full = refresh_full
         self._entra_groups: EntraGroupManager | None = None
         self._entra_users: EntraUserManager | None = None
         self._exchange_client: ExchangeOnlineClient | None = None
         self._entra_users_cache: list[EntraUser] | None = None
         self._all_users_cache: list[EntraUser] | None = None
+        self._source_emails: set[str] | None = None
 
     @property
     def entra_groups(self) -> EntraGroupManager:
@@ -138,16 +182,18 @@ class UnifiedGroupSyncManager:
 
     @property
     def entra_users(self) -> EntraUserManager:
-        """Lazy-load Entra user manager."""
+        """Lazy-load Entra user manager (delta-cached when ENTRA_CACHE_DIR is set)."""
         if self._entra_users is None:
-            self._entra_users = EntraUserManager()
+            self._entra_users = EntraUserManager(
+                cache_dir=get_entra_cache_dir(), refresh_full=self.refresh_full
+            )
         return self._entra_users
 
     @property
     def exchange_client(self) -> ExchangeOnlineClient:
-        """Lazy-load Exchange client."""
+        """Lazy-load Exchange client (one persistent PowerShell session per run)."""
         if self._exchange_client is None:
-            self._exchange_client = ExchangeOnlineClient()
+            self._exchange_client = ExchangeOnlineClient(persistent=True)
         return self._exchange_client
 
     async def get_entra_users(self) -> list[EntraUser]:
@@ -155,13 +201,16 @@ class UnifiedGroupSyncManager:
 
         Returns active users with organization email addresses. This filters
         out guest accounts and non-human accounts while including members
-        who may not have employee IDs set.
+        who may not have employee IDs set. Derived from the run's single
+        ``get_all_entra_users`` snapshot.
         """
         if self._entra_users_cache is None:
-            all_users = await self.entra_users.get_users(include_disabled=False)
-            # Filter to organization domain (excludes guests, external accounts)
+            all_users = await self.get_all_entra_users()
+            # Filter to active users in the organization domain (excludes guests, external accounts)
             self._entra_users_cache = [
-                u for u in all_users if u.email and u.email.lower().endswith(f"@{self.domain}")
+                u
+                for u in all_users
+                if u.account_enabled and u.email and u.email.lower().endswith(f"@{self.domain}")
             ]
             logger.info("Loaded %d Entra users for group sync", len(self._entra_users_cache))
         return self._entra_users_cache
@@ -169,14 +218,31 @@ class UnifiedGroupSyncManager:
     async def get_all_entra_users(self) -> list[EntraUser]:
         """Get all Entra users including disabled (cached).
 
-        Used for ghost member reconciliation where we need to map user IDs
-        to emails for disabled accounts that PowerShell can't see.
+        This is the per-run user snapshot: it is fetched once and shared by
+        every strategy (active members, partial-sync source emails, ghost
+        member reconciliation, service account lookup).
         """
         if self._all_users_cache is None:
             self._all_users_cache = await self.entra_users.get_users(include_disabled=True)
             logger.info("Loaded %d Entra users (including disabled)", len(self._all_users_cache))
         return self._all_users_cache
 
+    async def get_source_emails(self) -> set[str]:
+        """Get emails of all Aladtec-sourced users, including disabled (cached).
+
+        Used by partial-sync strategies: only these members may be removed.
+        """
+        if self._source_emails is None:
+            # Members with work_group set are from Aladtec (disabled included)
+            self._source_emails = {
+                u.email.lower()
+                for u in await self.get_all_entra_users()
+                if u.work_group is not None and u.email
+            }
+            # Whitelist service accounts that should never be removed
+            self._source_emails.discard(get_service_email().lower())
+        return self._source_emails
+
     async def _add_service_account_to_group(self, group_id: str) -> bool:
         """Add service account to an M365 group for delegated calendar auth.
 
@@ -196,7 +262,7 @@ class UnifiedGroupSyncManager:
         svc_email = get_service_email()
 
         # Find service account user (do this once, outside retry)
-        all_users = await self.entra_users.get_users(include_disabled=True)
+        all_users = await self.get_all_entra_users()
         svc_user = next(
             (u for u in all_users if u.email and u.email.lower() == svc_email.lower()),
             None,
@@ -360,6 +426,7 @@ class UnifiedGroupSyncManager:
         dry_run: bool = False,
         partial_sync: bool = False,
         source_emails: set[str] | None = None,
+        detected_type: GroupType | None = None,
     ) -> GroupSyncResult:
         """Sync a single group, detecting type automatically.
 
@@ -371,6 +438,7 @@ class UnifiedGroupSyncManager:
             dry_run: If True, don't make changes
             partial_sync: If True, preserve members not in source_emails
             source_emails: Set of all source member emails (for partial sync)
+            detected_type: Already-detected group type (skips detection)
 
         Returns:
             GroupSyncResult with sync details
@@ -382,7 +450,8 @@ class UnifiedGroupSyncManager:
         email = f"{mail_nickname}@{self.domain}"
 
         # Detect existing group type
-        detected_type = await self.detect_group_type(email, mail_nickname)
+        if detected_type is None:
+            detected_type = await self.detect_group_type(email, mail_nickname)
 
         # Handle conflict - exists in both systems
         if detected_type == GroupType.BOTH:
@@ -693,7 +762,8 @@ class UnifiedGroupSyncManager:
     ) -> GroupSyncResult:
         """Sync a group via Exchange (PowerShell).
 
-        Uses a SINGLE PowerShell connection per group that does everything:
+        Uses a SINGLE PowerShell script per group (on the run's shared
+        session) that does everything:
         - Gets group info and current members
         - Updates description and managed_by
         - Adds/removes members to match target
@@ -796,7 +866,7 @@ class UnifiedGroupSyncManager:
                 errors=ghost_errors,
             )
 
-        # SINGLE CONNECTION: Do everything in one PowerShell call
+        # SINGLE SCRIPT: Do everything in one PowerShell call
         result = await self.exchange_client.sync_group(
             identity=email,
             description=strategy.automation_notice,
@@ -858,6 +928,115 @@ class UnifiedGroupSyncManager:
             errors=all_errors,
         )
 
+    async def plan_exchange_groups(
+        self,
+        strategy: GroupStrategy,
+        groups: dict[str, list[GroupMember]],
+    ) -> tuple[list[ExchangeGroupPlan], dict[str, GroupSyncResult]]:
+        """Plan member changes for existing Exchange groups.
+
+        Reads every group's membership in bulk (one PowerShell script per
+        batch of groups) and diffs against the target members in Python.
+
+        Args:
+            strategy: The group strategy instance
+            groups: Group key -> members who should be in that group
+
+        Returns:
+            Tuple of (plans, error results keyed by group key for groups not found)
+        """
+        configs = {key: strategy.get_config(key) for key in groups}
+        emails = {key: f"{config.mail_nickname}@{self.domain}" for key, config in configs.items()}
+        current = await self.exchange_client.get_groups_with_members(list(emails.values()))
+        service_email = get_service_email()
+
+        plans: list[ExchangeGroupPlan] = []
+        missing: dict[str, GroupSyncResult] = {}
+        for key, group_members in groups.items():
+            config = configs[key]
+            email = emails[key]
+            group, current_members = current.get(email, (None, []))
+            if group is None:
+                missing[key] = GroupSyncResult(
+                    group_name=config.display_name,
+                    group_email=email,
+                    group_type=GroupType.EXCHANGE,
+                    errors=[f"Group not found: {email}"],
+                )
+                continue
+
+            member_names = {m.email.lower(): m.display_name for m in group_members if m.email}
+            target = sorted(member_names)
+            current_set = set(current_members)
+            plans.append(
+                ExchangeGroupPlan(
+                    group_key=key,
+                    display_name=config.display_name,
+                    email=email,
+                    alias=config.mail_nickname,
+                    description=strategy.automation_notice,
+                    managed_by=service_email,
+                    target_members=target,
+                    to_add=[e for e in target if e not in current_set],
+                    to_remove=sorted(current_set - set(target)),
+                    aliases=list(config.aliases or []),
+                    member_names=member_names,
+                )
+            )
+        return plans, missing
+
+    async def apply_exchange_plans(
+        self, plans: list[ExchangeGroupPlan], dry_run: bool
+    ) -> dict[str, GroupSyncResult]:
+        """Apply (or preview) planned Exchange group changes.
+
+        All groups' adds, removes, description/owner updates and aliases go
+        out in batched scripts with per-group results; ghost members are then
+        reconciled per group via Graph.
+
+        Args:
+            plans: Plans from ``plan_exchange_groups`` (or a saved plan file)
+            dry_run: If True, only log what would be done
+
+        Returns:
+            GroupSyncResult per plan, keyed by group key
+        """
+        outcomes = {}
+        if not dry_run:
+            changes = [p.to_change() for p in plans]
+            outcomes = await self.exchange_client.apply_group_changes(changes)
+
+        results: dict[str, GroupSyncResult] = {}
+        for plan in plans:
+            if dry_run:
+                added_emails, removed, errors = plan.to_add, list(plan.to_remove), []
+                for member_email in added_emails:
+                    name = plan.member_names.get(member_email, member_email)
+                    logger.info("Would add %s to %s", name, plan.email)
+                for member_email in removed:
+                    logger.info("Would remove %s from %s", member_email, plan.email)
+            else:
+                outcome = outcomes.get(plan.email)
+                added_emails = outcome.added if outcome else []
+                removed = list(outcome.removed) if outcome else []
+                errors = list(outcome.errors) if outcome else ["Group missing from results"]
+
+            ghost_removed, ghost_errors = await self._reconcile_ghost_members(
+                alias=plan.alias,
+                email=plan.email,
+                target_emails=set(plan.target_members),
+                dry_run=dry_run,
+            )
+            results[plan.group_key] = GroupSyncResult(
+                group_name=plan.display_name,
+                group_email=plan.email,
+                group_type=GroupType.EXCHANGE,
+                members_added=[plan.member_names.get(e.lower(), e) for e in added_emails],
+                members_removed=removed + ghost_removed,
+                errors=errors + ghost_errors,
+            )
+        return results
+
     async def sync(
         self,
         strategy_name: str,
@@ -901,22 +1080,25 @@ class UnifiedGroupSyncManager:
         # Members with work_group set are from Aladtec; work_group=None means not from Aladtec
         # This preserves non-Aladtec members (board members, guests, etc.) while removing
         # disabled Aladtec members who no longer meet criteria
-        source_emails: set[str] | None = None
-        if partial_sync:
-            # Get all users including disabled to properly identify Aladtec members
-            all_users_for_source = await self.entra_users.get_users(include_disabled=True)
-            all_aladtec = [u for u in all_users_for_source if u.work_group is not None]
-            source_emails = {m.email.lower() for m in all_aladtec if m.email}
-            # Whitelist service accounts that should never be removed
-            source_emails.discard(get_service_email().lower())
+        source_emails = await self.get_source_emails() if partial_sync else None
 
-        results: list[GroupSyncResult] = []
+        results: dict[str, GroupSyncResult] = {}
+        existing_exchange: dict[str, list[GroupMember]] = {}
 
         for group_key in sorted(groups_to_sync.keys()):
             group_members = groups_to_sync[group_key]
             logger.info("Processing %s (%d members)", group_key, len(group_members))
 
-            result = await self.sync_group(
+            config = strategy.get_config(group_key)
+            email = f"{config.mail_nickname}@{self.domain}"
+            detected_type = await self.detect_group_type(email, config.mail_nickname)
+
+            # Existing Exchange groups are planned and applied together below
+            if detected_type == GroupType.EXCHANGE:
+                existing_exchange[group_key] = group_members
+                continue
+
+            results[group_key] = await self.sync_group(
                 strategy=strategy,
                 group_key=group_key,
                 group_members=group_members,
@@ -924,14 +1106,42 @@ class UnifiedGroupSyncManager:
                 dry_run=dry_run,
                 partial_sync=partial_sync,
                 source_emails=source_emails,
+                detected_type=detected_type,
             )
-            results.append(result)
 
-        return FullSyncResult(groups=results)
+        plans: list[ExchangeGroupPlan] = []
+        if existing_exchange:
+            logger.info("Planning %d Exchange groups...", len(existing_exchange))
+            plans, missing = await self.plan_exchange_groups(strategy, existing_exchange)
+            results.update(missing)
+            results.update(await self.apply_exchange_plans(plans, dry_run))
+
+        return FullSyncResult(
+            groups=[results[key] for key in sorted(results)],
+            exchange_plans=plans,
+        )
+
+    async def apply_plan(self, plans: list[ExchangeGroupPlan]) -> FullSyncResult:
+        """Apply a saved Exchange plan (from a dry run) without re-planning.
+
+        Args:
+            plans: Plans loaded with ``load_sync_plan``
+
+        Returns:
+            FullSyncResult for the planned groups
+        """
+        results = await self.apply_exchange_plans(plans, dry_run=False)
+        return FullSyncResult(
+            groups=[results[key] for key in sorted(results)],
+            exchange_plans=plans,
+        )
 
     async def close(self) -> None:
         """Close all clients."""
         if self._exchange_client:
+            logger.debug(
+                "Exchange PowerShell connects this run: %d", self._exchange_client.connect_count
+            )
             await self._exchange_client.close()
 
 
@@ -1097,10 +1307,41 @@ async def backup_groups(
         logger.info("No existing groups to backup")
 
 
+def save_sync_plan(plans: dict[str, list[ExchangeGroupPlan]], path: str | Path) -> None:
+    """Write Exchange group plans (keyed by strategy) to JSON.
+
+    Args:
+        plans: Strategy name -> plans from that strategy's sync
+        path: Output file
+    """
+    data = {name: [asdict(p) for p in strategy_plans] for name, strategy_plans in plans.items()}
+    Path(path).write_text(json.dumps({"strategies": data}, indent=2))
+    total = sum(len(p) for p in plans.values())
+    logger.info("Saved plan for %d Exchange groups to %s", total, path)
+
+
+def load_sync_plan(path: str | Path) -> dict[str, list[ExchangeGroupPlan]]:
+    """Load Exchange group plans written by ``save_sync_plan``.
+
+    Args:
+        path: Plan file
+
+    Returns:
+        Strategy name -> plans
+    """
+    data = json.loads(Path(path).read_text())
+    return {
+        name: [ExchangeGroupPlan(**p) for p in strategy_plans]
+        for name, strategy_plans in data.get("strategies", {}).items()
+    }
+
+
 async def run_sync(
     strategies: list[str],
     new_group_type: GroupType = GroupType.EXCHANGE,
     dry_run: bool = False,
+    save_plan: str | None = None,
+    refresh_full: bool = False,
 ) -> int:
     """Run group sync for specified strategies.
 
@@ -1110,6 +1351,8 @@ async def run_sync(
         strategies: List of strategy names to run
         new_group_type: Type to use for new groups
         dry_run: If True, don't make changes
+        save_plan: Path to write the Exchange group plans (for ``--apply-plan``)
+        refresh_full: If True, rebuild the Entra user cache instead of using delta
 
     Returns:
         Exit code
@@ -1125,7 +1368,7 @@ async def run_sync(
     logger.info("New group type: %s", new_group_type.value)
 
     # Initialize manager
-    manager = UnifiedGroupSyncManager()
+    manager = UnifiedGroupSyncManager(refresh_full=refresh_full)
 
     # Fetch users from Entra ID
     logger.info("")
@@ -1157,6 +1400,7 @@ async def run_sync(
             # Continue with sync even if backup fails
     total_errors = 0
     total_skipped = 0
+    plans: dict[str, list[ExchangeGroupPlan]] = {}
 
     try:
         for strategy_name in strategies:
@@ -1173,6 +1417,7 @@ async def run_sync(
                 print_result(result, dry_run=dry_run)
                 total_errors += result.total_errors
                 total_skipped += result.total_skipped
+                plans[strategy_name] = result.exchange_plans
 
             except Exception as e:
                 logger.error("Failed to sync %s: %s", strategy_name, e)
@@ -1181,6 +1426,9 @@ async def run_sync(
     finally:
         await manager.close()
 
+    if save_plan:
+        save_sync_plan(plans, save_plan)
+
     if total_skipped:
         logger.warning(
             "\n  %d group(s) skipped due to conflicts. "
@@ -1191,6 +1439,43 @@ async def run_sync(
     return 0 if total_errors == 0 else 1
 
 
+async def run_apply_plan(path: str) -> int:
+    """Apply Exchange group plans saved by a previous (dry) run.
+
+    Skips Entra user loading and membership reads: the saved diff is
+    applied as-is, so review the plan shortly before applying it.
+
+    Args:
+        path: Plan file written with ``--save-plan``
+
+    Returns:
+        Exit code
+    """
+    logger.info("=" * 60)
+    logger.info("Microsoft Group Sync - Apply Plan")
+    logger.info("=" * 60)
+
+    try:
+        plans = load_sync_plan(path)
+    except (OSError, ValueError, TypeError) as e:
+        logger.error("Failed to load plan %s: %s", path, e)
+        return 1
+
+    manager = UnifiedGroupSyncManager()
+    total_errors = 0
+    try:
+        for strategy_name, strategy_plans in plans.items():
+            logger.info("")
+            logger.info("Applying %s plan (%d groups)...", strategy_name, len(strategy_plans))
+            result = await manager.apply_plan(strategy_plans)
+            print_result(result)
+            total_errors += result.total_errors
+    finally:
+        await manager.close()
+
+    return 0 if total_errors == 0 else 1
+
+
 async def delete_group(email: str, dry_run: bool = False) -> int:
     """Delete a group (M365 or Exchange), with full backup first.
 
@@ -1389,6 +1674,21 @@ def main() -> None:
         metavar="EMAIL",
         help="Delete a group by email (auto-detects M365 vs Exchange, backs up first)",
     )
+    parser.add_argument(
+        "--save-plan",
+        metavar="PATH",
+        help="Write the planned Exchange group changes to a JSON file (use with --dry-run)",
+    )
+    parser.add_argument(
+        "--apply-plan",
+        metavar="PATH",
+        help="Apply Exchange group changes from a plan written by --save-plan",
+    )
+    parser.add_argument(
+        "--refresh-full",
+        action="store_true",
+        help="Rebuild the Entra user cache ($ENTRA_CACHE_DIR) with a full sync",
+    )
 
     args = parser.parse_args()
 
@@ -1397,6 +1697,9 @@ def main() -> None:
         exit_code = asyncio.run(delete_group(args.delete, dry_run=args.dry_run))
         sys.exit(exit_code)
 
+    if args.apply_plan:
+        sys.exit(asyncio.run(run_apply_plan(args.apply_plan)))
+
     # Determine which strategies to run
     strategies: list[str] = []
     if args.all:
@@ -1415,6 +1718,8 @@ def main() -> None:
             strategies=strategies,
             new_group_type=new_group_type,
             dry_run=args.dry_run,
+            save_plan=args.save_plan,
+            refresh_full=args.refresh_full,
         )
     )
     sys.exit(exit_code)
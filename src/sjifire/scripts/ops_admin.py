@@ -6,6 +6,7 @@ Commands:
     reset-incident  - Reset a draft incident (bypasses cooldown)
     re-enrich       - Re-run LLM enrichment on a dispatch call
     update-neris    - Push local corrections to a NERIS record
+    backfill-participants - Add participant_emails index to older incidents
 
 Usage:
     uv run ops-admin reopen-incident <incident-id>
@@ -13,6 +14,7 @@ Usage:
     uv run ops-admin reset-incident <incident-id> --email user@sjifire.org
     uv run ops-admin re-enrich <dispatch-id>
     uv run ops-admin update-neris <incident-id> [--fields narrative timestamps]
+    uv run ops-admin backfill-participants
 """
 
 import argparse
@@ -164,6 +166,17 @@ async def _re_enrich(dispatch_id: str) -> int:
     return 0
 
 
+async def _backfill_participants() -> int:
+    """Add the participant_emails index field to incidents missing it."""
+    from sjifire.ops.incidents.store import IncidentStore
+
+    async with IncidentStore() as store:
+        count = await store.backfill_participants()
+
+    print(f"Backfilled participant_emails on {count} incident(s)")
+    return 0
+
+
 def cmd_reopen_incident(args: argparse.Namespace) -> int:
     """Reopen a submitted/approved incident."""
     return asyncio.run(_reopen_incident(args.incident_id, getattr(args, "email", None)))
@@ -223,6 +236,11 @@ def cmd_update_neris(args: argparse.Namespace) -> int:
     return asyncio.run(_update_neris(args.incident_id, getattr(args, "email", None), fields))
 
 
+def cmd_backfill_participants(args: argparse.Namespace) -> int:
+    """Backfill participant_emails on older incidents."""
+    return asyncio.run(_backfill_participants())
+
+
 def main() -> None:
     """CLI entry point for ops admin commands."""
     parser = argparse.ArgumentParser(description="Ops admin CLI")
@@ -251,6 +269,11 @@ def main() -> None:
         help="Specific fields to update (e.g. narrative timestamps units)",
     )
 
+    sub.add_parser(
+        "backfill-participants",
+        help="Add participant_emails index to incidents created before it existed",
+    )
+
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
@@ -261,5 +284,6 @@ def main() -> None:
         "reset-incident": cmd_reset_incident,
         "re-enrich": cmd_re_enrich,
         "update-neris": cmd_update_neris,
+        "backfill-participants": cmd_backfill_participants,
     }
     sys.exit(commands[args.command](args))
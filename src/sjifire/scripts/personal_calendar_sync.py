@@ -8,6 +8,20 @@ Usage:
     uv run personal-calendar-sync --user user@example.org --month "Feb 2026"
     uv run personal-calendar-sync --all --month "Feb 2026" --dry-run
     uv run personal-calendar-sync --inspect --user user@example.org --month "Feb 2026"
+
+With --changed-only, only users scheduled on a day that changed since the
+last scrape are synced (diff from --load-diff, or from the scraper's
+ALADTEC_CACHE_DIR cache when fetching directly).
+
+Users are synced concurrently (up to --concurrency mailboxes at once). Each
+user's writes go only to their own mailbox, so the per-mailbox limit is
+unaffected; the app-wide limit is respected by an AIMD controller that
+halves concurrency on 429s and pauses for Retry-After.
+
+When ALADTEC_CACHE_DIR is set, a fingerprint of each user's synced entries
+is kept there: users whose schedule slice is unchanged are skipped without
+any Graph calls, and the rest only have changed events rewritten. --full
+(or --force) ignores the fingerprints and compares every event.
 """
 
 import argparse
@@ -15,18 +29,28 @@ import asyncio
 import calendar
 import logging
 import sys
+import time
+from dataclasses import dataclass
 from datetime import date
 
 from dateutil import parser as dateparser
 
+from sjifire.aladtec.client import get_aladtec_cache_dir
 from sjifire.aladtec.member_scraper import AladtecMemberScraper
+from sjifire.aladtec.schedule_cache import ScheduleDiff, load_schedule_diff
 from sjifire.aladtec.schedule_scraper import (
     AladtecScheduleScraper,
     ScheduleEntry,
     load_schedules,
 )
-from sjifire.calendar.personal_sync import PersonalCalendarSync
+from sjifire.calendar.personal_sync import (
+    PersonalCalendarSync,
+    PersonalSyncResult,
+    schedule_fingerprint,
+)
+from sjifire.calendar.sync_state import SYNC_STATE_FILE, PersonalSyncState
 from sjifire.core.schedule import is_filled_entry
+from sjifire.core.throttle import AdaptiveLimiter
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,11 +62,43 @@ logger = logging.getLogger(__name__)
 logging.getLogger("azure").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
-# Pause between users so Outlook's rolling per-mailbox concurrency counters
-# have a moment to drain. Retry throttled users once at the end after a
-# longer cooldown — per-mailbox throttles usually clear by then.
-INTER_USER_PAUSE_SEC = 1.0
-THROTTLE_RETRY_COOLDOWN_SEC = 60.0
+# Users synced at once: start small and let the AIMD controller grow
+# toward the ceiling while Graph isn't throttling.
+INITIAL_CONCURRENT_USERS = 2
+MAX_CONCURRENT_USERS = 6
+
+# Pause before new user syncs start after a throttled user whose 429 came
+# without a Retry-After (SDK reads). Throttled users are retried once.
+THROTTLE_PAUSE_SEC = 30.0
+
+
+@dataclass
+class SyncRunStats:
+    """Throughput and throttling for one multi-user sync run."""
+
+    users: int = 0
+    elapsed_sec: float = 0.0
+    throttle_events: int = 0
+    skipped_users: int = 0
+    throttled_users: int = 0
+    retried_users: int = 0
+    peak_concurrency: int = 0
+    final_concurrency: int = 0
+
+    @property
+    def users_per_minute(self) -> float:
+        """Users synced per minute of wall time."""
+        return self.users * 60 / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Return a one-line summary."""
+        return (
+            f"{self.users} users in {self.elapsed_sec:.1f}s "
+            f"({self.users_per_minute:.1f}/min), {self.skipped_users} unchanged, "
+            f"{self.throttle_events} throttle events, "
+            f"{self.retried_users} retried, concurrency peak {self.peak_concurrency} "
+            f"final {self.final_concurrency}"
+        )
 
 
 def parse_month(month_str: str) -> tuple[int, int]:
@@ -112,6 +168,92 @@ def match_schedule_name_to_email(
     return None
 
 
+async def sync_users(
+    sync: PersonalCalendarSync,
+    entries_by_email: dict[str, list[ScheduleEntry]],
+    start_date: date,
+    end_date: date,
+    dry_run: bool = False,
+    force: bool = False,
+    limiter: AdaptiveLimiter | None = None,
+    state: PersonalSyncState | None = None,
+    full: bool = False,
+) -> tuple[list[PersonalSyncResult], SyncRunStats]:
+    """Sync many users' calendars concurrently under adaptive throttle control.
+
+    Every ``$batch`` item Graph throttles (and every user whose sync was
+    throttled) is fed to ``limiter``, which cuts concurrency and pauses new
+    starts for Retry-After. Throttled users are retried once.
+
+    With ``state``, users whose entries match the stored fingerprint are
+    skipped, the rest are synced change-only, and successful syncs update
+    the fingerprint (the caller saves it).
+
+    Args:
+        sync: Personal calendar sync instance (shared by all users)
+        entries_by_email: Schedule entries keyed by user email
+        start_date: Start of sync range
+        end_date: End of sync range
+        dry_run: If True, preview without making changes
+        force: If True, update all events even if body hasn't changed
+        limiter: Concurrency controller (defaults to the module limits)
+        state: Fingerprints of the last successful sync per user
+        full: If True, ignore stored fingerprints and compare every event
+
+    Returns:
+        Tuple of (results in ``entries_by_email`` order, run stats)
+    """
+    limiter = limiter or AdaptiveLimiter(
+        initial=INITIAL_CONCURRENT_USERS, maximum=MAX_CONCURRENT_USERS
+    )
+    sync.batch_client.on_throttle = limiter.record_throttle
+    stats = SyncRunStats(users=len(entries_by_email))
+    started = time.monotonic()
+
+    async def sync_one(email: str, entries: list[ScheduleEntry]) -> PersonalSyncResult:
+        fingerprint = schedule_fingerprint(entries)
+        previous = None
+        if state is not None and not (full or force):
+            previous = state.get(email, start_date, end_date)
+        if previous is not None and previous == fingerprint:
+            logger.debug("Skipping %s: schedule unchanged since last sync", email)
+            stats.skipped_users += 1
+            return PersonalSyncResult(user=email, skipped=True)
+
+        for attempt in range(2):
+            await limiter.acquire()
+            throttled = True
+            try:
+                logger.info("Syncing %s (%d entries)...", email, len(entries))
+                result = await sync.sync_user(
+                    email, entries, start_date, end_date, dry_run, force, previous=previous
+                )
+                throttled = result.throttled
+            finally:
+                limiter.release(throttled)
+            logger.info("  %s", result)
+            if not result.throttled:
+                if state is not None and not dry_run and not result.errors:
+                    state.record(email, start_date, end_date, fingerprint)
+                return result
+            stats.throttled_users += 1
+            limiter.record_throttle(THROTTLE_PAUSE_SEC)
+            if attempt == 0:
+                logger.warning("Throttled syncing %s; will retry", email)
+                stats.retried_users += 1
+        return result
+
+    results = list(
+        await asyncio.gather(*(sync_one(e, entries) for e, entries in entries_by_email.items()))
+    )
+
+    stats.elapsed_sec = time.monotonic() - started
+    stats.throttle_events = limiter.throttle_events
+    stats.peak_concurrency = limiter.peak
+    stats.final_concurrency = limiter.current
+    return results, stats
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -138,6 +280,17 @@ def main() -> int:
         metavar="PATH",
         help="Load schedule from JSON file (from duty-calendar-sync --save-schedule)",
     )
+    parser.add_argument(
+        "--load-diff",
+        type=str,
+        metavar="PATH",
+        help="Load changed-day report from JSON file (from duty-calendar-sync --save-diff)",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only sync users scheduled on days that changed since the last scrape",
+    )
     parser.add_argument(
         "--user",
         type=str,
@@ -159,6 +312,18 @@ def main() -> int:
         action="store_true",
         help="Force update all events even if body hasn't changed",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Compare every user's events, ignoring last-sync fingerprints",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENT_USERS,
+        metavar="N",
+        help=f"Most users to sync at once (default: {MAX_CONCURRENT_USERS})",
+    )
     parser.add_argument(
         "--inspect",
         action="store_true",
@@ -208,6 +373,9 @@ def main() -> int:
     if args.month and args.months:
         parser.error("Cannot use both --month and --months")
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
     # Calculate date range
     if args.month:
         try:
@@ -289,6 +457,14 @@ def main() -> int:
     logger.info("Found %d members with emails", len(members))
 
     # Step 2: Get schedule data (from cache or Aladtec)
+    diff: ScheduleDiff | None = None
+    scraper: AladtecScheduleScraper | None = None
+    if args.load_diff:
+        try:
+            diff = load_schedule_diff(args.load_diff)
+        except Exception as e:
+            logger.warning("Failed to load schedule diff %s: %s", args.load_diff, e)
+
     if args.load_schedule:
         logger.info("Loading schedule from %s...", args.load_schedule)
         try:
@@ -308,6 +484,7 @@ def main() -> int:
                 logger.error("Failed to login to Aladtec")
                 return 1
             schedules = scraper.get_schedule_range(start_date, end_date)
+            diff = diff or scraper.last_diff
 
     logger.info("Got %d days with schedule data", len(schedules))
 
@@ -340,6 +517,15 @@ def main() -> int:
             for name in sorted(unmatched_names):
                 logger.debug("  Unmatched: %s", name)
 
+    # Users synced before who no longer have entries still need their old
+    # events removed
+    cache_dir = get_aladtec_cache_dir()
+    state = PersonalSyncState(cache_dir / SYNC_STATE_FILE) if cache_dir else None
+    if state is not None:
+        known = {email.lower() for email in entries_by_email}
+        for email in sorted(state.users_with_entries(start_date, end_date) - known):
+            entries_by_email[email] = []
+
     # Step 4: Filter to requested user(s)
     if args.user:
         user_email = args.user.lower()
@@ -349,50 +535,45 @@ def main() -> int:
         else:
             entries_by_email = {user_email: entries_by_email[user_email]}
 
-    logger.info("Syncing calendars for %d users", len(entries_by_email))
-
-    # Step 5: Sync each user
-    sync = PersonalCalendarSync()
-
-    async def sync_all() -> list:
-        results: list = []
-        throttled_emails: list[str] = []
-        for email, entries in entries_by_email.items():
-            logger.info("Syncing %s (%d entries)...", email, len(entries))
-            result = await sync.sync_user(
-                email, entries, start_date, end_date, args.dry_run, args.force
-            )
-            results.append(result)
-            logger.info("  %s", result)
-            if result.throttled:
-                throttled_emails.append(email)
-            await asyncio.sleep(INTER_USER_PAUSE_SEC)
-
-        if throttled_emails:
-            logger.warning(
-                "Retrying %d throttled user(s) after %.0fs cooldown: %s",
-                len(throttled_emails),
-                THROTTLE_RETRY_COOLDOWN_SEC,
-                ", ".join(throttled_emails),
+    if args.changed_only and not args.force:
+        if diff is None:
+            logger.warning("No schedule diff available; syncing all users")
+        elif not diff.has_changes:
+            logger.info("No schedule changes since last scrape; nothing to sync")
+            if scraper is not None and not args.dry_run:
+                scraper.commit_cache()
+            return 0
+        else:
+            affected = {match_schedule_name_to_email(name, members) for name in diff.names}
+            entries_by_email = {e: v for e, v in entries_by_email.items() if e in affected}
+            logger.info(
+                "Schedule changed on %d day(s); limiting sync to affected users",
+                len(diff.changed_dates),
             )
-            await asyncio.sleep(THROTTLE_RETRY_COOLDOWN_SEC)
-            for email in throttled_emails:
-                entries = entries_by_email[email]
-                logger.info("Retry: Syncing %s (%d entries)...", email, len(entries))
-                retry_result = await sync.sync_user(
-                    email, entries, start_date, end_date, args.dry_run, args.force
-                )
-                logger.info("  %s", retry_result)
-                # Replace the original (failed) result with the retry outcome.
-                for i, r in enumerate(results):
-                    if r.user == email:
-                        results[i] = retry_result
-                        break
-                await asyncio.sleep(INTER_USER_PAUSE_SEC)
 
-        return results
+    logger.info("Syncing calendars for %d users", len(entries_by_email))
 
-    results = asyncio.run(sync_all())
+    # Step 5: Sync users concurrently
+    sync = PersonalCalendarSync()
+    limiter = AdaptiveLimiter(
+        initial=min(INITIAL_CONCURRENT_USERS, args.concurrency), maximum=args.concurrency
+    )
+    results, stats = asyncio.run(
+        sync_users(
+            sync,
+            entries_by_email,
+            start_date,
+            end_date,
+            args.dry_run,
+            args.force,
+            limiter,
+            state=state,
+            full=args.full,
+        )
+    )
+    logger.info("Run stats: %s", stats)
+    if state is not None and not args.dry_run:
+        state.save()
 
     # Summary
     total_created = sum(r.events_created for r in results)
@@ -410,6 +591,10 @@ def main() -> int:
         logger.error("%d errors occurred", total_errors)
         return 1
 
+    # Only a real, successful sync consumes the schedule changes
+    if scraper is not None and not args.dry_run:
+        scraper.commit_cache()
+
     return 0
 
 
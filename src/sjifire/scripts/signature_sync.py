@@ -27,7 +27,7 @@ from sjifire.core.extension_attrs import (
     SIG_TITLE_TEXT_PS,
     SIG_TITLE_TEXT_TOKEN,
 )
-from sjifire.entra.users import EntraUser, EntraUserManager
+from sjifire.entra.users import EntraUser, EntraUserManager, get_entra_cache_dir
 from sjifire.exchange.client import ExchangeOnlineClient, _escape_ps_string
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -344,9 +344,18 @@ async def run_sync(
     preview: bool = False,
     remove: bool = False,
     template_name: str = "default",
+    refresh_full: bool = False,
 ) -> int:
     """Run signature sync.
 
+    Args:
+        dry_run: If True, don't make changes
+        email: Only sync this user
+        preview: Show the signature for ``email`` instead of syncing
+        remove: Remove custom attributes and the mail flow rule
+        template_name: Signature template from config/signatures/
+        refresh_full: If True, rebuild the Entra user cache instead of using delta
+
     Returns:
         Exit code
     """
@@ -376,7 +385,7 @@ async def run_sync(
     logger.info("")
     logger.info("Fetching users from Entra ID...")
 
-    user_manager = EntraUserManager()
+    user_manager = EntraUserManager(cache_dir=get_entra_cache_dir(), refresh_full=refresh_full)
 
     try:
         all_users = await user_manager.get_employees(include_disabled=False)
@@ -491,6 +500,11 @@ def main() -> None:
         metavar="NAME",
         help="Signature template name from config/signatures/ (default: default)",
     )
+    parser.add_argument(
+        "--refresh-full",
+        action="store_true",
+        help="Rebuild the Entra user cache ($ENTRA_CACHE_DIR) with a full sync",
+    )
 
     args = parser.parse_args()
 
@@ -501,6 +515,7 @@ def main() -> None:
             preview=args.preview,
             remove=args.remove,
             template_name=args.template,
+            refresh_full=args.refresh_full,
         )
     )
     sys.exit(exit_code)
@@ -1,5 +1,6 @@
 """Tests for operations dashboard."""
 
+import asyncio
 import os
 import time
 from datetime import UTC, datetime, timedelta
@@ -15,6 +16,7 @@ from sjifire.ops.dashboard import (
     _enrich_doc_for_kiosk,
     _fetch_incidents,
     _fetch_kiosk_data,
+    _fetch_open_calls_enriched,
     _fetch_open_docs_cached,
     _fetch_recent_calls,
     _normalize_incident_number,
@@ -24,6 +26,7 @@ from sjifire.ops.dashboard import (
     get_open_calls_cached,
 )
 from sjifire.ops.dispatch.models import DispatchCallDocument
+from sjifire.ops.dispatch.sites import SiteHistoryStore
 from sjifire.ops.dispatch.store import DispatchStore
 from sjifire.ops.incidents.models import (
     IncidentDocument,
@@ -57,6 +60,7 @@ def _env():
     sjifire.ops.auth._EDITOR_GROUP_ID = None
     # Clean up in-memory stores between tests
     DispatchStore._memory.clear()
+    SiteHistoryStore._memory.clear()
     IncidentStore._memory.clear()
 
 
@@ -1799,6 +1803,98 @@ class TestEnrichDocForKiosk:
         assert result["severity"] == "high"
 
 
+def _open_doc(call_id: str, address: str, **kw) -> DispatchCallDocument:
+    return DispatchCallDocument(
+        id=call_id,
+        year="2026",
+        long_term_call_id=f"26-{call_id}",
+        nature=kw.pop("nature", "Medical Aid"),
+        address=address,
+        agency_code="SJF",
+        **kw,
+    )
+
+
+class TestFetchOpenCallsEnriched:
+    """Site history for open calls comes from the per-address index."""
+
+    @patch("sjifire.ops.dashboard._fetch_open_docs_cached", new_callable=AsyncMock)
+    async def test_site_history_from_index(self, mock_open):
+        async with DispatchStore() as store:
+            await store.upsert(
+                _open_doc(
+                    "000100",
+                    "200 Spring Street",
+                    nature="Fire Alarm",
+                    time_reported=datetime(2026, 1, 5, 9, 0, tzinfo=UTC),
+                )
+            )
+            await store.upsert(_open_doc("000200", "100 First St"))
+        mock_open.return_value = [
+            _open_doc("000300", "200 SPRING ST APT 2"),
+            _open_doc("000400", ""),
+        ]
+
+        calls = await _fetch_open_calls_enriched()
+
+        assert calls[0]["site_history"] == [
+            {
+                "dispatch_id": "26-000100",
+                "nature": "Fire Alarm",
+                "date": "2026-01-05T09:00:00+00:00",
+            }
+        ]
+        assert calls[1]["site_history"] == []
+
+    @patch("sjifire.ops.dashboard._fetch_open_docs_cached", new_callable=AsyncMock)
+    async def test_excludes_the_open_call(self, mock_open):
+        doc = _open_doc("000100", "200 Spring St")
+        async with DispatchStore() as store:
+            await store.upsert(doc)
+        mock_open.return_value = [doc]
+
+        calls = await _fetch_open_calls_enriched()
+
+        assert calls[0]["site_history"] == []
+
+    @patch("sjifire.ops.dashboard._fetch_open_docs_cached", new_callable=AsyncMock)
+    async def test_lookups_run_concurrently(self, mock_open):
+        docs = [_open_doc(f"00010{i}", f"{i} Main St") for i in range(3)]
+        mock_open.return_value = docs
+        started = 0
+        all_started = asyncio.Event()
+
+        async def site_history(self, address, **kwargs):
+            nonlocal started
+            started += 1
+            if started == len(docs):
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), 1)
+            return []
+
+        with patch.object(DispatchStore, "site_history", site_history):
+            calls = await _fetch_open_calls_enriched()
+
+        assert [c["dispatch_id"] for c in calls] == [d.long_term_call_id for d in docs]
+
+    @patch("sjifire.ops.dashboard._fetch_open_docs_cached", new_callable=AsyncMock)
+    async def test_lookup_failure_isolated(self, mock_open):
+        mock_open.return_value = [
+            _open_doc("000100", "1 Main St"),
+            _open_doc("000200", "2 Main St"),
+        ]
+
+        async def site_history(self, address, **kwargs):
+            if address == "1 Main St":
+                raise RuntimeError("cosmos down")
+            return []
+
+        with patch.object(DispatchStore, "site_history", site_history):
+            calls = await _fetch_open_calls_enriched()
+
+        assert [c["site_history"] for c in calls] == [[], []]
+
+
 # ---------------------------------------------------------------------------
 # Unit tests: departure detection + recently-cleared calls
 # ---------------------------------------------------------------------------
@@ -1,13 +1,22 @@
 """Tests for dispatch call LLM analysis."""
 
 import json
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from sjifire.ops.dispatch.analysis import (
+    _SYSTEM_PROMPT,
     _build_prompt,
+    _call_anthropic,
+    _call_azure_openai,
     _clean_json,
     analyze_dispatch,
 )
+from sjifire.ops.dispatch.analysis_cache import (
+    AnalysisCacheStore,
+    analysis_cache_key,
+    cache_stats,
+)
 from sjifire.ops.dispatch.models import DispatchAnalysis
 from tests.factories import DispatchCallDocumentFactory
 
@@ -239,6 +248,78 @@ class TestCallLlm:
         mock_anthropic.assert_not_awaited()
 
 
+class TestPromptCaching:
+    def setup_method(self):
+        cache_stats.reset()
+
+    def teardown_method(self):
+        cache_stats.reset()
+
+    async def test_anthropic_marks_system_cacheable_and_records_usage(self):
+        usage = SimpleNamespace(
+            input_tokens=300, cache_read_input_tokens=2000, cache_creation_input_tokens=0
+        )
+        response = SimpleNamespace(content=[SimpleNamespace(text=" {} ")], usage=usage)
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=response)
+
+        with patch("sjifire.core.anthropic.get_client", return_value=client):
+            text = await _call_anthropic("static instructions", "per-call data")
+
+        assert text == "{}"
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "static instructions",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert kwargs["messages"] == [{"role": "user", "content": "per-call data"}]
+        assert cache_stats.prompt_cache_read_tokens == 2000
+        assert cache_stats.prompt_cache_write_tokens == 0
+        assert cache_stats.prompt_uncached_tokens == 300
+
+    async def test_azure_sends_system_first_and_records_cached_tokens(self, monkeypatch):
+        usage = SimpleNamespace(
+            prompt_tokens=2300, prompt_tokens_details=SimpleNamespace(cached_tokens=2048)
+        )
+        message = SimpleNamespace(content="{}")
+        response = SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=response)
+
+        with patch("sjifire.ops.dispatch.analysis._get_azure_client", return_value=client):
+            await _call_azure_openai("static instructions", "per-call data")
+
+        messages = client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[0] == {"role": "system", "content": "static instructions"}
+        assert cache_stats.prompt_cache_read_tokens == 2048
+        assert cache_stats.prompt_uncached_tokens == 252
+
+    async def test_missing_usage_details_count_as_zero(self):
+        from sjifire.ops.dispatch.analysis import _record_azure_usage
+
+        _record_azure_usage(SimpleNamespace(prompt_tokens=100, prompt_tokens_details=None))
+
+        assert cache_stats.prompt_cache_read_tokens == 0
+        assert cache_stats.prompt_uncached_tokens == 100
+
+    def test_prompt_holds_no_static_instructions(self):
+        doc = DispatchCallDocumentFactory.build(responder_details=[], cad_comments="Test")
+
+        assert _SYSTEM_PROMPT
+        assert _SYSTEM_PROMPT[:200] not in _build_prompt(doc)
+
+    def test_reset_clears_token_totals(self):
+        cache_stats.prompt_cache_read_tokens = 5
+        cache_stats.hits = 1
+        cache_stats.reset()
+
+        assert set(cache_stats.as_dict().values()) == {0}
+        assert "prompt_cache_read_tokens" in cache_stats.as_dict()
+
+
 # ---------------------------------------------------------------------------
 # analyze_dispatch — integration
 # ---------------------------------------------------------------------------
@@ -384,3 +465,88 @@ class TestAnalyzeDispatch:
         assert result.incident_commander == ""
         assert result.actions_taken == []
         assert result.patient_count == 0
+
+
+# ---------------------------------------------------------------------------
+# Analysis cache
+# ---------------------------------------------------------------------------
+
+
+class TestAnalysisCache:
+    def setup_method(self):
+        AnalysisCacheStore._memory.clear()
+        cache_stats.reset()
+
+    def teardown_method(self):
+        AnalysisCacheStore._memory.clear()
+        cache_stats.reset()
+
+    def _doc(self):
+        return DispatchCallDocumentFactory.build(
+            responder_details=[{"unit_number": "E31", "status": "On Scene"}],
+            cad_comments="Smoke showing",
+        )
+
+    async def test_no_provider_skips_cache(self, monkeypatch):
+        monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        mock_llm = AsyncMock(return_value=_VALID_ANALYSIS_JSON)
+
+        with patch("sjifire.ops.dispatch.analysis._call_llm", mock_llm):
+            await analyze_dispatch(self._doc())
+
+        assert AnalysisCacheStore._memory == {}
+        assert cache_stats.hits == 0
+        assert cache_stats.misses == 0
+
+    async def test_unchanged_prompt_reuses_response(self, monkeypatch):
+        monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-fake-key")
+        doc = self._doc()
+        mock_llm = AsyncMock(return_value=f"```json\n{_VALID_ANALYSIS_JSON}\n```")
+
+        with patch("sjifire.ops.dispatch.analysis._call_llm", mock_llm):
+            first = await analyze_dispatch(doc, crew_context="On duty: Capt Smith")
+            second = await analyze_dispatch(doc, crew_context="On duty: Capt Smith")
+
+        mock_llm.assert_awaited_once()
+        assert first == second
+        assert second.incident_commander == "BN31"
+        assert cache_stats.hits == 1
+        assert cache_stats.misses == 1
+
+    async def test_changed_crew_context_misses(self, monkeypatch):
+        monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-fake-key")
+        doc = self._doc()
+        mock_llm = AsyncMock(return_value=_VALID_ANALYSIS_JSON)
+
+        with patch("sjifire.ops.dispatch.analysis._call_llm", mock_llm):
+            await analyze_dispatch(doc, crew_context="On duty: Capt Smith")
+            await analyze_dispatch(doc, crew_context="On duty: Capt Jones")
+
+        assert mock_llm.await_count == 2
+        assert cache_stats.misses == 2
+        assert len(AnalysisCacheStore._memory) == 2
+
+    async def test_invalid_response_not_cached(self, monkeypatch):
+        monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-fake-key")
+        doc = self._doc()
+        mock_llm = AsyncMock(side_effect=["This is not JSON at all.", _VALID_ANALYSIS_JSON])
+
+        with patch("sjifire.ops.dispatch.analysis._call_llm", mock_llm):
+            bad = await analyze_dispatch(doc)
+            good = await analyze_dispatch(doc)
+
+        assert bad == DispatchAnalysis()
+        assert good.incident_commander == "BN31"
+        assert mock_llm.await_count == 2
+
+    def test_key_covers_model_and_instructions(self):
+        base = analysis_cache_key("anthropic:m1", "system", "prompt")
+
+        assert base == analysis_cache_key("anthropic:m1", "system", "prompt")
+        assert base != analysis_cache_key("anthropic:m2", "system", "prompt")
+        assert base != analysis_cache_key("anthropic:m1", "system v2", "prompt")
+        assert base != analysis_cache_key("anthropic:m1", "system", "prompt 2")
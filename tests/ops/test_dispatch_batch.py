@@ -0,0 +1,304 @@
+"""Tests for Message Batches dispatch analysis against a stub batch endpoint."""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import respx
+
+from sjifire.ops.dispatch import batch as batch_mod
+from sjifire.ops.dispatch.analysis_cache import AnalysisCacheStore, cache_stats
+from sjifire.ops.dispatch.batch import prefill_analysis_cache
+from sjifire.ops.dispatch.models import DispatchAnalysis, DispatchCallDocument
+from sjifire.ops.dispatch.sites import SiteHistoryStore
+from sjifire.ops.dispatch.store import DispatchStore
+from sjifire.ops.schedule.models import ScheduleEntryCache
+from tests.factories import DispatchCallDocumentFactory
+
+_STUB = "http://anthropic-stub.test"
+_API = f"{_STUB}/v1/messages/batches"
+
+_CREW = [
+    ScheduleEntryCache(
+        name="Capt Smith", position="Captain", section="S31", start_time="08:00", end_time="08:00"
+    ),
+    ScheduleEntryCache(
+        name="FF Garcia",
+        position="Firefighter",
+        section="S31",
+        start_time="08:00",
+        end_time="08:00",
+    ),
+]
+
+
+def _analysis_json(summary: str) -> str:
+    return json.dumps({"incident_commander": "E31", "summary": summary, "outcome": "Transported"})
+
+
+class StubBatchAPI:
+    """Local stand-in for the Anthropic Message Batches endpoints.
+
+    Records submitted requests, reports ``in_progress`` for ``polls``
+    status checks, then ends and serves JSONL results produced by
+    ``respond(custom_id, params)``.
+    """
+
+    def __init__(self, respond, *, polls: int = 1) -> None:
+        """Answer each request with ``respond`` after ``polls`` status checks."""
+        self.respond = respond
+        self.polls = polls
+        self.requests: list[dict] = []
+        self.batches_created = 0
+
+    def install(self, router: respx.MockRouter) -> None:
+        router.post(_API).mock(side_effect=self._create)
+        router.get(f"{_API}/msgbatch_stub").mock(side_effect=self._retrieve)
+        router.get(f"{_API}/msgbatch_stub/results").mock(side_effect=self._results)
+
+    def _batch(self, status: str) -> dict:
+        done = status == "ended"
+        return {
+            "id": "msgbatch_stub",
+            "type": "message_batch",
+            "processing_status": status,
+            "request_counts": {
+                "processing": 0 if done else len(self.requests),
+                "succeeded": len(self.requests) if done else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2026-03-01T00:00:00Z",
+            "expires_at": "2026-03-02T00:00:00Z",
+            "ended_at": "2026-03-01T00:05:00Z" if done else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{_API}/msgbatch_stub/results" if done else None,
+        }
+
+    def _create(self, request: httpx.Request) -> httpx.Response:
+        self.batches_created += 1
+        self.requests = json.loads(request.content)["requests"]
+        return httpx.Response(200, json=self._batch("in_progress"))
+
+    def _retrieve(self, request: httpx.Request) -> httpx.Response:
+        if self.polls > 0:
+            self.polls -= 1
+            return httpx.Response(200, json=self._batch("in_progress"))
+        return httpx.Response(200, json=self._batch("ended"))
+
+    def _results(self, request: httpx.Request) -> httpx.Response:
+        lines = []
+        for req in self.requests:
+            text = self.respond(req["custom_id"], req["params"])
+            if text is None:
+                result = {
+                    "type": "errored",
+                    "error": {"type": "error", "error": {"type": "api_error", "message": "boom"}},
+                }
+            else:
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": f"msg_{req['custom_id'][:8]}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": req["params"]["model"],
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 100, "output_tokens": 50},
+                    },
+                }
+            lines.append(json.dumps({"custom_id": req["custom_id"], "result": result}))
+        return httpx.Response(200, content="\n".join(lines).encode())
+
+
+def _doc(n: int, **overrides) -> DispatchCallDocument:
+    defaults = {
+        "id": f"uuid-batch-{n}",
+        "long_term_call_id": f"26-00010{n}",
+        "nature": "Medical Aid",
+        "address": f"{n}00 Spring St",
+        "time_reported": datetime(2026, 3, 1, 10, n),
+        "cad_comments": f"Patient {n} fall",
+        "responder_details": [
+            {
+                "unit_number": "E31",
+                "agency_code": "SJF3",
+                "status": "ENRT",
+                "time_of_status_change": f"2026-03-01T10:0{n}:30",
+                "radio_log": "",
+            },
+            {
+                "unit_number": "E31",
+                "agency_code": "SJF3",
+                "status": "ARRVD",
+                "time_of_status_change": f"2026-03-01T10:1{n}:00",
+                "radio_log": "On scene",
+            },
+        ],
+    }
+    defaults.update(overrides)
+    return DispatchCallDocumentFactory.build(analysis=DispatchAnalysis(), **defaults)
+
+
+@pytest.fixture(autouse=True)
+def _anthropic(monkeypatch):
+    """Anthropic provider on the stub host, in-memory stores, no polling delay, fixed crew."""
+    monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-fake-key")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", _STUB)
+    monkeypatch.setattr("sjifire.core.anthropic._client", None)
+    monkeypatch.setattr(batch_mod, "BATCH_POLL_INTERVAL", 0)
+    crew = AsyncMock(return_value=_CREW)
+    with (
+        patch("sjifire.ops.dispatch.batch._get_on_duty_entries", crew),
+        patch("sjifire.ops.dispatch.enrich._get_on_duty_entries", crew),
+    ):
+        yield
+    AnalysisCacheStore._memory.clear()
+    DispatchStore._memory.clear()
+    SiteHistoryStore._memory.clear()
+    cache_stats.reset()
+
+
+class TestPrefillAnalysisCache:
+    async def test_submits_prompts_and_caches_responses(self):
+        stub = StubBatchAPI(lambda _id, _params: _analysis_json("Fall, transported"), polls=2)
+
+        with respx.mock(base_url=_STUB) as router:
+            stub.install(router)
+            cached = await prefill_analysis_cache([_doc(1), _doc(2)])
+
+        assert cached == 2
+        assert len(stub.requests) == 2
+        params = stub.requests[0]["params"]
+        assert params["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert "Capt Smith" in params["messages"][0]["content"]
+        assert set(AnalysisCacheStore._memory) == {r["custom_id"] for r in stub.requests}
+        assert cache_stats.prompt_uncached_tokens == 200
+
+    async def test_skips_cached_and_duplicate_prompts(self):
+        stub = StubBatchAPI(lambda _id, _params: _analysis_json("Fall"))
+
+        with respx.mock(base_url=_STUB) as router:
+            stub.install(router)
+            await prefill_analysis_cache([_doc(1), _doc(1)])
+            cached = await prefill_analysis_cache([_doc(1)])
+
+        assert cached == 0
+        assert stub.batches_created == 1
+        assert len(stub.requests) == 1
+
+    async def test_errored_and_invalid_results_not_cached(self):
+        answers = iter([None, "not json"])
+        stub = StubBatchAPI(lambda _id, _params: next(answers))
+
+        with respx.mock(base_url=_STUB) as router:
+            stub.install(router)
+            cached = await prefill_analysis_cache([_doc(1), _doc(2)])
+
+        assert cached == 0
+        assert AnalysisCacheStore._memory == {}
+
+    async def test_requires_anthropic_provider(self, monkeypatch):
+        monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://fake.openai.azure.com")
+
+        with respx.mock(base_url=_STUB, assert_all_called=False) as router:
+            route = router.post(_API)
+            cached = await prefill_analysis_cache([_doc(1)])
+
+        assert cached == 0
+        assert not route.called
+
+    async def test_empty_docs_not_submitted(self):
+        empty = _doc(1, responder_details=[], cad_comments="")
+
+        with respx.mock(base_url=_STUB, assert_all_called=False) as router:
+            route = router.post(_API)
+            cached = await prefill_analysis_cache([empty])
+
+        assert cached == 0
+        assert not route.called
+
+
+class TestEnrichStoredBatch:
+    async def test_batch_results_get_deterministic_enrichment(self):
+        """Batched responses go through the same IC resolution and unit timing."""
+        stub = StubBatchAPI(lambda _id, _params: _analysis_json("Fall, transported"))
+        async with DispatchStore() as store:
+            for n in (1, 2):
+                await store.upsert(_doc(n))
+
+        mock_llm = AsyncMock(return_value="")
+        with (
+            respx.mock(base_url=_STUB) as router,
+            patch("sjifire.ops.dispatch.analysis._call_llm", mock_llm),
+        ):
+            stub.install(router)
+            async with DispatchStore() as store:
+                results = await store.enrich_stored(force=True, batch=True)
+
+        mock_llm.assert_not_awaited()
+        assert cache_stats.hits == 2
+        assert len(results) == 2
+        for doc in results:
+            assert doc.analysis.summary == "Fall, transported"
+            assert doc.analysis.incident_commander_name == "Capt Smith"
+            assert [c.name for c in doc.analysis.on_duty_crew] == ["Capt Smith", "FF Garcia"]
+            assert [t.unit for t in doc.analysis.unit_times] == ["E31"]
+            assert doc.analysis.first_enroute.startswith("2026-03-01T10:0")
+
+    async def test_failed_batch_requests_fall_back_to_interactive(self):
+        first_id: list[str] = []
+
+        def respond(custom_id, _params):
+            if not first_id:
+                first_id.append(custom_id)
+                return None
+            return _analysis_json("Batched")
+
+        stub = StubBatchAPI(respond)
+        async with DispatchStore() as store:
+            for n in (1, 2):
+                await store.upsert(_doc(n))
+
+        mock_llm = AsyncMock(return_value=_analysis_json("Interactive"))
+        with (
+            respx.mock(base_url=_STUB) as router,
+            patch("sjifire.ops.dispatch.analysis._call_llm", mock_llm),
+        ):
+            stub.install(router)
+            async with DispatchStore() as store:
+                results = await store.enrich_stored(force=True, batch=True)
+
+        mock_llm.assert_awaited_once()
+        assert sorted(d.analysis.summary for d in results) == ["Batched", "Interactive"]
+
+    async def test_batch_api_error_falls_back_to_interactive(self):
+        async with DispatchStore() as store:
+            await store.upsert(_doc(1))
+
+        mock_llm = AsyncMock(return_value=_analysis_json("Interactive"))
+        with (
+            respx.mock(base_url=_STUB) as router,
+            patch("sjifire.ops.dispatch.analysis._call_llm", mock_llm),
+        ):
+            router.post(_API).mock(
+                return_value=httpx.Response(
+                    400,
+                    json={
+                        "type": "error",
+                        "error": {"type": "invalid_request_error", "message": "bad"},
+                    },
+                )
+            )
+            async with DispatchStore() as store:
+                results = await store.enrich_stored(force=True, batch=True)
+
+        mock_llm.assert_awaited_once()
+        assert results[0].analysis.summary == "Interactive"
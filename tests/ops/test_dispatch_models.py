@@ -6,6 +6,7 @@ from sjifire.ispyfire.models import DispatchCall, UnitResponse
 from sjifire.ops.dispatch.models import (
     DispatchCallDocument,
     _extract_year,
+    normalize_address,
     year_from_dispatch_id,
 )
 
@@ -160,6 +161,7 @@ class TestToDict:
         # Should not have Cosmos-only fields
         assert "year" not in d
         assert "stored_at" not in d
+        assert "address_key" not in d
 
         # Should have all original DispatchCall fields
         assert d["id"] == "call-uuid-123"
@@ -180,3 +182,33 @@ class TestToDict:
         assert d["zone_code"] == "Z1"
         assert d["cad_comments"] == "Patient fall"
         assert d["responding_units"] == "E31,M31"
+
+
+class TestNormalizeAddress:
+    def test_folds_case_and_suffix(self):
+        assert normalize_address("200 Spring Street") == "200 SPRING ST"
+        assert normalize_address("200 spring st.") == "200 SPRING ST"
+
+    def test_folds_directionals(self):
+        assert normalize_address("100 North Beach Road") == normalize_address("100 N Beach Rd")
+
+    def test_drops_unit_numbers(self):
+        for spelling in ("200 Spring St Apt 4", "200 Spring St, Unit B", "200 Spring St #12"):
+            assert normalize_address(spelling) == "200 SPRING ST"
+
+    def test_blank(self):
+        assert normalize_address("") == ""
+        assert normalize_address("  ") == ""
+
+    def test_document_carries_key(self):
+        doc = DispatchCallDocument.from_dispatch_call(
+            _make_dispatch_call(address="200 Spring Street Suite 3")
+        )
+        assert doc.address_key == "200 SPRING ST"
+        assert doc.to_cosmos()["address_key"] == "200 SPRING ST"
+
+    def test_key_derived_for_stored_documents(self):
+        """Documents stored before the key existed get it on load."""
+        data = DispatchCallDocument.from_dispatch_call(_make_dispatch_call()).to_cosmos()
+        del data["address_key"]
+        assert DispatchCallDocument.from_cosmos(data).address_key == "200 SPRING ST"
@@ -5,9 +5,21 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosResourceExistsError,
+    CosmosResourceNotFoundError,
+)
 
 from sjifire.ispyfire.models import DispatchCall, UnitResponse
 from sjifire.ops.dispatch.models import DispatchAnalysis, DispatchCallDocument
+from sjifire.ops.dispatch.sites import (
+    SITE_HISTORY_MAX,
+    SITE_RECORD_ATTEMPTS,
+    SiteHistory,
+    SiteHistoryStore,
+)
 from sjifire.ops.dispatch.store import DispatchStore
 
 
@@ -21,6 +33,7 @@ def _no_cosmos():
         yield
     # Clean up shared in-memory state between tests
     DispatchStore._memory.clear()
+    SiteHistoryStore._memory.clear()
 
 
 def _make_call(**overrides) -> DispatchCall:
@@ -245,6 +258,165 @@ class TestListByAddress:
         assert len(results) == 3
 
 
+class TestSiteHistory:
+    async def test_upsert_records_site(self):
+        async with DispatchStore() as store:
+            await store.upsert(_make_doc(id="uuid-1", address="200 Spring St"))
+            results = await store.site_history("200 Spring St")
+
+        assert [r.id for r in results] == ["uuid-1"]
+        assert results[0].dispatch_id == "26-001678"
+        assert results[0].nature == "Medical Aid"
+        assert results[0].date.startswith("2026-02-12")
+
+    async def test_matches_near_duplicate_spellings(self):
+        async with DispatchStore() as store:
+            await store.upsert(_make_doc(id="uuid-1", address="200 Spring Street"))
+            await store.upsert(_make_doc(id="uuid-2", address="200 SPRING ST APT 4"))
+            await store.upsert(_make_doc(id="uuid-3", address="100 First St"))
+            results = await store.site_history("200 spring st.", exclude_id="uuid-2")
+
+        assert [r.id for r in results] == ["uuid-1"]
+
+    async def test_sorted_desc_and_reupsert_replaces(self):
+        async with DispatchStore() as store:
+            await store.upsert(_make_doc(id="uuid-1", time_reported=datetime(2026, 1, 10, 10, 0)))
+            await store.upsert(_make_doc(id="uuid-2", time_reported=datetime(2026, 2, 12, 14, 30)))
+            await store.upsert(
+                _make_doc(id="uuid-1", nature="Fire", time_reported=datetime(2026, 1, 10, 10, 0))
+            )
+            results = await store.site_history("200 Spring St")
+
+        assert [r.id for r in results] == ["uuid-2", "uuid-1"]
+        assert results[1].nature == "Fire"
+
+    async def test_capped(self):
+        async with DispatchStore() as store:
+            for i in range(SITE_HISTORY_MAX + 5):
+                await store.upsert(
+                    _make_doc(id=f"uuid-{i}", time_reported=datetime(2026, 1, 1 + i, 10, 0))
+                )
+            results = await store.site_history("200 Spring St", max_items=100)
+
+        assert len(results) == SITE_HISTORY_MAX
+        assert results[0].id == f"uuid-{SITE_HISTORY_MAX + 4}"
+
+    async def test_unknown_address(self):
+        async with DispatchStore() as store:
+            assert await store.site_history("999 Nowhere St") == []
+
+    async def test_site_failure_does_not_fail_upsert(self):
+        doc = _make_doc()
+        with patch.object(SiteHistoryStore, "record", side_effect=RuntimeError("boom")):
+            async with DispatchStore() as store:
+                await store.upsert(doc)
+                assert await store.get(doc.id, doc.year) is not None
+
+    async def test_rebuild_backfills_existing_calls(self):
+        DispatchStore._memory["uuid-1"] = _make_doc(id="uuid-1").to_cosmos()
+        DispatchStore._memory["uuid-2"] = _make_doc(
+            id="uuid-2", address="200 Spring Street", time_reported=datetime(2026, 3, 1, 9, 0)
+        ).to_cosmos()
+
+        async with DispatchStore() as store:
+            assert await store.site_history("200 Spring St") == []
+            assert await store.rebuild_site_history() == 1
+            results = await store.site_history("200 Spring St")
+
+        assert [r.id for r in results] == ["uuid-2", "uuid-1"]
+        async with SiteHistoryStore() as sites:
+            history = await sites.get("200 SPRING ST")
+        assert history.address == "200 Spring Street"
+
+
+class _EtagContainer:
+    """Cosmos container double with etag checks on create and replace."""
+
+    def __init__(self):
+        self.docs: dict[str, dict] = {}
+        self.writes = 0
+        self.before_write = None  # hook simulating a concurrent writer
+
+    async def read_item(self, item, partition_key):
+        if item not in self.docs:
+            raise CosmosResourceNotFoundError(status_code=404, message="missing")
+        return dict(self.docs[item])
+
+    def _store(self, body):
+        self.writes += 1
+        self.docs[body["id"]] = {**body, "_etag": f"etag-{self.writes}"}
+
+    async def create_item(self, body):
+        if self.before_write:
+            await self.before_write()
+        if body["id"] in self.docs:
+            raise CosmosResourceExistsError(status_code=409, message="exists")
+        self._store(body)
+
+    async def replace_item(self, item, body, etag, match_condition):
+        assert match_condition == MatchConditions.IfNotModified
+        if self.before_write:
+            await self.before_write()
+        if self.docs[item]["_etag"] != etag:
+            raise CosmosAccessConditionFailedError(status_code=412, message="changed")
+        self._store(body)
+
+
+def _cosmos_sites(container: _EtagContainer) -> SiteHistoryStore:
+    store = SiteHistoryStore()
+    store._in_memory = False
+    store._container = container
+    return store
+
+
+class TestSiteRecordConcurrency:
+    async def test_concurrent_writer_keeps_both_calls(self):
+        container = _EtagContainer()
+        sites = _cosmos_sites(container)
+        other = _make_doc(id="uuid-other", time_reported=datetime(2026, 1, 5, 9, 0))
+
+        async def interleave():
+            # Another process records its call between our read and write, once
+            container.before_write = None
+            await _cosmos_sites(container).record(other)
+
+        await sites.record(_make_doc(id="uuid-1"))
+        container.before_write = interleave
+        await sites.record(_make_doc(id="uuid-2", time_reported=datetime(2026, 3, 1, 9, 0)))
+
+        history = SiteHistory.from_cosmos(container.docs["200 SPRING ST"])
+        assert [c.id for c in history.calls] == ["uuid-2", "uuid-1", "uuid-other"]
+
+    async def test_concurrent_create_retries_as_replace(self):
+        container = _EtagContainer()
+
+        async def interleave():
+            container.before_write = None
+            await _cosmos_sites(container).record(_make_doc(id="uuid-other"))
+
+        container.before_write = interleave
+        await _cosmos_sites(container).record(_make_doc(id="uuid-1"))
+
+        history = SiteHistory.from_cosmos(container.docs["200 SPRING ST"])
+        assert {c.id for c in history.calls} == {"uuid-1", "uuid-other"}
+
+    async def test_gives_up_after_repeated_conflicts(self):
+        container = _EtagContainer()
+        await _cosmos_sites(container).record(_make_doc(id="uuid-1"))
+
+        attempts = []
+
+        async def always_interleave():
+            attempts.append(1)
+            container.docs["200 SPRING ST"]["_etag"] = f"moved-{len(attempts)}"
+
+        container.before_write = always_interleave
+        with pytest.raises(RuntimeError, match="kept changing"):
+            await _cosmos_sites(container).record(_make_doc(id="uuid-2"))
+        assert len(attempts) == SITE_RECORD_ATTEMPTS
+        assert container.writes == 1
+
+
 class TestListRecent:
     async def test_returns_recent_calls(self):
         doc1 = _make_doc(id="uuid-1", time_reported=datetime(2026, 2, 10, 10, 0))
@@ -48,10 +48,12 @@ class TestEventArchive:
         with patch(
             "sjifire.ops.events.calendar.fetch_events",
             AsyncMock(return_value=events),
-        ):
+        ) as mock_fetch:
             count = await event_archive()
 
         assert count == 1
+        # Short-lived task: no background refresh left pending when the loop ends
+        assert mock_fetch.call_args.kwargs == {"refresh_ahead": False}
 
         async with EventStore() as store:
             rec = await store.get_by_calendar_event_id("cal-123")
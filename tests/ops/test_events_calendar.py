@@ -1,10 +1,24 @@
 """Tests for the events calendar module — utility functions and fetch orchestration."""
 
+import asyncio
+import time
 from datetime import date
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from sjifire.ops.events.calendar import (
+    _background_tasks,
     _cache_key,
+    _calendar_ids,
+    _fetch_cached,
+    _fetch_one_calendar,
+    _get_graph_client,
+    _in_range,
+    _month_buckets,
+    _refreshing,
+    _resolve_calendar_id,
     _strip_html,
     fetch_events,
 )
@@ -53,19 +67,58 @@ class TestStripHtml:
 
 class TestCacheKey:
     def test_basic_format(self):
-        start = date(2026, 1, 1)
-        end = date(2026, 3, 31)
-        assert _cache_key("Training", start, end) == "cal:Training:2026-01-01:2026-03-31"
+        assert _cache_key("Training", date(2026, 1, 1)) == "cal:Training:2026-01"
 
     def test_different_labels_produce_different_keys(self):
-        start = date(2026, 1, 1)
-        end = date(2026, 3, 31)
-        assert _cache_key("A", start, end) != _cache_key("B", start, end)
+        month = date(2026, 1, 1)
+        assert _cache_key("A", month) != _cache_key("B", month)
 
-    def test_different_dates_produce_different_keys(self):
-        assert _cache_key("X", date(2026, 1, 1), date(2026, 3, 31)) != _cache_key(
-            "X", date(2026, 4, 1), date(2026, 6, 30)
-        )
+    def test_different_months_produce_different_keys(self):
+        assert _cache_key("X", date(2026, 1, 1)) != _cache_key("X", date(2026, 2, 1))
+
+
+# ---------------------------------------------------------------------------
+# _month_buckets / _in_range
+# ---------------------------------------------------------------------------
+
+
+class TestMonthBuckets:
+    def test_single_month(self):
+        assert _month_buckets(date(2026, 3, 5), date(2026, 3, 20)) == [date(2026, 3, 1)]
+
+    def test_spans_year_boundary(self):
+        assert _month_buckets(date(2025, 11, 15), date(2026, 2, 1)) == [
+            date(2025, 11, 1),
+            date(2025, 12, 1),
+            date(2026, 1, 1),
+            date(2026, 2, 1),
+        ]
+
+    def test_different_windows_share_months(self):
+        a = _month_buckets(date(2026, 1, 10), date(2026, 4, 10))
+        b = _month_buckets(date(2026, 1, 11), date(2026, 4, 11))
+        assert a == b
+
+
+class TestInRange:
+    def test_event_inside_range(self):
+        ev = {"start": "2026-02-01T09:00:00.0000000", "end": "2026-02-01T10:00:00.0000000"}
+        assert _in_range(ev, date(2026, 2, 1), date(2026, 2, 1))
+
+    def test_event_after_range(self):
+        ev = {"start": "2026-02-02T09:00:00.0000000", "end": "2026-02-02T10:00:00.0000000"}
+        assert not _in_range(ev, date(2026, 1, 1), date(2026, 2, 1))
+
+    def test_all_day_event_ending_at_range_start_excluded(self):
+        ev = {"start": "2026-01-31T00:00:00.0000000", "end": "2026-02-01T00:00:00.0000000"}
+        assert not _in_range(ev, date(2026, 2, 1), date(2026, 2, 28))
+
+    def test_event_overlapping_range_start(self):
+        ev = {"start": "2026-01-31T22:00:00.0000000", "end": "2026-02-01T02:00:00.0000000"}
+        assert _in_range(ev, date(2026, 2, 1), date(2026, 2, 28))
+
+    def test_missing_end_uses_start(self):
+        assert _in_range({"start": "2026-02-01T09:00:00"}, date(2026, 2, 1), date(2026, 2, 1))
 
 
 # ---------------------------------------------------------------------------
@@ -110,7 +163,12 @@ class TestFetchEvents:
         assert len(result) == 1
         assert result[0]["subject"] == "Ladder Drill"
         mock_fetch.assert_awaited_once_with(
-            "cal@sjifire.org", "Training", date(2026, 1, 1), date(2026, 3, 31), ""
+            "cal@sjifire.org",
+            "Training",
+            date(2026, 1, 1),
+            date(2026, 3, 31),
+            "",
+            refresh_ahead=True,
         )
 
     async def test_multiple_sources_merged_and_sorted(self):
@@ -125,7 +183,7 @@ class TestFetchEvents:
             {"event_id": "b1", "subject": "Earlier", "start": "2026-01-10T08:00:00"},
         ]
 
-        async def fake_fetch(mailbox, label, start, end, calendar_name=""):
+        async def fake_fetch(mailbox, label, start, end, calendar_name="", *, refresh_ahead=True):
             if label == "A":
                 return events_a
             return events_b
@@ -153,7 +211,7 @@ class TestFetchEvents:
         ]
         ok_events = [{"event_id": "1", "subject": "Good Event", "start": "2026-02-01T09:00:00"}]
 
-        async def fake_fetch(mailbox, label, start, end, calendar_name=""):
+        async def fake_fetch(mailbox, label, start, end, calendar_name="", *, refresh_ahead=True):
             if label == "Bad":
                 raise RuntimeError("Graph API unavailable")
             return ok_events
@@ -220,6 +278,7 @@ class TestFetchEvents:
             date(2026, 1, 1),
             date(2026, 3, 31),
             "Training Room",
+            refresh_ahead=True,
         )
 
     async def test_events_sorted_by_start_field(self):
@@ -247,60 +306,313 @@ class TestFetchEvents:
 
 
 # ---------------------------------------------------------------------------
-# _fetch_cached — caching logic tests
+# _fetch_cached — month slice caching
 # ---------------------------------------------------------------------------
 
 
+class _FakeCache:
+    """In-memory stand-in for ``cosmos_cache``."""
+
+    def __init__(self, entries: dict | None = None):
+        self.entries = dict(entries or {})
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.entries[key] = value
+        self.ttls[key] = ttl
+
+
+def _slice(events, age: float = 0.0) -> dict:
+    return {"fetched_at": time.time() - age, "events": events}
+
+
+def _event(event_id: str, start: str, end: str = "") -> dict:
+    return {"event_id": event_id, "subject": event_id, "start": start, "end": end or start}
+
+
+@pytest.fixture
+def _reset_calendar_state():
+    _calendar_ids.clear()
+    _refreshing.clear()
+    yield
+    _calendar_ids.clear()
+    _refreshing.clear()
+
+
+@pytest.mark.usefixtures("_reset_calendar_state")
 class TestFetchCached:
     async def test_cache_hit_returns_cached_data(self):
-        from sjifire.ops.events.calendar import _fetch_cached
+        cache = _FakeCache(
+            {
+                "cal:Training:2026-01": _slice([_event("jan", "2026-01-05T09:00:00")]),
+                "cal:Training:2026-02": _slice([_event("feb", "2026-02-05T09:00:00")]),
+                "cal:Training:2026-03": _slice([_event("mar", "2026-03-05T09:00:00")]),
+            }
+        )
 
-        cached_events = [
-            {"event_id": "cached", "subject": "From Cache", "start": "2026-01-01T09:00:00"}
-        ]
+        with (
+            patch("sjifire.ops.cache.cosmos_cache", cache),
+            patch("sjifire.ops.events.calendar._fetch_one_calendar", AsyncMock()) as mock_fetch,
+        ):
+            result = await _fetch_cached(
+                "cal@sjifire.org", "Training", date(2026, 1, 1), date(2026, 3, 31)
+            )
+
+        assert [e["event_id"] for e in result] == ["jan", "feb", "mar"]
+        mock_fetch.assert_not_awaited()
 
-        mock_cache = AsyncMock()
-        mock_cache.get = AsyncMock(return_value=cached_events)
-        mock_cache.set = AsyncMock()
+    async def test_cache_miss_fetches_each_month_and_caches(self):
+        cache = _FakeCache()
+
+        async def fake_fetch(mailbox, label, start, end, calendar_name=""):
+            return [_event(f"ev-{start:%m}", f"{start}T09:00:00")]
 
         with (
-            patch("sjifire.ops.cache.cosmos_cache", mock_cache),
+            patch("sjifire.ops.cache.cosmos_cache", cache),
             patch(
                 "sjifire.ops.events.calendar._fetch_one_calendar",
-                AsyncMock(),
-            ) as mock_fetch_one,
+                AsyncMock(side_effect=fake_fetch),
+            ) as mock_fetch,
         ):
             result = await _fetch_cached(
                 "cal@sjifire.org", "Training", date(2026, 1, 1), date(2026, 3, 31)
             )
 
-        assert result == cached_events
-        mock_fetch_one.assert_not_awaited()
+        assert [e["event_id"] for e in result] == ["ev-01", "ev-02", "ev-03"]
+        windows = sorted((c.args[2], c.args[3]) for c in mock_fetch.call_args_list)
+        assert windows == [
+            (date(2026, 1, 1), date(2026, 1, 31)),
+            (date(2026, 2, 1), date(2026, 2, 28)),
+            (date(2026, 3, 1), date(2026, 3, 31)),
+        ]
+        assert set(cache.entries) == {
+            "cal:Training:2026-01",
+            "cal:Training:2026-02",
+            "cal:Training:2026-03",
+        }
+        assert set(cache.ttls.values()) == {10800}
 
-    async def test_cache_miss_fetches_and_caches(self):
-        from sjifire.ops.events.calendar import _fetch_cached
+    async def test_shifted_window_reuses_month_slices(self):
+        cache = _FakeCache()
+        mock_fetch = AsyncMock(return_value=[])
 
-        fresh_events = [{"event_id": "fresh", "subject": "Fresh", "start": "2026-02-01T10:00:00"}]
+        with (
+            patch("sjifire.ops.cache.cosmos_cache", cache),
+            patch("sjifire.ops.events.calendar._fetch_one_calendar", mock_fetch),
+        ):
+            await _fetch_cached("cal@sjifire.org", "T", date(2026, 1, 10), date(2026, 3, 10))
+            await _fetch_cached("cal@sjifire.org", "T", date(2026, 1, 11), date(2026, 3, 11))
+
+        assert mock_fetch.await_count == 3
 
-        mock_cache = AsyncMock()
-        mock_cache.get = AsyncMock(return_value=None)
-        mock_cache.set = AsyncMock()
+    async def test_only_missing_months_fetched(self):
+        cache = _FakeCache({"cal:T:2026-01": _slice([_event("jan", "2026-01-05T09:00:00")])})
+        mock_fetch = AsyncMock(return_value=[_event("feb", "2026-02-05T09:00:00")])
 
         with (
-            patch("sjifire.ops.cache.cosmos_cache", mock_cache),
-            patch(
-                "sjifire.ops.events.calendar._fetch_one_calendar",
-                AsyncMock(return_value=fresh_events),
-            ) as mock_fetch_one,
+            patch("sjifire.ops.cache.cosmos_cache", cache),
+            patch("sjifire.ops.events.calendar._fetch_one_calendar", mock_fetch),
         ):
             result = await _fetch_cached(
-                "cal@sjifire.org", "Training", date(2026, 1, 1), date(2026, 3, 31)
+                "cal@sjifire.org", "T", date(2026, 1, 1), date(2026, 2, 28)
             )
 
-        assert result == fresh_events
-        mock_fetch_one.assert_awaited_once()
-        mock_cache.set.assert_awaited_once()
-        call_args = mock_cache.set.call_args
-        assert call_args[0][0] == "cal:Training:2026-01-01:2026-03-31"
-        assert call_args[0][1] == fresh_events
-        assert call_args[1]["ttl"] == 10800
+        mock_fetch.assert_awaited_once()
+        assert mock_fetch.call_args.args[2] == date(2026, 2, 1)
+        assert [e["event_id"] for e in result] == ["jan", "feb"]
+
+    async def test_trims_to_range_and_dedupes_boundary_events(self):
+        spanning = _event("span", "2026-01-31T22:00:00", "2026-02-01T02:00:00")
+        cache = _FakeCache(
+            {
+                "cal:T:2026-01": _slice([_event("early", "2026-01-02T09:00:00"), spanning]),
+                "cal:T:2026-02": _slice([spanning, _event("late", "2026-02-20T09:00:00")]),
+            }
+        )
+
+        with patch("sjifire.ops.cache.cosmos_cache", cache):
+            result = await _fetch_cached(
+                "cal@sjifire.org", "T", date(2026, 1, 15), date(2026, 2, 10)
+            )
+
+        assert [e["event_id"] for e in result] == ["span"]
+
+    async def test_graph_failure_not_cached(self):
+        cache = _FakeCache()
+
+        with (
+            patch("sjifire.ops.cache.cosmos_cache", cache),
+            patch("sjifire.ops.events.calendar._fetch_one_calendar", AsyncMock(return_value=None)),
+        ):
+            result = await _fetch_cached(
+                "cal@sjifire.org", "T", date(2026, 1, 1), date(2026, 1, 31)
+            )
+
+        assert result == []
+        assert cache.entries == {}
+
+    async def test_stale_current_month_refreshed_in_background(self):
+        this_month = date.today().replace(day=1)
+        key = _cache_key("T", this_month)
+        cache = _FakeCache({key: _slice([_event("old", f"{this_month}T09:00:00")], age=7300)})
+        mock_fetch = AsyncMock(return_value=[_event("new", f"{this_month}T09:00:00")])
+
+        with (
+            patch("sjifire.ops.cache.cosmos_cache", cache),
+            patch("sjifire.ops.events.calendar._fetch_one_calendar", mock_fetch),
+        ):
+            result = await _fetch_cached("cal@sjifire.org", "T", this_month, this_month)
+            # Served from cache immediately; the refresh runs afterwards
+            assert [e["event_id"] for e in result] == ["old"]
+            await asyncio.gather(*_background_tasks)
+
+        mock_fetch.assert_awaited_once()
+        assert cache.entries[key]["events"][0]["event_id"] == "new"
+        assert key not in _refreshing
+
+    async def test_refresh_ahead_off_serves_stale_slice_without_refresh(self):
+        this_month = date.today().replace(day=1)
+        key = _cache_key("T", this_month)
+        cache = _FakeCache({key: _slice([_event("old", f"{this_month}T09:00:00")], age=7300)})
+        mock_fetch = AsyncMock()
+
+        with (
+            patch("sjifire.ops.cache.cosmos_cache", cache),
+            patch("sjifire.ops.events.calendar._fetch_one_calendar", mock_fetch),
+        ):
+            result = await _fetch_cached(
+                "cal@sjifire.org", "T", this_month, this_month, refresh_ahead=False
+            )
+
+        assert [e["event_id"] for e in result] == ["old"]
+        assert not _background_tasks
+        assert key not in _refreshing
+        mock_fetch.assert_not_awaited()
+
+    async def test_fresh_or_past_months_not_refreshed(self):
+        this_month = date.today().replace(day=1)
+        past = date(2020, 1, 1)
+        cache = _FakeCache(
+            {
+                _cache_key("T", this_month): _slice([], age=60),
+                _cache_key("T", past): _slice([], age=7300),
+            }
+        )
+        mock_fetch = AsyncMock(return_value=[])
+
+        with (
+            patch("sjifire.ops.cache.cosmos_cache", cache),
+            patch("sjifire.ops.events.calendar._fetch_one_calendar", mock_fetch),
+        ):
+            await _fetch_cached("cal@sjifire.org", "T", this_month, this_month)
+            await _fetch_cached("cal@sjifire.org", "T", past, past)
+
+        assert not _background_tasks
+        mock_fetch.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# _resolve_calendar_id
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.usefixtures("_reset_calendar_state")
+class TestResolveCalendarId:
+    def _client(self, *names):
+        client = MagicMock()
+        calendars = SimpleNamespace(value=[SimpleNamespace(name=n, id=f"id-{n}") for n in names])
+        client.users.by_user_id.return_value.calendars.get = AsyncMock(return_value=calendars)
+        return client
+
+    async def test_found_id_is_memoized(self):
+        client = self._client("Training Room")
+
+        first = await _resolve_calendar_id(client, "room@sjifire.org", "training room")
+        second = await _resolve_calendar_id(client, "ROOM@sjifire.org", "Training Room")
+
+        assert first == second == "id-Training Room"
+        client.users.by_user_id.return_value.calendars.get.assert_awaited_once()
+
+    async def test_missing_calendar_not_memoized(self):
+        client = self._client("Other")
+
+        assert await _resolve_calendar_id(client, "room@sjifire.org", "Training Room") is None
+        assert await _resolve_calendar_id(client, "room@sjifire.org", "Training Room") is None
+
+        assert client.users.by_user_id.return_value.calendars.get.await_count == 2
+
+    async def test_listing_failure_raises(self):
+        client = MagicMock()
+        client.users.by_user_id.return_value.calendars.get = AsyncMock(
+            side_effect=RuntimeError("Graph down")
+        )
+
+        with pytest.raises(RuntimeError):
+            await _resolve_calendar_id(client, "room@sjifire.org", "Training Room")
+
+        assert _calendar_ids == {}
+
+
+@pytest.mark.usefixtures("_reset_calendar_state")
+class TestFetchOneCalendarNamed:
+    def _patch_client(self, get):
+        client = MagicMock()
+        client.users.by_user_id.return_value.calendars.get = get
+        return (
+            patch("sjifire.ops.events.calendar._get_graph_client", return_value=client),
+            patch("sjifire.ops.events.calendar.get_timezone_name", return_value="UTC"),
+        )
+
+    async def test_missing_calendar_returns_empty(self):
+        calendars = SimpleNamespace(value=[SimpleNamespace(name="Other", id="id-other")])
+        client_patch, tz_patch = self._patch_client(AsyncMock(return_value=calendars))
+
+        with client_patch, tz_patch:
+            result = await _fetch_one_calendar(
+                "room@sjifire.org", "T", date(2026, 1, 1), date(2026, 1, 31), "Training Room"
+            )
+
+        assert result == []
+
+    async def test_listing_failure_returns_none_and_is_not_cached(self):
+        cache = _FakeCache()
+        client_patch, tz_patch = self._patch_client(AsyncMock(side_effect=RuntimeError("down")))
+
+        with client_patch, tz_patch, patch("sjifire.ops.cache.cosmos_cache", cache):
+            direct = await _fetch_one_calendar(
+                "room@sjifire.org", "T", date(2026, 1, 1), date(2026, 1, 31), "Training Room"
+            )
+            cached = await _fetch_cached(
+                "room@sjifire.org", "T", date(2026, 1, 1), date(2026, 1, 31), "Training Room"
+            )
+
+        assert direct is None
+        assert cached == []
+        assert cache.entries == {}
+
+
+# ---------------------------------------------------------------------------
+# _get_graph_client
+# ---------------------------------------------------------------------------
+
+
+class TestGetGraphClient:
+    def test_client_shared_within_loop_and_replaced_per_loop(self, monkeypatch):
+        monkeypatch.setattr("sjifire.ops.events.calendar._graph_client", None)
+        monkeypatch.setattr("sjifire.ops.events.calendar._graph_client_loop", None)
+
+        async def two_calls():
+            return _get_graph_client(), _get_graph_client()
+
+        with patch(
+            "sjifire.core.msgraph_client.get_graph_client", side_effect=lambda: object()
+        ) as factory:
+            first_a, first_b = asyncio.run(two_calls())
+            second, _ = asyncio.run(two_calls())
+
+        assert first_a is first_b
+        assert second is not first_a
+        assert factory.call_count == 2
@@ -1,11 +1,18 @@
 """Tests for the Azure Maps geo module."""
 
+from __future__ import annotations
+
+import asyncio
+import json
 import os
+import time
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
+from sjifire.ops import geo
+from sjifire.ops.cache import CosmosDBCache
 from sjifire.ops.geo import reverse_geocode
 
 
@@ -60,25 +67,86 @@ EMPTY_RESPONSE = {"addresses": []}
 # ---------------------------------------------------------------------------
 
 
-class TestReverseGeocode:
-    async def test_happy_path(self):
-        """Should return address, cross streets, and property type."""
+class FakeMapsServer:
+    """Local HTTP/1.1 server speaking the two Azure Maps reverse endpoints.
+
+    Counts requests per endpoint and TCP connections, and delays every
+    response by ``latency`` seconds.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Configure responses; the server starts on ``async with``."""
+        self.latency = latency
+        self.requests: list[str] = []
+        self.connections = 0
+        self.address = REVERSE_GEOCODE_RESPONSE
+        self.address_status = 200
+        self.cross_status = 200
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> FakeMapsServer:
+        """Listen on an ephemeral localhost port."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Stop listening."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while request_line := await reader.readline():
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass  # headers (GET requests have no body)
+                path = request_line.split()[1].decode().split("?")[0]
+                self.requests.append(path)
+                await asyncio.sleep(self.latency)
+                if "crossStreet" in path:
+                    status, data = self.cross_status, CROSS_STREET_RESPONSE
+                else:
+                    status, data = self.address_status, self.address
+                body = json.dumps(data).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def maps_server():
+    """Fake Maps server wired into the geo module, with empty caches."""
+    fresh_cache = CosmosDBCache(namespace="test")
+    fresh_cache._fallback = True
+    async with FakeMapsServer() as server:
+        geo._l1.clear()
         with (
             patch.dict(os.environ, {"AZURE_MAPS_KEY": "test-key"}),
-            patch("sjifire.ops.geo.httpx.AsyncClient") as mock_cls,
+            patch.object(geo, "_BASE_URL", server.url),
+            patch("sjifire.ops.cache.cosmos_cache", fresh_cache),
         ):
-            client = AsyncMock()
+            await geo.close_client()
+            yield server
+            await geo.close_client()
+        geo._l1.clear()
 
-            async def mock_get(url, **kwargs):
-                if "crossStreet" in url:
-                    return _mock_response(CROSS_STREET_RESPONSE)
-                return _mock_response(REVERSE_GEOCODE_RESPONSE)
 
-            client.get = mock_get
-            mock_cls.return_value.__aenter__ = AsyncMock(return_value=client)
-            mock_cls.return_value.__aexit__ = AsyncMock(return_value=None)
-
-            result = await reverse_geocode(48.534, -123.013)
+class TestReverseGeocode:
+    async def test_happy_path(self, maps_server):
+        """Should return address, cross streets, and property type."""
+        result = await reverse_geocode(48.534, -123.013)
 
         assert result["road"] == "Spring Street"
         assert result["city"] == "Friday Harbor"
@@ -94,46 +162,37 @@ class TestReverseGeocode:
         # Main road should not appear in cross streets
         assert "Spring Street" not in cross_names
 
-    async def test_empty_result(self):
+    async def test_empty_result(self, maps_server):
         """Should return empty fields when no addresses found."""
-        with (
-            patch.dict(os.environ, {"AZURE_MAPS_KEY": "test-key"}),
-            patch("sjifire.ops.geo.httpx.AsyncClient") as mock_cls,
-        ):
-            client = AsyncMock()
-            client.get = AsyncMock(return_value=_mock_response(EMPTY_RESPONSE))
-            mock_cls.return_value.__aenter__ = AsyncMock(return_value=client)
-            mock_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+        maps_server.address = EMPTY_RESPONSE
 
-            result = await reverse_geocode(0.0, 0.0)
+        result = await reverse_geocode(0.0, 0.0)
 
         assert result["road"] == ""
         assert result["cross_streets"] == []
         assert result["city"] == ""
         assert result["display_address"] == ""
 
-    async def test_cross_street_failure_graceful(self):
-        """Cross street failure should not fail the whole call."""
-        with (
-            patch.dict(os.environ, {"AZURE_MAPS_KEY": "test-key"}),
-            patch("sjifire.ops.geo.httpx.AsyncClient") as mock_cls,
-        ):
-            client = AsyncMock()
-
-            async def mock_get(url, **kwargs):
-                if "crossStreet" in url:
-                    raise httpx.ConnectError("timeout")
-                return _mock_response(REVERSE_GEOCODE_RESPONSE)
-
-            client.get = mock_get
-            mock_cls.return_value.__aenter__ = AsyncMock(return_value=client)
-            mock_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+    async def test_cross_street_failure_graceful(self, maps_server):
+        """Cross street failure should not fail the whole call (or be cached)."""
+        maps_server.cross_status = 500
 
-            result = await reverse_geocode(48.534, -123.013)
+        result = await reverse_geocode(48.534, -123.013)
+        await reverse_geocode(48.534, -123.013)
 
         assert result["road"] == "Spring Street"
         assert result["cross_streets"] == []  # Gracefully degraded
         assert result["city"] == "Friday Harbor"
+        assert len(maps_server.requests) == 4  # degraded result retried
+
+    async def test_address_error_raises(self, maps_server):
+        maps_server.address_status = 503
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await reverse_geocode(48.534, -123.013)
+
+        maps_server.address_status = 200
+        assert (await reverse_geocode(48.534, -123.013))["road"] == "Spring Street"
 
     async def test_missing_api_key_raises(self):
         """Should raise ValueError when AZURE_MAPS_KEY is not set."""
@@ -144,6 +203,74 @@ class TestReverseGeocode:
             await reverse_geocode(48.534, -123.013)
 
 
+class TestGeocodeCache:
+    """Request counts and latency against the fake Maps server."""
+
+    async def test_lookups_run_concurrently(self, maps_server):
+        maps_server.latency = 0.25
+
+        start = time.perf_counter()
+        await reverse_geocode(48.534, -123.013)
+        elapsed = time.perf_counter() - start
+
+        assert sorted(maps_server.requests) == [
+            "/search/address/reverse/crossStreet/json",
+            "/search/address/reverse/json",
+        ]
+        assert elapsed < 0.45  # two 0.25 s requests overlapped, not back to back
+
+    async def test_repeated_coordinates_hit_cache(self, maps_server):
+        maps_server.latency = 0.05
+        first = await reverse_geocode(48.534, -123.013)
+
+        start = time.perf_counter()
+        for _ in range(20):
+            # Within the ~11 m quantum: same key
+            assert await reverse_geocode(48.53401, -123.01304) == first
+        elapsed = time.perf_counter() - start
+
+        assert len(maps_server.requests) == 2
+        assert elapsed < 0.05
+
+    async def test_cosmos_cache_backs_l1(self, maps_server):
+        first = await reverse_geocode(48.534, -123.013)
+        geo._l1.clear()  # e.g. another replica or a restart
+
+        assert await reverse_geocode(48.534, -123.013) == first
+        assert len(maps_server.requests) == 2
+
+    async def test_concurrent_callers_share_lookup(self, maps_server):
+        maps_server.latency = 0.05
+
+        results = await asyncio.gather(*(reverse_geocode(48.534, -123.013) for _ in range(5)))
+
+        assert all(r == results[0] for r in results)
+        assert len(maps_server.requests) == 2
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self, maps_server):
+        maps_server.latency = 0.3
+        leader = asyncio.create_task(reverse_geocode(48.534, -123.013))
+        await asyncio.sleep(0.1)  # leader's requests reach the server
+        assert len(maps_server.requests) == 2
+        waiters = [asyncio.create_task(reverse_geocode(48.534, -123.013)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert all(r["road"] == "Spring Street" for r in results)
+        assert len(maps_server.requests) == 4  # one retried lookup shared by the waiters
+        assert not geo._inflight
+
+    async def test_distinct_points_reuse_connections(self, maps_server):
+        for i in range(5):
+            await reverse_geocode(48.5 + i / 100, -123.0)
+
+        assert len(maps_server.requests) == 10
+        assert maps_server.connections <= 2  # pooled keep-alive, not one per call
+
+
 class TestLookupLocationFallback:
     """Test that _lookup_location uses Azure Maps when key is set, OSM otherwise."""
 
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 
 import pytest
 
+from sjifire.core.config import local_now
 from sjifire.ops.incidents.models import IncidentDocument, PersonnelAssignment, UnitAssignment
 from sjifire.ops.incidents.store import IncidentStore
 
@@ -16,11 +17,13 @@ async def _noop_container(name):
 def _clear_memory_and_env(monkeypatch):
     """Reset in-memory store and ensure Cosmos env vars are unset."""
     IncidentStore._memory.clear()
+    IncidentStore._partitions.clear()
     monkeypatch.delenv("COSMOS_ENDPOINT", raising=False)
     monkeypatch.delenv("COSMOS_KEY", raising=False)
     monkeypatch.setattr("sjifire.ops.cosmos.get_cosmos_container", _noop_container)
     yield
     IncidentStore._memory.clear()
+    IncidentStore._partitions.clear()
 
 
 def _make_doc(**overrides) -> IncidentDocument:
@@ -349,3 +352,134 @@ class TestListForUser:
             await store.create(doc_jan)
             results = await store.list_for_user("ff@sjifire.org")
         assert [r.incident_number for r in results] == ["26-001", "26-002"]
+
+
+class TestParticipantIndex:
+    async def test_create_writes_participant_emails(self):
+        doc = _make_doc(
+            created_by="Chief@sjifire.org",
+            units=[
+                UnitAssignment(
+                    unit_id="E31",
+                    personnel=[
+                        PersonnelAssignment(name="Jane", email="jane@sjifire.org"),
+                        PersonnelAssignment(name="No Email"),
+                    ],
+                )
+            ],
+        )
+        async with IncidentStore() as store:
+            await store.create(doc)
+        assert IncidentStore._memory[doc.id]["participant_emails"] == [
+            "chief@sjifire.org",
+            "jane@sjifire.org",
+        ]
+
+    async def test_update_refreshes_participant_emails(self):
+        doc = _make_doc()
+        async with IncidentStore() as store:
+            await store.create(doc)
+            doc.units = [
+                UnitAssignment(
+                    unit_id="E31",
+                    personnel=[PersonnelAssignment(name="Jane", email="jane@sjifire.org")],
+                )
+            ]
+            await store.update(doc)
+            results = await store.list_for_user("jane@sjifire.org")
+        assert [r.id for r in results] == [doc.id]
+
+    async def test_round_trip_ignores_index_field(self):
+        doc = _make_doc()
+        async with IncidentStore() as store:
+            await store.create(doc)
+            fetched = await store.get(doc.id, "2026")
+        assert fetched is not None
+        assert "participant_emails" not in fetched.model_dump()
+
+    async def test_legacy_document_without_field_still_listed(self):
+        legacy = _make_doc(
+            created_by="ff@sjifire.org",
+            units=[
+                UnitAssignment(
+                    unit_id="E31",
+                    personnel=[PersonnelAssignment(name="Jane", email="jane@sjifire.org")],
+                )
+            ],
+        )
+        IncidentStore._memory[legacy.id] = legacy.to_cosmos()
+        async with IncidentStore() as store:
+            for email in ("ff@sjifire.org", "jane@sjifire.org"):
+                results = await store.list_for_user(email)
+                assert [r.id for r in results] == [legacy.id]
+            assert await store.list_for_user("other@sjifire.org") == []
+
+    async def test_backfill_adds_missing_field(self):
+        legacy = _make_doc(created_by="ff@sjifire.org")
+        IncidentStore._memory[legacy.id] = legacy.to_cosmos()
+        async with IncidentStore() as store:
+            assert await store.backfill_participants() == 1
+            assert await store.backfill_participants() == 0
+            results = await store.list_for_user("ff@sjifire.org")
+        assert IncidentStore._memory[legacy.id]["participant_emails"] == ["ff@sjifire.org"]
+        assert [r.id for r in results] == [legacy.id]
+
+
+class _FakeContainer:
+    """Cosmos container double that records point reads and queries."""
+
+    def __init__(self, *docs: IncidentDocument):
+        self.docs = {d.id: d.to_cosmos() for d in docs}
+        self.reads: list[str] = []
+        self.queries = 0
+
+    async def read_item(self, item, partition_key):
+        self.reads.append(partition_key)
+        data = self.docs.get(item)
+        if data is None or data["year"] != partition_key:
+            raise LookupError(item)
+        return dict(data)
+
+    def query_items(self, query, parameters, **kwargs):
+        self.queries += 1
+        matches = [dict(d) for d in self.docs.values() if d["id"] == parameters[0]["value"]]
+
+        async def _iter():
+            for data in matches:
+                yield data
+
+        return _iter()
+
+
+def _cosmos_store(container: _FakeContainer) -> IncidentStore:
+    store = IncidentStore()
+    store._container = container
+    return store
+
+
+class TestGetByIdPointReads:
+    async def test_current_year_is_point_read(self):
+        doc = _make_doc(incident_datetime=local_now())
+        container = _FakeContainer(doc)
+        result = await _cosmos_store(container).get_by_id(doc.id)
+        assert result is not None
+        assert container.reads == [doc.year]
+        assert container.queries == 0
+
+    async def test_older_year_falls_back_then_caches(self):
+        doc = _make_doc(incident_datetime=datetime(2019, 6, 1, tzinfo=UTC))
+        container = _FakeContainer(doc)
+        store = _cosmos_store(container)
+
+        assert await store.get_by_id(doc.id) is not None
+        assert container.queries == 1
+
+        container.reads.clear()
+        assert await store.get_by_id(doc.id) is not None
+        assert container.reads == ["2019"]
+        assert container.queries == 1
+
+    async def test_missing_returns_none(self):
+        container = _FakeContainer()
+        assert await _cosmos_store(container).get_by_id("nope") is None
+        assert container.queries == 1
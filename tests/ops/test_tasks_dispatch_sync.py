@@ -8,6 +8,7 @@ from sjifire.ops.tasks.dispatch_sync import (
     _prewarm_schedule,
     dispatch_enrich,
     dispatch_reenrich,
+    dispatch_reenrich_batch,
     dispatch_sync,
 )
 from tests.factories import DispatchAnalysisFactory, DispatchCallDocumentFactory
@@ -147,7 +148,7 @@ class TestDispatchReenrich:
         with patch(_DS, cls):
             result = await dispatch_reenrich()
         assert result == 0
-        s.enrich_stored.assert_awaited_once_with(force=True, limit=9999)
+        s.enrich_stored.assert_awaited_once_with(force=True, limit=9999, batch=False)
 
     async def test_force_reenriches_all(self):
         """Prewarms schedule and force re-enriches all stored calls."""
@@ -161,7 +162,7 @@ class TestDispatchReenrich:
             result = await dispatch_reenrich()
         assert result == 3
         mock_pw.assert_awaited_once_with(docs)
-        s.enrich_stored.assert_awaited_once_with(force=True, limit=9999)
+        s.enrich_stored.assert_awaited_once_with(force=True, limit=9999, batch=False)
 
     async def test_reenrich_partial_success(self):
         """Counts only docs with analysis after force re-enrichment."""
@@ -185,6 +186,50 @@ class TestDispatchReenrich:
             await dispatch_reenrich()
         mock_pw.assert_not_awaited()
 
+    async def test_reports_cache_stats(self):
+        """Analysis cache hits/misses during the run are recorded on the task result."""
+        from sjifire.ops.dispatch.analysis_cache import cache_stats
+
+        cache_stats.hits = 99  # stale counts from an earlier run are reset
+
+        async def enrich(**_kw):
+            cache_stats.hits += 2
+            cache_stats.misses += 1
+            return [_enriched() for _ in range(3)]
+
+        cls, s = _mock_store(recent=[_enriched()])
+        s.enrich_stored = AsyncMock(side_effect=enrich)
+        with (
+            patch(_DS, cls),
+            patch(_PW, new_callable=AsyncMock),
+            patch("sjifire.ops.tasks.dispatch_sync.record_stats") as mock_record,
+        ):
+            await dispatch_reenrich()
+
+        mock_record.assert_called_once_with(
+            analysis_cache_hits=2,
+            analysis_cache_misses=1,
+            prompt_cache_read_tokens=0,
+            prompt_cache_write_tokens=0,
+            prompt_uncached_tokens=0,
+        )
+        cache_stats.reset()
+
+
+class TestDispatchReenrichBatch:
+    async def test_force_reenriches_in_batch_mode(self):
+        """Same flow as dispatch-reenrich, with batch analysis enabled."""
+        docs = [_enriched() for _ in range(2)]
+        cls, s = _mock_store(recent=docs, enrich=[_enriched(), _unenriched()])
+        with (
+            patch(_DS, cls),
+            patch(_PW, new_callable=AsyncMock) as mock_pw,
+        ):
+            result = await dispatch_reenrich_batch()
+        assert result == 1
+        mock_pw.assert_awaited_once_with(docs)
+        s.enrich_stored.assert_awaited_once_with(force=True, limit=9999, batch=True)
+
 
 # ---------------------------------------------------------------------------
 # _prewarm_schedule
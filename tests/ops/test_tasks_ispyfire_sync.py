@@ -1,9 +1,12 @@
 """Tests for iSpyFire sync background task."""
 
+import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from sjifire.ops.tasks.ispyfire_sync import ispyfire_sync
+from sjifire.ops.tasks.ispyfire_sync import APPLY_MAX_WORKERS, ispyfire_sync
 
 # ---------------------------------------------------------------------------
 # Mock data classes
@@ -168,15 +171,28 @@ class TestISpyFireSync:
         user = _MockEntraUser(email="exists@sjifire.org")
         comparison = _MockComparison(to_add=[user])
 
-        existing = _MockISpyFirePerson(id="old-1", email="exists@sjifire.org", is_active=False)
+        existing = _MockISpyFirePerson(id="old-1", email="Exists@sjifire.org", is_active=False)
 
-        with _patch_all(employees=[user], comparison=comparison) as ctx:
-            ctx.client.get_person_by_email = MagicMock(return_value=existing)
+        with _patch_all(employees=[user], people=[existing], comparison=comparison) as ctx:
             result = await ispyfire_sync()
 
         assert result == 1
-        ctx.client.reactivate_person.assert_called_once()
+        ctx.client.reactivate_person.assert_called_once_with("old-1", email="Exists@sjifire.org")
         ctx.client.create_and_invite.assert_not_called()
+        # Looked up in the people list already fetched, not per user
+        ctx.client.get_person_by_email.assert_not_called()
+
+    async def test_add_existing_active_is_left_alone(self):
+        """An already-active existing person is neither created nor reactivated."""
+        user = _MockEntraUser(email="exists@sjifire.org")
+        existing = _MockISpyFirePerson(id="old-1", email="exists@sjifire.org")
+
+        with _patch_all(people=[existing], comparison=_MockComparison(to_add=[user])) as ctx:
+            result = await ispyfire_sync()
+
+        assert result == 0
+        ctx.client.create_and_invite.assert_not_called()
+        ctx.client.reactivate_person.assert_not_called()
 
     async def test_update_users(self):
         """Updates users with changed fields."""
@@ -238,3 +254,56 @@ class TestISpyFireSync:
 
         # 1 add + 1 update + 1 reactivate (matched inactive) + 1 deactivate = 4
         assert result == 4
+
+    async def test_update_then_reactivate_same_person(self):
+        """An inactive person being updated is reactivated after the update."""
+        user = _MockEntraUser(first_name="Updated")
+        person = _MockISpyFirePerson(first_name="Old", is_active=False)
+        calls = []
+
+        with _patch_all(comparison=_MockComparison(to_update=[(user, person)])) as ctx:
+            ctx.client.update_person.side_effect = lambda p: calls.append("update") or True
+            ctx.client.reactivate_person.side_effect = (
+                lambda *a, **k: calls.append("reactivate") or True
+            )
+            result = await ispyfire_sync()
+
+        assert result == 2
+        assert calls == ["update", "reactivate"]
+
+    async def test_applies_people_concurrently(self):
+        """Independent people are processed on several worker threads."""
+        removed = [_MockISpyFirePerson(id=f"rm-{i}") for i in range(8)]
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def deactivate(person_id, email=None):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return True
+
+        with _patch_all(comparison=_MockComparison(to_remove=removed)) as ctx:
+            ctx.client.deactivate_person.side_effect = deactivate
+            result = await ispyfire_sync()
+
+        assert result == 8
+        assert 1 < peak <= APPLY_MAX_WORKERS
+        assert ctx.client.__enter__.call_count == 2  # one fetch session, one apply session
+
+    async def test_logs_per_operation_latency(self, caplog):
+        """Each operation type's call count and latency is logged."""
+        comparison = _MockComparison(
+            to_add=[_MockEntraUser(email="a@sjifire.org"), _MockEntraUser(email="b@sjifire.org")],
+            to_remove=[_MockISpyFirePerson(id="rm-1")],
+        )
+
+        with caplog.at_level(logging.INFO), _patch_all(comparison=comparison):
+            await ispyfire_sync()
+
+        assert "iSpyFire create: 2 calls" in caplog.text
+        assert "iSpyFire deactivate: 1 calls" in caplog.text
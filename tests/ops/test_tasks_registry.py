@@ -5,6 +5,7 @@ from sjifire.ops.tasks.registry import (
     _tasks,
     is_auto,
     list_tasks,
+    record_stats,
     register,
     run_all,
     run_task,
@@ -97,6 +98,41 @@ class TestRunTask:
         assert result.ok is False
         assert "Unknown task" in result.error
 
+    async def test_records_stats(self):
+        @register("stats-task")
+        async def stats_task():
+            record_stats(hits=1, misses=2)
+            record_stats(hits=3)
+            return 4
+
+        result = await run_task("stats-task")
+
+        assert result.stats == {"hits": 3, "misses": 2}
+
+    async def test_stats_kept_on_error(self):
+        @register("stats-bad-task")
+        async def stats_bad_task():
+            record_stats(hits=1)
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        result = await run_task("stats-bad-task")
+
+        assert result.ok is False
+        assert result.stats == {"hits": 1}
+
+    async def test_stats_isolated_between_runs(self):
+        @register("plain-task")
+        async def plain_task():
+            return 0
+
+        result = await run_task("plain-task")
+
+        assert result.stats == {}
+
+    def test_record_stats_outside_task_is_noop(self):
+        record_stats(hits=1)
+
 
 class TestRunAll:
     def setup_method(self):
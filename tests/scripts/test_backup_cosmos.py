@@ -0,0 +1,411 @@
+"""Tests for the streaming backup-cosmos export and restore."""
+
+import gzip
+import importlib
+import json
+import os
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sjifire.ops.cosmos import CosmosStore
+from sjifire.ops.dispatch.store import DispatchStore
+from sjifire.ops.incidents.store import IncidentStore
+from sjifire.scripts.backup_cosmos import (
+    CHAIN_FILE,
+    CONTAINER_STORES,
+    FULL_SNAPSHOT_DAYS,
+    MANIFEST_FILE,
+    TS_CLOCK_SKEW,
+    compact_chain,
+    export_backup,
+    incremental_backup,
+    restore_backup,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_cosmos():
+    """Ensure in-memory mode with empty stores."""
+    with patch.dict(os.environ, {"COSMOS_ENDPOINT": "", "COSMOS_KEY": ""}, clear=False):
+        yield
+    DispatchStore._memory.clear()
+    IncidentStore._memory.clear()
+
+
+def _fill_dispatch(count: int) -> dict[str, dict]:
+    docs = {
+        f"call-{i:06d}": {
+            "id": f"call-{i:06d}",
+            "year": "2026",
+            "long_term_call_id": f"26-{i:06d}",
+            "nature": "Medical Aid",
+            "address": f"{i} Spring St",
+            "_ts": 1_770_000_000 + i,
+        }
+        for i in range(count)
+    }
+    DispatchStore._memory.update(docs)
+    return docs
+
+
+def _lines(path) -> list[dict]:
+    with gzip.open(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+class FakePager:
+    """``AsyncItemPaged.by_page`` over a list, with offset continuation tokens."""
+
+    def __init__(self, docs: list[dict], page_size: int, token: str | None) -> None:
+        """Start at *token* (an offset) or the beginning."""
+        self.docs = docs
+        self.page_size = page_size
+        self.offset = int(token or 0)
+        self.continuation_token = token
+
+    def __aiter__(self):
+        """Iterate pages."""
+        return self
+
+    async def __anext__(self):
+        """Next page as an async iterator of documents."""
+        if self.offset >= len(self.docs):
+            raise StopAsyncIteration
+        page = self.docs[self.offset : self.offset + self.page_size]
+        self.offset += len(page)
+        self.continuation_token = str(self.offset) if self.offset < len(self.docs) else None
+
+        async def items():
+            for doc in page:
+                yield doc
+
+        return items()
+
+
+class FakeContainer:
+    """The subset of the Cosmos container client the backup uses."""
+
+    def __init__(self, docs: list[dict]) -> None:
+        """Serve *docs*."""
+        self.docs = docs
+        self.queries: list[dict] = []
+        self.upsert_item = AsyncMock()
+
+    def query_items(self, **kwargs):
+        """Query builder whose ``by_page`` returns a FakePager."""
+        self.queries.append(kwargs)
+        container = self
+
+        class Paged:
+            def by_page(self, token=None):
+                return FakePager(container.docs, kwargs["max_item_count"], token)
+
+        return Paged()
+
+
+def _cosmos_store(docs: list[dict]) -> DispatchStore:
+    store = DispatchStore()
+    store._container = FakeContainer(docs)
+    return store
+
+
+class TestRawPages:
+    async def test_follows_continuation_tokens(self):
+        docs = [{"id": str(i)} for i in range(25)]
+        store = _cosmos_store(docs)
+
+        pages = [p async for p in store.iter_raw_pages(page_size=10)]
+
+        assert [len(docs) for docs, _ in pages] == [10, 10, 5]
+        assert [token for _, token in pages] == ["10", "20", None]
+        assert store._container.queries[0]["max_item_count"] == 10
+
+    async def test_resumes_from_token(self):
+        store = _cosmos_store([{"id": str(i)} for i in range(25)])
+
+        pages = [p async for p in store.iter_raw_pages(page_size=10, continuation="20")]
+
+        assert [d["id"] for d in pages[0][0]] == [str(i) for i in range(20, 25)]
+
+    async def test_since_filters_on_ts(self):
+        store = _cosmos_store([{"id": "1"}])
+
+        [page async for page in store.iter_raw_pages(since_ts=1_770_000_000)]
+
+        query = store._container.queries[0]
+        assert query["query"] == "SELECT * FROM c WHERE c._ts >= @since"
+        assert query["parameters"] == [{"name": "@since", "value": 1_770_000_000}]
+
+    async def test_since_in_memory(self):
+        _fill_dispatch(10)
+        async with DispatchStore() as store:
+            pages = [p async for p in store.iter_raw_pages(since_ts=1_770_000_007)]
+
+        assert [d["id"] for d in pages[0][0]] == ["call-000007", "call-000008", "call-000009"]
+
+    async def test_upsert_raw_strips_system_properties(self):
+        store = _cosmos_store([])
+        doc = {"id": "1", "year": "2026", "_rid": "r", "_etag": "e", "_ts": 1, "_self": "s"}
+
+        assert await store.upsert_raw([doc]) == 1
+
+        store._container.upsert_item.assert_awaited_once_with(body={"id": "1", "year": "2026"})
+
+
+class TestExportRestore:
+    async def test_round_trip_large_archive(self, tmp_path):
+        """Tens of thousands of documents stream out and back without truncation."""
+        original = _fill_dispatch(25_000)
+        IncidentStore._memory["inc-1"] = {"id": "inc-1", "year": "2026"}
+
+        counts = await export_backup(tmp_path, page_size=1000)
+
+        assert counts["dispatch-calls"] == 25_000
+        assert counts["incidents"] == 1
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        assert set(manifest["containers"]) == set(CONTAINER_STORES)
+        assert all(e["complete"] for e in manifest["containers"].values())
+
+        DispatchStore._memory.clear()
+        IncidentStore._memory.clear()
+        restored = await restore_backup(tmp_path)
+
+        assert restored["dispatch-calls"] == 25_000
+        assert DispatchStore._memory["call-012345"]["address"] == "12345 Spring St"
+        assert "_ts" not in DispatchStore._memory["call-000000"]
+        assert DispatchStore._memory.keys() == original.keys()
+        assert IncidentStore._memory["inc-1"] == {"id": "inc-1", "year": "2026"}
+
+    async def test_selected_containers(self, tmp_path):
+        _fill_dispatch(3)
+
+        counts = await export_backup(tmp_path, ["dispatch-calls"])
+
+        assert counts == {"dispatch-calls": 3}
+        assert not (tmp_path / "incidents.ndjson.gz").exists()
+
+    async def test_resume_after_interruption(self, tmp_path):
+        _fill_dispatch(5_000)
+        original_pages = CosmosStore.iter_raw_pages
+
+        async def failing_pages(self, **kwargs):
+            pages = 0
+            async for page in original_pages(self, **kwargs):
+                if pages == 3:
+                    raise RuntimeError("connection reset")
+                pages += 1
+                yield page
+
+        with (
+            patch.object(CosmosStore, "iter_raw_pages", failing_pages),
+            pytest.raises(RuntimeError),
+        ):
+            await export_backup(tmp_path, ["dispatch-calls"], page_size=1000)
+
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        entry = manifest["containers"]["dispatch-calls"]
+        assert (entry["count"], entry["continuation"], entry["complete"]) == (3000, "3000", False)
+        # A half-written page after the last recorded one is discarded on resume
+        with (tmp_path / entry["file"]).open("ab") as f:
+            f.write(b"\x1f\x8b partial page")
+
+        counts = await export_backup(tmp_path)
+
+        assert counts == {"dispatch-calls": 5_000}
+        ids = [d["id"] for d in _lines(tmp_path / entry["file"])]
+        assert len(ids) == len(set(ids)) == 5_000
+
+    async def test_restore_skips_incomplete_export(self, tmp_path):
+        _fill_dispatch(3)
+        await export_backup(tmp_path, ["dispatch-calls"])
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        manifest["containers"]["dispatch-calls"]["complete"] = False
+        (tmp_path / MANIFEST_FILE).write_text(json.dumps(manifest))
+
+        assert await restore_backup(tmp_path) == {}
+
+
+T0 = datetime(2026, 3, 1, 2, 0, tzinfo=UTC)
+
+# Wall clock (epoch seconds) when the first backup in a test runs
+START_TS = 1_770_000_500
+
+
+@pytest.fixture
+def clock():
+    """Controllable ``time.time()`` for the backup module, starting at START_TS."""
+    now = SimpleNamespace(ts=START_TS)
+    with patch("sjifire.scripts.backup_cosmos.time") as fake_time:
+        fake_time.time.side_effect = lambda: now.ts
+        yield now
+
+
+def _touch(doc_id: str, ts: int, **fields) -> None:
+    """Simulate a write: update fields and bump ``_ts``."""
+    doc = DispatchStore._memory.setdefault(doc_id, {"id": doc_id, "year": "2026"})
+    doc.update(fields, _ts=ts)
+
+
+class TestIncremental:
+    async def test_first_run_full_then_delta(self, tmp_path, clock):
+        _fill_dispatch(100)
+
+        full_dir, full_counts = await incremental_backup(tmp_path, ["dispatch-calls"], now=T0)
+        _touch("call-000005", 1_770_001_000, nature="Fire")
+        _touch("call-new", 1_770_001_001)
+        clock.ts = 1_770_001_500
+        delta_dir, delta_counts = await incremental_backup(tmp_path, now=T0 + timedelta(days=1))
+
+        assert full_counts == {"dispatch-calls": 100}
+        assert delta_counts == {"dispatch-calls": 2}
+        ids = {d["id"] for d in _lines(delta_dir / "dispatch-calls.ndjson.gz")}
+        assert ids == {"call-000005", "call-new"}
+        manifest = json.loads((delta_dir / MANIFEST_FILE).read_text())
+        assert manifest["kind"] == "delta"
+        assert manifest["containers"]["dispatch-calls"]["since"] == START_TS - TS_CLOCK_SKEW
+        assert manifest["containers"]["dispatch-calls"]["high_water"] == (
+            1_770_001_500 - TS_CLOCK_SKEW
+        )
+        chain = json.loads((tmp_path / CHAIN_FILE).read_text())
+        assert [(c["dir"], c["kind"]) for c in chain] == [
+            (full_dir.name, "full"),
+            (delta_dir.name, "delta"),
+        ]
+
+    async def test_write_to_exported_page_during_export_not_lost(self, tmp_path, clock):
+        """Pages are not in ``_ts`` order: an early-page write must not hide behind a later one."""
+        _fill_dispatch(100)
+        original_pages = CosmosStore.iter_raw_pages
+
+        async def pages_with_concurrent_writes(self, **kwargs):
+            first = True
+            async for page in original_pages(self, **kwargs):
+                yield page
+                if first:
+                    first = False
+                    # Both land mid-export: one on the page just written, one still ahead
+                    _touch("call-000000", START_TS + 1, nature="Fire")
+                    _touch("call-000099", START_TS + 2, nature="Rescue")
+
+        with patch.object(CosmosStore, "iter_raw_pages", pages_with_concurrent_writes):
+            await incremental_backup(tmp_path, ["dispatch-calls"], page_size=10, now=T0)
+        clock.ts = START_TS + 1000
+        delta_dir, _ = await incremental_backup(tmp_path, now=T0 + timedelta(days=1))
+
+        docs = {d["id"]: d for d in _lines(delta_dir / "dispatch-calls.ndjson.gz")}
+        assert docs["call-000000"]["nature"] == "Fire"
+        assert docs["call-000099"]["nature"] == "Rescue"
+
+    async def test_empty_delta_still_advances_high_water(self, tmp_path, clock):
+        _fill_dispatch(5)
+        await incremental_backup(tmp_path, ["dispatch-calls"], now=T0)
+        clock.ts = START_TS + 1000
+        await incremental_backup(tmp_path, now=T0 + timedelta(hours=1))
+        _touch("call-new", START_TS + 1500)
+        clock.ts = START_TS + 2000
+
+        delta_dir, counts = await incremental_backup(tmp_path, now=T0 + timedelta(hours=2))
+
+        manifest = json.loads((delta_dir / MANIFEST_FILE).read_text())
+        assert manifest["containers"]["dispatch-calls"]["since"] == START_TS + 1000 - TS_CLOCK_SKEW
+        assert counts == {"dispatch-calls": 1}
+
+    @pytest.mark.usefixtures("clock")
+    async def test_full_snapshot_when_due_or_forced(self, tmp_path):
+        _fill_dispatch(5)
+        await incremental_backup(tmp_path, ["dispatch-calls"], now=T0)
+
+        due = T0 + timedelta(days=FULL_SNAPSHOT_DAYS, hours=1)
+        due_dir, due_counts = await incremental_backup(tmp_path, now=due)
+        forced_dir, _ = await incremental_backup(tmp_path, full=True, now=due + timedelta(hours=1))
+
+        assert due_counts["dispatch-calls"] == 5
+        for backup_dir in (due_dir, forced_dir):
+            assert json.loads((backup_dir / MANIFEST_FILE).read_text())["kind"] == "full"
+
+    async def test_unfinished_backup_resumed_first(self, tmp_path, clock):
+        _fill_dispatch(5)
+        backup_dir, _ = await incremental_backup(tmp_path, ["dispatch-calls"], now=T0)
+        manifest = json.loads((backup_dir / MANIFEST_FILE).read_text())
+        manifest["containers"]["dispatch-calls"].update(
+            count=0, bytes=0, continuation=None, complete=False
+        )
+        (backup_dir / MANIFEST_FILE).write_text(json.dumps(manifest))
+
+        clock.ts = START_TS + 1000
+        resumed_dir, counts = await incremental_backup(tmp_path, now=T0 + timedelta(days=1))
+
+        assert resumed_dir == backup_dir
+        assert counts == {"dispatch-calls": 5}
+        # The high-water mark stays at the original start, not the resume time
+        manifest = json.loads((backup_dir / MANIFEST_FILE).read_text())
+        assert manifest["containers"]["dispatch-calls"]["high_water"] == START_TS - TS_CLOCK_SKEW
+        assert len(json.loads((tmp_path / CHAIN_FILE).read_text())) == 1
+
+
+class TestCompact:
+    async def _chain(self, tmp_path, clock):
+        _fill_dispatch(100)
+        full_dir, _ = await incremental_backup(tmp_path, ["dispatch-calls"], now=T0)
+        _touch("call-000005", 1_770_001_000, nature="Fire")
+        clock.ts = 1_770_001_500
+        await incremental_backup(tmp_path, now=T0 + timedelta(days=1))
+        _touch("call-000005", 1_770_002_000, nature="Rescue")
+        _touch("call-new", 1_770_002_001)
+        clock.ts = 1_770_002_500
+        last_dir, _ = await incremental_backup(tmp_path, now=T0 + timedelta(days=2))
+        return full_dir, last_dir
+
+    async def test_latest_snapshot(self, tmp_path, clock):
+        _, last_dir = await self._chain(tmp_path, clock)
+
+        snapshot, counts = compact_chain(tmp_path)
+
+        assert snapshot == tmp_path / f"{last_dir.name}_snapshot"
+        assert counts == {"dispatch-calls": 101}
+        docs = {d["id"]: d for d in _lines(snapshot / "dispatch-calls.ndjson.gz")}
+        assert len(docs) == 101
+        assert docs["call-000005"]["nature"] == "Rescue"
+        manifest = json.loads((snapshot / MANIFEST_FILE).read_text())
+        assert len(manifest["compacted_from"]) == 3
+        assert manifest["containers"]["dispatch-calls"]["high_water"] == (
+            1_770_002_500 - TS_CLOCK_SKEW
+        )
+
+    async def test_point_in_time_restores(self, tmp_path, clock):
+        await self._chain(tmp_path, clock)
+        chain = json.loads((tmp_path / CHAIN_FILE).read_text())
+
+        snapshot, counts = compact_chain(tmp_path, until=chain[1]["dir"])
+        DispatchStore._memory.clear()
+        await restore_backup(snapshot)
+
+        assert counts == {"dispatch-calls": 100}
+        assert DispatchStore._memory["call-000005"]["nature"] == "Fire"
+        assert "call-new" not in DispatchStore._memory
+
+    async def test_unknown_backup(self, tmp_path, clock):
+        await self._chain(tmp_path, clock)
+
+        with pytest.raises(ValueError, match="No backup"):
+            compact_chain(tmp_path, until="cosmos_19990101_000000")
+
+
+def _subclasses(cls: type) -> set[type]:
+    found = set()
+    for sub in cls.__subclasses__():
+        found |= {sub, *_subclasses(sub)}
+    return found
+
+
+def test_every_cosmos_store_container_is_backed_up():
+    for path in CONTAINER_STORES.values():
+        importlib.import_module(path.partition(":")[0])
+    importlib.import_module("sjifire.ops.chat.turn_lock")
+
+    containers = {cls._container_name for cls in _subclasses(CosmosStore)}
+
+    assert containers <= set(CONTAINER_STORES)
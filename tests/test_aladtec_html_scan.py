@@ -0,0 +1,116 @@
+"""Tests for sjifire.aladtec.html_scan (lightweight Aladtec HTML parsing).
+
+Golden files under ``tests/fixtures/aladtec`` were produced by the original
+BeautifulSoup-based parsers; the scanner must reproduce them exactly.
+"""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from sjifire.aladtec.html_scan import parse_html, scan_day_html, scan_member_detail
+from sjifire.aladtec.member_scraper import AladtecMemberScraper
+from sjifire.aladtec.schedule_scraper import AladtecScheduleScraper
+
+FIXTURES = Path(__file__).parent / "fixtures" / "aladtec"
+
+
+def _load(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text())
+
+
+class TestScheduleGolden:
+    """A month of day HTML parses to the same DaySchedules as the BeautifulSoup parser."""
+
+    @pytest.mark.parametrize("date_str", sorted(_load("schedule_month.json")))
+    def test_day_matches_golden(self, date_str, mock_env_vars):
+        html = _load("schedule_month.json")[date_str]
+        expected = _load("schedule_month_golden.json")[date_str]
+
+        day = AladtecScheduleScraper().parse_day_html(date_str, html)
+
+        assert day.platoon == expected["platoon"]
+        actual = [{**asdict(e), "date": e.date.isoformat()} for e in day.entries]
+        assert actual == expected["entries"]
+
+    def test_golden_covers_skipped_rows(self):
+        month = _load("schedule_month.json")
+        html = "".join(month.values())
+        assert "calendar-event ust" in html
+        assert "open-shift" in html
+        total_rows = html.count('class="calendar-event')
+        golden_rows = sum(len(d["entries"]) for d in _load("schedule_month_golden.json").values())
+        assert 0 < golden_rows < total_rows
+
+
+class TestMemberDetailGolden:
+    """Member detail pages match the BeautifulSoup-based extractors."""
+
+    @pytest.mark.parametrize("page", sorted(_load("member_details.json")))
+    def test_matches_golden(self, page):
+        html = _load("member_details.json")[page]
+        assert asdict(scan_member_detail(html)) == _load("member_details_golden.json")[page]
+
+    @pytest.mark.parametrize("page", sorted(_load("member_details.json")))
+    def test_matches_beautifulsoup_extractors(self, page, mock_env_vars):
+        html = _load("member_details.json")[page]
+        scraper = AladtecMemberScraper(domain="sjifire.org")
+        soup = BeautifulSoup(html, "html.parser")
+
+        detail = scraper._parse_member_detail(html)
+
+        assert detail.positions == scraper._extract_list_items(soup, "Positions:")
+        assert detail.schedules == scraper._extract_list_items(soup, "Schedules:")
+        assert detail.username == scraper._extract_username(soup)
+
+
+class TestParseHtml:
+    """Tree-building rules that mirror BeautifulSoup's html.parser builder."""
+
+    def test_void_elements_do_not_nest(self):
+        root = parse_html("<td>a<br>b<input name=x>c</td>")
+        td = root.find("td")
+        assert [c if isinstance(c, str) else c.tag for c in td.children] == [
+            "a",
+            "br",
+            "b",
+            "input",
+            "c",
+        ]
+
+    def test_stray_end_tag_is_ignored(self):
+        root = parse_html("<div class='a'>x</span>y</div>")
+        assert root.find("div").text() == "xy"
+
+    def test_end_tag_closes_unclosed_children(self):
+        root = parse_html("<tr><td>one<td>two</tr><p>after</p>")
+        assert root.find("tr").text() == "onetwo"
+        assert root.find("p").parent is root
+
+    def test_attributes_are_unescaped(self):
+        root = parse_html('<tr class="calendar-event" title="A&lt;br/&gt;B &amp; C">')
+        row = root.find("tr", class_="calendar-event")
+        assert row.get("title") == "A<br/>B & C"
+
+    def test_comments_split_strings(self):
+        root = parse_html("<b> a <!-- note --> b </b>")
+        assert list(root.find("b").strings()) == [" a ", " b "]
+        assert root.find("b").text() == "ab"
+
+    def test_gt_inside_quoted_attribute(self):
+        root = parse_html('<tr class="calendar-event" title="06:00 -> 18:00"><td>x</td></tr>')
+        assert root.find("tr").get("title") == "06:00 -> 18:00"
+        assert root.find("td").text() == "x"
+
+    def test_script_content_is_raw(self):
+        root = parse_html("<script>if (a < b) { x('<div>') }</script><div class='z'>ok</div>")
+        assert root.find(class_="z").text() == "ok"
+        assert root.find("div").text() == "ok"
+
+    def test_empty_day(self):
+        day = scan_day_html("")
+        assert day.platoon == ""
+        assert day.rows == []
@@ -1,12 +1,14 @@
 """Tests for sjifire.entra.aladtec_import."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from sjifire.aladtec.models import Member
-from sjifire.entra.aladtec_import import AladtecImporter, ImportResult
+from sjifire.core.msgraph_client import GRAPH_BATCH_SIZE
+from sjifire.entra.aladtec_import import OPERATION_LIMITS, AladtecImporter, ImportResult
 from sjifire.entra.users import EntraUser
 
 
@@ -1503,3 +1505,135 @@ class TestUsernameUPNMatching:
         # Should still match by name
         assert len(result.created) == 0
         assert len(result.updated) + len(result.skipped) == 1
+
+
+class TestConcurrentImport:
+    """import_members runs members concurrently with deterministic results."""
+
+    @staticmethod
+    def _members(count: int) -> list[Member]:
+        return [
+            Member(
+                id=str(i),
+                first_name="Member",
+                last_name=f"N{i}",
+                email=f"m{i}@testfire.org",
+                status="Active",
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _existing(members: list[Member]) -> list[EntraUser]:
+        # Company name differs, so every member needs an update
+        return [
+            EntraUser(
+                id=f"u{m.id}",
+                display_name=m.display_name,
+                first_name=m.first_name,
+                last_name=m.last_name,
+                email=m.email,
+                upn=m.email,
+                employee_id=None,
+                account_enabled=True,
+            )
+            for m in members
+        ]
+
+    async def test_results_keep_input_order(self, importer):
+        """Members that finish first don't jump ahead in the result lists."""
+        members = self._members(10)
+        importer.user_manager.get_users = AsyncMock(return_value=self._existing(members))
+
+        async def slow_update(user_id, **kwargs):
+            # Earlier members finish last
+            await asyncio.sleep((10 - int(user_id[1:])) * 0.002)
+            if user_id == "u3":
+                raise RuntimeError("boom")
+            return True
+
+        importer.user_manager.update_user = AsyncMock(side_effect=slow_update)
+
+        result = await importer.import_members(members)
+
+        assert [u["email"] for u in result.updated] == [
+            m.email for m in members if m.email != "m3@testfire.org"
+        ]
+        assert result.errors == [{"member": "Member N3", "error": "boom"}]
+
+    async def test_operation_limit_caps_graph_calls(self, importer):
+        """No more than OPERATION_LIMITS["create"] creates are in flight at once."""
+        in_flight = peak = 0
+
+        async def create_user(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return EntraUser(
+                id=kwargs["upn"],
+                display_name=kwargs["display_name"],
+                first_name=kwargs["first_name"],
+                last_name=kwargs["last_name"],
+                email=kwargs["email"],
+                upn=kwargs["upn"],
+                employee_id=None,
+            )
+
+        importer.user_manager.get_users = AsyncMock(return_value=[])
+        importer.user_manager.create_user = AsyncMock(side_effect=create_user)
+
+        result = await importer.import_members(self._members(12))
+
+        assert len(result.created) == 12
+        assert peak == OPERATION_LIMITS["create"]
+        assert importer._limits == {}
+
+    async def test_concurrent_updates_fill_a_graph_batch(self, importer):
+        """Enough updates are issued at once to fill one $batch, and no more."""
+        members = self._members(2 * GRAPH_BATCH_SIZE)
+        importer.user_manager.get_users = AsyncMock(return_value=self._existing(members))
+        in_flight = peak = 0
+
+        async def update_user(user_id, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return True
+
+        importer.user_manager.update_user = AsyncMock(side_effect=update_user)
+
+        result = await importer.import_members(members)
+
+        assert len(result.updated) == 2 * GRAPH_BATCH_SIZE
+        assert peak == GRAPH_BATCH_SIZE
+
+    async def test_updates_batched_only_when_concurrent(self, importer):
+        """Concurrent live runs open a $batch session; serial and dry runs don't."""
+        members = self._members(2)
+        importer.user_manager.get_users = AsyncMock(return_value=self._existing(members))
+        importer.user_manager.update_user = AsyncMock(return_value=True)
+        batch_updates = importer.user_manager.batch_updates
+
+        await importer.import_members(members, dry_run=True)
+        batch_updates.assert_not_called()
+
+        await importer.import_members(members)
+        batch_updates.assert_called_once_with(importer.batch_client)
+
+        batch_updates.reset_mock()
+        importer.concurrency = 1
+        result = await importer.import_members(members)
+        batch_updates.assert_not_called()
+        assert len(result.updated) == 2
+
+    def test_extend_appends_in_order(self):
+        first = ImportResult(created=[{"member": "A"}], errors=[{"member": "B"}])
+        first.extend(ImportResult(created=[{"member": "C"}], skipped=[{"member": "D"}]))
+
+        assert first.created == [{"member": "A"}, {"member": "C"}]
+        assert first.skipped == [{"member": "D"}]
+        assert first.total_processed == 4
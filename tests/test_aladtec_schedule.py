@@ -8,6 +8,12 @@ import httpx
 import pytest
 import respx
 
+from sjifire.aladtec.schedule_cache import (
+    ScheduleCache,
+    ScheduleDiff,
+    load_schedule_diff,
+    save_schedule_diff,
+)
 from sjifire.aladtec.schedule_scraper import AladtecScheduleScraper, DaySchedule, ScheduleEntry
 
 
@@ -641,3 +647,173 @@ class TestAladtecScheduleScraperMonthsAhead:
 
                 # Should handle crossing into 2027
                 mock_range.assert_called_once()
+
+
+def _day_html(name: str) -> str:
+    """Minimal day HTML with one filled entry for ``name``."""
+    return (
+        '<div class="shift-label-display">A</div><div class="sch_entry">'
+        '<div class="calendar-event-header">S31</div>'
+        f'<tr class="calendar-event" title="{name}&lt;br/&gt;&lt;p&gt;S31 / Captain'
+        '&lt;br/&gt;01 Feb 18:00 - 02 Feb 18:00&lt;/p&gt;"><td></td></tr></div>'
+    )
+
+
+class TestScheduleCache:
+    """Tests for the content-addressed schedule day cache."""
+
+    def test_put_reports_change_and_dedups_blobs(self, tmp_path):
+        cache = ScheduleCache(tmp_path)
+        assert cache.put("2026-02-01", "<p>a</p>") is True
+        assert cache.put("2026-02-01", "<p>a</p>") is False
+        assert cache.put("2026-02-02", "<p>a</p>") is True
+        assert cache.hash_for("2026-02-01") == cache.hash_for("2026-02-02")
+        assert len(list((cache.root / "days").glob("*/*.html"))) == 1
+        assert cache.put("2026-02-01", "<p>b</p>") is True
+        assert cache.get("2026-02-01") == "<p>b</p>"
+
+    def test_save_and_reload(self, tmp_path):
+        cache = ScheduleCache(tmp_path)
+        cache.put("2026-01-05", "<p>x</p>")
+        cache.mark_month_fetched(date(2026, 1, 1), date(2026, 2, 3))
+        cache.save(today=date(2026, 2, 3))
+
+        reloaded = ScheduleCache(tmp_path)
+        assert reloaded.get("2026-01-05") == "<p>x</p>"
+        assert reloaded.is_month_final(date(2026, 1, 1))
+
+    def test_month_not_final_when_fetched_before_it_ended(self, tmp_path):
+        cache = ScheduleCache(tmp_path)
+        cache.put("2026-01-05", "<p>x</p>")
+        cache.mark_month_fetched(date(2026, 1, 1), date(2026, 1, 31))
+        assert not cache.is_month_final(date(2026, 1, 1))
+
+    def test_save_prunes_unreferenced_and_expired(self, tmp_path):
+        cache = ScheduleCache(tmp_path)
+        cache.put("2024-01-01", "<p>old</p>")
+        cache.put("2026-02-01", "<p>v1</p>")
+        cache.put("2026-02-01", "<p>v2</p>")
+        cache.save(today=date(2026, 2, 10))
+
+        blobs = [b.read_text() for b in (cache.root / "days").glob("*/*.html")]
+        assert blobs == ["<p>v2</p>"]
+        assert cache.hash_for("2024-01-01") is None
+
+    def test_unreadable_index_is_ignored(self, tmp_path):
+        (tmp_path / "schedule").mkdir()
+        (tmp_path / "schedule" / "index.json").write_text("{not json")
+        assert ScheduleCache(tmp_path).get("2026-02-01") is None
+
+    def test_diff_round_trip(self, tmp_path):
+        diff = ScheduleDiff(added=["2026-02-02"], changed=["2026-02-01"], unchanged=3)
+        save_schedule_diff(diff, tmp_path / "diff.json")
+        loaded = load_schedule_diff(tmp_path / "diff.json")
+        assert loaded == diff
+        assert loaded.has_changes
+        assert loaded.changed_dates == ["2026-02-01", "2026-02-02"]
+        assert str(loaded) == "1 added, 1 changed, 0 removed, 3 unchanged"
+
+
+class TestGetScheduleRangeCached:
+    """Tests for get_schedule_range with a schedule cache."""
+
+    aladtec_url = "https://test.aladtec.com"
+
+    def _serve(self, days: dict[str, str]):
+        """Mock Aladtec returning ``days`` from the requested start date onward."""
+        starts: list[str] = []
+
+        def respond(request):
+            start = request.url.params["ajax_start_date"]
+            starts.append(start)
+            window = {d: html for d, html in days.items() if d >= start}
+            return httpx.Response(200, json={"return_data": json.dumps(window)})
+
+        respx.get(f"{self.aladtec_url}/").mock(return_value=httpx.Response(200))
+        respx.post(f"{self.aladtec_url}/index.php").mock(return_value=httpx.Response(200))
+        respx.get(f"{self.aladtec_url}/index.php").mock(side_effect=respond)
+        return starts
+
+    def _scrape(self, tmp_path, today: date, start: date, end: date, *, commit: bool = True):
+        with (
+            patch("sjifire.aladtec.schedule_scraper.date") as mock_date,
+            AladtecScheduleScraper(cache_dir=tmp_path) as scraper,
+        ):
+            mock_date.today.return_value = today
+            mock_date.side_effect = date
+            schedules = scraper.get_schedule_range(start, end)
+            if commit:
+                scraper.commit_cache()
+        return schedules, scraper.last_diff
+
+    @respx.mock
+    def test_ended_month_served_from_cache(self, mock_env_vars, tmp_path):
+        jan = {f"2026-01-{d:02d}": _day_html("Doe, John") for d in range(1, 32)}
+        starts = self._serve(jan)
+
+        first, diff = self._scrape(tmp_path, date(2026, 2, 10), date(2026, 1, 1), date(2026, 1, 31))
+        assert len(first) == 31
+        assert len(diff.added) == 31
+        requests_after_first = len(starts)
+
+        second, diff = self._scrape(
+            tmp_path, date(2026, 2, 11), date(2026, 1, 1), date(2026, 1, 31)
+        )
+        assert len(starts) == requests_after_first
+        assert [s.date for s in second] == [s.date for s in first]
+        assert not diff.has_changes
+
+    @respx.mock
+    def test_current_month_fetched_from_today_with_diff(self, mock_env_vars, tmp_path):
+        feb = {f"2026-02-{d:02d}": _day_html("Doe, John") for d in range(1, 29)}
+        starts = self._serve(feb)
+        self._scrape(tmp_path, date(2026, 2, 10), date(2026, 2, 1), date(2026, 2, 28))
+        assert starts == ["2026-02-01"]
+
+        feb["2026-02-12"] = _day_html("Smith, Jane")
+        del feb["2026-02-20"]
+        starts.clear()
+        schedules, diff = self._scrape(
+            tmp_path, date(2026, 2, 11), date(2026, 2, 1), date(2026, 2, 28)
+        )
+
+        assert starts == ["2026-02-11"]
+        assert len(schedules) == 27  # past days from cache + fetched window
+        assert diff.changed == ["2026-02-12"]
+        assert diff.removed == ["2026-02-20"]
+        assert diff.added == []
+        assert diff.unchanged == 16
+        assert diff.names == ["Doe, John", "Smith, Jane"]
+
+    @respx.mock
+    def test_empty_fetch_keeps_cached_days(self, mock_env_vars, tmp_path):
+        feb = {f"2026-02-{d:02d}": _day_html("Doe, John") for d in range(1, 29)}
+        self._serve(feb)
+        self._scrape(tmp_path, date(2026, 2, 1), date(2026, 2, 1), date(2026, 2, 28))
+
+        feb.clear()
+        schedules, diff = self._scrape(
+            tmp_path, date(2026, 2, 1), date(2026, 2, 1), date(2026, 2, 28)
+        )
+        assert len(schedules) == 28
+        assert not diff.has_changes
+
+    @respx.mock
+    def test_uncommitted_scrape_keeps_previous_snapshot(self, mock_env_vars, tmp_path):
+        """A dry run (no commit) must not consume the changes it saw."""
+        feb = {f"2026-02-{d:02d}": _day_html("Doe, John") for d in range(1, 29)}
+        self._serve(feb)
+        self._scrape(tmp_path, date(2026, 2, 10), date(2026, 2, 1), date(2026, 2, 28))
+
+        feb["2026-02-12"] = _day_html("Smith, Jane")
+        _, dry_diff = self._scrape(
+            tmp_path, date(2026, 2, 11), date(2026, 2, 1), date(2026, 2, 28), commit=False
+        )
+        _, diff = self._scrape(tmp_path, date(2026, 2, 11), date(2026, 2, 1), date(2026, 2, 28))
+
+        assert dry_diff.changed == ["2026-02-12"]
+        assert diff.changed == ["2026-02-12"]
+
+    def test_no_cache_dir_disables_diff(self, mock_env_vars, monkeypatch):
+        monkeypatch.delenv("ALADTEC_CACHE_DIR", raising=False)
+        assert AladtecScheduleScraper()._cache is None
@@ -464,6 +464,109 @@ class TestEnrichMemberDetails:
         assert len(result) == 1
 
 
+class TestEnrichMemberDetailsConcurrentAndCached:
+    """Tests for the thread-pool fetch path and per-user detail cache."""
+
+    HTML = """
+    <table>
+        <tr><td>Positions:</td><td><ul><li>Firefighter</li></ul></td></tr>
+        <tr><td>Schedules:</td><td><ul><li>A Shift</li></ul></td></tr>
+    </table>
+    """
+
+    @pytest.fixture(autouse=True)
+    def _no_throttle(self, monkeypatch):
+        monkeypatch.setattr("sjifire.aladtec.member_scraper.ENRICHMENT_THROTTLE_DELAY", 0)
+
+    def _members(self, count):
+        from sjifire.aladtec.models import Member
+
+        return [Member(id=str(i), first_name=f"F{i}", last_name=f"L{i}") for i in range(count)]
+
+    def _response(self, status, text="", headers=None):
+        import httpx
+
+        return httpx.Response(status, text=text, headers=headers or {})
+
+    def test_results_applied_in_member_order(self, mock_env_vars):
+        from unittest.mock import MagicMock, patch
+
+        scraper = AladtecMemberScraper()
+        scraper.client = MagicMock()
+        members = self._members(8)
+        user_map = {f"L{i}, F{i}": str(100 + i) for i in range(8)}
+
+        def fake_get(url, params, **kwargs):
+            uid = params["target_user_id"]
+            html = self.HTML.replace("Firefighter", f"Pos-{uid}")
+            return self._response(200, html)
+
+        scraper.client.get.side_effect = fake_get
+        with patch.object(scraper, "get_user_id_map", return_value=user_map):
+            scraper.enrich_member_details(members)
+
+        assert [m.positions for m in members] == [[f"Pos-{100 + i}"] for i in range(8)]
+        assert scraper.request_count == 8
+
+    def test_cache_sends_validators_and_reuses_on_304(self, mock_env_vars, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        user_map = {"L0, F0": "7"}
+
+        first = AladtecMemberScraper(cache_dir=tmp_path)
+        first.client = MagicMock()
+        first.client.get.return_value = self._response(200, self.HTML, {"ETag": '"v1"'})
+        with patch.object(first, "get_user_id_map", return_value=user_map):
+            first.enrich_member_details(self._members(1))
+        assert (tmp_path / "member-details.json").exists()
+
+        second = AladtecMemberScraper(cache_dir=tmp_path)
+        second.client = MagicMock()
+        second.client.get.return_value = self._response(304)
+        members = self._members(1)
+        with (
+            patch.object(second, "get_user_id_map", return_value=user_map),
+            patch.object(second, "_parse_member_detail") as parse,
+        ):
+            second.enrich_member_details(members)
+
+        parse.assert_not_called()
+        assert second.client.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert members[0].positions == ["Firefighter"]
+        assert members[0].schedules == ["A Shift"]
+
+    def test_unchanged_body_skips_parse(self, mock_env_vars, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        user_map = {"L0, F0": "7"}
+        for expected_parses in (1, 0):
+            scraper = AladtecMemberScraper(cache_dir=tmp_path)
+            scraper.client = MagicMock()
+            scraper.client.get.return_value = self._response(200, self.HTML)
+            members = self._members(1)
+            with (
+                patch.object(scraper, "get_user_id_map", return_value=user_map),
+                patch.object(
+                    scraper, "_parse_member_detail", wraps=scraper._parse_member_detail
+                ) as parse,
+            ):
+                scraper.enrich_member_details(members)
+            assert parse.call_count == expected_parses
+            assert members[0].positions == ["Firefighter"]
+
+    def test_corrupt_cache_is_ignored(self, mock_env_vars, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        (tmp_path / "member-details.json").write_text("{not json")
+        scraper = AladtecMemberScraper(cache_dir=tmp_path)
+        scraper.client = MagicMock()
+        scraper.client.get.return_value = self._response(200, self.HTML)
+        members = self._members(1)
+        with patch.object(scraper, "get_user_id_map", return_value={"L0, F0": "7"}):
+            scraper.enrich_member_details(members)
+        assert members[0].positions == ["Firefighter"]
+
+
 class TestExtractUsername:
     """Tests for _extract_username from member detail page."""
 
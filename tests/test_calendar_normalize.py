@@ -0,0 +1,88 @@
+"""Tests for calendar/normalize.py - event body normalization and hashing."""
+
+from sjifire.calendar.normalize import body_hash, extract_crew_data, normalize_body
+
+
+class TestExtractCrewData:
+    """Tests for extract_crew_data."""
+
+    def test_extracts_json(self):
+        html = '<h3>On Duty</h3><!-- CREW_DATA:{"version": 1} --><p>Footer</p>'
+        assert extract_crew_data(html) == '{"version": 1}'
+
+    def test_none_without_marker(self):
+        assert extract_crew_data("<h3>On Duty</h3><!-- a comment -->") is None
+
+
+class TestNormalizeBody:
+    """Tests for normalize_body."""
+
+    def test_uses_json_when_present(self):
+        """When CREW_DATA JSON is embedded, returns just the JSON string."""
+        payload = '{"version": 1, "shift_change_hour": 18}'
+        html = f"<h3>From 1800</h3><!-- CREW_DATA:{payload} --><p>Footer</p>"
+        assert normalize_body(html) == payload
+
+    def test_comment_padding_ignored(self):
+        html_a = '<!-- CREW_DATA:{"version": 1} -->'
+        html_b = '<!--CREW_DATA:{"version": 1}\r\n-->'
+        assert normalize_body(html_a) == normalize_body(html_b)
+
+    def test_ignores_html_changes_when_json_matches(self):
+        """Cosmetic HTML changes are ignored when JSON is identical."""
+        payload = '{"version": 1, "from_platoon": "A"}'
+        html_v1 = f"<h3>On Duty</h3><!-- CREW_DATA:{payload} --><p>Footer v1</p>"
+        html_v2 = f'<div class="new"><h3>On Duty</h3></div><!-- CREW_DATA:{payload} --><p>v2</p>'
+        assert normalize_body(html_v1) == normalize_body(html_v2)
+
+    def test_detects_json_data_change(self):
+        html_a = '<h3>On Duty</h3><!-- CREW_DATA:{"version": 1, "from_platoon": "A"} -->'
+        html_b = '<h3>On Duty</h3><!-- CREW_DATA:{"version": 1, "from_platoon": "B"} -->'
+        assert normalize_body(html_a) != normalize_body(html_b)
+
+    def test_falls_back_to_text_for_legacy_html(self):
+        html = "<h3>On Duty</h3><p>  Some   crew  info  </p>"
+        assert normalize_body(html) == "On Duty Some crew info"
+
+    def test_adjacent_tags_become_spaces(self):
+        assert normalize_body("Position: Captain<br>Section: S31") == (
+            "Position: Captain Section: S31"
+        )
+
+    def test_handles_exchange_html_format(self):
+        """Exchange's HTML conversion of a plain-text body matches the original."""
+        html = (
+            '<html><head><meta http-equiv="Content-Type" content="text/html">\r\n'
+            "<style>p { margin: 0 }</style></head>\r\n<body>\r\n"
+            '<div class="PlainText">Position: Captain<br>\r\n'
+            "Section: S31</div>\r\n</body></html>"
+        )
+        assert normalize_body(html) == normalize_body("Position: Captain\nSection: S31")
+
+    def test_drops_comments_and_scripts(self):
+        html = "<p>Crew</p><!-- note --><script>var x = 1;</script>"
+        assert normalize_body(html) == "Crew"
+
+    def test_unescapes_entities(self):
+        assert normalize_body("<p>Fire &amp; Rescue&nbsp;Ops</p>") == "Fire & Rescue Ops"
+
+    def test_plain_text_whitespace_collapsed(self):
+        assert normalize_body("Hello\n\n  World\t\tTest") == "Hello World Test"
+
+    def test_empty_string(self):
+        assert normalize_body("") == ""
+
+
+class TestBodyHash:
+    """Tests for body_hash."""
+
+    def test_stable_across_cosmetic_changes(self):
+        assert body_hash("<p>Crew   Alpha</p>") == body_hash("Crew Alpha")
+
+    def test_differs_on_content_change(self):
+        assert body_hash("Crew Alpha") != body_hash("Crew Bravo")
+
+    def test_is_sha256_hex(self):
+        digest = body_hash("Crew Alpha")
+        assert len(digest) == 64
+        assert int(digest, 16) >= 0
@@ -6,44 +6,30 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from sjifire.aladtec.schedule_scraper import DaySchedule, ScheduleEntry
-from sjifire.calendar.duty_sync import DutyCalendarSync, normalize_html_for_comparison
+from sjifire.calendar.duty_sync import (
+    DUTY_BODY_HASH_PROPERTY_ID,
+    DutyCalendarSync,
+    ExistingDutyEvent,
+)
 from sjifire.calendar.models import AllDayDutyEvent, CrewMember
+from sjifire.calendar.normalize import body_hash
+from sjifire.core.msgraph_client import GraphResponse
 from sjifire.core.schedule import is_filled_entry, should_exclude_section
 
 
-class TestNormalizeHtmlForComparison:
-    """Tests for normalize_html_for_comparison."""
+def _fake_batch_client(statuses: list[int] | None = None) -> MagicMock:
+    """Batch client mock; ``statuses`` are returned in request order (default 200/201)."""
+    client = MagicMock()
 
-    def test_uses_json_when_present(self):
-        """When CREW_DATA JSON is embedded, returns just the JSON string."""
-        json_payload = '{"version": 1, "shift_change_hour": 18}'
-        html = f"<h3>From 1800</h3><!-- CREW_DATA:{json_payload} --><p>Footer</p>"
-        assert normalize_html_for_comparison(html) == json_payload
-
-    def test_ignores_html_changes_when_json_matches(self):
-        """Cosmetic HTML changes are ignored when JSON is identical."""
-        json_payload = '{"version": 1, "from_platoon": "A"}'
-        html_v1 = f"<h3>On Duty</h3><!-- CREW_DATA:{json_payload} --><p>Footer v1</p>"
-        html_v2 = f'<div class="new"><h3>On Duty</h3></div><!-- CREW_DATA:{json_payload} --><p>Footer v2</p>'
-        assert normalize_html_for_comparison(html_v1) == normalize_html_for_comparison(html_v2)
-
-    def test_detects_json_data_change(self):
-        """Different JSON data produces different comparison values."""
-        html_a = '<h3>On Duty</h3><!-- CREW_DATA:{"version": 1, "from_platoon": "A"} -->'
-        html_b = '<h3>On Duty</h3><!-- CREW_DATA:{"version": 1, "from_platoon": "B"} -->'
-        assert normalize_html_for_comparison(html_a) != normalize_html_for_comparison(html_b)
-
-    def test_falls_back_to_text_for_legacy_html(self):
-        """Without JSON comment, falls back to text extraction."""
-        html = "<h3>On Duty</h3><p>  Some   crew  info  </p>"
-        result = normalize_html_for_comparison(html)
-        assert result == "On Duty Some crew info"
+    async def execute(requests):
+        codes = statuses or [201 if r.method == "POST" else 200 for r in requests]
+        return [
+            GraphResponse(code, {"id": f"new-{i}"} if code == 201 else {})
+            for i, code in enumerate(codes)
+        ]
 
-    def test_legacy_ignores_whitespace_differences(self):
-        """Legacy fallback normalizes whitespace."""
-        html_a = "<p>Crew Alpha</p>"
-        html_b = "<p>Crew   Alpha</p>"
-        assert normalize_html_for_comparison(html_a) == normalize_html_for_comparison(html_b)
+    client.execute = AsyncMock(side_effect=execute)
+    return client
 
 
 class TestShouldExcludeSection:
@@ -536,27 +522,46 @@ class TestDutyCalendarSyncGraphAPI:
 
     @pytest.mark.asyncio
     async def test_get_existing_events_returns_dict(self, calendar_sync):
-        """Get existing events returns date to (ID, body) mapping."""
+        """Get existing events maps date to (ID, stored body hash) without bodies."""
         mock_event = MagicMock()
         mock_event.id = "event-123"
         mock_event.start = MagicMock()
         mock_event.start.date_time = "2026-02-01T00:00:00"
-        mock_event.body = MagicMock()
-        mock_event.body.content = "<html>test body</html>"
+        mock_event.single_value_extended_properties = [MagicMock(value="hash-1")]
 
         mock_result = MagicMock()
         mock_result.value = [mock_event]
+        mock_result.odata_next_link = None
 
-        calendar_sync.client.users.by_user_id.return_value.calendar_view.get = AsyncMock(
-            return_value=mock_result
-        )
+        calendar_view = calendar_sync.client.users.by_user_id.return_value.calendar_view
+        calendar_view.get = AsyncMock(return_value=mock_result)
 
         result = await calendar_sync.get_existing_events(date(2026, 2, 1), date(2026, 2, 28))
 
-        assert date(2026, 2, 1) in result
-        event_id, body = result[date(2026, 2, 1)]
-        assert event_id == "event-123"
-        assert body == "<html>test body</html>"
+        assert result == {date(2026, 2, 1): ExistingDutyEvent("event-123", "hash-1")}
+        query = calendar_view.get.call_args.kwargs["request_configuration"].query_parameters
+        assert "body" not in query.select
+
+    @pytest.mark.asyncio
+    async def test_get_existing_events_follows_next_link(self, calendar_sync):
+        """Pages beyond the first are followed via @odata.nextLink."""
+
+        def page(event_id: str, day: int, next_link: str | None) -> MagicMock:
+            event = MagicMock(id=event_id, single_value_extended_properties=None)
+            event.start.date_time = f"2026-02-{day:02d}T00:00:00"
+            return MagicMock(value=[event], odata_next_link=next_link)
+
+        calendar_view = calendar_sync.client.users.by_user_id.return_value.calendar_view
+        calendar_view.get = AsyncMock(return_value=page("e1", 1, "https://next"))
+        calendar_view.with_url.return_value.get = AsyncMock(return_value=page("e2", 2, None))
+
+        result = await calendar_sync.get_existing_events(date(2026, 2, 1), date(2026, 2, 28))
+
+        assert result == {
+            date(2026, 2, 1): ExistingDutyEvent("e1", None),
+            date(2026, 2, 2): ExistingDutyEvent("e2", None),
+        }
+        calendar_view.with_url.assert_called_once_with("https://next")
 
     @pytest.mark.asyncio
     async def test_get_existing_events_handles_error(self, calendar_sync):
@@ -676,33 +681,21 @@ class TestDutyCalendarSyncBatchOperations:
     @pytest.mark.asyncio
     async def test_create_events_batch_success(self, calendar_sync, sample_events):
         """Batch create returns success count."""
-        mock_result = MagicMock()
-        mock_result.id = "new-id"
-
-        calendar_sync.client.users.by_user_id.return_value.events.post = AsyncMock(
-            return_value=mock_result
-        )
+        calendar_sync._batch_client = _fake_batch_client()
 
         count, errors = await calendar_sync.create_events_batch(sample_events)
 
         assert count == 5
         assert errors == []
+        calendar_sync._batch_client.execute.assert_called_once()
+        requests = calendar_sync._batch_client.execute.call_args[0][0]
+        assert {r.url for r in requests} == {f"/users/{calendar_sync.mailbox}/events"}
+        assert sample_events[0].event_id == "new-0"
 
     @pytest.mark.asyncio
     async def test_create_events_batch_partial_failure(self, calendar_sync, sample_events):
         """Batch create handles partial failures."""
-        call_count = 0
-
-        async def mock_post(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 3:
-                raise Exception("API Error")
-            mock_result = MagicMock()
-            mock_result.id = f"id-{call_count}"
-            return mock_result
-
-        calendar_sync.client.users.by_user_id.return_value.events.post = mock_post
+        calendar_sync._batch_client = _fake_batch_client([201, 201, 500, 201, 201])
 
         count, errors = await calendar_sync.create_events_batch(sample_events)
 
@@ -720,7 +713,7 @@ class TestDutyCalendarSyncBatchOperations:
     @pytest.mark.asyncio
     async def test_delete_events_batch_success(self, calendar_sync):
         """Batch delete returns success count."""
-        calendar_sync.client.users.by_user_id.return_value.events.by_event_id.return_value.delete = AsyncMock()
+        calendar_sync._batch_client = _fake_batch_client([204, 204, 404])
 
         events_to_delete = {
             date(2026, 2, 1): "id-1",
@@ -730,8 +723,11 @@ class TestDutyCalendarSyncBatchOperations:
 
         count, errors = await calendar_sync.delete_events_batch(events_to_delete)
 
-        assert count == 3
+        assert count == 3  # 404 means already deleted
         assert errors == []
+        requests = calendar_sync._batch_client.execute.call_args[0][0]
+        assert [r.method for r in requests] == ["DELETE"] * 3
+        assert requests[0].url.endswith("/events/id-1")
 
     @pytest.mark.asyncio
     async def test_delete_events_batch_empty(self, calendar_sync):
@@ -800,8 +796,8 @@ class TestDutyCalendarSyncSyncEvents:
         # All events exist with different body content
         calendar_sync.get_existing_events = AsyncMock(
             return_value={
-                date(2026, 2, 1): ("id-1", "<html>old body 1</html>"),
-                date(2026, 2, 2): ("id-2", "<html>old body 2</html>"),
+                date(2026, 2, 1): ExistingDutyEvent("id-1", body_hash("<html>old 1</html>")),
+                date(2026, 2, 2): ExistingDutyEvent("id-2", None),
             }
         )
         calendar_sync.create_events_batch = AsyncMock(return_value=(0, []))
@@ -819,8 +815,8 @@ class TestDutyCalendarSyncSyncEvents:
         # Mock existing events with same body as new events
         calendar_sync.get_existing_events = AsyncMock(
             return_value={
-                date(2026, 2, 1): ("id-1", sample_events[0].body_html),
-                date(2026, 2, 2): ("id-2", sample_events[1].body_html),
+                date(2026, 2, 1): ExistingDutyEvent("id-1", body_hash(sample_events[0].body_html)),
+                date(2026, 2, 2): ExistingDutyEvent("id-2", body_hash(sample_events[1].body_html)),
             }
         )
         calendar_sync.create_events_batch = AsyncMock(return_value=(0, []))
@@ -839,8 +835,8 @@ class TestDutyCalendarSyncSyncEvents:
         # Existing events have the SAME body as new events
         calendar_sync.get_existing_events = AsyncMock(
             return_value={
-                date(2026, 2, 1): ("id-1", sample_events[0].body_html),
-                date(2026, 2, 2): ("id-2", sample_events[1].body_html),
+                date(2026, 2, 1): ExistingDutyEvent("id-1", body_hash(sample_events[0].body_html)),
+                date(2026, 2, 2): ExistingDutyEvent("id-2", body_hash(sample_events[1].body_html)),
             }
         )
         calendar_sync.create_events_batch = AsyncMock(return_value=(0, []))
@@ -871,6 +867,125 @@ class TestDutyCalendarSyncSyncEvents:
         calendar_sync.update_events_batch.assert_not_called()
 
 
+class TestDutyCalendarSyncDelta:
+    """Tests for calendarView delta tracking of existing events."""
+
+    FEB = (date(2026, 2, 1), date(2026, 2, 28))
+
+    @pytest.fixture
+    def delta_sync(self, mock_env_vars, tmp_path):
+        """DutyCalendarSync for a user mailbox with delta state under tmp_path."""
+        with (
+            patch("sjifire.calendar.duty_sync.ClientSecretCredential"),
+            patch("sjifire.calendar.duty_sync.create_graph_client") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            sync = DutyCalendarSync("duty@sjifire.org", state_path=tmp_path / "delta.json")
+            sync.client = mock_client
+            sync._is_group = False
+            return sync
+
+    @staticmethod
+    def _event(event_id: str, day: int, body: str = "<p>crew</p>", subject: str = "On Duty"):
+        event = MagicMock(id=event_id, subject=subject, additional_data={})
+        event.start.date_time = f"2026-02-{day:02d}T00:00:00.0000000"
+        event.body.content = body
+        return event
+
+    @staticmethod
+    def _removed(event_id: str) -> MagicMock:
+        return MagicMock(id=event_id, subject=None, start=None, additional_data={"@removed": {}})
+
+    @staticmethod
+    def _page(items, next_link=None, delta_link=None) -> MagicMock:
+        return MagicMock(value=items, odata_next_link=next_link, odata_delta_link=delta_link)
+
+    async def test_first_run_pages_and_stores_delta_link(self, delta_sync):
+        delta = delta_sync.client.users.by_user_id.return_value.calendar_view.delta
+        delta.get = AsyncMock(
+            return_value=self._page([self._event("e1", 1)], next_link="https://next")
+        )
+        delta.with_url.return_value.get = AsyncMock(
+            return_value=self._page(
+                [self._event("e2", 2), self._event("x", 3, subject="Staff meeting")],
+                delta_link="https://delta-1",
+            )
+        )
+
+        events = await delta_sync.get_existing_events(*self.FEB)
+
+        assert events == {
+            date(2026, 2, 1): ExistingDutyEvent("e1", body_hash("<p>crew</p>")),
+            date(2026, 2, 2): ExistingDutyEvent("e2", body_hash("<p>crew</p>")),
+        }
+        query = delta.get.call_args.kwargs["request_configuration"].query_parameters
+        assert query.start_date_time.startswith("2026-02-01T00:00:00")
+        assert "https://delta-1" in delta_sync.state_path.read_text()
+
+    async def test_next_run_applies_only_changes(self, delta_sync):
+        delta = delta_sync.client.users.by_user_id.return_value.calendar_view.delta
+        delta.get = AsyncMock(
+            return_value=self._page(
+                [self._event("e1", 1), self._event("e2", 2)], delta_link="https://delta-1"
+            )
+        )
+        delta.with_url.return_value.get = AsyncMock(return_value=self._page([]))
+        await delta_sync.get_existing_events(*self.FEB)
+
+        delta.get.reset_mock()
+        delta.with_url.reset_mock()
+        delta.with_url.return_value.get = AsyncMock(
+            return_value=self._page(
+                [self._removed("e1"), self._event("e2", 2, body="<p>new crew</p>")],
+                delta_link="https://delta-2",
+            )
+        )
+
+        events = await delta_sync.get_existing_events(*self.FEB)
+
+        delta.get.assert_not_called()
+        delta.with_url.assert_called_once_with("https://delta-1")
+        assert events == {date(2026, 2, 2): ExistingDutyEvent("e2", body_hash("<p>new crew</p>"))}
+
+    async def test_failed_delta_falls_back_and_resets(self, delta_sync):
+        client = delta_sync.client.users.by_user_id.return_value
+        client.calendar_view.delta.get = AsyncMock(side_effect=Exception("syncStateNotFound"))
+        client.calendar_view.get = AsyncMock(
+            return_value=self._page([self._event("e1", 1)], next_link=None)
+        )
+        client.calendar_view.get.return_value.value[0].single_value_extended_properties = []
+
+        events = await delta_sync.get_existing_events(*self.FEB)
+
+        assert events == {date(2026, 2, 1): ExistingDutyEvent("e1", None)}
+        client.calendar_view.get.assert_called_once()
+
+    async def test_group_calendar_does_not_use_delta(self, delta_sync):
+        delta_sync._is_group = True
+        delta_sync._group_id = "group-123"
+        group = delta_sync.client.groups.by_group_id.return_value
+        group.calendar_view.get = AsyncMock(return_value=self._page([]))
+
+        await delta_sync.get_existing_events(*self.FEB)
+
+        group.calendar_view.get.assert_called_once()
+        delta_sync.client.users.by_user_id.return_value.calendar_view.delta.get.assert_not_called()
+
+    def test_written_events_carry_body_hash(self, delta_sync):
+        event = AllDayDutyEvent(
+            event_date=date(2026, 2, 1),
+            until_crew={},
+            from_crew={},
+            shift_change_hour=18,
+        )
+
+        [prop] = delta_sync._build_duty_event(event).single_value_extended_properties
+
+        assert prop.id == DUTY_BODY_HASH_PROPERTY_ID
+        assert prop.value == body_hash(event.body_html)
+
+
 class TestDutyCalendarSyncDeleteDateRange:
     """Tests for delete_date_range method."""
 
@@ -902,8 +1017,8 @@ class TestDutyCalendarSyncDeleteDateRange:
             "get_existing_events",
             new=AsyncMock(
                 return_value={
-                    date(2026, 2, 1): ("id-1", "body1"),
-                    date(2026, 2, 2): ("id-2", "body2"),
+                    date(2026, 2, 1): ExistingDutyEvent("id-1", None),
+                    date(2026, 2, 2): ExistingDutyEvent("id-2", None),
                 }
             ),
         ):
@@ -921,8 +1036,8 @@ class TestDutyCalendarSyncDeleteDateRange:
                 "get_existing_events",
                 new=AsyncMock(
                     return_value={
-                        date(2026, 2, 1): ("id-1", "body1"),
-                        date(2026, 2, 2): ("id-2", "body2"),
+                        date(2026, 2, 1): ExistingDutyEvent("id-1", None),
+                        date(2026, 2, 2): ExistingDutyEvent("id-2", None),
                     }
                 ),
             ),
@@ -982,14 +1097,15 @@ class TestDutyCalendarSyncUpdateEventsBatch:
     @pytest.mark.asyncio
     async def test_update_events_batch_success(self, calendar_sync, sample_events):
         """Batch update returns success count."""
-        calendar_sync.client.users.by_user_id.return_value.events.by_event_id.return_value.patch = (
-            AsyncMock()
-        )
+        calendar_sync._batch_client = _fake_batch_client()
 
         count, errors = await calendar_sync.update_events_batch(sample_events)
 
         assert count == 2
         assert errors == []
+        requests = calendar_sync._batch_client.execute.call_args[0][0]
+        assert [r.method for r in requests] == ["PATCH", "PATCH"]
+        assert requests[1].url.endswith("/events/id-2")
 
     @pytest.mark.asyncio
     async def test_update_events_batch_empty(self, calendar_sync):
@@ -1002,17 +1118,8 @@ class TestDutyCalendarSyncUpdateEventsBatch:
     @pytest.mark.asyncio
     async def test_update_events_batch_with_failures(self, calendar_sync, sample_events):
         """Batch update reports errors on failures."""
-        # Make first call succeed, second fail
-        call_count = [0]
-
-        async def mock_patch(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 2:
-                raise Exception("API Error")
-
-        calendar_sync.client.users.by_user_id.return_value.events.by_event_id.return_value.patch = (
-            mock_patch
-        )
+        # First update succeeds, second fails
+        calendar_sync._batch_client = _fake_batch_client([200, 500])
 
         count, errors = await calendar_sync.update_events_batch(sample_events)
 
@@ -1182,6 +1289,16 @@ class TestDutyCalendarSyncGroupCalendar:
         assert result is True
         group_sync._delegated_client.groups.by_group_id.assert_called_with("group-123")
 
+    @pytest.mark.asyncio
+    async def test_batch_uses_group_endpoint_and_delegated_credential(self, group_sync):
+        """Batched writes target the group calendar with the delegated credential."""
+        group_sync._delegated_credential = MagicMock()
+
+        batch = group_sync._get_batch_client()
+
+        assert batch._credential is group_sync._delegated_credential
+        assert group_sync._events_url("evt-1") == "/groups/group-123/calendar/events/evt-1"
+
     @pytest.mark.asyncio
     async def test_get_existing_events_uses_group_calendar_view(self, group_sync):
         """get_existing_events uses group calendar_view endpoint."""
@@ -0,0 +1,61 @@
+"""Tests for calendar/sync_state.py - persisted personal sync fingerprints."""
+
+from datetime import date
+
+from sjifire.calendar.sync_state import PersonalSyncState
+
+FEB = (date(2026, 2, 1), date(2026, 2, 28))
+MAR = (date(2026, 3, 1), date(2026, 3, 31))
+
+
+class TestPersonalSyncState:
+    """Tests for PersonalSyncState."""
+
+    def test_unknown_user_needs_full_sync(self, tmp_path):
+        state = PersonalSyncState(tmp_path / "state.json")
+        assert state.get("a@test.org", *FEB) is None
+
+    def test_round_trip_by_range(self, tmp_path):
+        path = tmp_path / "state.json"
+        state = PersonalSyncState(path)
+        state.record("A@test.org", *FEB, {"2026-02-03|S31 - Captain|08:00|18:00": "h1"})
+        state.record("a@test.org", *MAR, {"2026-03-04|S31 - Captain|08:00|18:00": "h2"})
+        state.save(today=date(2026, 2, 15))
+
+        reloaded = PersonalSyncState(path)
+        assert reloaded.get("a@test.org", *FEB) == {"2026-02-03|S31 - Captain|08:00|18:00": "h1"}
+        assert reloaded.get("a@test.org", FEB[0], MAR[1]) == {
+            "2026-02-03|S31 - Captain|08:00|18:00": "h1",
+            "2026-03-04|S31 - Captain|08:00|18:00": "h2",
+        }
+
+    def test_range_with_unsynced_month_needs_full_sync(self, tmp_path):
+        state = PersonalSyncState(tmp_path / "state.json")
+        state.record("a@test.org", *FEB, {})
+        assert state.get("a@test.org", *FEB) == {}
+        assert state.get("a@test.org", FEB[0], MAR[1]) is None
+
+    def test_record_replaces_entries_in_range(self, tmp_path):
+        state = PersonalSyncState(tmp_path / "state.json")
+        state.record("a@test.org", *FEB, {"2026-02-03|x|08:00|18:00": "h1"})
+        state.record("a@test.org", *FEB, {"2026-02-05|x|08:00|18:00": "h2"})
+        assert state.get("a@test.org", *FEB) == {"2026-02-05|x|08:00|18:00": "h2"}
+
+    def test_users_with_entries(self, tmp_path):
+        state = PersonalSyncState(tmp_path / "state.json")
+        state.record("a@test.org", *FEB, {"2026-02-03|x|08:00|18:00": "h1"})
+        state.record("b@test.org", *FEB, {})
+        assert state.users_with_entries(*FEB) == {"a@test.org"}
+        assert state.users_with_entries(*MAR) == set()
+
+    def test_save_drops_expired_months(self, tmp_path):
+        path = tmp_path / "state.json"
+        state = PersonalSyncState(path)
+        state.record("a@test.org", *FEB, {"2026-02-03|x|08:00|18:00": "h1"})
+        state.save(today=date(2026, 6, 1))
+        assert PersonalSyncState(path).get("a@test.org", *FEB) is None
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text("{not json")
+        assert PersonalSyncState(path).get("a@test.org", *FEB) is None
@@ -0,0 +1,123 @@
+"""Tests for core/throttle.py - AIMD concurrency control and request spacing."""
+
+import asyncio
+
+from sjifire.core.throttle import AdaptiveLimiter, RateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start at t=0."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveLimiter:
+    """Tests for AdaptiveLimiter."""
+
+    async def test_clean_completions_increase_to_maximum(self):
+        limiter = AdaptiveLimiter(initial=1, maximum=3)
+        for _ in range(5):
+            await limiter.acquire()
+            limiter.release()
+        assert limiter.current == 3
+
+    async def test_throttled_release_does_not_increase(self):
+        limiter = AdaptiveLimiter(initial=2, maximum=6)
+        await limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.current == 2
+
+    def test_throttle_halves_limit_once_per_cooldown(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial=8, maximum=8, cooldown=5.0, clock=clock)
+
+        limiter.record_throttle()
+        limiter.record_throttle()  # same burst: counted, no second cut
+        assert limiter.current == 4
+        assert limiter.throttle_events == 2
+
+        clock.now = 6.0
+        limiter.record_throttle()
+        assert limiter.current == 2
+        assert limiter.decreases == 2
+
+    def test_limit_never_below_minimum(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial=2, minimum=1, cooldown=0.0, clock=clock)
+        for _ in range(5):
+            clock.now += 1
+            limiter.record_throttle()
+        assert limiter.current == 1
+
+    async def test_acquire_waits_for_free_slot(self):
+        limiter = AdaptiveLimiter(initial=2, maximum=2)
+        active = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal active, peak
+            await limiter.acquire()
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            limiter.release()
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.peak == 2
+        assert limiter.in_flight == 0
+
+    async def test_retry_after_pauses_new_starts(self, monkeypatch):
+        clock = FakeClock()
+        slept: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            slept.append(delay)
+            clock.now += delay
+
+        monkeypatch.setattr("sjifire.core.throttle.asyncio.sleep", fake_sleep)
+        limiter = AdaptiveLimiter(initial=2, clock=clock)
+        limiter.record_throttle(retry_after=12.0)
+
+        await limiter.acquire()
+
+        assert slept == [12.0]
+        assert limiter.in_flight == 1
+
+
+class TestRateLimiter:
+    """Tests for the shared request-spacing limiter."""
+
+    def test_spaces_calls_across_threads(self):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from itertools import pairwise
+
+        limiter = RateLimiter(0.05)
+        starts: list[float] = []
+
+        def call(_):
+            limiter.wait()
+            starts.append(time.monotonic())
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(call, range(5)))
+
+        starts.sort()
+        gaps = [b - a for a, b in pairwise(starts)]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    def test_first_call_does_not_wait(self):
+        import time
+
+        limiter = RateLimiter(10)
+        start = time.monotonic()
+        limiter.wait()
+        assert time.monotonic() - start < 1
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from sjifire.aladtec.schedule_cache import ScheduleDiff, load_schedule_diff
 from sjifire.calendar.models import SyncResult
 from sjifire.scripts.duty_calendar_sync import get_month_date_range, main, parse_month
 
@@ -277,6 +278,91 @@ class TestMainCLI:
         call_kwargs = mock_calendar_sync.sync.call_args[1]
         assert call_kwargs["force"] is True
 
+    def test_changed_only_skips_sync_when_nothing_changed(
+        self, mock_calendar_sync, mock_aladtec_scraper, mock_env_vars, tmp_path
+    ):
+        """--changed-only skips the calendar sync but still saves the diff."""
+        mock_aladtec_scraper.last_diff = ScheduleDiff(unchanged=31)
+        diff_path = tmp_path / "diff.json"
+
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "calendar-sync",
+                "--month",
+                "Jan 2026",
+                "--mailbox",
+                "test@sjifire.org",
+                "--changed-only",
+                "--save-diff",
+                str(diff_path),
+            ],
+        ):
+            result = main()
+
+        assert result == 0
+        mock_calendar_sync.sync.assert_not_called()
+        assert load_schedule_diff(diff_path).unchanged == 31
+        mock_aladtec_scraper.commit_cache.assert_called_once()
+
+    def test_changed_only_syncs_when_days_changed(
+        self, mock_calendar_sync, mock_aladtec_scraper, mock_env_vars
+    ):
+        """--changed-only still syncs when the scrape reported changes."""
+        mock_aladtec_scraper.last_diff = ScheduleDiff(changed=["2026-01-05"])
+        mock_calendar_sync.sync.return_value = SyncResult(events_updated=1)
+
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "calendar-sync",
+                "--month",
+                "Jan 2026",
+                "--mailbox",
+                "x@sjifire.org",
+                "--changed-only",
+            ],
+        ):
+            result = main()
+
+        assert result == 0
+        mock_calendar_sync.sync.assert_called_once()
+        mock_aladtec_scraper.commit_cache.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("extra_args", "sync_result"),
+        [
+            (["--dry-run"], SyncResult(events_updated=1)),
+            ([], SyncResult(errors=["Graph error"])),
+        ],
+        ids=["dry-run", "sync-errors"],
+    )
+    def test_schedule_cache_not_committed(
+        self, mock_calendar_sync, mock_aladtec_scraper, mock_env_vars, extra_args, sync_result
+    ):
+        """A dry run or failed sync leaves the changes for the next run."""
+        mock_aladtec_scraper.last_diff = ScheduleDiff(changed=["2026-01-05"])
+        mock_calendar_sync.sync.return_value = sync_result
+
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "calendar-sync",
+                "--month",
+                "Jan 2026",
+                "--mailbox",
+                "x@sjifire.org",
+                "--changed-only",
+                *extra_args,
+            ],
+        ):
+            main()
+
+        mock_aladtec_scraper.commit_cache.assert_not_called()
+
     def test_month_mode_aladtec_login_failure(
         self, mock_calendar_sync, mock_aladtec_scraper, mock_env_vars
     ):
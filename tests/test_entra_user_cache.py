@@ -0,0 +1,188 @@
+"""Tests for entra/user_cache.py and the delta-synced EntraUserManager snapshot."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from msgraph.generated.models.on_premises_extension_attributes import (
+    OnPremisesExtensionAttributes,
+)
+from msgraph.generated.models.user import User
+
+from sjifire.entra.user_cache import FULL_REFRESH_DAYS, USER_CACHE_FILE, UserDirectoryCache
+from sjifire.entra.users import USER_SELECT_FIELDS, EntraUserManager
+
+SELECT = ["id", "mail"]
+
+
+class TestUserDirectoryCache:
+    """Tests for UserDirectoryCache."""
+
+    def test_new_cache_needs_full_sync(self, tmp_path):
+        assert UserDirectoryCache(tmp_path / "users.json").needs_full_sync(SELECT)
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "users.json"
+        cache = UserDirectoryCache(path)
+        cache.reset(SELECT)
+        cache.apply("1", {"id": "1", "email": "a@test.org"})
+        cache.delta_link = "https://graph/delta?token=1"
+        cache.save()
+
+        reloaded = UserDirectoryCache(path)
+        assert reloaded.users == {"1": {"id": "1", "email": "a@test.org"}}
+        assert reloaded.delta_link == "https://graph/delta?token=1"
+        assert not reloaded.needs_full_sync(SELECT)
+
+    def test_select_change_or_age_forces_full_sync(self, tmp_path):
+        cache = UserDirectoryCache(tmp_path / "users.json")
+        now = datetime(2026, 3, 1, tzinfo=UTC)
+        cache.reset(SELECT, now=now)
+        cache.delta_link = "link"
+
+        assert not cache.needs_full_sync(SELECT, now=now + timedelta(days=1))
+        assert cache.needs_full_sync([*SELECT, "department"], now=now)
+        assert cache.needs_full_sync(SELECT, now=now + timedelta(days=FULL_REFRESH_DAYS + 1))
+
+    def test_apply_merges_and_removes(self, tmp_path):
+        cache = UserDirectoryCache(tmp_path / "users.json")
+        cache.apply("1", {"id": "1", "email": "a@test.org", "job_title": "FF"})
+        cache.apply("2", {"id": "2"})
+        cache.apply("1", {"job_title": "Captain"})
+        cache.apply("2", None)
+
+        assert cache.users == {"1": {"id": "1", "email": "a@test.org", "job_title": "Captain"}}
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        path = tmp_path / "users.json"
+        path.write_text("{not json")
+        assert UserDirectoryCache(path).users == {}
+
+
+def _page(users, next_link=None, delta_link=None):
+    return MagicMock(value=users, odata_next_link=next_link, odata_delta_link=delta_link)
+
+
+class TestEntraUserManagerDeltaCache:
+    """EntraUserManager snapshots through the on-disk delta cache."""
+
+    @pytest.fixture
+    def manager(self, mock_env_vars, tmp_path):
+        with patch("sjifire.entra.users.get_graph_client", return_value=MagicMock()):
+            return EntraUserManager(domain="test.org", cache_dir=tmp_path)
+
+    @staticmethod
+    def _fresh(manager, refresh_full=False):
+        """A new manager (next run) sharing the client and cache directory."""
+        with patch("sjifire.entra.users.get_graph_client", return_value=manager.client):
+            return EntraUserManager(
+                domain="test.org",
+                cache_dir=manager.cache_path.parent,
+                refresh_full=refresh_full,
+            )
+
+    async def test_first_run_full_then_delta(self, manager):
+        delta = manager.client.users.delta
+        delta.get = AsyncMock(
+            return_value=_page(
+                [
+                    User(
+                        id="1",
+                        mail="a@test.org",
+                        account_enabled=True,
+                        job_title="Firefighter",
+                        on_premises_extension_attributes=OnPremisesExtensionAttributes(
+                            extension_attribute1="Firefighter"
+                        ),
+                    ),
+                    User(id="2", mail="b@test.org", account_enabled=True),
+                ],
+                next_link="page-2",
+            )
+        )
+        delta.with_url.return_value.get = AsyncMock(
+            side_effect=[
+                _page([User(id="3", mail="c@test.org", account_enabled=False)], delta_link="d1"),
+                # Next run: a partial update for 1 and a deletion of 2
+                _page(
+                    [
+                        User(
+                            id="1",
+                            job_title="Captain",
+                            on_premises_extension_attributes=OnPremisesExtensionAttributes(),
+                        ),
+                        User(id="2", additional_data={"@removed": {"reason": "deleted"}}),
+                    ],
+                    delta_link="d2",
+                ),
+            ]
+        )
+
+        first = await manager.get_users()
+        assert sorted(u.id for u in first) == ["1", "2"]
+        config = delta.get.call_args.kwargs["request_configuration"]
+        assert config.query_parameters.select == list(USER_SELECT_FIELDS)
+        assert manager.cache_path.name == USER_CACHE_FILE
+
+        second = self._fresh(manager)
+        users = {u.id: u for u in await second.get_users(include_disabled=True)}
+
+        delta.get.assert_awaited_once()
+        assert delta.with_url.call_args.args == ("d1",)
+        assert sorted(users) == ["1", "3"]
+        assert users["1"].email == "a@test.org"
+        assert users["1"].job_title == "Captain"
+        assert users["1"].rank is None  # cleared inside the complex type
+        assert not users["3"].account_enabled
+        assert UserDirectoryCache(manager.cache_path).delta_link == "d2"
+
+    async def test_snapshot_memoized_per_manager(self, manager):
+        manager.client.users.delta.get = AsyncMock(
+            return_value=_page([User(id="1", account_enabled=True)], delta_link="d1")
+        )
+
+        await manager.get_users()
+        await manager.get_employees(include_disabled=True)
+
+        manager.client.users.delta.get.assert_awaited_once()
+
+    async def test_refresh_full_ignores_delta_link(self, manager):
+        cache = UserDirectoryCache(manager.cache_path)
+        cache.reset(USER_SELECT_FIELDS)
+        cache.apply("gone", {"id": "gone", "account_enabled": True})
+        cache.delta_link = "d1"
+        cache.save()
+        manager.client.users.delta.get = AsyncMock(
+            return_value=_page([User(id="1", account_enabled=True)], delta_link="d2")
+        )
+
+        users = await self._fresh(manager, refresh_full=True).get_users()
+
+        assert [u.id for u in users] == ["1"]
+        manager.client.users.delta.with_url.assert_not_called()
+
+    async def test_failed_delta_lists_users_and_resets(self, manager):
+        cache = UserDirectoryCache(manager.cache_path)
+        cache.reset(USER_SELECT_FIELDS)
+        cache.delta_link = "expired"
+        cache.save()
+        manager.client.users.delta.with_url.return_value.get = AsyncMock(
+            side_effect=RuntimeError("410 Gone")
+        )
+        listed = MagicMock()
+        listed.configure_mock(
+            id="1", account_enabled=True, employee_id=None, on_premises_extension_attributes=None
+        )
+        manager.client.users.get = AsyncMock(return_value=_page([listed]))
+
+        users = await manager.get_users()
+
+        assert [u.id for u in users] == ["1"]
+        assert UserDirectoryCache(manager.cache_path).needs_full_sync(USER_SELECT_FIELDS)
+
+    async def test_explicit_select_bypasses_cache(self, manager):
+        manager.client.users.get = AsyncMock(return_value=_page([]))
+
+        await manager.get_users(select=["mail"])
+
+        manager.client.users.delta.get.assert_not_called()
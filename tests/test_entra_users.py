@@ -1,12 +1,19 @@
 """Tests for sjifire.entra.users."""
 
+import asyncio
 import string
 from datetime import date, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from sjifire.entra.users import EntraUser, EntraUserManager
+from sjifire.core.msgraph_client import GraphResponse
+from sjifire.entra.users import (
+    USER_SELECT_FIELDS,
+    USERS_PAGE_SIZE,
+    EntraUser,
+    EntraUserManager,
+)
 
 
 class TestEntraUser:
@@ -796,6 +803,52 @@ class TestEntraUserManagerGetUsers:
 
         manager.client.users.get.assert_called_once()
 
+    async def test_iter_user_pages_streams_each_page(self, manager):
+        page1 = MagicMock(value=[self._mock_graph_user(user_id="1")], odata_next_link="next")
+        page2 = MagicMock(
+            value=[self._mock_graph_user(user_id="2", account_enabled=False)],
+            odata_next_link=None,
+        )
+        manager.client.users.get = AsyncMock(return_value=page1)
+        manager.client.users.with_url.return_value.get = AsyncMock(return_value=page2)
+
+        pages = [[u.id for u in page] async for page in manager.iter_user_pages()]
+
+        assert pages == [["1"], []]
+        manager.client.users.with_url.assert_called_once_with("next")
+
+    async def test_iter_users_selects_requested_fields(self, manager):
+        manager.client.users.get = AsyncMock(
+            return_value=MagicMock(value=[self._mock_graph_user()], odata_next_link=None)
+        )
+
+        users = [u async for u in manager.iter_users(select=["mail"], employees_only=True)]
+
+        assert [u.id for u in users] == ["123"]
+        config = manager.client.users.get.call_args.kwargs["request_configuration"]
+        assert config.query_parameters.select == ["id", "accountEnabled", "employeeId", "mail"]
+        assert config.query_parameters.top == USERS_PAGE_SIZE
+
+    async def test_get_users_default_select(self, manager):
+        manager.client.users.get = AsyncMock(return_value=MagicMock(value=[], odata_next_link=None))
+
+        await manager.get_users()
+
+        config = manager.client.users.get.call_args.kwargs["request_configuration"]
+        assert set(config.query_parameters.select) == set(USER_SELECT_FIELDS)
+
+    def test_entra_user_is_slotted(self):
+        user = EntraUser(
+            id="1",
+            display_name=None,
+            first_name=None,
+            last_name=None,
+            email=None,
+            upn=None,
+            employee_id=None,
+        )
+        assert not hasattr(user, "__dict__")
+
 
 class TestEntraUserManagerGetUserByUpn:
     """Tests for get_user_by_upn method."""
@@ -1003,6 +1056,36 @@ class TestEntraUserManagerUpdateUser:
 
         assert result is False
 
+    async def test_batched_updates_go_through_batch_client(self, manager):
+        batch = MagicMock()
+        batch.execute = AsyncMock(return_value=[GraphResponse(204), GraphResponse(204)])
+
+        async with manager.batch_updates(batch):
+            results = await asyncio.gather(
+                manager.update_user(user_id="1", display_name="A"),
+                manager.update_user(user_id="2", display_name="B"),
+            )
+
+        assert results == [True, True]
+        [sent] = batch.execute.await_args.args
+        assert [(r.method, r.url) for r in sent] == [("PATCH", "/users/1"), ("PATCH", "/users/2")]
+        manager.client.users.by_user_id.assert_not_called()
+        assert manager._update_queue is None
+
+    async def test_batched_403_retries_without_phone(self, manager):
+        denied = GraphResponse(403, {"error": {"code": "Authorization_RequestDenied"}})
+        batch = MagicMock()
+        batch.execute = AsyncMock(side_effect=[[denied], [GraphResponse(204)]])
+
+        async with manager.batch_updates(batch):
+            result = await manager.update_user(
+                user_id="123", display_name="John Updated", mobile_phone="555-1234"
+            )
+
+        assert result is True
+        retry = batch.execute.await_args_list[1].args[0][0].body
+        assert retry.mobile_phone is None
+
 
 class TestEntraUserManagerEnableDisable:
     """Tests for enable_user and disable_user methods."""
@@ -3,11 +3,18 @@
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from sjifire.exchange.client import ExchangeGroup, ExchangeOnlineClient
+from sjifire.exchange.client import (
+    BATCH_SCRIPT_FAILED,
+    GROUP_BATCH_SIZE,
+    ExchangeGroup,
+    ExchangeGroupChange,
+    ExchangeOnlineClient,
+)
+from sjifire.exchange.session import COMMAND_TIMEOUT_SECONDS
 
 # Test password for certificate authentication (not a real secret)
 TEST_CERT_PASSWORD = "test-password"
@@ -871,6 +878,195 @@ class TestRemoveDistributionGroupMember:
 # =============================================================================
 
 
+class TestGetGroupsWithMembers:
+    """Tests for get_groups_with_members (bulk reads)."""
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    @pytest.mark.asyncio
+    async def test_reads_batch_in_one_script(self, mock_run_ps, mock_get_creds):
+        """Should read every group in a batch with a single PowerShell call."""
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        mock_run_ps.return_value = [
+            {
+                "Identity": "a@test.org",
+                "Group": {"Identity": "a", "DisplayName": "A", "PrimarySmtpAddress": "a@test.org"},
+                "Members": ["One@Test.org", "two@test.org"],
+            },
+            {
+                "Identity": "b@test.org",
+                "Group": {"Identity": "b", "DisplayName": "B", "PrimarySmtpAddress": "b@test.org"},
+                "Members": "solo@test.org",
+            },
+            {"Identity": "missing@test.org", "Group": None, "Members": []},
+        ]
+
+        client = ExchangeOnlineClient()
+        result = await client.get_groups_with_members(
+            ["a@test.org", "b@test.org", "missing@test.org"]
+        )
+
+        mock_run_ps.assert_called_once()
+        assert result["a@test.org"][0].display_name == "A"
+        assert result["a@test.org"][1] == ["one@test.org", "two@test.org"]
+        assert result["b@test.org"][1] == ["solo@test.org"]
+        assert result["missing@test.org"] == (None, [])
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    @pytest.mark.asyncio
+    async def test_splits_into_batches(self, mock_run_ps, mock_get_creds):
+        """Should issue one script per GROUP_BATCH_SIZE groups."""
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        mock_run_ps.return_value = {"raw": "error"}
+
+        client = ExchangeOnlineClient()
+        identities = [f"g{i}@test.org" for i in range(GROUP_BATCH_SIZE + 1)]
+        result = await client.get_groups_with_members(identities)
+
+        assert mock_run_ps.call_count == 2
+        assert all(v == (None, []) for v in result.values())
+
+
+class TestApplyGroupChanges:
+    """Tests for apply_group_changes (batched multi-group writes)."""
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    @pytest.mark.asyncio
+    async def test_applies_all_groups_in_one_script(self, mock_run_ps, mock_get_creds):
+        """Should send every group's changes in one script and map per-group results."""
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        mock_run_ps.return_value = [
+            {"Identity": "a@test.org", "Added": ["x@test.org"], "Removed": [], "Errors": []},
+            {"Identity": "b@test.org", "Added": [], "Removed": "y@test.org", "Errors": []},
+        ]
+
+        client = ExchangeOnlineClient()
+        result = await client.apply_group_changes(
+            [
+                ExchangeGroupChange(identity="a@test.org", add=["x@test.org"], description="D"),
+                ExchangeGroupChange(
+                    identity="b@test.org", remove=["y@test.org"], alias_addresses=["bb@test.org"]
+                ),
+            ]
+        )
+
+        mock_run_ps.assert_called_once()
+        script = "\n".join(mock_run_ps.call_args[0][0])
+        assert "-Description 'D'" in script
+        assert "smtp:bb@test.org" in script
+        assert result["a@test.org"].added == ["x@test.org"]
+        assert result["b@test.org"].removed == ["y@test.org"]
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    @pytest.mark.asyncio
+    async def test_script_failure_reports_error_per_group(self, mock_run_ps, mock_get_creds):
+        """Should report an error for every group when the script fails."""
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        mock_run_ps.return_value = None
+
+        client = ExchangeOnlineClient()
+        result = await client.apply_group_changes(
+            [ExchangeGroupChange(identity="a@test.org", add=["x@test.org"])]
+        )
+
+        assert result["a@test.org"].errors == ["Failed to execute batched change script"]
+
+    @patch("sjifire.exchange.client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    @pytest.mark.asyncio
+    async def test_retries_transient_adds_across_groups(self, mock_run_ps, mock_get_creds, _sleep):
+        """Should retry transient add failures from all groups in one batched script."""
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        transient = "Resource 'x@test.org' does not exist"
+        mock_run_ps.side_effect = [
+            [
+                {"Identity": "a@test.org", "Errors": [f"Add x@test.org: {transient}"]},
+                {"Identity": "b@test.org", "Errors": [f"Add y@test.org: {transient}"]},
+            ],
+            [
+                {"Identity": "a@test.org", "Added": ["x@test.org"]},
+                {"Identity": "b@test.org", "Added": ["y@test.org"]},
+            ],
+        ]
+
+        client = ExchangeOnlineClient()
+        result = await client.apply_group_changes(
+            [
+                ExchangeGroupChange(identity="a@test.org", add=["x@test.org"]),
+                ExchangeGroupChange(identity="b@test.org", add=["y@test.org"]),
+            ]
+        )
+
+        assert mock_run_ps.call_count == 2
+        assert result["a@test.org"].added == ["x@test.org"]
+        assert result["b@test.org"].added == ["y@test.org"]
+        assert not result["a@test.org"].errors and not result["b@test.org"].errors
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    @pytest.mark.asyncio
+    async def test_time_limit_scales_with_operations(self, mock_run_ps, mock_get_creds):
+        """A batch with many member changes gets longer than a single command."""
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        mock_run_ps.return_value = []
+        members = [f"m{i}@test.org" for i in range(50)]
+
+        client = ExchangeOnlineClient()
+        await client.apply_group_changes([ExchangeGroupChange(identity="a@test.org", add=["x"])])
+        await client.apply_group_changes(
+            [ExchangeGroupChange(identity=f"g{i}@test.org", add=members) for i in range(3)]
+        )
+
+        small, large = (c.args[2] for c in mock_run_ps.call_args_list)
+        assert COMMAND_TIMEOUT_SECONDS < small < large
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    @pytest.mark.asyncio
+    async def test_failed_script_rereads_groups(self, mock_run_ps, mock_get_creds):
+        """Changes applied before a script timed out are reported as applied."""
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        mock_run_ps.side_effect = [
+            None,  # change script timed out partway
+            [
+                {
+                    "Identity": "a@test.org",
+                    "Group": {"Identity": "a", "PrimarySmtpAddress": "a@test.org"},
+                    "Members": ["x@test.org", "keep@test.org"],
+                },
+                {"Identity": "gone@test.org", "Group": None, "Members": []},
+            ],
+        ]
+
+        client = ExchangeOnlineClient()
+        result = await client.apply_group_changes(
+            [
+                ExchangeGroupChange(
+                    identity="a@test.org",
+                    add=["X@test.org", "y@test.org"],
+                    remove=["old@test.org", "keep@test.org"],
+                    description="D",
+                ),
+                ExchangeGroupChange(identity="gone@test.org", add=["z@test.org"]),
+            ]
+        )
+
+        assert mock_run_ps.call_count == 2
+        a = result["a@test.org"]
+        assert a.added == ["X@test.org"]
+        assert a.removed == ["old@test.org"]
+        assert a.errors == [
+            f"Add y@test.org: {BATCH_SCRIPT_FAILED}",
+            f"Remove keep@test.org: {BATCH_SCRIPT_FAILED}",
+            f"Description: {BATCH_SCRIPT_FAILED}",
+        ]
+        assert result["gone@test.org"].errors == [BATCH_SCRIPT_FAILED]
+
+
 class TestClose:
     """Tests for close method."""
 
@@ -0,0 +1,219 @@
+"""Tests for exchange/session.py - persistent PowerShell worker sessions.
+
+A stub ``pwsh`` (a small Python script placed first on PATH) speaks the
+worker protocol: it records each connect, prints a banner, then answers
+framed JSON requests.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sjifire.exchange.client import ExchangeOnlineClient
+from sjifire.exchange.session import (
+    COMMAND_TIMEOUT_SECONDS,
+    FRAME_MARKER,
+    PowerShellCommandError,
+    PowerShellSession,
+    PowerShellSessionError,
+    build_worker_script,
+)
+from sjifire.scripts.ms_group_sync import UnifiedGroupSyncManager
+from tests.test_exchange_client import MockExchangeCredentials
+
+STUB_PWSH = """\
+import json, os, re, sys
+
+script = sys.argv[sys.argv.index("-Command") + 1]
+if "Connect-ExchangeOnline" in script:
+    with open(os.environ["STUB_PWSH_LOG"], "a") as f:
+        f.write("connect\\n")
+if os.environ.get("STUB_PWSH_FAIL_START"):
+    print("Connect-ExchangeOnline: bad certificate", file=sys.stderr)
+    sys.exit(1)
+
+def send(frame):
+    sys.stdout.write(MARKER + json.dumps(frame) + "\\n")
+    sys.stdout.flush()
+
+print("Welcome to Exchange Online (banner noise)", flush=True)
+send({"id": 0, "ok": True, "output": "READY"})
+for line in sys.stdin:
+    request = json.loads(line)
+    body = request["script"]
+    if "CRASH" in body:
+        sys.exit(3)
+    if "THROW" in body:
+        send({"id": request["id"], "ok": False, "output": "", "error": "boom"})
+        continue
+    group = re.search(r"Get-DistributionGroup -Identity '([^']+)'", body)
+    if group:
+        targets = re.search(r"\\$targetMembers = @\\(([^)]*)\\)", body)
+        added = re.findall(r"'([^']+)'", targets.group(1)) if targets else []
+        output = json.dumps({
+            "group": {"Identity": group.group(1)},
+            "current_members": [],
+            "added": added,
+            "removed": [],
+            "errors": [],
+        })
+    else:
+        output = "SUCCESS"
+    send({"id": request["id"], "ok": True, "output": output + "\\n"})
+"""
+
+
+@pytest.fixture
+def stub_pwsh(tmp_path, monkeypatch):
+    """Put a stub ``pwsh`` first on PATH; returns a function counting connects."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "pwsh"
+    stub.write_text(f"#!{sys.executable}\nMARKER = {FRAME_MARKER!r}\n{STUB_PWSH}")
+    stub.chmod(0o755)
+    log = tmp_path / "connects.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("STUB_PWSH_LOG", str(log))
+
+    def connects() -> int:
+        return len(log.read_text().splitlines()) if log.exists() else 0
+
+    return connects
+
+
+SETUP = ["Import-Module ExchangeOnlineManagement", "Connect-ExchangeOnline *>$null"]
+
+
+class TestBuildWorkerScript:
+    """Tests for build_worker_script."""
+
+    def test_setup_runs_before_loop(self):
+        script = build_worker_script(SETUP)
+        assert script.index("Connect-ExchangeOnline") < script.index("[Console]::In.ReadLine()")
+        assert FRAME_MARKER in script
+        assert script.rstrip().endswith("Disconnect-ExchangeOnline -Confirm:$false *>$null")
+
+
+class TestPowerShellSession:
+    """Tests for PowerShellSession against the stub worker."""
+
+    async def test_connects_once_for_many_commands(self, stub_pwsh):
+        session = PowerShellSession(SETUP)
+        try:
+            outputs = [await session.run("Write-Output 'SUCCESS'") for _ in range(5)]
+        finally:
+            await session.close()
+
+        assert [o.strip() for o in outputs] == ["SUCCESS"] * 5
+        assert stub_pwsh() == 1
+        assert session.starts == 1
+
+    async def test_command_error_keeps_session(self, stub_pwsh):
+        session = PowerShellSession(SETUP)
+        try:
+            with pytest.raises(PowerShellCommandError, match="boom"):
+                await session.run("THROW")
+            assert (await session.run("Write-Output 'SUCCESS'")).strip() == "SUCCESS"
+        finally:
+            await session.close()
+        assert stub_pwsh() == 1
+
+    async def test_restarts_after_crash(self, stub_pwsh):
+        session = PowerShellSession(SETUP)
+        try:
+            await session.run("Write-Output 'SUCCESS'")
+            with pytest.raises(PowerShellSessionError, match="code 3"):
+                await session.run("CRASH")
+            assert not session.running
+            assert (await session.run("Write-Output 'SUCCESS'")).strip() == "SUCCESS"
+        finally:
+            await session.close()
+        assert stub_pwsh() == 2
+
+    async def test_start_failure_reports_stderr(self, stub_pwsh, monkeypatch):
+        monkeypatch.setenv("STUB_PWSH_FAIL_START", "1")
+        session = PowerShellSession(SETUP)
+        with pytest.raises(PowerShellSessionError, match="bad certificate"):
+            await session.run("Write-Output 'SUCCESS'")
+
+    async def test_missing_executable(self, tmp_path):
+        session = PowerShellSession(SETUP, executable=str(tmp_path / "no-such-pwsh"))
+        with pytest.raises(PowerShellSessionError, match="Failed to run PowerShell"):
+            await session.run("Write-Output 'SUCCESS'")
+
+    async def test_close_stops_worker(self, stub_pwsh):
+        session = PowerShellSession(SETUP)
+        await session.run("Write-Output 'SUCCESS'")
+        assert session.running
+        await session.close()
+        assert not session.running
+
+
+class TestExchangeClientPersistent:
+    """Tests for ExchangeOnlineClient(persistent=True)."""
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    async def test_methods_share_one_connect(self, mock_get_creds, stub_pwsh):
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        client = ExchangeOnlineClient(persistent=True)
+        try:
+            assert await client.add_distribution_group_member("g@test.org", "a@test.org")
+            assert await client.set_unified_group_welcome_message("g@test.org", False)
+        finally:
+            await client.close()
+        assert stub_pwsh() == 1
+        assert client.connect_count == 0  # pool released on close
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    async def test_command_error_returns_none(self, mock_get_creds, stub_pwsh):
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        client = ExchangeOnlineClient(persistent=True)
+        try:
+            assert await client._execute(["THROW"]) is None
+        finally:
+            await client.close()
+
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    @patch.object(ExchangeOnlineClient, "_run_powershell")
+    async def test_default_runs_one_shot_in_thread(self, mock_run_ps, mock_get_creds):
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        mock_run_ps.return_value = "SUCCESS"
+        client = ExchangeOnlineClient()
+        assert await client._execute(["Write-Output 'SUCCESS'"], parse_json=False) == "SUCCESS"
+        mock_run_ps.assert_called_once_with(
+            ["Write-Output 'SUCCESS'"], False, COMMAND_TIMEOUT_SECONDS
+        )
+
+
+class TestMsGroupSyncSingleConnect:
+    """ms-group-sync pays one Exchange connect for a whole run."""
+
+    @patch("sjifire.scripts.ms_group_sync.get_service_email", return_value="svc@test.org")
+    @patch("sjifire.exchange.client.get_exchange_credentials")
+    async def test_n_groups_one_connect(self, mock_get_creds, _svc, stub_pwsh):
+        mock_get_creds.return_value = MockExchangeCredentials(certificate_thumbprint="ABC123")
+        manager = UnifiedGroupSyncManager(domain="test.org")
+        manager._reconcile_ghost_members = AsyncMock(return_value=([], []))
+        strategy = MagicMock(automation_notice="Managed by automation")
+        strategy.get_config.side_effect = lambda key: SimpleNamespace(
+            display_name=key.title(), mail_nickname=key, aliases=[]
+        )
+        member = SimpleNamespace(email="a@test.org", display_name="A Member")
+
+        groups = [f"group{i}" for i in range(6)]
+        try:
+            results = [
+                await manager._sync_exchange_group(
+                    strategy, key, [member], dry_run=False, creating=False
+                )
+                for key in groups
+            ]
+        finally:
+            await manager.close()
+
+        assert [r.group_email for r in results] == [f"{g}@test.org" for g in groups]
+        assert all(r.members_added == ["A Member"] and not r.errors for r in results)
+        assert stub_pwsh() == 1
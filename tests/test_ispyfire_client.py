@@ -622,7 +622,7 @@ class TestRateLimitingRetry:
 
     @respx.mock
     def test_request_includes_proactive_delay(self, mock_credentials):
-        """Test that _request includes proactive delay before each request."""
+        """Test that _request spaces back-to-back requests BULK_OPERATION_DELAY apart."""
         from sjifire.ispyfire.client import BULK_OPERATION_DELAY
 
         respx.post("https://test.ispyfire.com/login").mock(return_value=httpx.Response(200))
@@ -632,7 +632,10 @@ class TestRateLimitingRetry:
 
         with (
             ISpyFireClient() as client,
-            patch("sjifire.ispyfire.client.time.sleep") as mock_sleep,
+            patch("sjifire.core.throttle.time.sleep") as mock_sleep,
         ):
             client.get_people()
-            mock_sleep.assert_called_with(BULK_OPERATION_DELAY)
+            mock_sleep.assert_not_called()  # first request goes straight out
+            client.get_people()
+            [delay] = mock_sleep.call_args.args
+            assert 0 < delay <= BULK_OPERATION_DELAY
@@ -6,10 +6,13 @@ import pytest
 
 from sjifire.core.group_strategies import FirefighterStrategy
 from sjifire.entra.users import EntraUser
+from sjifire.exchange.client import ExchangeGroupChangeResult
 from sjifire.scripts.ms_group_sync import (
     GroupSyncResult,
     GroupType,
     UnifiedGroupSyncManager,
+    load_sync_plan,
+    save_sync_plan,
 )
 
 # =============================================================================
@@ -110,6 +113,45 @@ class TestUnifiedGroupSyncManager:
         assert manager._exchange_client is not None
 
 
+class TestUserSnapshot:
+    """All strategies in a run share one Entra user fetch."""
+
+    @staticmethod
+    def _user(user_id, email, enabled=True, work_group="FF"):
+        return EntraUser(
+            id=user_id,
+            display_name=user_id,
+            first_name=None,
+            last_name=None,
+            email=email,
+            upn=email,
+            employee_id=None,
+            account_enabled=enabled,
+            employee_type=work_group,
+        )
+
+    @patch("sjifire.scripts.ms_group_sync.get_service_email", return_value="svc@test.org")
+    async def test_single_fetch_feeds_every_consumer(self, _svc, manager, mock_entra_users):
+        mock_entra_users.get_users = AsyncMock(
+            return_value=[
+                self._user("1", "active@test.org"),
+                self._user("2", "Disabled@test.org", enabled=False),
+                self._user("3", "guest@other.org"),
+                self._user("4", "board@test.org", work_group=None),
+                self._user("5", "svc@test.org"),
+            ]
+        )
+
+        active = await manager.get_entra_users()
+        source = await manager.get_source_emails()
+        await manager.get_source_emails()
+        await manager.get_all_entra_users()
+
+        assert [u.id for u in active] == ["1", "4", "5"]
+        assert source == {"active@test.org", "disabled@test.org", "guest@other.org"}
+        mock_entra_users.get_users.assert_awaited_once_with(include_disabled=True)
+
+
 # =============================================================================
 # detect_group_type Tests
 # =============================================================================
@@ -1092,3 +1134,126 @@ class TestDeleteExchangeGroup:
 
         assert result == 0
         mock_manager.exchange_client.delete_distribution_group.assert_not_called()
+
+
+# =============================================================================
+# Batched Exchange Plan Tests
+# =============================================================================
+
+
+def _plan_strategy(keys: list[str], members: list[EntraUser]) -> MagicMock:
+    """Strategy mock with one group per key, each targeting ``members``."""
+    strategy = MagicMock(automation_notice="Managed by automation", partial_sync=False)
+    strategy.get_members.return_value = dict.fromkeys(keys, members)
+    strategy.get_config.side_effect = lambda key: MagicMock(
+        display_name=key.title(), mail_nickname=key, aliases=[]
+    )
+    return strategy
+
+
+def _plan_user(name: str) -> EntraUser:
+    """Create an EntraUser with an @test.org email."""
+    return EntraUser(
+        id=name,
+        display_name=name.title(),
+        email=f"{name}@test.org",
+        upn=f"{name}@test.org",
+        first_name=name.title(),
+        last_name="",
+        account_enabled=True,
+        employee_id=None,
+    )
+
+
+class TestExchangePlans:
+    """Tests for planning and applying existing Exchange groups in bulk."""
+
+    @pytest.fixture(autouse=True)
+    def _service_email(self):
+        with patch("sjifire.scripts.ms_group_sync.get_service_email", return_value="svc@test.org"):
+            yield
+
+    def _setup(self, manager, mock_exchange_client, keys):
+        manager._exchange_client = mock_exchange_client
+        manager._reconcile_ghost_members = AsyncMock(return_value=([], []))
+        manager.detect_group_type = AsyncMock(return_value=GroupType.EXCHANGE)
+        mock_exchange_client.get_groups_with_members = AsyncMock(
+            return_value={
+                f"{key}@test.org": (MagicMock(), ["alice@test.org", "old@test.org"]) for key in keys
+            }
+        )
+        mock_exchange_client.apply_group_changes = AsyncMock(
+            side_effect=lambda changes: {
+                c.identity: ExchangeGroupChangeResult(
+                    identity=c.identity, added=c.add, removed=c.remove
+                )
+                for c in changes
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_sync_reads_and_applies_all_groups_once(self, manager, mock_exchange_client):
+        """N existing groups cost one bulk read and one batched apply."""
+        keys = ["g1", "g2", "g3", "g4"]
+        self._setup(manager, mock_exchange_client, keys)
+        strategy = _plan_strategy(keys, [_plan_user("alice"), _plan_user("bob")])
+
+        with patch("sjifire.scripts.ms_group_sync.get_strategy", return_value=strategy):
+            result = await manager.sync("test", members=[])
+
+        mock_exchange_client.get_groups_with_members.assert_called_once()
+        mock_exchange_client.apply_group_changes.assert_called_once()
+        mock_exchange_client.sync_group.assert_not_called()
+        assert [g.group_email for g in result.groups] == [f"{k}@test.org" for k in keys]
+        assert all(g.members_added == ["Bob"] for g in result.groups)
+        assert all(g.members_removed == ["old@test.org"] for g in result.groups)
+        assert [p.to_add for p in result.exchange_plans] == [["bob@test.org"]] * 4
+
+    @pytest.mark.asyncio
+    async def test_dry_run_plans_without_applying(self, manager, mock_exchange_client):
+        """Dry run reports the plan but makes no changes."""
+        self._setup(manager, mock_exchange_client, ["g1"])
+        strategy = _plan_strategy(["g1"], [_plan_user("alice"), _plan_user("bob")])
+
+        with patch("sjifire.scripts.ms_group_sync.get_strategy", return_value=strategy):
+            result = await manager.sync("test", members=[], dry_run=True)
+
+        mock_exchange_client.apply_group_changes.assert_not_called()
+        assert result.groups[0].members_added == ["Bob"]
+        assert result.groups[0].members_removed == ["old@test.org"]
+
+    @pytest.mark.asyncio
+    async def test_missing_group_reports_error(self, manager, mock_exchange_client):
+        """A group that disappears between detection and read is an error."""
+        self._setup(manager, mock_exchange_client, [])
+        strategy = _plan_strategy(["gone"], [_plan_user("alice")])
+
+        with patch("sjifire.scripts.ms_group_sync.get_strategy", return_value=strategy):
+            result = await manager.sync("test", members=[])
+
+        assert result.groups[0].errors == ["Group not found: gone@test.org"]
+        assert result.exchange_plans == []
+
+    @pytest.mark.asyncio
+    async def test_saved_plan_round_trips_and_applies(
+        self, manager, mock_exchange_client, tmp_path
+    ):
+        """A dry run's saved plan applies as-is without re-reading groups."""
+        self._setup(manager, mock_exchange_client, ["g1"])
+        strategy = _plan_strategy(["g1"], [_plan_user("alice"), _plan_user("bob")])
+        with patch("sjifire.scripts.ms_group_sync.get_strategy", return_value=strategy):
+            dry = await manager.sync("test", members=[], dry_run=True)
+
+        path = tmp_path / "plan.json"
+        save_sync_plan({"test": dry.exchange_plans}, path)
+        loaded = load_sync_plan(path)
+        assert loaded == {"test": dry.exchange_plans}
+
+        mock_exchange_client.get_groups_with_members.reset_mock()
+        result = await manager.apply_plan(loaded["test"])
+
+        mock_exchange_client.get_groups_with_members.assert_not_called()
+        change = mock_exchange_client.apply_group_changes.call_args[0][0][0]
+        assert change.add == ["bob@test.org"]
+        assert change.remove == ["old@test.org"]
+        assert result.groups[0].members_added == ["Bob"]
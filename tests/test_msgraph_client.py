@@ -1,12 +1,24 @@
 """Tests for core/msgraph_client.py - Microsoft Graph API client wrapper."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import pytest
+import respx
+from azure.core.credentials import AccessToken
 from msgraph import GraphServiceClient
+from msgraph.generated.models.event import Event
 
 from sjifire.core.msgraph_client import (
+    GRAPH_API_URL,
     GRAPH_MAX_RETRIES,
     GRAPH_RETRY_DELAY,
+    GraphBatchClient,
+    GraphBatchQueue,
+    GraphRequest,
     create_graph_client,
     get_graph_client,
 )
@@ -128,3 +140,200 @@ class TestCreateGraphClient:
         """Retry constants should be reasonable values."""
         assert GRAPH_MAX_RETRIES == 8
         assert GRAPH_RETRY_DELAY == 5.0
+
+
+class FakeGraph:
+    """In-memory stand-in for the Graph ``$batch`` endpoint.
+
+    Counts HTTP calls and items; URLs listed in ``throttle`` answer 429
+    (with a Retry-After header) that many times before succeeding.
+    """
+
+    def __init__(self, throttle: dict[str, int] | None = None, retry_after: str = "7"):
+        """Set up per-URL throttle counts and the Retry-After value returned."""
+        self.throttle = dict(throttle or {})
+        self.retry_after = retry_after
+        self.http_calls = 0
+        self.items: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.http_calls += 1
+        assert request.headers["Authorization"] == "Bearer token-1"
+        batch = json.loads(request.content)["requests"]
+        assert len(batch) <= 20
+        responses = []
+        for item in batch:
+            self.items.append(item)
+            if self.throttle.get(item["url"], 0) > 0:
+                self.throttle[item["url"]] -= 1
+                responses.append(
+                    {
+                        "id": item["id"],
+                        "status": 429,
+                        "headers": {"Retry-After": self.retry_after},
+                        "body": {"error": {"code": "ApplicationThrottled", "message": "slow"}},
+                    }
+                )
+            elif item["method"] == "POST":
+                responses.append({"id": item["id"], "status": 201, "body": {"id": item["url"]}})
+            else:
+                responses.append({"id": item["id"], "status": 204})
+        # Graph may return items out of order
+        return httpx.Response(200, json={"responses": list(reversed(responses))})
+
+
+def _credential() -> MagicMock:
+    credential = MagicMock()
+    credential.get_token.return_value = AccessToken("token-1", int(time.time()) + 3600)
+    return credential
+
+
+class TestGraphBatchClient:
+    """Tests for GraphBatchClient against a fake $batch endpoint."""
+
+    @respx.mock
+    async def test_packs_twenty_per_http_call(self):
+        """45 operations go out in 3 HTTP calls; results keep request order."""
+        fake = FakeGraph()
+        respx.post(f"{GRAPH_API_URL}/$batch").mock(side_effect=fake)
+        client = GraphBatchClient(_credential())
+
+        requests = [GraphRequest("POST", f"/users/u/events?n={i}", {"n": i}) for i in range(45)]
+        responses = await client.execute(requests)
+
+        assert fake.http_calls == 3
+        assert client.http_requests == 3
+        assert [r.body["id"] for r in responses] == [r.url for r in requests]
+        assert all(r.ok for r in responses)
+
+    @respx.mock
+    @patch("sjifire.core.msgraph_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_only_throttled_items_after_retry_after(self, mock_sleep):
+        """Throttled items are re-sent alone after the item's Retry-After."""
+        fake = FakeGraph(throttle={"/users/u/events/3": 2})
+        respx.post(f"{GRAPH_API_URL}/$batch").mock(side_effect=fake)
+        client = GraphBatchClient(_credential())
+
+        requests = [GraphRequest("DELETE", f"/users/u/events/{i}") for i in range(5)]
+        responses = await client.execute(requests)
+
+        assert all(r.status == 204 for r in responses)
+        assert fake.http_calls == 3
+        assert len(fake.items) == 7  # 5 + 2 retries of the throttled item
+        assert client.throttle_events == 2
+        mock_sleep.assert_awaited_with(7.0)
+
+    @respx.mock
+    @patch("sjifire.core.msgraph_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_on_throttle_reports_retry_after(self, _sleep):
+        """on_throttle is called once per throttled item with its Retry-After."""
+        fake = FakeGraph(throttle={"/users/u/events/1": 1}, retry_after="12")
+        respx.post(f"{GRAPH_API_URL}/$batch").mock(side_effect=fake)
+        client = GraphBatchClient(_credential())
+        seen: list[float] = []
+        client.on_throttle = seen.append
+
+        await client.execute([GraphRequest("DELETE", f"/users/u/events/{i}") for i in range(3)])
+
+        assert seen == [12.0]
+
+    @respx.mock
+    @patch("sjifire.core.msgraph_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_gives_up_after_max_retries(self, _sleep):
+        """Items still throttled after max_retries come back as 429."""
+        fake = FakeGraph(throttle={"/users/u/events/0": 10})
+        respx.post(f"{GRAPH_API_URL}/$batch").mock(side_effect=fake)
+        client = GraphBatchClient(_credential(), max_retries=2)
+
+        [response] = await client.execute([GraphRequest("DELETE", "/users/u/events/0")])
+
+        assert response.throttled
+        assert response.error == "slow"
+        assert fake.http_calls == 3
+
+    @respx.mock
+    @patch("sjifire.core.msgraph_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_whole_batch_throttle_uses_header(self, mock_sleep):
+        """A 429 on the $batch call itself retries every item per its header."""
+        route = respx.post(f"{GRAPH_API_URL}/$batch")
+        route.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"responses": [{"id": "0", "status": 204}]}),
+        ]
+        client = GraphBatchClient(_credential())
+
+        [response] = await client.execute([GraphRequest("DELETE", "/users/u/events/0")])
+
+        assert response.status == 204
+        mock_sleep.assert_awaited_once_with(3.0)
+
+    @respx.mock
+    async def test_serializes_sdk_models(self):
+        """Graph SDK models are sent as camelCase JSON bodies."""
+        fake = FakeGraph()
+        respx.post(f"{GRAPH_API_URL}/$batch").mock(side_effect=fake)
+        client = GraphBatchClient(_credential())
+
+        await client.execute([GraphRequest("POST", "/users/u/events", Event(is_all_day=True))])
+
+        assert fake.items[0]["body"]["isAllDay"] is True
+        assert fake.items[0]["headers"] == {"Content-Type": "application/json"}
+
+    async def test_empty_request_list(self):
+        """No operations means no HTTP calls."""
+        client = GraphBatchClient(_credential())
+        assert await client.execute([]) == []
+        assert client.http_requests == 0
+
+
+class TestGraphBatchQueue:
+    """Tests for GraphBatchQueue coalescing concurrent submits."""
+
+    @respx.mock
+    async def test_coalesces_concurrent_submits(self):
+        """45 concurrent PATCHes share 3 HTTP calls; each caller gets its own result."""
+        fake = FakeGraph()
+        respx.post(f"{GRAPH_API_URL}/$batch").mock(side_effect=fake)
+        queue = GraphBatchQueue(GraphBatchClient(_credential()))
+
+        requests = [GraphRequest("POST", f"/users/{i}/x") for i in range(45)]
+        responses = await asyncio.gather(*(queue.submit(r) for r in requests))
+
+        assert fake.http_calls == 3
+        assert [r.body["id"] for r in responses] == [r.url for r in requests]
+
+    async def test_partial_batch_sent_after_linger(self):
+        """A lone request is not held waiting for a full batch."""
+        client = MagicMock()
+        client.execute = AsyncMock(return_value=[MagicMock(status=204)])
+        queue = GraphBatchQueue(client, linger=0.01)
+
+        response = await asyncio.wait_for(queue.submit(GraphRequest("PATCH", "/users/1")), 1)
+
+        assert response.status == 204
+        client.execute.assert_awaited_once()
+
+    async def test_send_failure_resolves_every_caller(self):
+        """An exception from the batch client fails each waiting request."""
+        client = MagicMock()
+        client.execute = AsyncMock(side_effect=RuntimeError("boom"))
+        queue = GraphBatchQueue(client, linger=0.01)
+
+        responses = await asyncio.gather(
+            *(queue.submit(GraphRequest("PATCH", f"/users/{i}")) for i in range(3))
+        )
+
+        assert [r.status for r in responses] == [0, 0, 0]
+        assert responses[0].error == "boom"
+
+
+@pytest.mark.parametrize("count", [1, 20, 21])
+@respx.mock
+async def test_http_calls_per_batch_size(count):
+    """Graph is called ceil(count / 20) times."""
+    fake = FakeGraph()
+    respx.post(f"{GRAPH_API_URL}/$batch").mock(side_effect=fake)
+    await GraphBatchClient(_credential()).execute(
+        [GraphRequest("DELETE", f"/e/{i}") for i in range(count)]
+    )
+    assert fake.http_calls == -(-count // 20)
@@ -1,5 +1,6 @@
 """Tests for sjifire.calendar.personal_sync module."""
 
+import asyncio
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,14 +10,32 @@ from sjifire.aladtec.schedule_scraper import ScheduleEntry
 from sjifire.calendar.personal_sync import (
     ExistingEvent,
     PersonalCalendarSync,
+    body_hash,
+    event_key,
     make_event_body,
     make_event_subject,
-    normalize_body_for_comparison,
+    schedule_fingerprint,
 )
 from sjifire.core.config import get_org_config
+from sjifire.core.msgraph_client import GraphResponse
 
 ALADTEC_CATEGORY = get_org_config().calendar_category
 
+
+def _fake_batch_client(status: int = 200) -> MagicMock:
+    """Batch client mock answering every request with ``status``."""
+    client = MagicMock()
+    client.execute = AsyncMock(side_effect=lambda requests: [GraphResponse(status)] * len(requests))
+    return client
+
+
+def _batched(sync, method: str) -> list:
+    """Requests with ``method`` sent through the sync's batch client."""
+    if not sync._batch_client.execute.called:
+        return []
+    return [r for r in sync._batch_client.execute.call_args[0][0] if r.method == method]
+
+
 # =============================================================================
 # Helper Function Tests
 # =============================================================================
@@ -93,25 +112,6 @@ class TestMakeEventBody:
         assert "automatically imported from Aladtec" in body
 
 
-class TestNormalizeBodyForComparison:
-    """Tests for normalize_body_for_comparison function."""
-
-    def test_removes_html_tags(self):
-        """HTML tags are removed."""
-        html = "<p>Hello <strong>World</strong></p>"
-        assert normalize_body_for_comparison(html) == "Hello World"
-
-    def test_normalizes_whitespace(self):
-        """Multiple spaces and newlines are collapsed."""
-        text = "Hello    World\n\nTest"
-        assert normalize_body_for_comparison(text) == "Hello World Test"
-
-    def test_plain_text_unchanged(self):
-        """Plain text content is preserved."""
-        text = "Simple text"
-        assert normalize_body_for_comparison(text) == "Simple text"
-
-
 # =============================================================================
 # Primary Calendar Feature Tests
 # =============================================================================
@@ -328,8 +328,9 @@ class TestGetExistingEventsWithFilter:
 
         mock_result = MagicMock()
         mock_result.value = []
+        mock_result.odata_next_link = None
 
-        sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.events.get = AsyncMock(
+        sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.calendar_view.get = AsyncMock(
             return_value=mock_result
         )
 
@@ -338,7 +339,7 @@ class TestGetExistingEventsWithFilter:
         )
 
         # Check that filter was applied
-        call_args = sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.events.get.call_args
+        call_args = sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.calendar_view.get.call_args
         config = call_args[1]["request_configuration"]
         assert f"categories/any(c:c eq '{ALADTEC_CATEGORY}')" in str(config.query_parameters.filter)
 
@@ -349,8 +350,9 @@ class TestGetExistingEventsWithFilter:
 
         mock_result = MagicMock()
         mock_result.value = []
+        mock_result.odata_next_link = None
 
-        sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.events.get = AsyncMock(
+        sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.calendar_view.get = AsyncMock(
             return_value=mock_result
         )
 
@@ -359,11 +361,68 @@ class TestGetExistingEventsWithFilter:
         )
 
         # Check that no filter was applied
-        call_args = sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.events.get.call_args
+        call_args = sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value.calendar_view.get.call_args
         config = call_args[1]["request_configuration"]
         assert config.query_parameters.filter is None
 
 
+class TestGetExistingEventsCalendarView:
+    """Tests for the windowed, paginated calendarView listing."""
+
+    @pytest.fixture
+    def sync(self, mock_env_vars):
+        """Create PersonalCalendarSync with mocked client."""
+        with patch("sjifire.calendar.personal_sync.get_graph_client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            sync = PersonalCalendarSync()
+            sync.client = mock_client
+            return sync
+
+    @staticmethod
+    def _event(event_id: str, day: str, stored_hash: str | None = None) -> MagicMock:
+        event = MagicMock()
+        event.id = event_id
+        event.subject = "S31 - Captain"
+        event.start.date_time = f"{day}T08:00:00.0000000"
+        event.start.time_zone = "America/Los_Angeles"
+        event.end.date_time = f"{day}T18:00:00.0000000"
+        event.end.time_zone = "America/Los_Angeles"
+        event.single_value_extended_properties = (
+            [MagicMock(value=stored_hash)] if stored_hash else None
+        )
+        return event
+
+    @pytest.mark.asyncio
+    async def test_follows_pages_within_window_without_bodies(self, sync):
+        """All pages are read, the query is bounded, and bodies are not selected."""
+        view = sync.client.users.by_user_id.return_value.calendars.by_calendar_id.return_value
+        view = view.calendar_view
+        first = MagicMock(
+            value=[self._event("e1", "2026-02-03", "hash-1")], odata_next_link="https://next"
+        )
+        second = MagicMock(
+            value=[self._event("e2", "2026-02-04"), self._event("early", "2026-01-31")],
+            odata_next_link=None,
+        )
+        view.get = AsyncMock(return_value=first)
+        view.with_url.return_value.get = AsyncMock(return_value=second)
+
+        result = await sync.get_existing_events(
+            "test@example.com", "cal-id", date(2026, 2, 1), date(2026, 2, 28)
+        )
+
+        params = view.get.call_args[1]["request_configuration"].query_parameters
+        assert params.start_date_time.startswith("2026-02-01T00:00:00")
+        assert params.end_date_time.startswith("2026-03-01T00:00:00")
+        assert "body" not in params.select
+        view.with_url.assert_called_once_with("https://next")
+        assert result == {
+            "2026-02-03|S31 - Captain|08:00|18:00": ExistingEvent("e1", None, "hash-1"),
+            "2026-02-04|S31 - Captain|08:00|18:00": ExistingEvent("e2", None, None),
+        }
+
+
 class TestUpdateEventWithCategory:
     """Tests for update_event adding category for primary calendar users."""
 
@@ -679,10 +738,8 @@ class TestSyncUserLogic:
             existing_events = {}
         sync.get_existing_events = AsyncMock(return_value=existing_events)
 
-        # Mock create/update/delete
-        sync.create_event = AsyncMock(return_value=True)
-        sync.update_event = AsyncMock(return_value=True)
-        sync.delete_event = AsyncMock(return_value=True)
+        # Mock batched create/update/delete
+        sync._batch_client = _fake_batch_client()
 
     @pytest.mark.asyncio
     async def test_skips_existing_event_with_matching_key(self, sync, sample_entry):
@@ -707,9 +764,67 @@ class TestSyncUserLogic:
         assert result.events_created == 0
         assert result.events_updated == 0
         assert result.events_deleted == 0
-        sync.create_event.assert_not_called()
-        sync.update_event.assert_not_called()
-        sync.delete_event.assert_not_called()
+        assert _batched(sync, "POST") == []
+        assert _batched(sync, "DELETE") == []
+        # Only the body hash is stored (older event without one)
+        [tag] = _batched(sync, "PATCH")
+        assert set(tag.body) == {"singleValueExtendedProperties"}
+
+    @pytest.mark.asyncio
+    async def test_matching_body_hash_skips_without_body(self, sync, sample_entry):
+        """An event whose stored hash matches needs no body download and no write."""
+        key = f"{sample_entry.date}|{make_event_subject(sample_entry)}|08:00|18:00"
+        stored = body_hash(make_event_body(sample_entry))
+        existing = {key: ExistingEvent(event_id="evt-1", body_hash=stored)}
+        self._setup_sync_mocks(sync, existing)
+
+        result = await sync.sync_user(
+            "test@example.com", [sample_entry], date(2026, 2, 1), date(2026, 2, 28)
+        )
+
+        assert result.events_updated == 0
+        sync._batch_client.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changed_body_hash_updates_without_body(self, sync, sample_entry):
+        """A stale stored hash means the body changed: update without downloading it."""
+        key = f"{sample_entry.date}|{make_event_subject(sample_entry)}|08:00|18:00"
+        existing = {key: ExistingEvent(event_id="evt-1", body_hash="stale")}
+        self._setup_sync_mocks(sync, existing)
+
+        result = await sync.sync_user(
+            "test@example.com", [sample_entry], date(2026, 2, 1), date(2026, 2, 28)
+        )
+
+        assert result.events_updated == 1
+        sync._batch_client.execute.assert_called_once()
+        assert _batched(sync, "GET") == []
+
+    @pytest.mark.asyncio
+    async def test_fetches_bodies_only_for_unhashed_candidates(self, sync, sample_entry):
+        """Events without a stored hash or body get their body fetched in one batch."""
+        key = f"{sample_entry.date}|{make_event_subject(sample_entry)}|08:00|18:00"
+        existing = {
+            key: ExistingEvent(event_id="evt-1"),
+            "2026-02-20|S31 - Captain|08:00|18:00": ExistingEvent(event_id="gone"),
+        }
+        self._setup_sync_mocks(sync, existing)
+        sync._batch_client.execute = AsyncMock(
+            side_effect=[
+                [GraphResponse(200, {"body": {"content": "<p>Old body</p>"}})],
+                [GraphResponse(200), GraphResponse(204)],
+            ]
+        )
+
+        result = await sync.sync_user(
+            "test@example.com", [sample_entry], date(2026, 2, 1), date(2026, 2, 28)
+        )
+
+        [get] = sync._batch_client.execute.call_args_list[0][0][0]
+        assert get.method == "GET"
+        assert get.url.endswith("/events/evt-1?$select=body")
+        assert result.events_updated == 1
+        assert result.events_deleted == 1
 
     @pytest.mark.asyncio
     async def test_deletes_event_no_longer_in_schedule(self, sync):
@@ -732,9 +847,8 @@ class TestSyncUserLogic:
         # Should delete the old event
         assert result.events_deleted == 1
         assert result.events_created == 0
-        sync.delete_event.assert_called_once_with(
-            "test@example.com", "calendar-123", "old-event-id"
-        )
+        [delete] = _batched(sync, "DELETE")
+        assert delete.url == "/users/test@example.com/calendars/calendar-123/events/old-event-id"
 
     @pytest.mark.asyncio
     async def test_creates_event_not_in_calendar(self, sync, sample_entry):
@@ -753,11 +867,9 @@ class TestSyncUserLogic:
         # Should create the new event
         assert result.events_created == 1
         assert result.events_deleted == 0
-        sync.create_event.assert_called_once()
-        call_args = sync.create_event.call_args
-        assert call_args[0][0] == "test@example.com"
-        assert call_args[0][1] == "calendar-123"
-        assert call_args[0][2] == sample_entry
+        [create] = _batched(sync, "POST")
+        assert create.url == "/users/test@example.com/calendars/calendar-123/events"
+        assert create.body.subject == make_event_subject(sample_entry)
 
     @pytest.mark.asyncio
     async def test_updates_event_when_body_changes(self, sync, sample_entry):
@@ -781,12 +893,9 @@ class TestSyncUserLogic:
         assert result.events_updated == 1
         assert result.events_created == 0
         assert result.events_deleted == 0
-        sync.update_event.assert_called_once()
-        call_args = sync.update_event.call_args
-        assert call_args[0][0] == "test@example.com"
-        assert call_args[0][1] == "calendar-123"
-        assert call_args[0][2] == "existing-event-id"
-        assert call_args[0][3] == sample_entry
+        [update] = _batched(sync, "PATCH")
+        assert update.url.endswith("/calendars/calendar-123/events/existing-event-id")
+        assert update.body.body.content == make_event_body(sample_entry)
 
     @pytest.mark.asyncio
     async def test_trade_scenario_delete_old_create_new(self, sync):
@@ -818,10 +927,10 @@ class TestSyncUserLogic:
         # Should delete old and create new
         assert result.events_deleted == 1
         assert result.events_created == 1
-        sync.delete_event.assert_called_once_with(
-            "test@example.com", "calendar-123", "old-event-id"
-        )
-        sync.create_event.assert_called_once()
+        [delete] = _batched(sync, "DELETE")
+        assert delete.url.endswith("/events/old-event-id")
+        assert len(_batched(sync, "POST")) == 1
+        sync._batch_client.execute.assert_called_once()  # one round trip for both
 
     @pytest.mark.asyncio
     async def test_force_updates_even_when_body_matches(self, sync, sample_entry):
@@ -846,7 +955,7 @@ class TestSyncUserLogic:
         # Should update even though body matches
         assert result.events_updated == 1
         assert result.events_created == 0
-        sync.update_event.assert_called_once()
+        assert len(_batched(sync, "PATCH")) == 1
 
     @pytest.mark.asyncio
     async def test_dry_run_reports_changes_without_api_calls(self, sync, sample_entry):
@@ -870,9 +979,55 @@ class TestSyncUserLogic:
         assert result.events_deleted == 1
 
         # But no API calls should be made
-        sync.create_event.assert_not_called()
-        sync.delete_event.assert_not_called()
-        sync.update_event.assert_not_called()
+        sync._batch_client.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_previous_fingerprint_updates_only_changed_keys(self, sync, sample_entry):
+        """With a previous fingerprint, only entries whose body changed are rewritten."""
+        changed = ScheduleEntry(
+            date=date(2026, 2, 16),
+            section="S31",
+            position="Engineer",
+            name="John Doe",
+            start_time="08:00",
+            end_time="18:00",
+        )
+        existing = {
+            event_key(sample_entry): ExistingEvent(event_id="evt-same"),
+            event_key(changed): ExistingEvent(event_id="evt-changed"),
+        }
+        self._setup_sync_mocks(sync, existing)
+        sync.fetch_event_bodies = AsyncMock()
+        previous = schedule_fingerprint([sample_entry])
+        previous[event_key(changed)] = "stale-hash"
+
+        result = await sync.sync_user(
+            "test@example.com",
+            [sample_entry, changed],
+            date(2026, 2, 1),
+            date(2026, 2, 28),
+            previous=previous,
+        )
+
+        assert result.events_updated == 1
+        [update] = _batched(sync, "PATCH")
+        assert update.url.endswith("/events/evt-changed")
+        sync.fetch_event_bodies.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_previous_fingerprint_still_recreates_missing_events(self, sync, sample_entry):
+        """Events missing from the calendar are created even if unchanged in the schedule."""
+        self._setup_sync_mocks(sync, {})
+
+        result = await sync.sync_user(
+            "test@example.com",
+            [sample_entry],
+            date(2026, 2, 1),
+            date(2026, 2, 28),
+            previous=schedule_fingerprint([sample_entry]),
+        )
+
+        assert result.events_created == 1
 
 
 # =============================================================================
@@ -913,7 +1068,7 @@ class TestSyncUserErrorAccumulation:
         sync.get_or_create_calendar = AsyncMock(return_value="cal-id")
         sync.ensure_aladtec_category = AsyncMock(return_value=True)
         sync.get_existing_events = AsyncMock(return_value={})
-        sync.create_event = AsyncMock(return_value=False)
+        sync._batch_client = _fake_batch_client(status=500)
 
         result = await sync.sync_user(
             "test@example.com",
@@ -939,8 +1094,12 @@ class TestSyncUserErrorAccumulation:
                 ),
             }
         )
-        sync.delete_event = AsyncMock(return_value=False)
-        sync.create_event = AsyncMock(return_value=True)
+        sync._batch_client = MagicMock()
+        sync._batch_client.execute = AsyncMock(
+            side_effect=lambda requests: [
+                GraphResponse(500 if r.method == "DELETE" else 201) for r in requests
+            ]
+        )
 
         result = await sync.sync_user(
             "test@example.com",
@@ -1080,3 +1239,43 @@ class TestSyncUserThrottleDetection:
 
         assert result.throttled is False
         assert sync._throttled_this_run is False
+
+    @pytest.mark.asyncio
+    async def test_throttle_flag_is_per_concurrent_user(self, sync):
+        """Concurrent sync_user calls on one instance don't share the flag."""
+
+        async def get_calendar(user_email):
+            await asyncio.sleep(0)
+            if user_email == "throttled@example.com":
+                sync._throttled_this_run = True
+                return None
+            await asyncio.sleep(0.01)
+            return "cal-id"
+
+        sync.get_or_create_calendar = AsyncMock(side_effect=get_calendar)
+        sync.ensure_aladtec_category = AsyncMock(return_value=True)
+        sync.get_existing_events = AsyncMock(return_value={})
+
+        throttled, clean = await asyncio.gather(
+            sync.sync_user("throttled@example.com", [], date(2026, 2, 1), date(2026, 2, 28)),
+            sync.sync_user("clean@example.com", [], date(2026, 2, 1), date(2026, 2, 28)),
+        )
+
+        assert throttled.throttled is True
+        assert clean.throttled is False
+
+    @pytest.mark.asyncio
+    async def test_batched_429_sets_throttled(self, sync):
+        """Batch items still throttled after retries flag the user for retry."""
+        sync.get_or_create_calendar = AsyncMock(return_value="cal-id")
+        sync.ensure_aladtec_category = AsyncMock(return_value=True)
+        sync.get_existing_events = AsyncMock(
+            return_value={"2026-02-01|S31 - Captain|08:00|18:00": ExistingEvent("evt-id", "")}
+        )
+        sync._batch_client = _fake_batch_client(status=429)
+
+        result = await sync.sync_user("test@example.com", [], date(2026, 2, 1), date(2026, 2, 28))
+
+        assert result.throttled is True
+        assert result.events_deleted == 0
+        assert result.errors == ["Failed to delete event"]
@@ -1,5 +1,6 @@
 """Tests for sjifire.scripts.personal_calendar_sync module."""
 
+import asyncio
 import json
 import sys
 import tempfile
@@ -8,14 +9,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from sjifire.aladtec.schedule_cache import ScheduleDiff, save_schedule_diff
 from sjifire.aladtec.schedule_scraper import DaySchedule, ScheduleEntry
-from sjifire.calendar.personal_sync import PersonalSyncResult
+from sjifire.calendar.personal_sync import PersonalSyncResult, schedule_fingerprint
+from sjifire.calendar.sync_state import SYNC_STATE_FILE, PersonalSyncState
+from sjifire.core.throttle import AdaptiveLimiter
 from sjifire.scripts.personal_calendar_sync import (
     get_month_date_range,
     main,
     match_schedule_name_to_email,
     normalize_name,
     parse_month,
+    sync_users,
 )
 
 # =============================================================================
@@ -354,6 +359,91 @@ class TestMainWithLoadSchedule:
         assert result == 1
 
 
+class TestMainChangedOnly:
+    """Tests for main() with --changed-only."""
+
+    def test_limits_sync_to_users_on_changed_days(
+        self,
+        mock_env_vars,
+        mock_member_scraper,
+        mock_schedule_scraper,
+        mock_personal_sync,
+        tmp_path,
+    ):
+        """Only users named in the diff are synced."""
+        diff_path = tmp_path / "diff.json"
+        save_schedule_diff(ScheduleDiff(changed=["2026-02-18"], names=["Smith, John"]), diff_path)
+
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "personal-calendar-sync",
+                "--all",
+                "--month",
+                "Feb 2026",
+                "--changed-only",
+                "--load-diff",
+                str(diff_path),
+            ],
+        ):
+            result = main()
+
+        assert result == 0
+        assert mock_personal_sync.sync_user.call_count == 1
+        assert mock_personal_sync.sync_user.call_args[0][0] == "jsmith@sjifire.org"
+
+    def test_no_changes_skips_sync(
+        self, mock_env_vars, mock_member_scraper, mock_schedule_scraper, mock_personal_sync
+    ):
+        """A scrape with no changed days syncs nobody."""
+        mock_schedule_scraper.last_diff = ScheduleDiff(unchanged=28)
+
+        with patch.object(
+            sys,
+            "argv",
+            ["personal-calendar-sync", "--all", "--month", "Feb 2026", "--changed-only"],
+        ):
+            result = main()
+
+        assert result == 0
+        mock_personal_sync.sync_user.assert_not_called()
+        mock_schedule_scraper.commit_cache.assert_called_once()
+
+    def test_force_overrides_changed_only(
+        self, mock_env_vars, mock_member_scraper, mock_schedule_scraper, mock_personal_sync
+    ):
+        """--force syncs everyone even when nothing changed."""
+        mock_schedule_scraper.last_diff = ScheduleDiff(unchanged=28)
+
+        with patch.object(
+            sys,
+            "argv",
+            ["personal-calendar-sync", "--all", "--month", "Feb 2026", "--changed-only", "--force"],
+        ):
+            result = main()
+
+        assert result == 0
+        assert mock_personal_sync.sync_user.call_count == 2
+        mock_schedule_scraper.commit_cache.assert_called_once()
+
+    def test_dry_run_does_not_commit_schedule_cache(
+        self, mock_env_vars, mock_member_scraper, mock_schedule_scraper, mock_personal_sync
+    ):
+        """A dry run leaves the schedule changes for the next real run."""
+        mock_schedule_scraper.last_diff = ScheduleDiff(changed=["2026-02-18"])
+
+        with patch.object(
+            sys,
+            "argv",
+            ["personal-calendar-sync", "--all", "--month", "Feb 2026", "--dry-run"],
+        ):
+            result = main()
+
+        assert result == 0
+        mock_schedule_scraper.commit_cache.assert_not_called()
+
+
 class TestMainWithUserFlag:
     """Tests for main() with --user flag."""
 
@@ -402,7 +492,7 @@ class TestMainThrottleRetry:
         # Second call (the retry) for agreene returns success.
         call_log: list[tuple[str, bool]] = []
 
-        async def fake_sync_user(email, entries, start, end, dry_run, force):
+        async def fake_sync_user(email, entries, start, end, dry_run, force, previous=None):
             throttled_first_time = email == "agreene@sjifire.org" and (email, True) not in call_log
             call_log.append((email, throttled_first_time))
             if throttled_first_time:
@@ -432,7 +522,7 @@ class TestMainThrottleRetry:
     ):
         """If the retry also throttles, the error is surfaced as exit 1."""
 
-        async def always_throttled(email, entries, start, end, dry_run, force):
+        async def always_throttled(email, entries, start, end, dry_run, force, previous=None):
             return PersonalSyncResult(user=email, throttled=True, errors=["Throttled by Graph API"])
 
         mock_personal_sync.sync_user = AsyncMock(side_effect=always_throttled)
@@ -447,6 +537,166 @@ class TestMainThrottleRetry:
         assert result == 1
 
 
+class TestSyncUsers:
+    """Tests for the concurrent multi-user scheduler."""
+
+    @staticmethod
+    def _entries(n: int) -> dict[str, list[ScheduleEntry]]:
+        return {f"user{i}@sjifire.org": [] for i in range(n)}
+
+    async def test_syncs_users_concurrently_in_order(self):
+        active = 0
+        peak = 0
+
+        async def slow_sync(email, entries, start, end, dry_run, force, previous=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return PersonalSyncResult(user=email, events_created=1)
+
+        sync = MagicMock()
+        sync.sync_user = AsyncMock(side_effect=slow_sync)
+        limiter = AdaptiveLimiter(initial=2, maximum=4)
+
+        results, stats = await sync_users(
+            sync, self._entries(8), date(2026, 2, 1), date(2026, 2, 28), limiter=limiter
+        )
+
+        assert [r.user for r in results] == [f"user{i}@sjifire.org" for i in range(8)]
+        assert 1 < peak <= 4
+        assert stats.users == 8
+        assert stats.peak_concurrency == peak
+        assert stats.throttle_events == 0
+        assert stats.final_concurrency == 4
+        assert sync.batch_client.on_throttle == limiter.record_throttle
+
+    @patch("sjifire.core.throttle.asyncio.sleep", new_callable=AsyncMock)
+    async def test_throttled_user_backs_off_and_retries(self, _sleep):
+        calls: list[str] = []
+
+        async def fake_sync(email, entries, start, end, dry_run, force, previous=None):
+            calls.append(email)
+            if email == "user0@sjifire.org" and calls.count(email) == 1:
+                return PersonalSyncResult(user=email, throttled=True, errors=["Throttled"])
+            return PersonalSyncResult(user=email)
+
+        sync = MagicMock()
+        sync.sync_user = AsyncMock(side_effect=fake_sync)
+        limiter = AdaptiveLimiter(initial=4, maximum=4)
+
+        results, stats = await sync_users(
+            sync, self._entries(3), date(2026, 2, 1), date(2026, 2, 28), limiter=limiter
+        )
+
+        assert calls.count("user0@sjifire.org") == 2
+        assert not results[0].throttled
+        assert stats.retried_users == 1
+        assert stats.throttle_events == 1
+        assert limiter.decreases == 1
+
+
+class TestSyncUsersFingerprints:
+    """Tests for change-only syncing driven by stored fingerprints."""
+
+    FEB = (date(2026, 2, 1), date(2026, 2, 28))
+
+    @pytest.fixture(autouse=True)
+    def aladtec_url(self):
+        """make_event_body needs the Aladtec URL."""
+        with patch(
+            "sjifire.calendar.personal_sync.get_aladtec_url",
+            return_value="https://aladtec.example.com",
+        ):
+            yield
+
+    @staticmethod
+    def _entry(position: str = "Captain") -> ScheduleEntry:
+        return ScheduleEntry(
+            date=date(2026, 2, 18),
+            section="S31",
+            position=position,
+            name="Greene, Adam",
+            start_time="08:00",
+            end_time="18:00",
+        )
+
+    @staticmethod
+    def _sync(**result_fields) -> MagicMock:
+        sync = MagicMock()
+        sync.sync_user = AsyncMock(
+            side_effect=lambda email, *args, **kwargs: PersonalSyncResult(
+                user=email, **result_fields
+            )
+        )
+        return sync
+
+    async def test_unchanged_user_is_skipped_without_graph_calls(self, tmp_path):
+        state = PersonalSyncState(tmp_path / SYNC_STATE_FILE)
+        state.record("a@test.org", *self.FEB, schedule_fingerprint([self._entry()]))
+        sync = self._sync()
+
+        [result], stats = await sync_users(
+            sync, {"a@test.org": [self._entry()]}, *self.FEB, state=state
+        )
+
+        assert result.skipped
+        assert stats.skipped_users == 1
+        sync.sync_user.assert_not_called()
+
+    async def test_changed_user_syncs_change_only_and_records(self, tmp_path):
+        state = PersonalSyncState(tmp_path / SYNC_STATE_FILE)
+        old = schedule_fingerprint([self._entry()])
+        state.record("a@test.org", *self.FEB, old)
+        sync = self._sync(events_updated=1)
+        entries = [self._entry("Engineer")]
+
+        await sync_users(sync, {"a@test.org": entries}, *self.FEB, state=state)
+
+        assert sync.sync_user.call_args.kwargs["previous"] == old
+        assert state.get("a@test.org", *self.FEB) == schedule_fingerprint(entries)
+
+    async def test_full_mode_ignores_fingerprints(self, tmp_path):
+        state = PersonalSyncState(tmp_path / SYNC_STATE_FILE)
+        state.record("a@test.org", *self.FEB, schedule_fingerprint([self._entry()]))
+        sync = self._sync()
+
+        await sync_users(sync, {"a@test.org": [self._entry()]}, *self.FEB, state=state, full=True)
+
+        assert sync.sync_user.call_args.kwargs["previous"] is None
+
+    async def test_failed_sync_keeps_old_fingerprint(self, tmp_path):
+        state = PersonalSyncState(tmp_path / SYNC_STATE_FILE)
+        old = schedule_fingerprint([self._entry()])
+        state.record("a@test.org", *self.FEB, old)
+        sync = self._sync(errors=["Failed to update event"])
+
+        await sync_users(sync, {"a@test.org": [self._entry("Engineer")]}, *self.FEB, state=state)
+
+        assert state.get("a@test.org", *self.FEB) == old
+
+    def test_main_syncs_user_whose_entries_were_all_removed(
+        self,
+        mock_env_vars,
+        mock_member_scraper,
+        mock_schedule_scraper,
+        mock_personal_sync,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.setenv("ALADTEC_CACHE_DIR", str(tmp_path))
+        state = PersonalSyncState(tmp_path / SYNC_STATE_FILE)
+        state.record("gone@sjifire.org", *self.FEB, {"2026-02-03|S31 - Captain|08:00|18:00": "h"})
+        state.save(today=date(2026, 2, 1))
+
+        with patch.object(sys, "argv", ["personal-calendar-sync", "--all", "--month", "Feb 2026"]):
+            assert main() == 0
+
+        synced = {c.args[0]: c.args[1] for c in mock_personal_sync.sync_user.call_args_list}
+        assert synced["gone@sjifire.org"] == []
+
+
 class TestMainWithForceFlag:
     """Tests for main() with --force flag."""
 
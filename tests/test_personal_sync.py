@@ -14,7 +14,6 @@ from sjifire.calendar.personal_sync import (
     _parse_graph_datetime,
     make_event_body,
     make_event_subject,
-    normalize_body_for_comparison,
 )
 
 
@@ -243,42 +242,6 @@ class TestParseGraphDatetime:
         assert result.strftime("%H:%M") == "00:00"  # Same as uppercase UTC
 
 
-class TestNormalizeBodyForComparison:
-    """Tests for normalize_body_for_comparison function."""
-
-    def test_strips_html_tags(self):
-        """Removes HTML tags from body."""
-        html = "<html><body><p>Hello World</p></body></html>"
-        assert normalize_body_for_comparison(html) == "Hello World"
-
-    def test_normalizes_whitespace(self):
-        """Collapses multiple spaces and newlines."""
-        text = "Hello\n\n  World\t\tTest"
-        assert normalize_body_for_comparison(text) == "Hello World Test"
-
-    def test_handles_exchange_html_format(self):
-        """Handles Microsoft Exchange HTML conversion format."""
-        html = (
-            '<html><head><meta http-equiv="Content-Type" content="text/html">\r\n'
-            "</head>\r\n<body>\r\n"
-            '<div class="PlainText">Position: Captain<br>\r\n'
-            "Section: S31</div>\r\n</body></html>"
-        )
-        result = normalize_body_for_comparison(html)
-        assert "Position: Captain" in result
-        assert "Section: S31" in result
-
-    def test_plain_text_unchanged(self):
-        """Plain text content normalized correctly."""
-        text = "Position: Captain\nSection: S31"
-        result = normalize_body_for_comparison(text)
-        assert result == "Position: Captain Section: S31"
-
-    def test_empty_string(self):
-        """Empty string returns empty."""
-        assert normalize_body_for_comparison("") == ""
-
-
 class TestExistingEvent:
     """Tests for ExistingEvent dataclass."""
 